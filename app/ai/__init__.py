@@ -0,0 +1,15 @@
+"""
+AI 플레이어 모듈
+
+엔진 상태를 입력으로 봇의 행동을 결정합니다.
+"""
+
+from .policy import DIFFICULTIES, choose_action, choose_actions, difficulty_of, score_action
+
+__all__ = [
+    "DIFFICULTIES",
+    "choose_action",
+    "choose_actions",
+    "difficulty_of",
+    "score_action",
+]
@@ -0,0 +1,303 @@
+"""
+정보 집합 몬테카를로 트리 탐색 (ISMCTS) - "hard" AI
+
+봇이 볼 수 없는 정보(다른 플레이어의 손패 / 상단주가 아닌 역할 / 덱 순서)를 반복마다 무작위로
+정해(결정화) 엔진 상태 복제본 위에서 탐색합니다. 트리는 결정화와 무관하게 액션으로만 가지를 나누고
+(Single-Observer ISMCTS), 각 반복에서 합법인 가지만 고릅니다 (가용 횟수 기반 UCB).
+
+- 트리 밖은 가벼운 무작위 플레이아웃 (후보를 바로 적용하고 IllegalAction이면 다음 후보)
+- 플레이아웃은 rollout_depth 수까지만 진행하고, 끝나지 않으면 팀별 남은 재력 비율로 평가
+- 시간 예산(budget)을 넘기면 바로 멈추고 가장 많이 방문한 액션을 고름
+
+프로세스 풀에서 실행할 수 있도록 decide()는 피클 가능한 인자만 받습니다.
+"""
+
+import math
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.ai.policy import choose_action
+from app.engine.cards import IS_MISSED
+from app.engine.headless import HeadlessContext
+from app.engine.legal import PHASE_DRAW, PHASE_RESPOND, PHASE_TURN, acting_phase, legal_actions
+from app.engine.rules import (
+    GIVE_UP,
+    START_TURN,
+    WIN_OUTLAWS,
+    WIN_RENEGADE,
+    Action,
+    Context,
+    IllegalAction,
+    perform,
+    winner,
+)
+from app.engine.state import EngineState
+from app.utils.constants import ActionType, Role
+
+# UCB 탐색 상수
+EXPLORATION = 0.7
+# 플레이아웃 최대 수 (이후는 평가 함수)
+ROLLOUT_DEPTH = 60
+# 플레이아웃에서 카드 대신 턴을 끝낼 확률
+ROLLOUT_END_TURN = 0.25
+
+
+class Node:
+    """탐색 트리 노드 (mover가 action을 골라 도달한 상태)"""
+
+    __slots__ = ("action", "mover", "children", "visits", "reward", "available")
+
+    def __init__(self, action: Optional[Action] = None, mover: int = -1):
+        self.action = action
+        self.mover = mover
+        self.children: Dict[Action, "Node"] = {}
+        self.visits = 0
+        self.reward = 0.0
+        self.available = 0
+
+    def ucb(self, exploration: float) -> float:
+        return self.reward / self.visits + exploration * math.sqrt(math.log(self.available) / self.visits)
+
+
+def determinize(state: EngineState, seat: int, rng: random.Random) -> EngineState:
+    """
+    seat이 볼 수 없는 정보를 무작위로 정한 상태 복제본을 만듭니다.
+
+    다른 생존 플레이어의 손패와 덱을 섞어 같은 장수로 다시 나누고,
+    상단주가 아닌 다른 생존 플레이어의 역할을 서로 섞습니다.
+
+    Args:
+        state: 엔진 상태 (변경하지 않음)
+        seat: 관찰자 좌석
+        rng: 난수 생성기
+
+    Returns:
+        결정화된 상태
+    """
+    det = state.clone()
+    others = [p for i, p in enumerate(det.players) if i != seat and p.alive]
+    pool = [card for p in others for card in p.hand] + det.deck
+    rng.shuffle(pool)
+    start = 0
+    for p in others:
+        count = len(p.hand)
+        p.hand = pool[start:start + count]
+        start += count
+    det.deck = pool[start:]
+
+    hidden = [p for p in others if p.role != Role.SHERIFF]
+    roles = [p.role for p in hidden]
+    rng.shuffle(roles)
+    for p, role in zip(hidden, roles):
+        p.role = role
+    return det
+
+
+def _team(role: Any) -> str:
+    if role in (Role.SHERIFF, Role.DEPUTY):
+        return "law"
+    return "outlaw" if role == Role.OUTLAW else "renegade"
+
+
+def evaluate(state: EngineState) -> List[float]:
+    """
+    좌석별 보상을 계산합니다 (0~1).
+
+    승부가 났으면 승리 팀 1 / 나머지 0, 아니면 팀별 남은 재력 비율입니다.
+
+    Args:
+        state: 엔진 상태
+
+    Returns:
+        좌석별 보상
+    """
+    players = state.players
+    result = winner(state)
+    if result is not None:
+        code = result[0]
+        if code == WIN_OUTLAWS:
+            won = {"outlaw"}
+        elif code == WIN_RENEGADE:
+            won = {"renegade"}
+        else:
+            won = {"law"}
+        return [1.0 if _team(p.role) in won else 0.0 for p in players]
+
+    team_hp: Dict[str, int] = {}
+    total = 0
+    for p in players:
+        if p.alive:
+            team_hp[_team(p.role)] = team_hp.get(_team(p.role), 0) + p.hp
+            total += p.hp
+    return [team_hp.get(_team(p.role), 0) / total if total else 0.0 for p in players]
+
+
+def _try(ctx: Context, candidates: List[Action]) -> bool:
+    for action in candidates:
+        try:
+            if perform(ctx, action).success:
+                return True
+        except IllegalAction:
+            continue
+    return False
+
+
+def rollout_step(ctx: Context, rng: random.Random) -> bool:
+    """
+    무작위 플레이아웃을 한 수 진행합니다.
+
+    합법 액션을 모두 나열하지 않고 후보를 바로 적용해 보며, 카드 사용 단계에서는
+    일정 확률로 (또는 쓸 카드가 없으면) 턴을 끝냅니다.
+
+    Args:
+        ctx: 규칙 컨텍스트 (상태를 제자리 변경)
+        rng: 난수 생성기
+
+    Returns:
+        진행했는지 여부 (더 둘 수 없으면 False)
+    """
+    state = ctx.state
+    acting = acting_phase(state)
+    if acting is None:
+        return False
+    phase, seat = acting
+    if phase == PHASE_DRAW:
+        return _try(ctx, [Action(START_TURN, seat)])
+    if phase == PHASE_RESPOND:
+        missed = [Action(ActionType.RESPOND_ATTACK, seat, card) for card in state.players[seat].hand if IS_MISSED[card]]
+        return _try(ctx, missed[:1] + [Action(GIVE_UP, seat)])
+    if phase == PHASE_TURN:
+        hand = state.players[seat].hand
+        if hand and rng.random() >= ROLLOUT_END_TURN:
+            targets = [i for i, p in enumerate(state.players) if p.alive and i != seat]
+            candidates = []
+            for card in rng.sample(hand, min(3, len(hand))):
+                candidates.append(Action(ActionType.USE_CARD, seat, card))
+                candidates.append(Action(ActionType.USE_CARD, seat, card, rng.choice(targets)))
+            if _try(ctx, candidates):
+                return True
+        return _try(ctx, [Action(ActionType.END_TURN, seat)])
+    actions = legal_actions(state, seat)
+    return bool(actions) and _try(ctx, [rng.choice(actions)])
+
+
+def search(
+    state: EngineState,
+    seat: int,
+    budget: float,
+    rng: random.Random,
+    rollout_depth: int = ROLLOUT_DEPTH,
+) -> Tuple[Optional[Action], Dict[str, Any]]:
+    """
+    카드 사용 단계의 seat에 대해 시간 예산 안에서 ISMCTS를 수행합니다.
+
+    Args:
+        state: 엔진 상태 (변경하지 않음)
+        seat: 탐색할 좌석 (지금 행동할 플레이어)
+        budget: 시간 예산 (초)
+        rng: 난수 생성기
+        rollout_depth: 플레이아웃 최대 수
+
+    Returns:
+        (고른 액션, 통계) - 통계: iterations, playoutsPerSec, maxDepth, avgRolloutDepth, elapsedMs, rootActions
+    """
+    started = time.perf_counter()
+    deadline = started + budget
+    # 루트의 합법 액션은 공개 정보 + 자기 손패로만 정해지므로 한 번만 계산
+    root_actions = legal_actions(state, seat)
+    root = Node()
+    iterations = 0
+    max_depth = 0
+    rollout_total = 0
+
+    if len(root_actions) > 1:
+        while time.perf_counter() < deadline:
+            ctx = HeadlessContext(determinize(state, seat, rng), rng)
+            det = ctx.state
+            node = root
+            path = [root]
+            actions = root_actions
+            # 선택 / 확장
+            while True:
+                for action in actions:
+                    child = node.children.get(action)
+                    if child is not None:
+                        child.available += 1
+                untried = [action for action in actions if action not in node.children]
+                mover = acting_phase(det)[1]
+                if untried:
+                    action = rng.choice(untried)
+                    child = node.children[action] = Node(action, mover)
+                    child.available = 1
+                else:
+                    child = max((node.children[a] for a in actions), key=lambda c: c.ucb(EXPLORATION))
+                    action = child.action
+                try:
+                    perform(ctx, action)
+                except IllegalAction:
+                    # 이 결정화에서만 불법인 액션 (방문 기록 없이 되돌림)
+                    if untried:
+                        del node.children[action]
+                    break
+                node = child
+                path.append(node)
+                if untried or winner(det) is not None:
+                    break
+                acting = acting_phase(det)
+                while acting is not None and acting[0] == PHASE_DRAW:
+                    rollout_step(ctx, rng)
+                    acting = acting_phase(det)
+                if acting is None:
+                    break
+                actions = legal_actions(det, acting[1])
+                if not actions:
+                    break
+            # 플레이아웃
+            plies = 0
+            while plies < rollout_depth and winner(det) is None and rollout_step(ctx, rng):
+                plies += 1
+            rewards = evaluate(det)
+            for visited in path:
+                visited.visits += 1
+                if visited.mover >= 0:
+                    visited.reward += rewards[visited.mover]
+            iterations += 1
+            max_depth = max(max_depth, len(path) - 1)
+            rollout_total += plies
+
+    if root.children:
+        best = max(root.children.values(), key=lambda c: c.visits).action
+    else:
+        best = root_actions[0] if root_actions else None
+    elapsed = time.perf_counter() - started
+    return best, {
+        "iterations": iterations,
+        "playoutsPerSec": round(iterations / elapsed, 1) if elapsed > 0 else 0.0,
+        "maxDepth": max_depth,
+        "avgRolloutDepth": round(rollout_total / iterations, 1) if iterations else 0.0,
+        "elapsedMs": round(elapsed * 1000, 3),
+        "rootActions": len(root_actions),
+    }
+
+
+def decide(state: EngineState, seat: int, budget: float, seed: int) -> Tuple[Optional[Action], Dict[str, Any]]:
+    """
+    hard 봇의 결정 (프로세스 풀 진입점).
+
+    카드 사용 단계는 ISMCTS로, 공격 대응 / 선택 요청은 medium 휴리스틱으로 고릅니다.
+
+    Args:
+        state: 엔진 상태
+        seat: 봇 좌석
+        budget: 시간 예산 (초)
+        seed: 난수 시드
+
+    Returns:
+        (액션, 통계)
+    """
+    rng = random.Random(seed)
+    acting = acting_phase(state)
+    if acting is None or acting[0] != PHASE_TURN or acting[1] != seat:
+        return choose_action(state, seat, "medium", rng), {"iterations": 0}
+    return search(state, seat, budget, rng)
@@ -0,0 +1,198 @@
+"""
+AI 플레이어 정책 (Bot Policy)
+
+엔진 상태만 보고 봇의 다음 액션을 고릅니다. pydantic 모델에 의존하지 않으므로
+워커 스레드 / 프로세스에서 그대로 실행할 수 있습니다.
+
+- easy: 합법 액션 중 무작위
+- medium: 휴리스틱 점수가 가장 높은 액션 (점수가 0 이하면 턴 종료)
+- hard: 카드 사용 결정은 ISMCTS 탐색 (app.ai.ismcts, BotDriver가 프로세스 풀에서 실행)
+  이 모듈에서는 medium과 같으며, 탐색하지 않는 결정과 탐색 시간 초과 시에 쓰입니다.
+
+봇은 자기 역할과 공개된 상단주만 압니다. 다른 플레이어의 역할은 보지 않습니다.
+"""
+
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.engine.cards import CARD_TYPES
+from app.engine.legal import legal_actions
+from app.engine.rules import GIVE_UP, Action
+from app.engine.state import EngineState
+from app.utils.constants import BOT_NAME_PREFIXES, ActionType, CardType, Role
+
+DIFFICULTIES = tuple(BOT_NAME_PREFIXES)
+
+# 묶음 결정 요청: (엔진 상태, 봇 좌석, 난이도, 난수 시드)
+DecisionRequest = Tuple[EngineState, int, str, int]
+
+# 카드 타입별 사용 가치 (대상이 있는 카드는 대상 적대도를 곱함)
+PLAY_VALUE: Dict[CardType, float] = {
+    CardType.BANG: 3.0,
+    CardType.DUEL: 2.5,
+    CardType.PANIC: 2.0,
+    CardType.JAIL: 2.0,
+    CardType.GATLING: 2.5,
+    CardType.INDIANS: 2.0,
+    CardType.BEER: 3.0,
+    CardType.SALOON: 1.0,
+    CardType.GENERAL_STORE: 1.5,
+    CardType.VOLCANIC: 2.0,
+    CardType.WINCHESTER: 2.5,
+    CardType.SCOPE: 2.0,
+    CardType.BARREL: 2.5,
+    CardType.MUSTANG: 2.5,
+    CardType.MISSED: -5.0,
+}
+
+# 카드 타입별 보유 가치 (자선 경매 / 강탈 / 드로우 순서 선택에 사용)
+KEEP_VALUE: Dict[CardType, float] = {
+    CardType.MISSED: 3.0,
+    CardType.BEER: 3.0,
+    CardType.BANG: 2.5,
+    CardType.BARREL: 2.5,
+    CardType.MUSTANG: 2.0,
+    CardType.DUEL: 2.0,
+    CardType.GATLING: 2.0,
+    CardType.WINCHESTER: 2.0,
+    CardType.PANIC: 1.5,
+    CardType.INDIANS: 1.5,
+    CardType.JAIL: 1.5,
+    CardType.VOLCANIC: 1.5,
+    CardType.SCOPE: 1.5,
+    CardType.GENERAL_STORE: 1.0,
+    CardType.SALOON: 1.0,
+}
+
+
+def difficulty_of(name: str) -> str:
+    """
+    봇 이름 접두사로 난이도를 판별합니다.
+
+    Args:
+        name: 플레이어 이름
+
+    Returns:
+        "easy" | "medium" | "hard" (알 수 없으면 "medium")
+    """
+    for difficulty, prefix in BOT_NAME_PREFIXES.items():
+        if name.startswith(prefix + "_"):
+            return difficulty
+    return "medium"
+
+
+def hostility(state: EngineState, seat: int, target: int) -> float:
+    """
+    봇이 보기에 대상이 얼마나 적인지 반환합니다 (-1 아군 ~ 1 확실한 적).
+
+    Args:
+        state: 엔진 상태
+        seat: 봇 좌석
+        target: 대상 좌석
+
+    Returns:
+        적대도
+    """
+    role = state.players[seat].role
+    target_is_sheriff = state.players[target].role == Role.SHERIFF
+    if role == Role.OUTLAW:
+        return 1.0 if target_is_sheriff else 0.4
+    if role == Role.DEPUTY:
+        return -1.0 if target_is_sheriff else 0.6
+    if role == Role.RENEGADE:
+        # 상단주는 마지막까지 남겨 둠
+        alive = sum(1 for p in state.players if p.alive)
+        return (1.0 if alive <= 2 else 0.1) if target_is_sheriff else 0.7
+    return 0.6
+
+
+def score_action(state: EngineState, seat: int, action: Action) -> float:
+    """
+    액션의 휴리스틱 점수를 계산합니다 (턴 종료 = 0 기준).
+
+    Args:
+        state: 엔진 상태
+        seat: 봇 좌석
+        action: 후보 액션 (합법 액션)
+
+    Returns:
+        점수
+    """
+    kind = action.kind
+    if kind == ActionType.END_TURN:
+        return 0.0
+    if kind == GIVE_UP:
+        return -1.0
+    if kind == ActionType.RESPOND_ATTACK:
+        return 1.0
+    if kind == ActionType.USE_TREASURE:
+        return 0.5
+    if kind in (ActionType.GENERAL_STORE_PICK, ActionType.SELECT_STEAL_CARD):
+        return KEEP_VALUE.get(CARD_TYPES[action.card], 1.0)
+    if kind == ActionType.SELECT_DRAW_ORDER:
+        take, top = action.cards[0], action.cards[1]
+        return KEEP_VALUE.get(CARD_TYPES[take], 1.0) + 0.5 * KEEP_VALUE.get(CARD_TYPES[top], 1.0)
+
+    card_type = CARD_TYPES[action.card]
+    value = PLAY_VALUE.get(card_type, 1.0)
+    player = state.players[seat]
+    if card_type == CardType.BEER or card_type == CardType.SALOON:
+        missing = player.max_hp - player.hp
+        return value + missing if missing > 0 else -1.0
+    if action.target is not None:
+        enmity = hostility(state, seat, action.target)
+        if enmity <= 0:
+            return -5.0
+        # 재력이 적은 대상을 우선
+        return value * enmity + 0.5 / max(1, state.players[action.target].hp)
+    if card_type in (CardType.GATLING, CardType.INDIANS) and player.role == Role.DEPUTY:
+        # 상단주도 맞으므로 덜 씀
+        return value - 1.5
+    return value
+
+
+def choose_action(
+    state: EngineState,
+    seat: int,
+    difficulty: str = "medium",
+    rng: Optional[random.Random] = None,
+) -> Optional[Action]:
+    """
+    봇의 다음 액션을 고릅니다.
+
+    Args:
+        state: 엔진 상태 (변경하지 않음)
+        seat: 봇 좌석
+        difficulty: 난이도
+        rng: 난수 생성기 (easy 선택 / 동점 처리용)
+
+    Returns:
+        엔진 액션 (할 수 있는 액션이 없으면 None)
+    """
+    actions: List[Action] = legal_actions(state, seat)
+    if not actions:
+        return None
+    rng = rng or random.Random()
+    if difficulty == "easy":
+        return rng.choice(actions)
+    # 동점이면 무작위로 (아주 작은 잡음)
+    scored = [(score_action(state, seat, action) + rng.random() * 1e-3, i) for i, action in enumerate(actions)]
+    return actions[max(scored)[1]]
+
+
+def choose_actions(requests: Sequence[DecisionRequest]) -> List[Optional[Action]]:
+    """
+    여러 봇의 다음 액션을 한 번에 고릅니다 (봇 드라이버가 워커 호출 한 번으로 보냄).
+
+    결정마다 시드로 만든 난수를 쓰므로 같은 시드로 choose_action을 부른 결과와 같습니다.
+
+    Args:
+        requests: (엔진 상태, 봇 좌석, 난이도, 난수 시드) 목록
+
+    Returns:
+        요청 순서대로의 엔진 액션 (할 수 있는 액션이 없으면 None)
+    """
+    return [
+        choose_action(state, seat, difficulty, random.Random(seed))
+        for state, seat, difficulty, seed in requests
+    ]
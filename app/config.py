@@ -29,6 +29,86 @@ class Settings(BaseSettings):
     MAX_PLAYERS: int = 7
     MIN_PLAYERS: int = 4
     
+    # 액션 로그 설정 (게임별 추가 전용 로그 + 주기 스냅샷, 디렉터리가 없으면 기록하지 않음)
+    ACTION_LOG_DIR: Optional[str] = None
+    ACTION_LOG_SNAPSHOT_INTERVAL: int = 200
+    
+    # 게임 저장소 설정 (memory | sqlite | redis)
+    GAME_STORE_BACKEND: str = "memory"
+    GAME_STORE_SQLITE_PATH: str = "./data/games.db"
+    GAME_STORE_REDIS_URL: str = "redis://localhost:6379/0"
+    GAME_STORE_FLUSH_INTERVAL_MS: int = 50
+    GAME_STORE_BATCH_SIZE: int = 100
+    
+    # 게임 수명 관리 (초 단위, 마지막 활동 기준)
+    GAME_REAPER_INTERVAL: float = 30
+    GAME_FINISHED_TTL: float = 300
+    GAME_WAITING_TTL: float = 120
+    GAME_ABANDONED_TTL: float = 900
+    
+    # 행동 제한 시간 (초 단위, 0이면 해당 단계는 마감 없음)
+    TURN_TIMEOUT: float = 60
+    RESPOND_TIMEOUT: float = 20
+    SELECTION_TIMEOUT: float = 20
+    
+    # AI 플레이어 구동 (생각 시간 범위는 초 단위, 결정 계산 워커 스레드 수)
+    BOT_THINK_TIME_MIN: float = 0.8
+    BOT_THINK_TIME_MAX: float = 2.0
+    BOT_WORKERS: int = 4
+    # hard 봇 탐색 (ISMCTS, 프로세스 수가 0이면 hard도 휴리스틱 사용)
+    BOT_SEARCH_WORKERS: int = 2
+    BOT_SEARCH_BUDGET_MS: int = 300
+    # 같은 틱에 만기가 된 휴리스틱 봇 결정을 모아 워커 호출 한 번으로 계산
+    BOT_BATCH_POLICY: bool = True
+    
+    # 웜 리스타트 스냅샷 경로 (종료 시 게임 전체를 기록하고 기동 시 복원, 없으면 사용하지 않음)
+    WARM_RESTART_PATH: Optional[str] = None
+    
+    # 관리자 API 토큰 (X-Admin-Token 헤더, 비어 있으면 /admin/* 비활성)
+    ADMIN_TOKEN: Optional[str] = None
+    
+    # 이벤트 루프 감시 (지연 샘플 주기 초, 느린 메시지 처리 기준 ms, 최근 기록 보관 수)
+    LOOP_LAG_INTERVAL: float = 0.25
+    SLOW_HANDLER_MS: float = 100
+    SLOW_OPERATIONS_KEEP: int = 200
+    # 느린 액션 캡처 (디렉터리를 지정하면 켜짐, 기준 ms, 디렉터리에 둘 최대 파일 수)
+    SLOW_ACTION_CAPTURE_DIR: Optional[str] = None
+    SLOW_ACTION_CAPTURE_MS: float = 250
+    SLOW_ACTION_CAPTURE_MAX_FILES: int = 100
+    
+    # 샘플링 프로파일러 (/admin/profile 한 번의 최대 시간 초, 기본 샘플 간격 ms)
+    PROFILER_MAX_SECONDS: float = 60
+    PROFILER_INTERVAL_MS: float = 5
+    
+    # 구조화 로그 (JSON 한 줄씩 stdout, LOG_FILE이 있으면 파일에도, 쓰기와 로테이션은 별도 스레드)
+    LOG_LEVEL: str = "INFO"
+    LOG_FILE: Optional[str] = None
+    LOG_FILE_MAX_BYTES: int = 10_000_000
+    LOG_FILE_BACKUPS: int = 5
+    LOG_QUEUE_SIZE: int = 10000
+    # 같은 위치 / 예외의 반복 로그: LOG_RATE_WINDOW초마다 처음 LOG_RATE_BURST개, 이후 LOG_SAMPLE_EVERY개 중 1개만
+    LOG_RATE_WINDOW: float = 10.0
+    LOG_RATE_BURST: int = 5
+    LOG_SAMPLE_EVERY: int = 100
+    
+    # 요청 추적 (루트 스팬 샘플링 비율 0~1, 0이면 끔 / 메모리에 남길 최근 추적 수 / OTLP JSONL 파일 경로)
+    TRACE_SAMPLE_RATE: float = 0.0
+    TRACE_RING_SIZE: int = 200
+    TRACE_FILE: Optional[str] = None
+    
+    # 송신 대역폭 집계 (남길 분 단위 버킷 수, 게임 하나의 분당 송신 예산 KB, 0이면 경고 끔)
+    BANDWIDTH_WINDOW_MINUTES: int = 60
+    BANDWIDTH_GAME_BUDGET_KB_PER_MIN: float = 0
+    
+    # 준비 상태 (/ready, 넘으면 503 / 0이면 검사 안 함): 남은 연결 비율, 최근 루프 지연 ms, 송신 대기 메시지 수, 게임 수
+    READY_MIN_CONNECTION_HEADROOM: float = 0.1
+    READY_MAX_LOOP_LAG_MS: float = 250
+    READY_MAX_PENDING_SENDS: int = 500
+    READY_MAX_GAMES: int = 0
+    
+    # 관리자 실시간 통계 스트림 (/admin/stats/ws 스냅샷 주기 초)
+    LIVE_STATS_INTERVAL: float = 1.0
+    
     # CORS 설정
     CORS_ORIGINS: list[str] = ["*"]
     
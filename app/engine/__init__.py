@@ -0,0 +1,27 @@
+"""
+규칙 엔진 모듈
+
+pydantic 모델과 문자열 이벤트에 의존하지 않는 순수 게임 규칙 코어입니다.
+"""
+
+from .state import EngineState, PlayerState
+from .events import Event
+from .rules import Action, Context, IllegalAction, Outcome, Transition, apply, perform
+from .legal import acting_phase, default_action, is_legal, legal_actions
+
+__all__ = [
+    "EngineState",
+    "PlayerState",
+    "Event",
+    "Action",
+    "Context",
+    "IllegalAction",
+    "Outcome",
+    "Transition",
+    "apply",
+    "perform",
+    "acting_phase",
+    "default_action",
+    "is_legal",
+    "legal_actions",
+]
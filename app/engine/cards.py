@@ -0,0 +1,48 @@
+"""
+엔진용 카드 테이블
+
+카드 카탈로그를 카드 인덱스(int) 기반의 정적 테이블로 펼칩니다.
+엔진 상태는 Card 모델 대신 이 인덱스만 보관합니다.
+"""
+
+from typing import Dict, Optional, Tuple
+from app.models.card import Card, get_card_catalog
+from app.utils.constants import CardType
+
+# 카탈로그 순서 그대로의 불변 Card 인스턴스 (어댑터에서 모델 복원 시 사용)
+CARDS: Tuple[Card, ...] = get_card_catalog()
+CARD_COUNT: int = len(CARDS)
+
+CARD_IDS: Tuple[str, ...] = tuple(c.id for c in CARDS)
+CARD_TYPES: Tuple[CardType, ...] = tuple(CardType(c.card_type) for c in CARDS)
+CARD_SUITS: Tuple[Optional[str], ...] = tuple(c.suit for c in CARDS)
+CARD_RANGES: Tuple[int, ...] = tuple(c.range for c in CARDS)
+CARD_INDEX: Dict[str, int] = {card_id: i for i, card_id in enumerate(CARD_IDS)}
+
+IS_BANG: Tuple[bool, ...] = tuple(t == CardType.BANG for t in CARD_TYPES)
+IS_MISSED: Tuple[bool, ...] = tuple(t == CardType.MISSED for t in CARD_TYPES)
+
+# 장착 카드 타입 -> 장착 슬롯
+EQUIP_SLOTS: Dict[CardType, str] = {
+    CardType.VOLCANIC: "weapon",
+    CardType.WINCHESTER: "weapon",
+    CardType.SCOPE: "scope",
+    CardType.BARREL: "barrel",
+    CardType.MUSTANG: "mustang",
+    CardType.JAIL: "jail",
+}
+
+
+def card_index(card_id: Optional[str]) -> Optional[int]:
+    """
+    카드 ID를 카드 인덱스로 변환합니다.
+
+    Args:
+        card_id: 카드 ID
+
+    Returns:
+        카드 인덱스 (ID가 비어 있으면 None, 카탈로그에 없으면 -1)
+    """
+    if not card_id:
+        return None
+    return CARD_INDEX.get(card_id, -1)
@@ -0,0 +1,82 @@
+"""
+엔진 이벤트 (Engine Events)
+
+규칙 엔진은 문자열 대신 구조화된 이벤트를 발생시킵니다.
+플레이어는 좌석 인덱스, 카드는 카드 인덱스로 참조하며,
+사람이 읽는 메시지로의 변환은 어댑터(app.game.event_text)가 담당합니다.
+"""
+
+from typing import Any, NamedTuple, Tuple
+
+
+class Event(NamedTuple):
+    """
+    엔진 이벤트
+
+    - kind: 이벤트 종류 (아래 상수)
+    - seat: 주체 플레이어 좌석
+    - target: 상대 플레이어 좌석 (없으면 -1)
+    - card: 관련 카드 인덱스 (없으면 -1)
+    - values: 추가 값 (재력 변화, 장수, 피해 원인 등)
+    """
+
+    kind: str
+    seat: int
+    target: int = -1
+    card: int = -1
+    values: Tuple[Any, ...] = ()
+
+
+# 턴 진행
+JAIL_SKIP = "JAIL_SKIP"
+RECORD_SHARD = "RECORD_SHARD"
+GOLD_ABACUS = "GOLD_ABACUS"
+DREW = "DREW"  # values: (장수,)
+HAND_LIMIT = "HAND_LIMIT"  # values: (버린 장수,)
+TURN_END = "TURN_END"
+
+# 카드 사용
+SUZY = "SUZY"  # values: (장수,)
+WILLY_DISCARD = "WILLY_DISCARD"
+BANG = "BANG"
+BEER = "BEER"  # values: (이전 재력, 이후 재력)
+PANIC_SELECT = "PANIC_SELECT"
+PANIC_STEAL = "PANIC_STEAL"
+EQUIP = "EQUIP"
+GATLING_DODGE = "GATLING_DODGE"
+GATLING = "GATLING"
+INDIANS_DEFEND = "INDIANS_DEFEND"
+INDIANS = "INDIANS"
+DUEL_BANG = "DUEL_BANG"
+DUEL = "DUEL"
+SALOON_HEAL = "SALOON_HEAL"  # values: (이전 재력, 이후 재력)
+SALOON = "SALOON"
+GS_NO_PLAYERS = "GS_NO_PLAYERS"
+GS_EMPTY = "GS_EMPTY"
+GS = "GS"
+GS_PICK = "GS_PICK"
+
+# 피해 / 사망
+DAMAGE = "DAMAGE"  # values: (원인, 남은 재력)
+DEATH = "DEATH"  # values: (원인,)
+VULTURE = "VULTURE"  # values: (상속 장수,)
+
+# 공격 대응
+RESPOND_PARTIAL = "RESPOND_PARTIAL"
+RESPOND_DODGE = "RESPOND_DODGE"
+BARREL_DODGE = "BARREL_DODGE"
+SILK_DODGE = "SILK_DODGE"
+SILK_FAIL = "SILK_FAIL"
+BART_DRAW = "BART_DRAW"
+GRINGO_STEAL = "GRINGO_STEAL"
+
+# 보물 / 선택 응답
+SID = "SID"  # values: (이전 재력, 이후 재력)
+STEAL_SELECT = "STEAL_SELECT"
+DRAW_ORDER = "DRAW_ORDER"
+
+# 피해 원인
+CAUSE_BANG = "BANG"
+CAUSE_GATLING = "GATLING"
+CAUSE_INDIANS = "INDIANS"
+CAUSE_DUEL = "DUEL"
@@ -0,0 +1,160 @@
+"""
+헤드리스 엔진 (Headless Engine)
+
+시뮬레이션용 빠른 경로입니다. pydantic 모델(Game / Player / Card)과 이벤트 문구 없이
+엔진 상태(EngineState) 하나를 게임이 끝날 때까지 제자리에서 진행합니다.
+
+- 규칙은 ActionHandler와 같은 rules.perform을 그대로 사용합니다 (같은 시드 / 같은 액션이면 같은 결과).
+- 액션마다 모델 <-> 엔진 상태 변환(load_state / store_state)과 이벤트 렌더링을 하지 않습니다.
+- HeadlessContext는 이벤트를 만들지 않습니다 (emit이 아무것도 하지 않음).
+- new_game()은 GameManager.create_game / add_player_to_game / start_game과 같은 난수 흐름으로 게임을 준비합니다.
+"""
+
+import random
+from typing import Any, Iterable, List, Optional, Sequence
+
+from app.engine.cards import CARD_TYPES, IS_BANG, IS_MISSED
+from app.engine.legal import PHASE_DRAW, PHASE_RESPOND, PHASE_TURN, acting_phase, default_action
+from app.engine.rules import GIVE_UP, START_TURN, Action, Context, IllegalAction, perform
+from app.engine.rules import start as start_game
+from app.engine.state import EngineState, PlayerState
+from app.utils.constants import DEFAULT_RANGE, INITIAL_HP, ActionType, CardType, Role
+
+
+class HeadlessContext(Context):
+    """이벤트를 기록하지 않는 규칙 컨텍스트 (events는 항상 빈 목록)"""
+
+    __slots__ = ()
+
+    def emit(self, kind: str, seat: int, target: int = -1, card: int = -1, *values: Any) -> None:
+        return None
+
+
+def new_game(
+    seed: int,
+    player_ids: Sequence[str],
+    treasures: Optional[Sequence[Optional[str]]] = None,
+    game_id: str = "headless",
+) -> HeadlessContext:
+    """
+    시작된 게임의 헤드리스 컨텍스트를 만듭니다.
+
+    GameManager로 같은 시드의 게임을 만들고 같은 순서로 플레이어를 넣어 시작한 것과 같은 상태입니다.
+
+    Args:
+        seed: 게임 시드
+        player_ids: 좌석 순서의 플레이어 ID (이름도 같은 값 사용)
+        treasures: 좌석별 보물 (없으면 보물 없음)
+        game_id: 게임 ID
+
+    Returns:
+        HeadlessContext (state.status == IN_PROGRESS, 첫 플레이어의 드로우 단계)
+    """
+    hp = INITIAL_HP[Role.SHERIFF]
+    treasures = treasures or [None] * len(player_ids)
+    players = [
+        PlayerState(
+            id=player_id,
+            name=player_id,
+            role=Role.SHERIFF,  # 임시 역할 (시작 시 재배정)
+            hp=hp,
+            max_hp=hp,
+            base_range=DEFAULT_RANGE,
+            hand=[],
+            equipment={},
+            treasure=treasure,
+            alive=True,
+            position=i,
+        )
+        for i, (player_id, treasure) in enumerate(zip(player_ids, treasures))
+    ]
+    ctx = HeadlessContext(EngineState(game_id, players), random.Random(seed))
+    start_game(ctx)
+    return ctx
+
+
+def apply_first(ctx: Context, candidates: Iterable[Action]) -> Optional[Action]:
+    """
+    후보 액션을 차례로 적용해 보고 처음 성공한 액션을 반환합니다.
+
+    IllegalAction이거나 성공하지 못한 결과는 다음 후보로 넘어갑니다 (ActionHandler의 실패 응답과 같은 취급).
+
+    Args:
+        ctx: 규칙 컨텍스트
+        candidates: 후보 액션 (우선순위 순)
+
+    Returns:
+        적용한 액션 (모두 실패하면 None)
+    """
+    for action in candidates:
+        try:
+            if perform(ctx, action).success:
+                return action
+        except IllegalAction:
+            continue
+    return None
+
+
+class ScriptedBot:
+    """
+    시뮬레이션용 간단한 규칙 기반 봇
+
+    턴마다 한 번, 정산을 쓸 수 있으면 무작위 대상에게 쓰고, 아니면 잃은 재력이 있을 때 비상금을 쓴 뒤 턴을 끝냅니다.
+    공격을 받으면 회피가 있으면 쓰고 없으면 포기하며, 드로우 / 선택 요청은 기본 액션을 따릅니다.
+
+    후보 목록만 만들고 적용은 호출자가 하므로 헤드리스 엔진과 ActionHandler 양쪽에서 같은 결정을 재현할 수 있습니다.
+    """
+
+    __slots__ = ("rng", "played_turn")
+
+    def __init__(self, seed: int):
+        """
+        Args:
+            seed: 봇 결정용 난수 시드 (게임 규칙 난수와 분리)
+        """
+        self.rng = random.Random(seed)
+        self.played_turn = -1
+
+    def candidates(self, state: EngineState) -> List[Action]:
+        """
+        지금 행동할 좌석의 후보 액션을 우선순위 순으로 반환합니다.
+
+        Args:
+            state: 엔진 상태
+
+        Returns:
+            후보 액션 목록 (행동할 좌석이 없으면 빈 목록)
+        """
+        acting = acting_phase(state)
+        if acting is None:
+            return []
+        phase, seat = acting
+        hand = state.players[seat].hand
+        if phase == PHASE_DRAW:
+            return [Action(START_TURN, seat)]
+        if phase == PHASE_RESPOND:
+            missed = next((card for card in hand if IS_MISSED[card]), None)
+            if missed is None:
+                return [Action(GIVE_UP, seat)]
+            return [Action(ActionType.RESPOND_ATTACK, seat, missed), Action(GIVE_UP, seat)]
+        if phase == PHASE_TURN:
+            end_turn = Action(ActionType.END_TURN, seat)
+            if self.played_turn == state.turn_number:
+                return [end_turn]
+            self.played_turn = state.turn_number
+            targets = [i for i, p in enumerate(state.players) if p.alive and i != seat]
+            attacks = [
+                Action(ActionType.USE_CARD, seat, card, target)
+                for card in dict.fromkeys(hand)
+                if IS_BANG[card]
+                for target in targets
+            ]
+            self.rng.shuffle(attacks)
+            player = state.players[seat]
+            if player.hp < player.max_hp:
+                beer = next((card for card in hand if CARD_TYPES[card] == CardType.BEER), None)
+                if beer is not None:
+                    attacks.append(Action(ActionType.USE_CARD, seat, beer))
+            return attacks + [end_turn]
+        action = default_action(state)
+        return [action] if action is not None else []
@@ -0,0 +1,185 @@
+"""
+합법 액션 생성기
+
+현재 상태에서 플레이어가 보낼 수 있는 모든 (액션, 카드, 대상) 조합을 나열합니다.
+후보 액션을 상태 복제본에 시험 적용해 규칙 함수와 항상 같은 판정을 내립니다.
+"""
+
+import random
+from itertools import combinations, permutations
+from typing import List, Optional, Tuple
+
+from app.engine.rules import GIVE_UP, START_TURN, Action, IllegalAction, apply
+from app.engine.state import (
+    RESPONSE_ATTACK,
+    RESPONSE_DRAW_ORDER,
+    RESPONSE_GENERAL_STORE,
+    RESPONSE_STEAL,
+    EngineState,
+)
+from app.utils.constants import ActionType, GameState, TurnState
+
+# 시험 적용 전용 난수 생성기 (게임의 난수 흐름을 소비하지 않음)
+_TRIAL_RNG = random.Random(0)
+
+# acting_phase()가 돌려주는 단계
+PHASE_DRAW = "draw"  # 턴 시작 전 드로우 (선택할 것 없음)
+PHASE_TURN = "turn"  # 카드 사용 단계
+PHASE_RESPOND = "respond"  # 공격 대응
+PHASE_SELECTION = "selection"  # 드로우 순서 / 자선 경매 / 강탈 카드 선택
+
+
+def is_legal(state: EngineState, action: Action) -> bool:
+    """
+    액션이 현재 상태에서 성공하는지 확인합니다 (상태는 변경되지 않음).
+
+    Args:
+        state: 엔진 상태
+        action: 엔진 액션
+
+    Returns:
+        합법 여부
+    """
+    try:
+        return apply(state, action, _TRIAL_RNG).outcome.success
+    except IllegalAction:
+        return False
+
+
+def _card_actions(state: EngineState, seat: int, card: int) -> List[Action]:
+    """대상 없이 쓸 수 있으면 그 액션만, 아니면 가능한 대상별 액션을 반환합니다."""
+    action = Action(ActionType.USE_CARD, seat, card)
+    if is_legal(state, action):
+        return [action]
+    actions = []
+    for target, player in enumerate(state.players):
+        if target == seat or not player.alive:
+            continue
+        action = Action(ActionType.USE_CARD, seat, card, target)
+        if is_legal(state, action):
+            actions.append(action)
+    return actions
+
+
+def _response_actions(state: EngineState, seat: int, response: tuple) -> Optional[List[Action]]:
+    """선택/대응 요청이 걸려 있으면 그에 대한 액션 목록을 반환합니다 (없으면 None)."""
+    kind = response[0]
+    if kind == RESPONSE_ATTACK:
+        if state.turn_state != TurnState.RESPOND or response[1] != seat:
+            return None
+        candidates = [Action(ActionType.RESPOND_ATTACK, seat, card) for card in state.players[seat].hand]
+        candidates.append(Action(GIVE_UP, seat))
+    elif kind == RESPONSE_GENERAL_STORE:
+        if response[1] != seat:
+            return []
+        candidates = [Action(ActionType.GENERAL_STORE_PICK, seat, card) for card in response[2]]
+    elif kind == RESPONSE_STEAL:
+        candidates = [Action(ActionType.SELECT_STEAL_CARD, seat, card) for card in response[2]]
+    elif kind == RESPONSE_DRAW_ORDER:
+        candidates = [
+            Action(ActionType.SELECT_DRAW_ORDER, seat, cards=order)
+            for order in permutations(response[1], 3)
+        ]
+    else:
+        return None
+    return [action for action in dict.fromkeys(candidates) if is_legal(state, action)]
+
+
+def legal_actions(state: EngineState, seat: int) -> List[Action]:
+    """
+    플레이어가 현재 보낼 수 있는 모든 합법 액션을 나열합니다.
+
+    대응 요청(공격 대응, 자선 경매, 강탈/드로우 순서 선택)이 걸려 있으면 그 응답만,
+    아니면 카드 사용 / 보물 사용 / 턴 종료를 나열합니다.
+    공격 대응과 포기(GIVE_UP)는 방어 중인 플레이어에게만 나열합니다.
+
+    Args:
+        state: 엔진 상태
+        seat: 플레이어 좌석
+
+    Returns:
+        엔진 액션 목록 (없으면 빈 목록)
+    """
+    if state.status != GameState.IN_PROGRESS:
+        return []
+    if seat < 0 or seat >= len(state.players) or not state.players[seat].alive:
+        return []
+
+    if state.response is not None:
+        actions = _response_actions(state, seat, state.response)
+        if actions is not None:
+            return actions
+
+    if state.current != seat or state.turn_state != TurnState.PLAY_CARD:
+        return []
+
+    player = state.players[seat]
+    actions: List[Action] = []
+    for card in dict.fromkeys(player.hand):
+        actions.extend(_card_actions(state, seat, card))
+    if player.treasure:
+        for pair in combinations(player.hand, 2):
+            action = Action(ActionType.USE_TREASURE, seat, cards=pair, name=player.treasure)
+            if is_legal(state, action):
+                actions.append(action)
+    end = Action(ActionType.END_TURN, seat)
+    if is_legal(state, end):
+        actions.append(end)
+    return actions
+
+
+def acting_phase(state: EngineState) -> Optional[Tuple[str, int]]:
+    """
+    지금 행동해야 하는 플레이어와 그 단계를 반환합니다.
+
+    Args:
+        state: 엔진 상태
+
+    Returns:
+        (단계, 좌석) - 진행 중이 아니거나 기다리는 행동이 없으면 None
+    """
+    if state.status != GameState.IN_PROGRESS:
+        return None
+    response = state.response
+    if response is not None:
+        kind = response[0]
+        if kind == RESPONSE_ATTACK:
+            return PHASE_RESPOND, response[1]
+        if kind == RESPONSE_GENERAL_STORE:
+            return PHASE_SELECTION, response[1]
+        if kind in (RESPONSE_STEAL, RESPONSE_DRAW_ORDER) and state.pending is not None:
+            return PHASE_SELECTION, state.pending[1]
+    if state.current < 0:
+        return None
+    if state.turn_state == TurnState.DRAW:
+        return PHASE_DRAW, state.current
+    if state.turn_state == TurnState.PLAY_CARD:
+        return PHASE_TURN, state.current
+    return None
+
+
+def default_action(state: EngineState) -> Optional[Action]:
+    """
+    행동 시간이 지났을 때 대신 적용할 기본 액션을 반환합니다.
+
+    드로우는 턴 시작, 카드 사용 단계는 턴 종료, 공격 대응은 포기,
+    선택 요청은 첫 번째 합법 선택입니다.
+
+    Args:
+        state: 엔진 상태
+
+    Returns:
+        엔진 액션 (기다리는 행동이 없으면 None)
+    """
+    phase = acting_phase(state)
+    if phase is None:
+        return None
+    kind, seat = phase
+    if kind == PHASE_DRAW:
+        return Action(START_TURN, seat)
+    if kind == PHASE_TURN:
+        return Action(ActionType.END_TURN, seat)
+    if kind == PHASE_RESPOND:
+        return Action(GIVE_UP, seat)
+    actions = legal_actions(state, seat)
+    return actions[0] if actions else None
@@ -0,0 +1,1326 @@
+"""
+규칙 엔진 (Rules Engine)
+
+EngineState 위에서 동작하는 순수 게임 규칙입니다.
+- 모든 규칙 함수는 Context(상태, 난수 생성기, 이벤트 목록)를 받아 상태를 제자리에서 변경합니다.
+- 잘못된 액션은 상태를 변경하기 전에 IllegalAction을 발생시킵니다.
+- apply()는 상태를 복제한 뒤 액션을 적용하므로 원본 상태는 변하지 않습니다.
+
+ActionHandler / TurnManager / GameManager는 이 모듈을 감싸는 어댑터입니다.
+"""
+
+import random
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from app.engine import events as ev
+from app.engine.cards import (
+    CARD_COUNT,
+    CARD_RANGES,
+    CARD_SUITS,
+    CARD_TYPES,
+    EQUIP_SLOTS,
+    IS_BANG,
+    IS_MISSED,
+)
+from app.engine.events import Event
+from app.engine.state import (
+    PENDING_DRAW_ORDER,
+    PENDING_GENERAL_STORE,
+    PENDING_STEAL,
+    RESPONSE_ATTACK,
+    RESPONSE_DRAW_ORDER,
+    RESPONSE_GENERAL_STORE,
+    RESPONSE_STEAL,
+    EngineState,
+)
+from app.utils.constants import (
+    INITIAL_HP,
+    ActionType,
+    CardType,
+    GameState,
+    Role as RoleEnum,
+    Suit,
+    TurnState,
+)
+
+# 보물 이름
+LUCKY_DUKE = "만능 통보"
+JESSE_JAMES = "천청 방울"
+ROSE_DOOLAN = "만국 지도"
+PAUL_REGRET = "안개 병풍"
+JOURDONNAIS = "비단 갑옷"
+EL_GRINGO = "응징의 패"
+SUZY_LAFAYETTE = "화수분"
+CALAMITY_JANET = "반전 금화"
+BART_CASSIDY = "이중 장부"
+KIT_CARLSON = "우선 전표"
+VULTURE_SAM = "유산 상자"
+PEDRO_RAMIREZ = "기록 파편"
+SLAB_THE_KILLER = "낙인 인장"
+WILLY_THE_KID = "황금 연갑"
+SID_KETCHUM = "생명 장부"
+BLACK_JACK = "황금 주판"
+
+# 엔진 전용 액션 (ActionType 외)
+GIVE_UP = "GIVE_UP"  # 공격 대응 포기 (회피 카드 없음)
+START_TURN = "START_TURN"  # 턴 시작 (드로우 단계 처리)
+
+# 플레이어 수별 역할 구성
+ROLE_SETS = {
+    4: (RoleEnum.SHERIFF, RoleEnum.DEPUTY, RoleEnum.OUTLAW, RoleEnum.RENEGADE),
+    5: (RoleEnum.SHERIFF, RoleEnum.DEPUTY, RoleEnum.OUTLAW, RoleEnum.OUTLAW, RoleEnum.RENEGADE),
+    6: (
+        RoleEnum.SHERIFF, RoleEnum.DEPUTY, RoleEnum.DEPUTY,
+        RoleEnum.OUTLAW, RoleEnum.OUTLAW, RoleEnum.RENEGADE,
+    ),
+    7: (
+        RoleEnum.SHERIFF, RoleEnum.DEPUTY, RoleEnum.DEPUTY,
+        RoleEnum.OUTLAW, RoleEnum.OUTLAW, RoleEnum.OUTLAW, RoleEnum.RENEGADE,
+    ),
+}
+
+# 승리 결과 코드
+WIN_OUTLAWS = "OUTLAWS"
+WIN_RENEGADE = "RENEGADE"
+WIN_SHERIFF = "SHERIFF"
+
+
+class IllegalAction(Exception):
+    """
+    규칙상 허용되지 않는 액션
+
+    code는 실패 사유 코드, args는 메시지 포맷 인자입니다.
+    이 예외가 발생하면 상태는 변경되지 않은 상태입니다.
+    """
+
+    def __init__(self, code: str, *args: Any):
+        super().__init__(code, *args)
+        self.code = code
+        self.params = args
+
+
+class Action(NamedTuple):
+    """
+    엔진 액션
+
+    - kind: ActionType 값 또는 엔진 전용 액션 (GIVE_UP, START_TURN)
+    - player: 액션 주체 좌석 (알 수 없는 플레이어면 -1)
+    - card: 카드 인덱스 (ID가 비어 있으면 None, 알 수 없으면 -1)
+    - target: 대상 좌석 (ID가 비어 있으면 None, 알 수 없으면 -1)
+    - cards: 여러 장이 필요한 액션의 카드 인덱스 (우선 전표: 획득/위/아래)
+    - name: 보물 이름 (USE_TREASURE)
+    """
+
+    kind: Any
+    player: int
+    card: Optional[int] = None
+    target: Optional[int] = None
+    cards: Tuple[Optional[int], ...] = ()
+    name: Optional[str] = None
+
+
+class Outcome(NamedTuple):
+    """
+    액션 처리 결과 코드
+
+    success가 False인 결과(END_TURN_FAILED 등)도 상태 변경을 포함할 수 있습니다.
+    """
+
+    code: str
+    args: Tuple[Any, ...] = ()
+    success: bool = True
+
+
+class Transition(NamedTuple):
+    """apply() 결과: 새 상태, 발생한 이벤트, 처리 결과"""
+
+    state: EngineState
+    events: List[Event]
+    outcome: Outcome
+
+
+class Context:
+    """
+    규칙 적용 컨텍스트
+
+    상태, 난수 생성기, 이번 적용에서 발생한 이벤트를 함께 전달합니다.
+    """
+
+    __slots__ = ("state", "rng", "events")
+
+    def __init__(self, state: EngineState, rng: Any = random):
+        self.state = state
+        self.rng = rng
+        self.events: List[Event] = []
+
+    def emit(self, kind: str, seat: int, target: int = -1, card: int = -1, *values: Any) -> None:
+        self.events.append(Event(kind, seat, target, card, values))
+
+
+# ==================== 공통 헬퍼 ====================
+
+def _treasure(state: EngineState, seat: int) -> Optional[str]:
+    return state.players[seat].treasure
+
+
+def _draw(state: EngineState) -> Optional[int]:
+    """덱 맨 위 카드를 뽑습니다 (덱이 비어 있으면 None)."""
+    if not state.deck:
+        return None
+    return state.deck.pop(0)
+
+
+def _draw_many(state: EngineState, count: int) -> List[int]:
+    """덱에서 최대 count장을 뽑습니다 (재생성 없음)."""
+    cards = []
+    for _ in range(count):
+        card = _draw(state)
+        if card is None:
+            break
+        cards.append(card)
+    return cards
+
+
+def reshuffle(ctx: Context) -> None:
+    """
+    버림 더미를 덱으로 재생성합니다 (맨 위 카드는 버림 더미에 남김).
+
+    Args:
+        ctx: 규칙 컨텍스트
+    """
+    state = ctx.state
+    if not state.discard:
+        return
+    top = state.discard.pop()
+    state.deck = state.discard
+    state.discard = [top]
+    if state.deck:
+        ctx.rng.shuffle(state.deck)
+
+
+def alive_seats(state: EngineState) -> List[int]:
+    """생존 플레이어 좌석 목록 (좌석 순서)"""
+    return [i for i, p in enumerate(state.players) if p.alive]
+
+
+def effective_range(state: EngineState, seat: int) -> int:
+    """
+    유효 영향력 (무기 사거리 또는 기본 사거리, 첩보원 +1)
+
+    Args:
+        state: 엔진 상태
+        seat: 플레이어 좌석
+
+    Returns:
+        유효 영향력
+    """
+    player = state.players[seat]
+    weapon = player.equipment.get("weapon")
+    result = CARD_RANGES[weapon] if weapon is not None else player.base_range
+    if "scope" in player.equipment:
+        result += 1
+    return result
+
+
+def distance(state: EngineState, source: int, target: int) -> int:
+    """
+    두 플레이어 간 거리 (Game.calculate_distance와 동일 규칙)
+
+    Args:
+        state: 엔진 상태
+        source: 출발 좌석
+        target: 도착 좌석
+
+    Returns:
+        거리 (같은 플레이어면 0, 그 외 최소 1)
+    """
+    if source == target:
+        return 0
+    src = state.players[source]
+    dst = state.players[target]
+    total = len(state.players)
+    diff = abs(src.position - dst.position)
+    dist = min(diff, total - diff)
+    if src.treasure == ROSE_DOOLAN:
+        dist -= 1
+    if dst.treasure == PAUL_REGRET:
+        dist += 1
+    if "mustang" in dst.equipment:
+        dist += 1
+    return max(1, dist)
+
+
+def _seat_at_position(state: EngineState, position: int) -> int:
+    for i, p in enumerate(state.players):
+        if p.position == position:
+            return i
+    return -1
+
+
+def next_seat(state: EngineState, seat: int) -> int:
+    """
+    다음 차례 플레이어 좌석 (Game.get_next_player와 동일 규칙)
+
+    Args:
+        state: 엔진 상태
+        seat: 기준 좌석
+
+    Returns:
+        다음 좌석 (없으면 -1)
+    """
+    if seat < 0:
+        return -1
+    alive = alive_seats(state)
+    if len(alive) <= 1:
+        return -1
+    positions = sorted(state.players[s].position for s in alive)
+    current_pos = state.players[seat].position
+    if current_pos not in positions:
+        return -1
+    index = (positions.index(current_pos) + 1) % len(positions)
+    return _seat_at_position(state, positions[index])
+
+
+def draw_cards_for_player(ctx: Context, seat: int, count: int) -> List[int]:
+    """
+    플레이어에게 카드를 드로우합니다 (덱이 비면 버림 더미 재생성).
+
+    Args:
+        ctx: 규칙 컨텍스트
+        seat: 플레이어 좌석
+        count: 드로우할 카드 수
+
+    Returns:
+        드로우한 카드 인덱스 목록
+    """
+    state = ctx.state
+    if seat < 0:
+        return []
+    hand = state.players[seat].hand
+    drawn = []
+    for _ in range(count):
+        if not state.deck:
+            reshuffle(ctx)
+            if not state.deck:
+                break
+        card = state.deck.pop(0)
+        hand.append(card)
+        drawn.append(card)
+    return drawn
+
+
+def _judgement(ctx: Context, seat: int, success_suit: str) -> bool:
+    """
+    판정 카드를 뽑습니다.
+
+    만능 통보 보유 시 2장을 보고 성공 카드를 우선 선택하며,
+    나머지 카드는 덱 맨 아래로 보냅니다.
+    """
+    state = ctx.state
+
+    def ensure_deck() -> None:
+        if not state.deck:
+            reshuffle(ctx)
+
+    if _treasure(state, seat) == LUCKY_DUKE:
+        ensure_deck()
+        first = _draw(state)
+        ensure_deck()
+        second = _draw(state)
+        cards = [c for c in (first, second) if c is not None]
+        if not cards:
+            return False
+        chosen = next((c for c in cards if CARD_SUITS[c] == success_suit), None)
+        if chosen is not None:
+            others = [c for c in cards if c != chosen]
+            success = True
+        else:
+            chosen, others = cards[0], cards[1:]
+            success = False
+        state.discard.append(chosen)
+        state.deck.extend(others)
+        return success
+
+    ensure_deck()
+    card = _draw(state)
+    if card is None:
+        return False
+    state.discard.append(card)
+    return CARD_SUITS[card] == success_suit
+
+
+def _suzy(ctx: Context, seat: int) -> None:
+    """화수분: 손패가 0장이 되면 2장 드로우"""
+    player = ctx.state.players[seat]
+    if player.treasure != SUZY_LAFAYETTE or player.hand:
+        return
+    drawn = draw_cards_for_player(ctx, seat, 2)
+    if drawn:
+        ctx.emit(ev.SUZY, seat, -1, -1, len(drawn))
+
+
+def _discard_from_hand(ctx: Context, seat: int, card: int) -> None:
+    ctx.state.players[seat].hand.remove(card)
+    ctx.state.discard.append(card)
+
+
+def _heal(state: EngineState, seat: int) -> Tuple[int, int]:
+    player = state.players[seat]
+    old = player.hp
+    player.hp = min(player.max_hp, player.hp + 1)
+    if player.hp > 0:
+        player.alive = True
+    return old, player.hp
+
+
+def _damage(ctx: Context, seat: int, cause: str) -> bool:
+    """
+    피해 1을 적용하고 사망 시 유산 상자 효과를 처리합니다.
+
+    Returns:
+        사망 여부
+    """
+    state = ctx.state
+    target = state.players[seat]
+    target.hp = max(0, target.hp - 1)
+    died = target.hp == 0
+    if died:
+        target.alive = False
+        ctx.emit(ev.DEATH, seat, -1, -1, cause)
+    else:
+        ctx.emit(ev.DAMAGE, seat, -1, -1, cause, target.hp)
+        return False
+
+    owner = -1
+    for i, p in enumerate(state.players):
+        if p.treasure == VULTURE_SAM and p.alive and i != seat:
+            owner = i
+            break
+    if owner < 0:
+        return True
+
+    inherited = []
+    while target.hand:
+        inherited.append(target.hand.pop())
+    inherited.extend(target.equipment.values())
+    target.equipment.clear()
+    state.players[owner].hand.extend(inherited)
+    if inherited:
+        ctx.emit(ev.VULTURE, owner, seat, -1, len(inherited))
+    return True
+
+
+def _require_player(state: EngineState, seat: Optional[int]) -> None:
+    if seat is None or seat < 0:
+        raise IllegalAction("PLAYER_NOT_FOUND")
+
+
+# ==================== 게임 시작 / 승리 판정 ====================
+
+def start(ctx: Context) -> None:
+    """
+    게임을 시작합니다: 역할 배정, 덱 셔플, 초기 카드 분배.
+
+    Args:
+        ctx: 규칙 컨텍스트
+    """
+    state = ctx.state
+    count = len(state.players)
+    roles = list(ROLE_SETS.get(count, ROLE_SETS[4]))
+    while len(roles) < count:
+        roles.append(RoleEnum.OUTLAW)
+    ctx.rng.shuffle(roles)
+    for player, role in zip(state.players, roles):
+        player.role = role
+        player.hp = INITIAL_HP[role]
+        player.max_hp = INITIAL_HP[role]
+
+    state.deck = list(range(CARD_COUNT))
+    state.discard = []
+    ctx.rng.shuffle(state.deck)
+
+    initial_cards = 4 if count <= 4 else 5
+    for player in state.players:
+        player.hand.extend(_draw_many(state, initial_cards))
+
+    state.status = GameState.IN_PROGRESS
+    state.turn_number = 1
+    if state.players:
+        state.current = 0
+        state.turn_state = TurnState.DRAW
+
+
+def winner(state: EngineState) -> Optional[Tuple[str, int]]:
+    """
+    승리 조건을 판정합니다.
+
+    Args:
+        state: 엔진 상태
+
+    Returns:
+        (승리 코드, 대표 승리자 좌석) 또는 None
+    """
+    alive = alive_seats(state)
+    roles = state.players
+    sheriff = next((s for s in alive if roles[s].role == RoleEnum.SHERIFF), -1)
+    outlaws = [s for s in alive if roles[s].role == RoleEnum.OUTLAW]
+    if sheriff < 0:
+        if outlaws:
+            return WIN_OUTLAWS, outlaws[0]
+        return None
+    if outlaws:
+        return None
+    renegades = [s for s in alive if roles[s].role == RoleEnum.RENEGADE]
+    if len(renegades) == 1 and len(alive) == 2:
+        return WIN_RENEGADE, renegades[0]
+    return WIN_SHERIFF, sheriff
+
+
+# ==================== 턴 진행 ====================
+
+def start_turn(ctx: Context, seat: int) -> bool:
+    """
+    플레이어의 턴을 시작합니다 (영업 금지 판정, 턴 상태 초기화, 드로우 단계).
+
+    Args:
+        ctx: 규칙 컨텍스트
+        seat: 턴을 시작할 좌석
+
+    Returns:
+        시작 성공 여부
+    """
+    state = ctx.state
+    if seat is None or seat < 0 or not state.players[seat].alive:
+        return False
+    if state.status != GameState.IN_PROGRESS:
+        return False
+    player = state.players[seat]
+
+    jail = player.equipment.pop("jail", None)
+    if jail is not None:
+        state.discard.append(jail)
+        if not state.deck:
+            reshuffle(ctx)
+        success = False
+        card = _draw(state)
+        if card is not None:
+            state.discard.append(card)
+            success = CARD_SUITS[card] == Suit.HEARTS
+        if not success:
+            state.current = seat
+            state.turn_state = TurnState.END_TURN
+            ctx.emit(ev.JAIL_SKIP, seat)
+            return move_to_next_player(ctx)
+
+    state.attack_counters.clear()
+    state.defending = -1
+    state.required_missed = 1
+    state.used_missed = 0
+    state.response = None
+    state.pending = None
+    state.current = seat
+    state.turn_state = TurnState.DRAW
+
+    if player.treasure == PEDRO_RAMIREZ and state.discard:
+        if CARD_SUITS[state.discard[-1]] == Suit.DIAMONDS:
+            player.hand.append(state.discard.pop())
+            ctx.emit(ev.RECORD_SHARD, seat)
+
+    return process_draw_phase(ctx, seat)
+
+
+def process_draw_phase(ctx: Context, seat: int) -> bool:
+    """
+    드로우 단계를 처리합니다 (우선 전표 / 황금 주판 포함).
+
+    Args:
+        ctx: 규칙 컨텍스트
+        seat: 플레이어 좌석
+
+    Returns:
+        처리 성공 여부
+    """
+    state = ctx.state
+    if seat is None or seat < 0 or state.current != seat:
+        return False
+    if state.turn_state != TurnState.DRAW:
+        return False
+    player = state.players[seat]
+    if not player.alive:
+        return False
+
+    if player.treasure == KIT_CARLSON:
+        temp = []
+        for _ in range(3):
+            if not state.deck:
+                reshuffle(ctx)
+                if not state.deck:
+                    break
+            temp.append(state.deck.pop(0))
+        if not temp:
+            return True
+        cards = tuple(temp)
+        state.pending = (PENDING_DRAW_ORDER, seat, cards)
+        state.response = (RESPONSE_DRAW_ORDER, cards)
+        return True
+
+    if player.treasure == BLACK_JACK:
+        first = draw_cards_for_player(ctx, seat, 1)
+        second = draw_cards_for_player(ctx, seat, 1)
+        drawn = first + second
+        if second and CARD_SUITS[second[0]] == Suit.DIAMONDS:
+            extra = draw_cards_for_player(ctx, seat, 1)
+            drawn += extra
+            if extra:
+                ctx.emit(ev.GOLD_ABACUS, seat)
+    else:
+        drawn = draw_cards_for_player(ctx, seat, 2)
+
+    if drawn:
+        ctx.emit(ev.DREW, seat, -1, -1, len(drawn))
+    state.turn_state = TurnState.PLAY_CARD
+    return True
+
+
+def can_end_turn(state: EngineState, seat: int) -> bool:
+    """현재 턴 플레이어가 카드 사용/대응 단계일 때만 턴을 종료할 수 있습니다."""
+    if seat is None or seat < 0 or state.current != seat:
+        return False
+    return state.turn_state in (TurnState.PLAY_CARD, TurnState.RESPOND)
+
+
+def can_play_card(state: EngineState, seat: int) -> bool:
+    """현재 턴 플레이어가 카드 사용 단계이고 생존해 있을 때만 카드를 사용할 수 있습니다."""
+    if seat is None or seat < 0 or state.current != seat:
+        return False
+    if state.turn_state != TurnState.PLAY_CARD:
+        return False
+    return state.players[seat].alive
+
+
+def end_turn(ctx: Context, seat: int) -> bool:
+    """
+    턴을 종료합니다 (손패 제한 초과분을 뒤에서부터 버린 뒤 다음 플레이어로 이동).
+
+    Args:
+        ctx: 규칙 컨텍스트
+        seat: 플레이어 좌석
+
+    Returns:
+        종료 성공 여부
+    """
+    state = ctx.state
+    if not can_end_turn(state, seat):
+        return False
+    player = state.players[seat]
+
+    excess = len(player.hand) - player.hp
+    if excess > 0:
+        dropped = player.hand[-excess:]
+        for card in dropped:
+            player.hand.remove(card)
+        state.discard.extend(dropped)
+        ctx.emit(ev.HAND_LIMIT, seat, -1, -1, len(dropped))
+
+    state.turn_state = TurnState.END_TURN
+    ctx.emit(ev.TURN_END, seat)
+    return move_to_next_player(ctx)
+
+
+def move_to_next_player(ctx: Context) -> bool:
+    """
+    다음 플레이어로 턴을 넘기고 턴을 시작합니다.
+
+    Returns:
+        이동 성공 여부
+    """
+    state = ctx.state
+    if state.current < 0:
+        return False
+    nxt = next_seat(state, state.current)
+    if nxt < 0:
+        return False
+    state.turn_number += 1
+    return start_turn(ctx, nxt)
+
+
+def set_respond_phase(ctx: Context, seat: int, required_missed: int = 1) -> bool:
+    """
+    공격 대응 단계로 전환합니다.
+
+    Args:
+        ctx: 규칙 컨텍스트
+        seat: 대응할 플레이어 좌석
+        required_missed: 필요한 회피 카드 수
+
+    Returns:
+        설정 성공 여부
+    """
+    state = ctx.state
+    if seat is None or seat < 0 or not state.players[seat].alive:
+        return False
+    state.turn_state = TurnState.RESPOND
+    state.defending = seat
+    state.required_missed = max(1, required_missed)
+    state.used_missed = 0
+    state.response = (RESPONSE_ATTACK, seat, state.required_missed, 0)
+    return True
+
+
+def return_to_play_phase(ctx: Context) -> bool:
+    """
+    대응이 끝난 뒤 카드 사용 단계로 돌아갑니다.
+
+    Returns:
+        설정 성공 여부
+    """
+    state = ctx.state
+    if state.current < 0:
+        return False
+    state.turn_state = TurnState.PLAY_CARD
+    state.defending = -1
+    state.required_missed = 1
+    state.used_missed = 0
+    state.response = None
+    state.pending = None
+    return True
+
+
+# ==================== 카드 사용 ====================
+
+def use_card(ctx: Context, seat: int, card: Optional[int], target: Optional[int]) -> Outcome:
+    """
+    손패의 카드를 사용합니다 (카드 타입별 규칙으로 분기).
+
+    Args:
+        ctx: 규칙 컨텍스트
+        seat: 사용자 좌석
+        card: 카드 인덱스
+        target: 대상 좌석
+
+    Returns:
+        처리 결과
+    """
+    state = ctx.state
+    if not can_play_card(state, seat):
+        raise IllegalAction("CANNOT_PLAY")
+    if card is None:
+        raise IllegalAction("CARD_REQUIRED")
+    if card < 0 or card not in state.players[seat].hand:
+        raise IllegalAction("CARD_NOT_FOUND")
+
+    card_type = CARD_TYPES[card]
+    if IS_BANG[card]:
+        return bang(ctx, seat, card, target)
+    if IS_MISSED[card]:
+        # 반전 금화: 회피 카드를 정산처럼 사용
+        if _treasure(state, seat) == CALAMITY_JANET:
+            return bang(ctx, seat, card, target)
+        raise IllegalAction("MISSED_ONLY_RESPONSE")
+    if card_type == CardType.BEER:
+        return beer(ctx, seat, card)
+    if card_type == CardType.PANIC:
+        return panic(ctx, seat, card, target)
+    slot = EQUIP_SLOTS.get(card_type)
+    if slot is not None:
+        return equip(ctx, seat, card, slot)
+    if card_type == CardType.GATLING:
+        return gatling(ctx, seat, card)
+    if card_type == CardType.INDIANS:
+        return indians(ctx, seat, card)
+    if card_type == CardType.DUEL:
+        return duel(ctx, seat, card, target)
+    if card_type == CardType.SALOON:
+        return saloon(ctx, seat, card)
+    if card_type == CardType.GENERAL_STORE:
+        return general_store(ctx, seat, card)
+    raise IllegalAction("NOT_IMPLEMENTED_CARD", card_type.value)
+
+
+def _require_in_hand(state: EngineState, seat: int, card: int) -> None:
+    _require_player(state, seat)
+    if card is None or card < 0 or card not in state.players[seat].hand:
+        raise IllegalAction("CARD_NOT_REMOVABLE")
+
+
+def check_bang(state: EngineState, seat: int, card: int, target: Optional[int]) -> None:
+    """
+    정산 사용 가능 여부를 검증합니다 (대상, 거리, 턴당 사용 횟수).
+
+    Raises:
+        IllegalAction: 사용할 수 없는 경우
+    """
+    if target is None:
+        raise IllegalAction("TARGET_REQUIRED")
+    if seat is None or seat < 0 or target < 0:
+        raise IllegalAction("PLAYER_NOT_FOUND")
+    if not state.players[target].alive:
+        raise IllegalAction("TARGET_DEAD")
+    if seat == target:
+        raise IllegalAction("SELF_TARGET")
+    dist = distance(state, seat, target)
+    reach = effective_range(state, seat)
+    if reach < dist:
+        raise IllegalAction("OUT_OF_RANGE", dist, reach)
+    used = state.attack_counters.get(seat, 0)
+    if used >= 1:
+        if _treasure(state, seat) != WILLY_THE_KID:
+            raise IllegalAction("BANG_LIMIT")
+        if not any(c != card for c in state.players[seat].hand):
+            raise IllegalAction("WILLY_NO_DISCARD")
+
+
+def bang(ctx: Context, seat: int, card: int, target: Optional[int]) -> Outcome:
+    """
+    정산: 대상에게 공격을 시도하고 대응 단계로 전환합니다.
+
+    - 황금 연갑: 두 번째 정산부터 다른 카드 1장을 무작위로 추가로 버림
+    - 낙인 인장: 내 손패가 대상보다 많으면 회피 2장 필요
+    """
+    state = ctx.state
+    check_bang(state, seat, card, target)
+    _require_in_hand(state, seat, card)
+    attacker = state.players[seat]
+    used = state.attack_counters.get(seat, 0)
+
+    if used >= 1:
+        extra = ctx.rng.choice([c for c in attacker.hand if c != card])
+        _discard_from_hand(ctx, seat, extra)
+        ctx.emit(ev.WILLY_DISCARD, seat)
+
+    required = 1
+    if attacker.treasure == SLAB_THE_KILLER:
+        if len(attacker.hand) > len(state.players[target].hand):
+            required = 2
+
+    _discard_from_hand(ctx, seat, card)
+    _suzy(ctx, seat)
+    state.attack_counters[seat] = used + 1
+    ctx.emit(ev.BANG, seat, target)
+    set_respond_phase(ctx, target, required)
+    return Outcome("BANG")
+
+
+def check_beer(state: EngineState, seat: int) -> None:
+    """비상금 사용 가능 여부 (생존자 3명 이상, 재력 미만)"""
+    _require_player(state, seat)
+    if len(alive_seats(state)) <= 2:
+        raise IllegalAction("BEER_LAST_TWO")
+    player = state.players[seat]
+    if player.hp >= player.max_hp:
+        raise IllegalAction("BEER_FULL_HP")
+
+
+def beer(ctx: Context, seat: int, card: int) -> Outcome:
+    """비상금: 재력 1 회복"""
+    check_beer(ctx.state, seat)
+    _require_in_hand(ctx.state, seat, card)
+    _discard_from_hand(ctx, seat, card)
+    _suzy(ctx, seat)
+    old, new = _heal(ctx.state, seat)
+    ctx.emit(ev.BEER, seat, -1, -1, old, new)
+    return Outcome("BEER")
+
+
+def check_panic(state: EngineState, seat: int, card: int, target: Optional[int]) -> None:
+    """강제 압류 사용 가능 여부 (대상, 사거리 1)"""
+    if target is None:
+        raise IllegalAction("PANIC_TARGET_REQUIRED")
+    if seat is None or seat < 0 or target < 0:
+        raise IllegalAction("PLAYER_NOT_FOUND")
+    if not state.players[target].alive:
+        raise IllegalAction("TARGET_DEAD")
+    if seat == target:
+        raise IllegalAction("PANIC_SELF")
+    dist = distance(state, seat, target)
+    if effective_range(state, seat) < dist or dist > CARD_RANGES[card]:
+        raise IllegalAction("PANIC_OUT_OF_RANGE")
+
+
+def panic(ctx: Context, seat: int, card: int, target: Optional[int]) -> Outcome:
+    """
+    강제 압류: 대상 손패에서 무작위 카드 1장 강탈.
+    천청 방울 보유 시 최대 2장을 공개하고 선택 응답을 기다립니다.
+    """
+    state = ctx.state
+    check_panic(state, seat, card, target)
+    _require_in_hand(state, seat, card)
+    _discard_from_hand(ctx, seat, card)
+    _suzy(ctx, seat)
+
+    victim = state.players[target]
+    if not victim.hand:
+        return Outcome("PANIC_EMPTY")
+
+    if _treasure(state, seat) == JESSE_JAMES:
+        candidates = tuple(ctx.rng.sample(victim.hand, min(2, len(victim.hand))))
+        state.pending = (PENDING_STEAL, seat, target, candidates)
+        state.response = (RESPONSE_STEAL, target, candidates)
+        ctx.emit(ev.PANIC_SELECT, seat)
+        return Outcome("PANIC_SELECT")
+
+    stolen = ctx.rng.choice(victim.hand)
+    victim.hand.remove(stolen)
+    state.players[seat].hand.append(stolen)
+    ctx.emit(ev.PANIC_STEAL, seat, target)
+    return Outcome("PANIC_STEAL")
+
+
+def equip(ctx: Context, seat: int, card: int, slot: str) -> Outcome:
+    """무기/장착 카드 장착 (같은 슬롯의 기존 카드는 버림)"""
+    state = ctx.state
+    _require_in_hand(state, seat, card)
+    player = state.players[seat]
+    player.hand.remove(card)
+    old = player.equipment.get(slot)
+    player.equipment[slot] = card
+    if old is not None:
+        state.discard.append(old)
+    _suzy(ctx, seat)
+    ctx.emit(ev.EQUIP, seat, -1, card)
+    return Outcome("EQUIP", (card,))
+
+
+def gatling(ctx: Context, seat: int, card: int) -> Outcome:
+    """전원 견제: 다른 모든 플레이어가 회피 카드를 자동 사용하거나 피해 1"""
+    state = ctx.state
+    _require_in_hand(state, seat, card)
+    _discard_from_hand(ctx, seat, card)
+    _suzy(ctx, seat)
+
+    for target in [s for s in alive_seats(state) if s != seat]:
+        victim = state.players[target]
+        if not victim.alive:
+            continue
+        calamity = victim.treasure == CALAMITY_JANET
+        dodge = next(
+            (c for c in victim.hand if IS_MISSED[c] or (calamity and IS_BANG[c])),
+            None,
+        )
+        if dodge is not None:
+            _discard_from_hand(ctx, target, dodge)
+            _suzy(ctx, target)
+            ctx.emit(ev.GATLING_DODGE, target)
+            continue
+        _damage(ctx, target, ev.CAUSE_GATLING)
+
+    ctx.emit(ev.GATLING, seat)
+    return Outcome("GATLING")
+
+
+def indians(ctx: Context, seat: int, card: int) -> Outcome:
+    """패거리 습격: 다른 모든 플레이어가 정산 카드를 자동으로 버리거나 피해 1"""
+    state = ctx.state
+    _require_in_hand(state, seat, card)
+    _discard_from_hand(ctx, seat, card)
+    _suzy(ctx, seat)
+
+    for target in [s for s in alive_seats(state) if s != seat]:
+        victim = state.players[target]
+        if not victim.alive:
+            continue
+        defend = next((c for c in victim.hand if IS_BANG[c]), None)
+        if defend is not None:
+            _discard_from_hand(ctx, target, defend)
+            _suzy(ctx, target)
+            ctx.emit(ev.INDIANS_DEFEND, target)
+            continue
+        _damage(ctx, target, ev.CAUSE_INDIANS)
+
+    ctx.emit(ev.INDIANS, seat)
+    return Outcome("INDIANS")
+
+
+def check_duel(state: EngineState, seat: int, target: Optional[int]) -> None:
+    """승부 사용 가능 여부 (생존한 다른 대상)"""
+    if target is None:
+        raise IllegalAction("DUEL_TARGET_REQUIRED")
+    if seat is None or seat < 0 or target < 0:
+        raise IllegalAction("PLAYER_NOT_FOUND")
+    if not state.players[target].alive or not state.players[seat].alive:
+        raise IllegalAction("DUEL_DEAD")
+    if seat == target:
+        raise IllegalAction("DUEL_SELF")
+
+
+def duel(ctx: Context, seat: int, card: int, target: Optional[int]) -> Outcome:
+    """승부: 대상부터 번갈아 정산을 버리고, 먼저 내지 못한 쪽이 피해 1"""
+    state = ctx.state
+    check_duel(state, seat, target)
+    _require_in_hand(state, seat, card)
+    _discard_from_hand(ctx, seat, card)
+    _suzy(ctx, seat)
+
+    current, opponent = target, seat
+    while True:
+        hand = state.players[current].hand
+        answer = next((c for c in hand if IS_BANG[c]), None)
+        if answer is None:
+            _damage(ctx, current, ev.CAUSE_DUEL)
+            break
+        _discard_from_hand(ctx, current, answer)
+        _suzy(ctx, current)
+        ctx.emit(ev.DUEL_BANG, current)
+        current, opponent = opponent, current
+
+    ctx.emit(ev.DUEL, seat, target)
+    return Outcome("DUEL")
+
+
+def saloon(ctx: Context, seat: int, card: int) -> Outcome:
+    """공개 연회: 생존 플레이어 전원 재력 1 회복"""
+    state = ctx.state
+    _require_in_hand(state, seat, card)
+    _discard_from_hand(ctx, seat, card)
+    _suzy(ctx, seat)
+
+    healed = False
+    for target in alive_seats(state):
+        player = state.players[target]
+        if player.hp < player.max_hp:
+            old, new = _heal(state, target)
+            healed = True
+            ctx.emit(ev.SALOON_HEAL, target, -1, -1, old, new)
+
+    ctx.emit(ev.SALOON, seat)
+    return Outcome("SALOON" if healed else "SALOON_NONE")
+
+
+def general_store(ctx: Context, seat: int, card: int) -> Outcome:
+    """
+    자선 경매: 생존자 수만큼 카드를 공개하고,
+    현재 플레이어부터 시계 방향으로 1장씩 선택합니다.
+    """
+    state = ctx.state
+    _require_in_hand(state, seat, card)
+    _discard_from_hand(ctx, seat, card)
+    _suzy(ctx, seat)
+
+    alive = alive_seats(state)
+    if not alive:
+        ctx.emit(ev.GS_NO_PLAYERS, seat)
+        return Outcome("GS_NO_PLAYERS")
+
+    pool = tuple(_draw_many(state, len(alive)))
+    if not pool:
+        ctx.emit(ev.GS_EMPTY, seat)
+        return Outcome("GS_EMPTY")
+
+    order: List[int] = []
+    current = state.current if state.current >= 0 else seat
+    visited = set()
+    while current >= 0 and current not in visited and len(order) < len(alive):
+        if state.players[current].alive:
+            order.append(current)
+        visited.add(current)
+        nxt = next_seat(state, current)
+        if nxt < 0:
+            break
+        current = nxt
+
+    state.pending = (PENDING_GENERAL_STORE, pool, tuple(order), 0)
+    state.response = (RESPONSE_GENERAL_STORE, order[0], pool)
+    ctx.emit(ev.GS, seat)
+    return Outcome("GS")
+
+
+def general_store_pick(ctx: Context, seat: int, card: Optional[int]) -> Outcome:
+    """자선 경매 공개 카드 중 1장을 선택합니다."""
+    state = ctx.state
+    pending = state.pending
+    if not pending or pending[0] != PENDING_GENERAL_STORE:
+        raise IllegalAction("NO_GENERAL_STORE")
+    _, remaining, order, index = pending
+    if index >= len(order):
+        raise IllegalAction("NO_PICK_TURN")
+    if order[index] != seat:
+        raise IllegalAction("NOT_YOUR_PICK")
+    if card is None:
+        raise IllegalAction("PICK_CARD_REQUIRED")
+    if card not in remaining:
+        raise IllegalAction("PICK_CARD_INVALID")
+    _require_player(state, seat)
+
+    rest = list(remaining)
+    rest.remove(card)
+    state.players[seat].hand.append(card)
+    ctx.emit(ev.GS_PICK, seat, -1, card)
+
+    index += 1
+    if index < len(order) and rest:
+        pool = tuple(rest)
+        state.pending = (PENDING_GENERAL_STORE, pool, order, index)
+        state.response = (RESPONSE_GENERAL_STORE, order[index], pool)
+    else:
+        state.pending = None
+        state.response = None
+    return Outcome("GS_PICK")
+
+
+# ==================== 공격 대응 ====================
+
+def check_respond(state: EngineState, seat: int, card: Optional[int]) -> None:
+    """회피 카드로 대응 가능 여부 (반전 금화는 정산도 허용)"""
+    if state.turn_state != TurnState.RESPOND:
+        raise IllegalAction("CANNOT_RESPOND")
+    _require_player(state, seat)
+    if card is None:
+        raise IllegalAction("CARD_REQUIRED")
+    player = state.players[seat]
+    if card < 0 or card not in player.hand:
+        raise IllegalAction("CARD_NOT_FOUND")
+    if not IS_MISSED[card] and not (player.treasure == CALAMITY_JANET and IS_BANG[card]):
+        raise IllegalAction("MISSED_REQUIRED")
+
+
+def respond_attack(ctx: Context, seat: int, card: Optional[int]) -> Outcome:
+    """회피 카드로 공격에 대응합니다 (낙인 인장이면 여러 장 필요)."""
+    state = ctx.state
+    check_respond(state, seat, card)
+    _discard_from_hand(ctx, seat, card)
+
+    state.used_missed += 1
+    required = max(1, state.required_missed)
+    used = state.used_missed
+    if used < required:
+        if state.defending == seat:
+            state.response = (RESPONSE_ATTACK, seat, required, used)
+        ctx.emit(ev.RESPOND_PARTIAL, seat)
+        return Outcome("RESPOND_PARTIAL")
+
+    ctx.emit(ev.RESPOND_DODGE, seat)
+    if state.current >= 0:
+        return_to_play_phase(ctx)
+    return Outcome("RESPOND_DODGE")
+
+
+def respond_attack_failed(ctx: Context, seat: int) -> Outcome:
+    """
+    회피 카드 없이 공격을 받습니다.
+
+    신의 한 수 / 비단 갑옷 판정, 이중 장부 드로우, 응징의 패 역강탈을 처리합니다.
+    """
+    state = ctx.state
+    if state.turn_state != TurnState.RESPOND:
+        raise IllegalAction("CANNOT_RESPOND")
+    _require_player(state, seat)
+    player = state.players[seat]
+
+    if "barrel" in player.equipment:
+        if _judgement(ctx, seat, Suit.HEARTS):
+            ctx.emit(ev.BARREL_DODGE, seat)
+            if state.current >= 0:
+                return_to_play_phase(ctx)
+            return Outcome("BARREL_DODGE")
+
+    if player.treasure == JOURDONNAIS:
+        if _judgement(ctx, seat, Suit.SPADES):
+            if draw_cards_for_player(ctx, seat, 1):
+                ctx.emit(ev.SILK_DODGE, seat)
+            if state.current >= 0:
+                return_to_play_phase(ctx)
+            return Outcome("SILK_DODGE")
+        ctx.emit(ev.SILK_FAIL, seat)
+
+    _damage(ctx, seat, ev.CAUSE_BANG)
+
+    if player.treasure == BART_CASSIDY:
+        counters = state.treasure_counters.setdefault(seat, {})
+        if counters.get("_turn") != state.turn_number:
+            counters["_turn"] = state.turn_number
+            counters["bart_damage_triggers"] = 0
+        used = counters.get("bart_damage_triggers", 0)
+        if used < 2 and draw_cards_for_player(ctx, seat, 1):
+            counters["bart_damage_triggers"] = used + 1
+            ctx.emit(ev.BART_DRAW, seat)
+
+    attacker = state.current
+    if player.treasure == EL_GRINGO and attacker >= 0 and state.players[attacker].hand:
+        source = state.players[attacker].hand
+        stolen = ctx.rng.choice(source)
+        source.remove(stolen)
+        player.hand.append(stolen)
+        ctx.emit(ev.GRINGO_STEAL, seat, attacker)
+
+    if state.current >= 0:
+        return_to_play_phase(ctx)
+    return Outcome("HIT")
+
+
+# ==================== 보물 / 선택 응답 ====================
+
+def check_use_treasure(
+    state: EngineState,
+    seat: int,
+    name: Optional[str],
+    cards: Tuple[Optional[int], ...],
+) -> None:
+    """생명 장부 사용 가능 여부 (서로 다른 문양 2장)"""
+    _require_player(state, seat)
+    player = state.players[seat]
+    if name != SID_KETCHUM or player.treasure != SID_KETCHUM:
+        raise IllegalAction("SID_ONLY")
+    if len(cards) != 2:
+        raise IllegalAction("SID_TWO_SUITS")
+    for card in cards:
+        if card is None or card < 0 or card not in player.hand:
+            raise IllegalAction("SID_CARD_NOT_FOUND")
+        if not CARD_SUITS[card]:
+            raise IllegalAction("SID_NO_SUIT")
+    if CARD_SUITS[cards[0]] == CARD_SUITS[cards[1]]:
+        raise IllegalAction("SID_TWO_SUITS")
+
+
+def use_treasure(
+    ctx: Context,
+    seat: int,
+    name: Optional[str],
+    cards: Tuple[Optional[int], ...],
+) -> Outcome:
+    """생명 장부: 서로 다른 문양 카드 2장을 버리고 재력 1 회복"""
+    state = ctx.state
+    check_use_treasure(state, seat, name, cards)
+    hand = state.players[seat].hand
+    for card in cards:
+        hand.remove(card)
+    state.discard.extend(cards)
+    _suzy(ctx, seat)
+    old, new = _heal(state, seat)
+    ctx.emit(ev.SID, seat, -1, -1, old, new)
+    return Outcome("SID")
+
+
+def select_steal_card(ctx: Context, seat: int, card: Optional[int]) -> Outcome:
+    """천청 방울: 대상 손패에서 강탈할 카드를 선택합니다."""
+    state = ctx.state
+    pending = state.pending
+    if not pending or pending[0] != PENDING_STEAL:
+        raise IllegalAction("NO_STEAL")
+    _, attacker, target, _cards = pending
+    if attacker != seat:
+        raise IllegalAction("STEAL_FORBIDDEN")
+    if card is None:
+        raise IllegalAction("PICK_CARD_REQUIRED")
+    _require_player(state, seat)
+    victim = state.players[target]
+    if card < 0 or card not in victim.hand:
+        raise IllegalAction("STEAL_CARD_MISSING")
+
+    victim.hand.remove(card)
+    state.players[seat].hand.append(card)
+    state.pending = None
+    state.response = None
+    ctx.emit(ev.STEAL_SELECT, seat, target)
+    return Outcome("STEAL_SELECT")
+
+
+def select_draw_order(
+    ctx: Context,
+    seat: int,
+    take: Optional[int],
+    top: Optional[int],
+    bottom: Optional[int],
+) -> Outcome:
+    """우선 전표: 1장 획득, 1장 덱 맨 위, 1장 덱 맨 아래 배치"""
+    state = ctx.state
+    pending = state.pending
+    if not pending or pending[0] != PENDING_DRAW_ORDER:
+        raise IllegalAction("NO_DRAW_ORDER")
+    _, owner, cards = pending
+    if owner != seat:
+        raise IllegalAction("DRAW_ORDER_FORBIDDEN")
+    if take is None or top is None or bottom is None:
+        raise IllegalAction("DRAW_ORDER_IDS_REQUIRED")
+    if take not in cards or top not in cards or bottom not in cards:
+        raise IllegalAction("PICK_CARD_INVALID")
+    if len({take, top, bottom}) != len(cards):
+        raise IllegalAction("DRAW_ORDER_DUPLICATE")
+    _require_player(state, seat)
+
+    state.players[seat].hand.append(take)
+    state.deck.insert(0, top)
+    state.deck.append(bottom)
+    state.pending = None
+    state.response = None
+    ctx.emit(ev.DRAW_ORDER, seat)
+    state.turn_state = TurnState.PLAY_CARD
+    return Outcome("DRAW_ORDER")
+
+
+def handle_end_turn(ctx: Context, seat: int) -> Outcome:
+    """턴 종료 액션 (성공 시 턴 종료 알림을 한 번 더 남깁니다)."""
+    if not can_end_turn(ctx.state, seat):
+        raise IllegalAction("CANNOT_END_TURN")
+    if end_turn(ctx, seat):
+        ctx.emit(ev.TURN_END, seat)
+        return Outcome("END_TURN")
+    return Outcome("END_TURN_FAILED", success=False)
+
+
+# ==================== 액션 적용 ====================
+
+def perform(ctx: Context, action: Action) -> Outcome:
+    """
+    액션을 컨텍스트의 상태에 제자리 적용합니다.
+
+    Args:
+        ctx: 규칙 컨텍스트
+        action: 엔진 액션
+
+    Returns:
+        처리 결과
+
+    Raises:
+        IllegalAction: 허용되지 않는 액션 (상태는 변경되지 않음)
+    """
+    state = ctx.state
+    kind = action.kind
+    seat = action.player
+
+    if kind == GIVE_UP:
+        return respond_attack_failed(ctx, seat)
+
+    if state.status != GameState.IN_PROGRESS:
+        raise IllegalAction("NOT_IN_PROGRESS")
+    if seat is None or seat < 0 or not state.players[seat].alive:
+        raise IllegalAction("PLAYER_UNAVAILABLE")
+
+    if kind == ActionType.USE_CARD:
+        return use_card(ctx, seat, action.card, action.target)
+    if kind == ActionType.RESPOND_ATTACK:
+        return respond_attack(ctx, seat, action.card)
+    if kind == ActionType.END_TURN:
+        return handle_end_turn(ctx, seat)
+    if kind == ActionType.USE_TREASURE:
+        return use_treasure(ctx, seat, action.name, action.cards)
+    if kind == ActionType.SELECT_STEAL_CARD:
+        return select_steal_card(ctx, seat, action.card)
+    if kind == ActionType.SELECT_DRAW_ORDER:
+        take, top, bottom = (tuple(action.cards) + (None, None, None))[:3]
+        return select_draw_order(ctx, seat, take, top, bottom)
+    if kind == ActionType.GENERAL_STORE_PICK:
+        return general_store_pick(ctx, seat, action.card)
+    if kind == START_TURN:
+        started = start_turn(ctx, seat)
+        return Outcome(START_TURN, success=started)
+    raise IllegalAction("UNSUPPORTED_ACTION", kind)
+
+
+def apply(state: EngineState, action: Action, rng: Any = random) -> Transition:
+    """
+    상태를 복제한 뒤 액션을 적용합니다 (원본 상태는 변경되지 않음).
+
+    Args:
+        state: 현재 상태
+        action: 엔진 액션
+        rng: 난수 생성기 (shuffle / choice / sample 제공)
+
+    Returns:
+        Transition(새 상태, 이벤트 목록, 처리 결과)
+
+    Raises:
+        IllegalAction: 허용되지 않는 액션
+    """
+    ctx = Context(state.clone(), rng)
+    outcome = perform(ctx, action)
+    return Transition(ctx.state, ctx.events, outcome)
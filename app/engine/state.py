@@ -0,0 +1,315 @@
+"""
+엔진 상태 (Engine State)
+
+pydantic 모델 대신 슬롯 기반의 간결한 상태 표현을 사용합니다.
+플레이어는 좌석 인덱스(int), 카드는 카탈로그 인덱스(int)로 참조하므로
+복제(clone)와 스냅샷이 저렴합니다.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from app.utils.constants import GameState, Role as RoleEnum, TurnState
+
+SNAPSHOT_VERSION = 1
+
+# pending / response 튜플의 첫 번째 원소 (종류)
+PENDING_DRAW_ORDER = "SELECT_DRAW_ORDER"  # (kind, seat, cards)
+PENDING_STEAL = "SELECT_STEAL_CARD"  # (kind, attacker, target, cards)
+PENDING_GENERAL_STORE = "GENERAL_STORE"  # (kind, remaining, order, current_index)
+
+RESPONSE_ATTACK = "RESPOND_ATTACK"  # (kind, target, required, used)
+RESPONSE_DRAW_ORDER = "SELECT_DRAW_ORDER"  # (kind, cards)
+RESPONSE_STEAL = "SELECT_STEAL_CARD"  # (kind, target, cards)
+RESPONSE_GENERAL_STORE = "GENERAL_STORE_PICK"  # (kind, picker, cards)
+
+
+class PlayerState:
+    """
+    플레이어 상태
+
+    hand는 카드 인덱스 리스트, equipment는 슬롯 -> 카드 인덱스 (삽입 순서 유지)입니다.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "role",
+        "hp",
+        "max_hp",
+        "base_range",
+        "hand",
+        "equipment",
+        "treasure",
+        "alive",
+        "position",
+        "is_bot",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        role: RoleEnum,
+        hp: int,
+        max_hp: int,
+        base_range: int,
+        hand: List[int],
+        equipment: Dict[str, int],
+        treasure: Optional[str],
+        alive: bool,
+        position: int,
+        is_bot: bool = False,
+    ):
+        self.id = id
+        self.name = name
+        self.role = role
+        self.hp = hp
+        self.max_hp = max_hp
+        self.base_range = base_range
+        self.hand = hand
+        self.equipment = equipment
+        self.treasure = treasure
+        self.alive = alive
+        self.position = position
+        self.is_bot = is_bot
+
+    def clone(self) -> "PlayerState":
+        """손패/장착만 새로 복사한 플레이어 상태를 반환합니다."""
+        return PlayerState(
+            self.id,
+            self.name,
+            self.role,
+            self.hp,
+            self.max_hp,
+            self.base_range,
+            list(self.hand),
+            dict(self.equipment),
+            self.treasure,
+            self.alive,
+            self.position,
+            self.is_bot,
+        )
+
+    def snapshot(self) -> Tuple:
+        """불변 튜플 스냅샷을 반환합니다."""
+        role = self.role.value if hasattr(self.role, "value") else self.role
+        return (
+            self.id,
+            self.name,
+            role,
+            self.hp,
+            self.max_hp,
+            self.base_range,
+            tuple(self.hand),
+            tuple(self.equipment.items()),
+            self.treasure,
+            self.alive,
+            self.position,
+            self.is_bot,
+        )
+
+    @classmethod
+    def from_snapshot(cls, snap: Tuple) -> "PlayerState":
+        """스냅샷 튜플로부터 플레이어 상태를 복원합니다."""
+        (pid, name, role, hp, max_hp, base_range, hand, equipment,
+         treasure, alive, position, is_bot) = snap
+        return cls(
+            pid,
+            name,
+            RoleEnum(role),
+            hp,
+            max_hp,
+            base_range,
+            list(hand),
+            {slot: idx for slot, idx in equipment},
+            treasure,
+            alive,
+            position,
+            is_bot,
+        )
+
+    def __repr__(self) -> str:
+        return f"PlayerState(id={self.id}, hp={self.hp}/{self.max_hp}, hand={len(self.hand)})"
+
+
+class EngineState:
+    """
+    게임 규칙 엔진 상태
+
+    - players: 좌석 순서의 PlayerState 목록 (seat_of로 ID -> 좌석 조회)
+    - deck / discard: 카드 인덱스 리스트 (deck[0]이 맨 위)
+    - current / defending: 좌석 인덱스 (없으면 -1)
+    - response: 클라이언트에 요청할 응답 (required_response의 구조화 표현)
+    - pending: 선택 응답이 필요한 액션의 내부 컨텍스트
+    """
+
+    __slots__ = (
+        "game_id",
+        "status",
+        "players",
+        "seat_of",
+        "deck",
+        "discard",
+        "current",
+        "turn_state",
+        "turn_number",
+        "attack_counters",
+        "treasure_counters",
+        "defending",
+        "required_missed",
+        "used_missed",
+        "response",
+        "pending",
+    )
+
+    def __init__(
+        self,
+        game_id: str,
+        players: List[PlayerState],
+        status: GameState = GameState.WAITING,
+        deck: Optional[List[int]] = None,
+        discard: Optional[List[int]] = None,
+        current: int = -1,
+        turn_state: TurnState = TurnState.DRAW,
+        turn_number: int = 0,
+        attack_counters: Optional[Dict[int, int]] = None,
+        treasure_counters: Optional[Dict[int, Dict[str, int]]] = None,
+        defending: int = -1,
+        required_missed: int = 1,
+        used_missed: int = 0,
+        response: Optional[Tuple] = None,
+        pending: Optional[Tuple] = None,
+        seat_of: Optional[Dict[str, int]] = None,
+    ):
+        self.game_id = game_id
+        self.status = status
+        self.players = players
+        self.seat_of = seat_of if seat_of is not None else {
+            p.id: i for i, p in enumerate(players)
+        }
+        self.deck = deck if deck is not None else []
+        self.discard = discard if discard is not None else []
+        self.current = current
+        self.turn_state = turn_state
+        self.turn_number = turn_number
+        self.attack_counters = attack_counters if attack_counters is not None else {}
+        self.treasure_counters = treasure_counters if treasure_counters is not None else {}
+        self.defending = defending
+        self.required_missed = required_missed
+        self.used_missed = used_missed
+        self.response = response
+        self.pending = pending
+
+    def seat(self, player_id: Optional[str]) -> int:
+        """
+        플레이어 ID의 좌석 인덱스를 반환합니다.
+
+        Args:
+            player_id: 플레이어 ID
+
+        Returns:
+            좌석 인덱스 (없으면 -1)
+        """
+        if player_id is None:
+            return -1
+        return self.seat_of.get(player_id, -1)
+
+    def clone(self) -> "EngineState":
+        """
+        독립적으로 변경 가능한 복제본을 반환합니다.
+
+        카드/플레이어 정적 정보와 튜플(pending, response)은 공유하고
+        리스트/딕셔너리만 복사합니다.
+        """
+        return EngineState(
+            self.game_id,
+            [p.clone() for p in self.players],
+            self.status,
+            list(self.deck),
+            list(self.discard),
+            self.current,
+            self.turn_state,
+            self.turn_number,
+            dict(self.attack_counters),
+            {seat: dict(c) for seat, c in self.treasure_counters.items()},
+            self.defending,
+            self.required_missed,
+            self.used_missed,
+            self.response,
+            self.pending,
+            self.seat_of,
+        )
+
+    def snapshot(self) -> Tuple:
+        """
+        불변(해시 가능) 튜플 스냅샷을 반환합니다.
+
+        Enum은 값 문자열로 저장하므로 그대로 JSON/pickle 직렬화할 수 있습니다.
+        """
+        return (
+            SNAPSHOT_VERSION,
+            self.game_id,
+            _value(self.status),
+            tuple(p.snapshot() for p in self.players),
+            tuple(self.deck),
+            tuple(self.discard),
+            self.current,
+            _value(self.turn_state),
+            self.turn_number,
+            tuple(sorted(self.attack_counters.items())),
+            tuple(
+                (seat, tuple(c.items()))
+                for seat, c in sorted(self.treasure_counters.items())
+            ),
+            self.defending,
+            self.required_missed,
+            self.used_missed,
+            self.response,
+            self.pending,
+        )
+
+    @classmethod
+    def from_snapshot(cls, snap: Any) -> "EngineState":
+        """
+        스냅샷으로부터 상태를 복원합니다.
+
+        JSON 왕복으로 튜플이 리스트가 된 경우도 허용합니다.
+        """
+        (version, game_id, status, players, deck, discard, current, turn_state,
+         turn_number, attack_counters, treasure_counters, defending,
+         required_missed, used_missed, response, pending) = snap
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 버전: {version}")
+        return cls(
+            game_id,
+            [PlayerState.from_snapshot(p) for p in players],
+            GameState(status),
+            list(deck),
+            list(discard),
+            current,
+            TurnState(turn_state),
+            turn_number,
+            {seat: n for seat, n in attack_counters},
+            {seat: {k: v for k, v in items} for seat, items in treasure_counters},
+            defending,
+            required_missed,
+            used_missed,
+            _freeze(response),
+            _freeze(pending),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"EngineState(game_id={self.game_id}, status={_value(self.status)}, "
+            f"turn={self.turn_number}, current={self.current})"
+        )
+
+
+def _value(v: Any) -> Any:
+    return v.value if hasattr(v, "value") else v
+
+
+def _freeze(obj: Any) -> Any:
+    """리스트를 재귀적으로 튜플로 바꿉니다 (JSON 복원 대응)."""
+    if isinstance(obj, list):
+        return tuple(_freeze(x) for x in obj)
+    return obj
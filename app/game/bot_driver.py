@@ -0,0 +1,357 @@
+"""
+봇 드라이버 (Bot Driver)
+
+AI 플레이어(is_bot)가 행동할 차례(턴 / 공격 대응 / 선택 요청)가 되면 대신 행동합니다.
+
+- GameManager가 게임을 저장할 때마다 sync()로 행동할 봇이 있는지 확인하고,
+  생각 시간(think time) 뒤로 결정을 예약합니다 (TimerScheduler 하나로 모든 봇 좌석을 관리).
+- 결정(app.ai.choose_action)은 이벤트 루프 밖의 워커 풀에서 계산합니다.
+  배치 모드(batch=True)에서는 같은 틱에 만기가 된 결정을 모아 워커 호출 한 번으로
+  결정합니다 (app.ai.choose_actions).
+- hard 봇의 카드 사용 결정은 프로세스 풀에서 시간 예산을 둔 ISMCTS(app.ai.ismcts)로 계산하고,
+  예산 + 여유 시간 안에 답이 없으면 medium 휴리스틱으로 대신합니다.
+- 결정한 액션은 클라이언트와 같은 경로(MessageHandler.apply_player_action)로 적용합니다.
+
+드로우 단계는 턴 타이머가 바로 처리하므로 여기서는 다루지 않습니다.
+"""
+
+import asyncio
+import multiprocessing
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.ai import ismcts
+from app.ai.policy import choose_action, choose_actions, difficulty_of
+from app.engine.legal import PHASE_DRAW, acting_phase
+from app.game import engine_bridge
+from app.game.card_manager import CardManager
+from app.game.game_manager import GameManager
+from app.game.legal_actions import to_client_action
+from app.models.game import Game
+from app.utils.scheduler import TimerScheduler
+
+# 결정 키: (좌석, 상태 버전) - 봇이 한 번 행동할 때마다 버전이 바뀌어 다음 결정을 예약
+DecisionKey = Tuple[int, int]
+
+# 탐색 결과를 기다리는 여유 시간 (프로세스 간 전달 / 풀 대기, 초)
+SEARCH_GRACE = 0.2
+
+
+class BotDriver:
+    """
+    봇 드라이버 클래스
+
+    apply_action(game_id, player_id, action)은 PLAYER_ACTION의 action 딕셔너리를 받아
+    결과 딕셔너리({"success", "message", ...})를 돌려주는 코루틴 함수입니다.
+    """
+
+    def __init__(
+        self,
+        game_manager: GameManager,
+        apply_action: Callable[[str, str, Dict], Awaitable[Dict]],
+        think_time: Tuple[float, float] = (0.8, 2.0),
+        workers: int = 4,
+        executor: Optional[Executor] = None,
+        search_workers: int = 0,
+        search_budget: float = 0.3,
+        batch: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            game_manager: 게임 매니저
+            apply_action: 액션 적용 코루틴 함수 (MessageHandler.apply_player_action)
+            think_time: 결정 전 대기 시간 범위 (초, 최소 / 최대)
+            workers: 결정 계산용 워커 스레드 수 (executor를 주면 무시)
+            executor: 결정 계산에 사용할 실행기 (주면 stop()이 닫지 않음)
+            search_workers: hard 봇 탐색용 프로세스 수 (0이면 hard도 medium 휴리스틱 사용)
+            search_budget: hard 봇 결정 하나의 탐색 시간 예산 (초)
+            batch: 같은 틱에 만기가 된 휴리스틱 결정을 모아 한 번에 계산할지 여부
+            clock: 현재 시각 함수
+        """
+        self.game_manager = game_manager
+        self.apply_action = apply_action
+        self.think_time = think_time
+        self.workers = workers
+        self._owns_executor = executor is None
+        self.executor = executor if executor is not None else self._new_executor()
+        self.search_budget = search_budget
+        self.search_workers = search_workers
+        self.search_executor = self._new_search_executor()
+        self.batch = batch
+        self.scheduler = TimerScheduler(self._decide, clock=clock)
+        # 이번 틱에 모인 배치 결정 (게임 ID, 결정 키)
+        self._pending: List[Tuple[str, DecisionKey]] = []
+        # 게임 ID -> 예약된 결정 키
+        self._keys: Dict[str, DecisionKey] = {}
+        # 생각 시간 추첨용 (게임 난수 흐름과 분리)
+        self._pacing = random.Random()
+        self.decisions = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.decide_seconds = 0.0
+        self.searches = 0
+        self.search_timeouts = 0
+        self.search_skipped = 0
+        self.search_busy = 0
+        self.search_iterations = 0
+        self.search_seconds = 0.0
+        self.search_max_depth = 0
+        self.batches = 0
+        self.batched = 0
+        self.max_batch = 0
+
+    def _new_executor(self) -> Executor:
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bot")
+
+    def _new_search_executor(self) -> Optional[Executor]:
+        if self.search_workers <= 0:
+            return None
+        # fork는 이벤트 루프 / 워커 스레드를 복제하므로 spawn 사용
+        return ProcessPoolExecutor(
+            max_workers=self.search_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def sync(self, game: Game, card_manager: Optional[CardManager] = None) -> None:
+        """
+        행동할 차례인 봇이 있으면 결정을 예약하고, 없으면 예약을 취소합니다.
+
+        Args:
+            game: Game 인스턴스
+            card_manager: 게임의 CardManager
+        """
+        game_id = game.id
+        state = engine_bridge.load_state(game, card_manager)
+        acting = acting_phase(state)
+        if acting is None or acting[0] == PHASE_DRAW or not state.players[acting[1]].is_bot:
+            self.cancel(game_id)
+            return
+        key = (acting[1], game.version)
+        if self._keys.get(game_id) == key:
+            return
+        self._keys[game_id] = key
+        low, high = self.think_time
+        delay = self._pacing.uniform(low, high) if high > low else low
+        self.scheduler.arm(game_id, self.scheduler.clock() + delay, key)
+
+    def cancel(self, game_id: str) -> None:
+        """
+        게임의 예약된 결정을 취소합니다.
+
+        Args:
+            game_id: 게임 ID
+        """
+        self.scheduler.cancel(game_id)
+        self._keys.pop(game_id, None)
+
+    def _decide(self, game_id: str, key: DecisionKey) -> Optional[Awaitable[Any]]:
+        if self._keys.get(game_id) != key:
+            return None
+        del self._keys[game_id]
+        if not self.batch:
+            return self.act(game_id, key)
+        self._pending.append((game_id, key))
+        # 틱의 첫 결정만 배치 태스크를 만들고, 태스크가 돌 때까지 같은 틱의 결정이 모임
+        return self.act_batch() if len(self._pending) == 1 else None
+
+    def _prepare(self, game_id: str, key: DecisionKey) -> Optional[Tuple[Game, Any, int, str]]:
+        """결정에 필요한 (게임, 엔진 상태, 난수 시드, 난이도)를 만듭니다 (이미 상태가 바뀌었으면 None)."""
+        seat, version = key
+        game = self.game_manager.games.get(game_id)
+        if game is None or game.version != version:
+            return None
+        state = engine_bridge.load_state(game, self.game_manager.card_managers[game_id])
+        seed = hash((game.seed, version, seat)) & 0xFFFFFFFF
+        return game, state, seed, difficulty_of(state.players[seat].name)
+
+    async def _apply(self, game_id: str, key: DecisionKey, game: Game, state: Any, action: Any) -> Optional[Dict]:
+        """계산한 결정을 적용합니다 (계산하는 동안 상태가 바뀌었으면 버림)."""
+        if action is None or game.version != key[1] or self.game_manager.games.get(game_id) is not game:
+            return None
+        result = await self.apply_action(game_id, state.players[key[0]].id, to_client_action(state, action))
+        self.decisions += 1
+        if not result.get("success"):
+            # 실패하면 다음 상태 변화(또는 턴 타이머의 기본 액션)까지 기다림
+            self.failures += 1
+        return result
+
+    async def act(self, game_id: str, key: DecisionKey) -> Optional[Dict]:
+        """
+        예약된 봇 결정을 계산해 적용합니다.
+
+        결정을 계산하는 동안 게임 상태가 바뀌었으면 (다른 플레이어 / 타이머가 먼저 행동) 버립니다.
+
+        Args:
+            game_id: 게임 ID
+            key: 예약할 때의 (좌석, 상태 버전)
+
+        Returns:
+            액션 처리 결과 (적용하지 않았으면 None)
+        """
+        prepared = self._prepare(game_id, key)
+        if prepared is None:
+            return None
+        return await self._act_prepared(game_id, key, *prepared)
+
+    async def _act_prepared(
+        self, game_id: str, key: DecisionKey, game: Game, state: Any, seed: int, difficulty: str
+    ) -> Optional[Dict]:
+        seat = key[0]
+
+        started = time.perf_counter()
+        self.in_flight += 1
+        try:
+            if difficulty == "hard" and self.search_executor is not None:
+                action = await self._search(state, seat, seed)
+            else:
+                action = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, choose_action, state, seat, difficulty, random.Random(seed)
+                )
+        finally:
+            self.in_flight -= 1
+            self.decide_seconds += time.perf_counter() - started
+        return await self._apply(game_id, key, game, state, action)
+
+    async def act_batch(self) -> List[Optional[Dict]]:
+        """
+        이번 틱에 모인 결정을 워커 호출 한 번으로 계산해 적용합니다.
+
+        hard 봇의 탐색 결정은 배치에 넣지 않고 act()로 따로 처리합니다.
+
+        Returns:
+            결정 순서대로의 액션 처리 결과 (적용하지 않았으면 None)
+        """
+        pending, self._pending = self._pending, []
+        jobs = []
+        searches = []
+        for game_id, key in pending:
+            prepared = self._prepare(game_id, key)
+            if prepared is None:
+                continue
+            if prepared[3] == "hard" and self.search_executor is not None:
+                searches.append(self._act_prepared(game_id, key, *prepared))
+            else:
+                jobs.append((game_id, key) + prepared)
+        if not jobs:
+            return list(await asyncio.gather(*searches))
+
+        requests = [(state, key[0], difficulty, seed) for _, key, _, state, seed, difficulty in jobs]
+        started = time.perf_counter()
+        self.in_flight += len(jobs)
+        try:
+            actions = await asyncio.get_running_loop().run_in_executor(
+                self.executor, choose_actions, requests
+            )
+        finally:
+            self.in_flight -= len(jobs)
+            self.decide_seconds += (time.perf_counter() - started) * len(jobs)
+        self.batches += 1
+        self.batched += len(jobs)
+        self.max_batch = max(self.max_batch, len(jobs))
+        applied = [
+            self._apply(game_id, key, game, state, action)
+            for (game_id, key, game, state, _, _), action in zip(jobs, actions)
+        ]
+        return list(await asyncio.gather(*applied, *searches))
+
+    async def _search(self, state: Any, seat: int, seed: int) -> Any:
+        """hard 봇 결정을 프로세스 풀에서 탐색합니다 (시간 초과 / 풀 고장 시 medium 휴리스틱)."""
+        loop = asyncio.get_running_loop()
+        if self.search_busy >= self.search_workers:
+            # 탐색 프로세스가 모두 바쁘면 줄 서지 않고 휴리스틱으로 바로 결정 (지연 상한 유지)
+            self.search_skipped += 1
+            return await loop.run_in_executor(
+                self.executor, choose_action, state, seat, "medium", random.Random(seed)
+            )
+        self.search_busy += 1
+        try:
+            future = loop.run_in_executor(
+                self.search_executor, ismcts.decide, state, seat, self.search_budget, seed
+            )
+            action, stats = await asyncio.wait_for(future, self.search_budget + SEARCH_GRACE)
+        except (asyncio.TimeoutError, BrokenProcessPool):
+            self.search_timeouts += 1
+            return await loop.run_in_executor(
+                self.executor, choose_action, state, seat, "medium", random.Random(seed)
+            )
+        finally:
+            self.search_busy -= 1
+        if stats.get("iterations"):
+            self.searches += 1
+            self.search_iterations += stats["iterations"]
+            self.search_seconds += stats["elapsedMs"] / 1000
+            self.search_max_depth = max(self.search_max_depth, stats["maxDepth"])
+        return action
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        봇 드라이버 통계를 반환합니다.
+
+        Returns:
+            {
+                "scheduled": int,  # 결정이 예약된 게임 수
+                "inFlight": int,  # 워커에서 계산 중인 결정 수
+                "decisions": int,
+                "failures": int,  # 적용에 실패한 결정 수
+                "avgDecisionMs": float,  # 결정 계산 평균 시간 (워커 대기 포함)
+                "batch": {  # 배치 모드 (batch=True)
+                    "batches": int,  # 워커 호출 수
+                    "avgSize": float,  # 호출 하나당 결정 수
+                    "maxSize": int
+                },
+                "search": {  # hard 봇 ISMCTS
+                    "searches": int,
+                    "timeouts": int,  # 예산 안에 답이 없어 휴리스틱으로 대신한 수
+                    "skipped": int,  # 탐색 프로세스가 모두 바빠 휴리스틱으로 대신한 수
+                    "playoutsPerSec": float,
+                    "avgPlayouts": float,  # 결정 하나당 플레이아웃 수
+                    "maxDepth": int  # 가장 깊이 내려간 트리 깊이
+                }
+            }
+        """
+        return {
+            "scheduled": len(self.scheduler),
+            "inFlight": self.in_flight,
+            "decisions": self.decisions,
+            "failures": self.failures,
+            "avgDecisionMs": round(self.decide_seconds * 1000 / max(1, self.decisions), 3),
+            "batch": {
+                "batches": self.batches,
+                "avgSize": round(self.batched / max(1, self.batches), 2),
+                "maxSize": self.max_batch,
+            },
+            "search": {
+                "searches": self.searches,
+                "timeouts": self.search_timeouts,
+                "skipped": self.search_skipped,
+                "playoutsPerSec": round(self.search_iterations / self.search_seconds, 1) if self.search_seconds else 0.0,
+                "avgPlayouts": round(self.search_iterations / max(1, self.searches), 1),
+                "maxDepth": self.search_max_depth,
+            },
+        }
+
+    def start(self) -> None:
+        """결정 스케줄러를 시작합니다 (탐색 프로세스도 미리 띄워 첫 결정이 예산을 넘지 않게 함)."""
+        self.scheduler.start()
+        if self.search_executor is not None:
+            for _ in range(self.search_workers):
+                self.search_executor.submit(int)
+
+    async def stop(self) -> None:
+        """
+        결정 스케줄러를 멈추고 워커 풀을 닫습니다.
+
+        닫은 풀은 새 풀로 바꿔 두므로 같은 프로세스에서 start()를 다시 불러도 됩니다
+        (풀은 첫 작업을 받을 때 스레드 / 프로세스를 띄우므로 바꿔 두는 비용은 없음).
+        """
+        await self.scheduler.stop()
+        if self._owns_executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = self._new_executor()
+        if self.search_executor is not None:
+            self.search_executor.shutdown(wait=False, cancel_futures=True)
+            self.search_executor = self._new_search_executor()
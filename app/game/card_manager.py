@@ -5,15 +5,8 @@
 """
 
 import random
-from typing import List, Optional
-from app.models.card import Card
-from app.utils.constants import (
-    CardType,
-    Suit,
-    Rank,
-    CARD_DECK_CONFIG,
-    CARD_DETAILS,
-)
+from typing import Any, List, Optional
+from app.models.card import Card, get_card_catalog
 
 
 class CardManager:
@@ -23,10 +16,16 @@ class CardManager:
     카드 덱의 생성, 셔플, 드로우, 버리기 등을 관리합니다.
     """
     
-    def __init__(self):
-        """카드 관리자 초기화"""
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        카드 관리자 초기화
+        
+        Args:
+            rng: 셔플에 사용할 난수 생성기 (없으면 전역 random 모듈)
+        """
         self.deck: List[Card] = []
         self.discard_pile: List[Card] = []
+        self.rng: Any = rng if rng is not None else random
     
     def create_deck(self) -> List[Card]:
         """
@@ -35,45 +34,8 @@ class CardManager:
         Returns:
             생성된 카드 덱
         """
-        deck: List[Card] = []
-        card_counter = 0
-        
-        # 각 카드 타입별로 지정된 수만큼 생성
-        for card_type, count in CARD_DECK_CONFIG.items():
-            card_info = CARD_DETAILS[card_type]
-            
-            for i in range(count):
-                card_id = f"{card_type.value}_{card_counter:03d}"
-                
-                # 무늬와 숫자가 있는 카드인지 확인
-                suit = None
-                rank = None
-                
-                # 정산, 회피, 비상금 카드는 무늬와 숫자가 있음
-                if card_type in [CardType.BANG, CardType.MISSED, CardType.BEER]:
-                    # 무늬와 숫자 할당 (순환)
-                    suits = [Suit.SPADES, Suit.CLUBS, Suit.HEARTS, Suit.DIAMONDS]
-                    ranks = [Rank.ACE, Rank.KING, Rank.QUEEN, Rank.JACK]
-                    
-                    suit_index = (card_counter // len(ranks)) % len(suits)
-                    rank_index = card_counter % len(ranks)
-                    
-                    suit = suits[suit_index]
-                    rank = ranks[rank_index]
-                
-                card = Card(
-                    id=card_id,
-                    card_type=card_type,
-                    name=card_info["name"],
-                    suit=suit,
-                    rank=rank,
-                    range=card_info["range"],
-                    description=card_info["description"],
-                )
-                
-                deck.append(card)
-                card_counter += 1
-        
+        # 카드는 불변이므로 카탈로그 인스턴스를 그대로 사용 (게임마다 새로 생성하지 않음)
+        deck: List[Card] = list(get_card_catalog())
         self.deck = deck
         return deck
     
@@ -82,7 +44,7 @@ class CardManager:
         덱을 셔플합니다.
         """
         if self.deck:
-            random.shuffle(self.deck)
+            self.rng.shuffle(self.deck)
     
     def draw_card(self) -> Optional[Card]:
         """
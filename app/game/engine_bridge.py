@@ -0,0 +1,515 @@
+"""
+엔진 브리지 (Engine Bridge)
+
+pydantic 게임 모델(Game / Player / CardManager)과 규칙 엔진 상태(EngineState) 사이를 변환합니다.
+ActionHandler / TurnManager / GameManager는 이 모듈을 통해 엔진 규칙을 실행합니다.
+"""
+
+import random
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from app.engine.cards import CARD_INDEX, CARDS
+from app.engine.events import Event
+from app.engine.rules import Context, IllegalAction, Outcome
+from app.engine.state import (
+    PENDING_DRAW_ORDER,
+    PENDING_GENERAL_STORE,
+    PENDING_STEAL,
+    RESPONSE_ATTACK,
+    RESPONSE_DRAW_ORDER,
+    RESPONSE_GENERAL_STORE,
+    RESPONSE_STEAL,
+    EngineState,
+    PlayerState,
+)
+from app.game.card_manager import CardManager
+from app.game import event_text
+from app.models.game import Game
+from app.models.player import Player
+from app.models.role import Role
+from app.storage.action_log import pack_rng_state, rng_mark, unpack_rng_state
+from app.storage.codec import decode, encode
+from app.utils.constants import GameState, TurnState
+
+# serialize_game() 형식 버전
+GAME_FORMAT_VERSION = 1
+
+
+def _indices(cards) -> Tuple[int, ...]:
+    return tuple(CARD_INDEX[c.id] for c in cards)
+
+
+def _seat(seat_of: Dict[str, int], player_id: Optional[str]) -> int:
+    if not player_id:
+        return -1
+    return seat_of.get(player_id, -1)
+
+
+def _load_response(data: Optional[Dict], seat_of: Dict[str, int]) -> Optional[Tuple]:
+    if not data:
+        return None
+    kind = data.get("type")
+    if kind == RESPONSE_ATTACK:
+        return (
+            RESPONSE_ATTACK,
+            _seat(seat_of, data.get("targetId")),
+            data.get("requiredMissed", 1),
+            data.get("usedMissed", 0),
+        )
+    if kind == RESPONSE_DRAW_ORDER:
+        return (RESPONSE_DRAW_ORDER, tuple(CARD_INDEX[c["id"]] for c in data["candidateCards"]))
+    if kind == RESPONSE_STEAL:
+        return (
+            RESPONSE_STEAL,
+            _seat(seat_of, data.get("targetId")),
+            tuple(CARD_INDEX[c["id"]] for c in data["candidateCards"]),
+        )
+    if kind == RESPONSE_GENERAL_STORE:
+        return (
+            RESPONSE_GENERAL_STORE,
+            _seat(seat_of, data.get("currentPickerId")),
+            tuple(CARD_INDEX[c["id"]] for c in data["candidateCards"]),
+        )
+    # 엔진이 모르는 응답은 그대로 보존
+    return ("UNKNOWN", data)
+
+
+def _load_pending(data: Optional[Dict], seat_of: Dict[str, int]) -> Optional[Tuple]:
+    if not data:
+        return None
+    kind = data.get("type")
+    if kind == PENDING_DRAW_ORDER:
+        return (PENDING_DRAW_ORDER, _seat(seat_of, data.get("player_id")), _indices(data.get("cards") or []))
+    if kind == PENDING_STEAL:
+        return (
+            PENDING_STEAL,
+            _seat(seat_of, data.get("attacker_id")),
+            _seat(seat_of, data.get("target_id")),
+            _indices(data.get("cards") or []),
+        )
+    if kind == PENDING_GENERAL_STORE:
+        return (
+            PENDING_GENERAL_STORE,
+            _indices(data.get("remaining_cards") or []),
+            tuple(_seat(seat_of, pid) for pid in data.get("pick_order") or []),
+            data.get("current_index", 0),
+        )
+    return ("UNKNOWN", data)
+
+
+def load_state(game: Game, card_manager: Optional[CardManager] = None) -> EngineState:
+    """
+    게임 모델로부터 엔진 상태를 만듭니다.
+
+    Args:
+        game: Game 인스턴스
+        card_manager: 게임의 CardManager (없으면 게임 모델에 반영된 덱 / 버림 더미 사용)
+
+    Returns:
+        엔진 상태
+    """
+    players = [
+        PlayerState(
+            p.id,
+            p.name,
+            p.role.role,
+            p.hp,
+            p.max_hp,
+            p.range,
+            [CARD_INDEX[c.id] for c in p.hand],
+            {slot: CARD_INDEX[c.id] for slot, c in p.equipment.items()},
+            p.treasure,
+            p.is_alive,
+            p.position,
+            p.is_bot,
+        )
+        for p in game.players
+    ]
+    seat_of = {p.id: i for i, p in enumerate(players)}
+    piles = card_manager if card_manager is not None else game
+    return EngineState(
+        game.id,
+        players,
+        status=GameState(game.state),
+        deck=[CARD_INDEX[c.id] for c in piles.deck],
+        discard=[CARD_INDEX[c.id] for c in piles.discard_pile],
+        current=_seat(seat_of, game.current_player_id),
+        turn_state=TurnState(game.turn_state),
+        turn_number=game.turn_number,
+        attack_counters={seat_of[pid]: n for pid, n in game.turn_attack_counters.items()},
+        treasure_counters={seat_of[pid]: dict(c) for pid, c in game.treasure_counters.items()},
+        defending=_seat(seat_of, game.defending_player_id),
+        required_missed=game.pending_required_missed,
+        used_missed=game.pending_used_missed,
+        response=_load_response(game.required_response, seat_of),
+        pending=_load_pending(game.pending_action, seat_of),
+        seat_of=seat_of,
+    )
+
+
+def _card_list(indices) -> list:
+    return [CARDS[i] for i in indices]
+
+
+def _draw_order_payload(index: int) -> Dict:
+    # 우선 전표 후보는 설명 없이 보냄 (id, name, suit, rank)
+    payload = CARDS[index].to_payload()
+    return {key: payload[key] for key in ("id", "name", "suit", "rank")}
+
+
+def _dump_response(state: EngineState, response: Optional[Tuple]) -> Optional[Dict]:
+    if response is None:
+        return None
+    kind = response[0]
+    players = state.players
+    if kind == RESPONSE_ATTACK:
+        _, seat, required, used = response
+        if used == 0:
+            message = f"{players[seat].name}이(가) 공격을 받았습니다. 회피하시겠습니까?"
+        else:
+            message = f"추가로 회피 카드가 더 필요합니다. (현재 {used}장 사용, 총 {required}장 필요)"
+        return {
+            "type": RESPONSE_ATTACK,
+            "targetId": players[seat].id,
+            "requiredMissed": required,
+            "usedMissed": used,
+            "message": message,
+        }
+    if kind == RESPONSE_DRAW_ORDER:
+        return {
+            "type": RESPONSE_DRAW_ORDER,
+            "source": "우선 전표",
+            "candidateCards": [_draw_order_payload(i) for i in response[1]],
+        }
+    if kind == RESPONSE_STEAL:
+        return {
+            "type": RESPONSE_STEAL,
+            "source": "천청 방울",
+            "targetId": players[response[1]].id,
+            "candidateCards": [{"id": CARDS[i].id} for i in response[2]],
+        }
+    if kind == RESPONSE_GENERAL_STORE:
+        return {
+            "type": RESPONSE_GENERAL_STORE,
+            "currentPickerId": players[response[1]].id,
+            "candidateCards": [CARDS[i].to_payload() for i in response[2]],
+        }
+    return response[1]
+
+
+def _dump_pending(state: EngineState, pending: Optional[Tuple]) -> Optional[Dict]:
+    if pending is None:
+        return None
+    kind = pending[0]
+    players = state.players
+    if kind == PENDING_DRAW_ORDER:
+        return {
+            "type": PENDING_DRAW_ORDER,
+            "player_id": players[pending[1]].id,
+            "cards": _card_list(pending[2]),
+        }
+    if kind == PENDING_STEAL:
+        return {
+            "type": PENDING_STEAL,
+            "attacker_id": players[pending[1]].id,
+            "target_id": players[pending[2]].id,
+            "cards": _card_list(pending[3]),
+        }
+    if kind == PENDING_GENERAL_STORE:
+        return {
+            "type": PENDING_GENERAL_STORE,
+            "remaining_cards": _card_list(pending[1]),
+            "pick_order": [players[s].id for s in pending[2]],
+            "current_index": pending[3],
+        }
+    return pending[1]
+
+
+def store_state(
+    ctx: Context,
+    game: Game,
+    card_manager: CardManager,
+    origin: Tuple,
+) -> None:
+    """
+    엔진 상태와 이벤트를 게임 모델에 반영합니다.
+
+    Args:
+        ctx: 규칙을 적용한 컨텍스트
+        game: Game 인스턴스
+        card_manager: 게임의 CardManager
+        origin: load 직후의 (상태, 턴 상태, 응답, 대기 액션) - 바뀐 필드만 다시 만듭니다
+    """
+    state = ctx.state
+    status, turn_state, response, pending = origin
+
+    for player, ps in zip(game.players, state.players):
+        if player.role.role != ps.role:
+            player.role = Role(ps.role)
+        player.hp = ps.hp
+        player.max_hp = ps.max_hp
+        player.is_alive = ps.alive
+        player.hand = _card_list(ps.hand)
+        player.equipment = {slot: CARDS[i] for slot, i in ps.equipment.items()}
+
+    card_manager.deck = _card_list(state.deck)
+    card_manager.discard_pile = _card_list(state.discard)
+    game.deck = card_manager.deck
+    game.discard_pile = card_manager.discard_pile
+
+    if state.status != status:
+        game.state = state.status
+    if state.turn_state != turn_state:
+        game.set_turn_state(state.turn_state)
+    players = state.players
+    game.current_player_id = players[state.current].id if state.current >= 0 else game.current_player_id
+    game.turn_number = state.turn_number
+    game.turn_attack_counters = {players[s].id: n for s, n in state.attack_counters.items()}
+    game.treasure_counters = {players[s].id: c for s, c in state.treasure_counters.items()}
+    game.defending_player_id = players[state.defending].id if state.defending >= 0 else None
+    game.pending_required_missed = state.required_missed
+    game.pending_used_missed = state.used_missed
+    if state.response != response:
+        game.required_response = _dump_response(state, state.response)
+    if state.pending != pending:
+        game.pending_action = _dump_pending(state, state.pending)
+
+    for event in ctx.events:
+        message, event_type = event_text.render_event(state, event)
+        game.add_event(message, event_type)
+    game.touch()
+
+
+def game_rng(game: Game) -> Any:
+    """게임에서 사용할 난수 생성기 (게임별 시드 고정)"""
+    return game.rng
+
+
+def run(game: Game, card_manager: CardManager, fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    게임 모델에서 엔진 상태를 만들어 규칙 함수를 실행하고 결과를 다시 반영합니다.
+
+    IllegalAction이 발생하면 게임 모델은 변경되지 않습니다.
+
+    Args:
+        game: Game 인스턴스
+        card_manager: 게임의 CardManager
+        fn: 규칙 함수 (첫 번째 인자로 Context를 받음)
+        *args: 규칙 함수 인자
+
+    Returns:
+        규칙 함수의 반환값
+
+    Raises:
+        IllegalAction: 허용되지 않는 액션
+    """
+    state = load_state(game, card_manager)
+    origin = (state.status, state.turn_state, state.response, state.pending)
+    rng = game_rng(game)
+    log = game.action_log
+    if log is not None:
+        if not log.has_snapshot:
+            # 첫 기록 전에 기준 스냅샷을 남겨 로그만으로 재생할 수 있게 함
+            log.write_snapshot(state.snapshot(), pack_rng_state(rng), game.seed, game.version, game.events)
+        mark = rng_mark(rng)
+    ctx = Context(state, rng)
+    value = fn(ctx, *args)
+    store_state(ctx, game, card_manager, origin)
+    if log is not None:
+        log.append(fn, args, mark, game.version)
+        if log.snapshot_due:
+            log.write_snapshot(ctx.state.snapshot(), pack_rng_state(rng), game.seed, game.version, game.events)
+    return value
+
+
+def build_game(
+    state: EngineState,
+    rng: Any,
+    seed: Optional[int],
+    version: int,
+    history: Iterable[Dict] = (),
+    events: Iterable[Event] = (),
+) -> Tuple[Game, CardManager]:
+    """
+    엔진 상태로부터 게임 모델과 CardManager를 새로 만듭니다 (로그 / 스냅샷 복원용).
+
+    Args:
+        state: 엔진 상태
+        rng: 복원한 게임 난수 생성기
+        seed: 게임 시드
+        version: 게임 상태 버전
+        history: 스냅샷에 저장된 게임 이벤트 로그 (Game.events)
+        events: history 뒤에 렌더링해 붙일 엔진 이벤트
+
+    Returns:
+        (Game, CardManager)
+    """
+    players = [
+        Player(
+            id=ps.id,
+            name=ps.name,
+            role=Role(ps.role),
+            hp=ps.hp,
+            max_hp=ps.max_hp,
+            range=ps.base_range,
+            hand=_card_list(ps.hand),
+            equipment={slot: CARDS[i] for slot, i in ps.equipment.items()},
+            treasure=ps.treasure,
+            is_alive=ps.alive,
+            position=ps.position,
+            is_bot=ps.is_bot,
+        )
+        for ps in state.players
+    ]
+    card_manager = CardManager(rng=rng)
+    card_manager.deck = _card_list(state.deck)
+    card_manager.discard_pile = _card_list(state.discard)
+    ids = [p.id for p in state.players]
+    game = Game(
+        id=state.game_id,
+        state=state.status,
+        players=players,
+        deck=card_manager.deck,
+        discard_pile=card_manager.discard_pile,
+        current_player_id=ids[state.current] if state.current >= 0 else None,
+        turn_state=state.turn_state,
+        turn_number=state.turn_number,
+        treasure_counters={ids[s]: dict(c) for s, c in state.treasure_counters.items()},
+        turn_attack_counters={ids[s]: n for s, n in state.attack_counters.items()},
+        defending_player_id=ids[state.defending] if state.defending >= 0 else None,
+        pending_required_missed=state.required_missed,
+        pending_used_missed=state.used_missed,
+        required_response=_dump_response(state, state.response),
+        pending_action=_dump_pending(state, state.pending),
+        version=version,
+        seed=seed,
+    )
+    game.rng = rng
+    game.events = [dict(e) for e in history]
+    if game.events:
+        game.last_event = game.events[-1]["message"]
+    for event in events:
+        message, event_type = event_text.render_event(state, event)
+        game.add_event(message, event_type)
+    return game, card_manager
+
+
+def failure(exc: IllegalAction) -> Dict:
+    """IllegalAction을 실패 결과 딕셔너리로 변환합니다."""
+    return {
+        "success": False,
+        "message": event_text.failure_message(exc.code, exc.params),
+        "event": None,
+    }
+
+
+def outcome_result(outcome: Outcome, game: Game) -> Dict:
+    """엔진 처리 결과를 핸들러 결과 딕셔너리로 변환합니다."""
+    message, event = event_text.outcome_message(outcome.code, outcome.args)
+    if event is event_text.LAST_EVENT:
+        event = game.last_event
+    return {
+        "success": outcome.success,
+        "message": message,
+        "event": event,
+    }
+
+
+def serialize_game(game: Game, card_manager: CardManager) -> bytes:
+    """
+    게임 하나를 저장용 바이트로 직렬화합니다 (엔진 스냅샷 + 시드 / 난수 상태 / 이벤트 로그).
+
+    Args:
+        game: Game 인스턴스
+        card_manager: 게임의 CardManager
+
+    Returns:
+        직렬화된 바이트
+    """
+    state = load_state(game, card_manager)
+    return encode((
+        GAME_FORMAT_VERSION,
+        game.seed,
+        game.version,
+        pack_rng_state(game.rng),
+        state.snapshot(),
+        game.events,
+    ))
+
+
+def game_parts(game: Game, card_manager: CardManager) -> Tuple:
+    """
+    serialize_game()에 들어갈 값을 인코딩하지 않고 모읍니다.
+    
+    느린 액션 캡처처럼 액션 전 상태를 매번 붙잡아 두지만 대부분 버리는 경우에 씁니다
+    (인코딩은 실제로 남길 때 encode_game_parts()로).
+    
+    Args:
+        game: Game 인스턴스
+        card_manager: 게임의 CardManager
+        
+    Returns:
+        (seed, version, 난수 상태, 엔진 스냅샷, 이벤트 로그 사본)
+    """
+    return (
+        game.seed,
+        game.version,
+        game.rng.getstate(),
+        load_state(game, card_manager).snapshot(),
+        list(game.events),
+    )
+
+
+def encode_game_parts(parts: Tuple) -> bytes:
+    """
+    game_parts()의 결과를 serialize_game()과 같은 형식의 바이트로 인코딩합니다.
+    
+    Args:
+        parts: game_parts()의 결과
+        
+    Returns:
+        deserialize_game()으로 복원할 수 있는 바이트
+    """
+    seed, version, rng_state, snapshot, history = parts
+    rng = random.Random()
+    rng.setstate(rng_state)
+    return encode((GAME_FORMAT_VERSION, seed, version, pack_rng_state(rng), snapshot, history))
+
+
+def game_summary(data: bytes) -> Tuple[str, int]:
+    """
+    serialize_game()으로 만든 바이트에서 목록용 요약만 꺼냅니다 (Game / CardManager를 만들지 않음).
+
+    Args:
+        data: 직렬화된 바이트
+
+    Returns:
+        (게임 상태 값, 플레이어 수)
+
+    Raises:
+        ValueError: 형식 버전이 다른 경우
+    """
+    fmt, _seed, _version, _rng_state, snapshot, _history = decode(data)
+    if fmt != GAME_FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 게임 형식 버전: {fmt}")
+    return snapshot[2], len(snapshot[3])
+
+
+def deserialize_game(data: bytes) -> Tuple[Game, CardManager]:
+    """
+    serialize_game()으로 만든 바이트에서 게임을 복원합니다.
+
+    Args:
+        data: 직렬화된 바이트
+
+    Returns:
+        (Game, CardManager)
+
+    Raises:
+        ValueError: 형식 버전이 다른 경우
+    """
+    fmt, seed, version, rng_state, snapshot, history = decode(data)
+    if fmt != GAME_FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 게임 형식 버전: {fmt}")
+    rng = unpack_rng_state(rng_state)
+    return build_game(EngineState.from_snapshot(snapshot), rng, seed, version, history)
@@ -0,0 +1,221 @@
+"""
+엔진 이벤트 / 결과 메시지 (Event Text)
+
+규칙 엔진의 구조화된 이벤트와 결과 코드를 클라이언트에 보여 줄 한국어 메시지로 변환합니다.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from app.engine import events as ev
+from app.engine.cards import CARDS
+from app.engine.events import Event
+from app.engine.state import EngineState
+
+# 피해 원인 -> 표시 이름
+CAUSE_NAMES: Dict[str, str] = {
+    ev.CAUSE_BANG: "공격",
+    ev.CAUSE_GATLING: "전원 견제",
+    ev.CAUSE_INDIANS: "패거리 습격",
+    ev.CAUSE_DUEL: "승부",
+}
+
+# 이벤트 종류 -> (메시지 템플릿, 이벤트 타입)
+# {name}: 주체, {target}: 상대, {card}: 카드 이름, {0}, {1}: 추가 값
+EVENT_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    ev.JAIL_SKIP: ("{name}이(가) 영업 금지 판정에 실패하여 이번 턴을 건너뜁니다.", "action"),
+    ev.RECORD_SHARD: ("{name}이(가) 기록 파편 효과로 버림 더미에서 카드를 회수했습니다.", "action"),
+    ev.GOLD_ABACUS: ("{name}의 황금 주판 효과로 추가로 카드를 1장 공개 드로우했습니다.", "action"),
+    ev.DREW: ("{name}이(가) 카드 {0}장을 뽑았습니다.", "action"),
+    ev.HAND_LIMIT: ("{name}이(가) 최대 손패 제한을 초과하여 카드 {0}장을 버렸습니다.", "action"),
+    ev.TURN_END: ("{name}의 턴이 종료되었습니다.", "notification"),
+    ev.SUZY: ("{name}의 화수분 효과로 카드 {0}장을 드로우했습니다.", "action"),
+    ev.WILLY_DISCARD: ("{name}이(가) 황금 연갑 효과로 카드를 1장 추가로 버렸습니다.", "action"),
+    ev.BANG: ("{name}이(가) {target}에게 정산을 시도했습니다.", "action"),
+    ev.BEER: ("{name}이(가) 비상금을 사용하여 재력을 {0}에서 {1}로 회복했습니다.", "action"),
+    ev.PANIC_SELECT: (
+        "{name}이(가) 강제 압류를 사용했습니다. 천청 방울 효과로 강탈할 카드를 선택 중입니다.",
+        "action",
+    ),
+    ev.PANIC_STEAL: ("{name}이(가) 강제 압류로 {target}의 손패에서 카드를 1장 강탈했습니다.", "action"),
+    ev.EQUIP: ("{name}이(가) '{card}' 카드를 장착했습니다.", "action"),
+    ev.GATLING_DODGE: ("{name}이(가) 전원 견제를 회피했습니다.", "action"),
+    ev.GATLING: ("{name}이(가) 전원 견제 카드를 사용했습니다.", "action"),
+    ev.INDIANS_DEFEND: ("{name}이(가) 패거리 습격을 방어하기 위해 정산 카드를 1장 사용했습니다.", "action"),
+    ev.INDIANS: ("{name}이(가) 패거리 습격 카드를 사용했습니다.", "action"),
+    ev.DUEL_BANG: ("{name}이(가) 승부에서 정산 카드를 사용했습니다.", "action"),
+    ev.DUEL: ("{name}이(가) {target}에게 승부를 걸었습니다.", "action"),
+    ev.SALOON_HEAL: ("{name}이(가) 공개 연회로 재력을 {0}에서 {1}로 회복했습니다.", "action"),
+    ev.SALOON: ("{name}이(가) 공개 연회 카드를 사용했습니다.", "action"),
+    ev.GS_NO_PLAYERS: ("{name}이(가) 자선 경매 카드를 사용했지만 생존 플레이어가 없습니다.", "action"),
+    ev.GS_EMPTY: ("{name}이(가) 자선 경매 카드를 사용했지만 덱에 카드가 없습니다.", "action"),
+    ev.GS: ("{name}이(가) 자선 경매 카드를 사용했습니다.", "action"),
+    ev.GS_PICK: ("{name}이(가) 자선 경매에서 '{card}' 카드를 선택했습니다.", "action"),
+    ev.DAMAGE: ("{name}이(가) {cause}으로 공격을 받아 재력이 {1}로 감소했습니다.", "action"),
+    ev.DEATH: ("{name}이(가) {cause}으로 재력이 0이 되어 사망했습니다.", "action"),
+    ev.VULTURE: (
+        "{name}이(가) 유산 상자 효과로 탈락한 {target}의 카드 {0}장을 상속받았습니다.",
+        "action",
+    ),
+    ev.RESPOND_PARTIAL: ("{name}이(가) 회피 카드를 사용했지만 추가 회피가 더 필요합니다.", "action"),
+    ev.RESPOND_DODGE: ("{name}이(가) 회피 카드를 사용하여 공격을 막았습니다.", "action"),
+    ev.BARREL_DODGE: ("{name}의 신의 한 수 효과로 공격을 회피했습니다.", "action"),
+    ev.SILK_DODGE: (
+        "{name}의 비단 갑옷 판정에 성공하여 공격을 회피하고 카드를 1장 드로우했습니다.",
+        "action",
+    ),
+    ev.SILK_FAIL: ("{name}의 비단 갑옷 판정이 실패했습니다.", "action"),
+    ev.BART_DRAW: ("{name}의 이중 장부 효과로 카드 1장을 드로우했습니다.", "action"),
+    ev.GRINGO_STEAL: ("{name}의 응징의 패 효과로 {target}의 손패에서 카드 1장을 강탈했습니다.", "action"),
+    ev.SID: (
+        "{name}이(가) 생명 장부 효과로 서로 다른 문양의 카드를 2장 버리고 재력을 {0}에서 {1}로 회복했습니다.",
+        "action",
+    ),
+    ev.STEAL_SELECT: ("{name}이(가) 천청 방울 효과로 {target}의 손패에서 카드를 1장 강탈했습니다.", "action"),
+    ev.DRAW_ORDER: (
+        "{name}이(가) 우선 전표 효과로 카드 1장을 획득하고 나머지 2장을 덱 위/아래로 배치했습니다.",
+        "action",
+    ),
+}
+
+# 실패 코드 -> 메시지
+FAILURE_MESSAGES: Dict[str, str] = {
+    "NOT_IN_PROGRESS": "게임이 진행 중이 아닙니다.",
+    "PLAYER_UNAVAILABLE": "플레이어를 찾을 수 없거나 사망했습니다.",
+    "CANNOT_PLAY": "카드를 사용할 수 없는 상태입니다.",
+    "CARD_REQUIRED": "카드 ID가 필요합니다.",
+    "CARD_NOT_FOUND": "카드를 찾을 수 없습니다.",
+    "CARD_NOT_REMOVABLE": "카드를 제거할 수 없습니다.",
+    "MISSED_ONLY_RESPONSE": "회피 카드는 공격 대응 시에만 사용할 수 있습니다.",
+    "NOT_IMPLEMENTED_CARD": "아직 구현되지 않은 카드 타입: {0}",
+    "TARGET_REQUIRED": "공격 대상이 필요합니다.",
+    "PLAYER_NOT_FOUND": "플레이어를 찾을 수 없습니다.",
+    "TARGET_DEAD": "대상 플레이어가 이미 사망했습니다.",
+    "SELF_TARGET": "자신을 공격할 수 없습니다.",
+    "OUT_OF_RANGE": "거리가 너무 멉니다. (필요: {0}, 현재: {1})",
+    "BANG_LIMIT": "이 턴에는 더 이상 정산 카드를 사용할 수 없습니다.",
+    "WILLY_NO_DISCARD": "황금 연갑 효과로 추가로 버릴 카드가 없어 정산을 사용할 수 없습니다.",
+    "BEER_LAST_TWO": "마지막 두 명만 남은 상황에서는 비상금을 사용할 수 없습니다.",
+    "BEER_FULL_HP": "재력이 이미 최대치입니다.",
+    "PANIC_TARGET_REQUIRED": "강탈 대상이 필요합니다.",
+    "PANIC_SELF": "자신에게 강제 압류를 사용할 수 없습니다.",
+    "PANIC_OUT_OF_RANGE": "거리가 너무 멉니다.",
+    "DUEL_TARGET_REQUIRED": "승부를 걸 대상이 필요합니다.",
+    "DUEL_DEAD": "사망한 플레이어와는 승부를 진행할 수 없습니다.",
+    "DUEL_SELF": "자신에게 승부를 걸 수 없습니다.",
+    "NO_GENERAL_STORE": "진행 중인 자선 경매가 없습니다.",
+    "NO_PICK_TURN": "더 이상 선택할 차례가 없습니다.",
+    "NOT_YOUR_PICK": "현재 카드를 선택할 차례가 아닙니다.",
+    "PICK_CARD_REQUIRED": "선택할 카드 ID가 필요합니다.",
+    "PICK_CARD_INVALID": "선택한 카드 ID가 유효하지 않습니다.",
+    "CANNOT_RESPOND": "대응할 수 없는 상태입니다.",
+    "MISSED_REQUIRED": "회피 카드만 사용할 수 있습니다.",
+    "SID_ONLY": "생명 장부 보물을 가진 플레이어만 사용할 수 있습니다.",
+    "SID_TWO_SUITS": "서로 다른 문양의 카드 2장이 필요합니다.",
+    "SID_CARD_NOT_FOUND": "지정한 카드를 찾을 수 없습니다.",
+    "SID_NO_SUIT": "문양이 없는 카드는 사용할 수 없습니다.",
+    "NO_STEAL": "선택할 강탈 액션이 없습니다.",
+    "STEAL_FORBIDDEN": "강탈 카드를 선택할 권한이 없습니다.",
+    "STEAL_CARD_MISSING": "대상 손패에서 선택한 카드를 찾을 수 없습니다.",
+    "NO_DRAW_ORDER": "선택할 드로우 액션이 없습니다.",
+    "DRAW_ORDER_FORBIDDEN": "드로우 순서를 선택할 권한이 없습니다.",
+    "DRAW_ORDER_IDS_REQUIRED": "획득/위/아래 배치에 사용할 카드 ID가 모두 필요합니다.",
+    "DRAW_ORDER_DUPLICATE": "각 카드는 서로 다른 역할로 한 번씩만 사용해야 합니다.",
+    "CANNOT_END_TURN": "턴을 종료할 수 없는 상태입니다.",
+    "UNSUPPORTED_ACTION": "지원하지 않는 액션 타입: {0}",
+}
+
+# 결과 코드 -> (메시지 템플릿, 이벤트)
+# 이벤트가 LAST_EVENT면 game.last_event, None이면 이벤트 없음, 그 외 문자열은 그대로 사용
+LAST_EVENT = object()
+OUTCOME_MESSAGES: Dict[str, Tuple[str, object]] = {
+    "BANG": ("정산 카드를 사용했습니다. 대상 플레이어가 대응할 수 있습니다.", LAST_EVENT),
+    "BEER": ("비상금을 사용하여 재력을 1 회복했습니다.", LAST_EVENT),
+    "PANIC_EMPTY": ("대상 손패가 비어 있어 강탈할 카드가 없습니다.", None),
+    "PANIC_SELECT": ("강제 압류를 사용했습니다. 강탈할 카드를 선택하세요.", LAST_EVENT),
+    "PANIC_STEAL": ("강제 압류로 카드를 강탈했습니다.", LAST_EVENT),
+    "EQUIP": ("{card} 카드를 장착했습니다.", LAST_EVENT),
+    "GATLING": ("전원 견제 카드를 사용했습니다.", LAST_EVENT),
+    "INDIANS": ("패거리 습격 카드를 사용했습니다.", LAST_EVENT),
+    "DUEL": ("승부 카드를 사용했습니다.", LAST_EVENT),
+    "SALOON": ("공개 연회 카드를 사용했습니다.", LAST_EVENT),
+    "SALOON_NONE": ("공개 연회 카드를 사용했습니다.", "공개 연회 효과로 회복된 플레이어가 없습니다."),
+    "GS_NO_PLAYERS": ("자선 경매 카드를 사용했지만 생존 플레이어가 없습니다.", LAST_EVENT),
+    "GS_EMPTY": ("덱에 카드가 없어 자선 경매 효과를 사용할 수 없습니다.", LAST_EVENT),
+    "GS": ("자선 경매 카드를 사용했습니다. 공개 카드 중에서 순서대로 선택합니다.", LAST_EVENT),
+    "GS_PICK": ("자선 경매 카드 선택을 완료했습니다.", LAST_EVENT),
+    "RESPOND_PARTIAL": ("공격을 부분적으로 회피했습니다. 추가 회피가 필요합니다.", LAST_EVENT),
+    "RESPOND_DODGE": ("공격을 회피했습니다.", LAST_EVENT),
+    "BARREL_DODGE": ("신의 한 수 효과로 공격을 회피했습니다.", LAST_EVENT),
+    "SILK_DODGE": ("비단 갑옷 효과로 공격을 회피했습니다.", LAST_EVENT),
+    "HIT": ("공격을 받았습니다.", LAST_EVENT),
+    "SID": ("생명 장부 효과로 재력을 1 회복했습니다.", LAST_EVENT),
+    "STEAL_SELECT": ("강탈할 카드를 선택했습니다.", LAST_EVENT),
+    "DRAW_ORDER": ("우선 전표 효과로 드로우/배치를 완료했습니다.", LAST_EVENT),
+    "END_TURN": ("턴이 종료되었습니다.", LAST_EVENT),
+    "START_TURN": ("턴이 시작되었습니다.", LAST_EVENT),
+    "END_TURN_FAILED": ("턴 종료에 실패했습니다.", None),
+}
+
+# 승리 코드 -> (승리 역할, 사유)
+WIN_MESSAGES: Dict[str, Tuple[str, str]] = {
+    "OUTLAWS": ("적도 세력", "상단주가 사망했습니다."),
+    "RENEGADE": ("야망가", "야망가가 마지막까지 생존했습니다."),
+    "SHERIFF": ("상단주", "상단주 팀이 승리했습니다."),
+}
+
+
+def _name(state: EngineState, seat: int) -> Optional[str]:
+    return state.players[seat].name if seat >= 0 else None
+
+
+def render_event(state: EngineState, event: Event) -> Tuple[str, str]:
+    """
+    엔진 이벤트를 (메시지, 이벤트 타입)으로 변환합니다.
+
+    Args:
+        state: 이벤트 발생 후 상태 (플레이어 이름 조회용)
+        event: 엔진 이벤트
+
+    Returns:
+        (메시지, 이벤트 타입)
+    """
+    template, event_type = EVENT_TEMPLATES[event.kind]
+    cause = CAUSE_NAMES.get(event.values[0]) if event.values else None
+    message = template.format(
+        *event.values,
+        name=_name(state, event.seat),
+        target=_name(state, event.target),
+        card=CARDS[event.card].name if event.card >= 0 else None,
+        cause=cause,
+    )
+    return message, event_type
+
+
+def failure_message(code: str, params: Tuple = ()) -> str:
+    """
+    실패 코드를 메시지로 변환합니다.
+
+    Args:
+        code: IllegalAction 코드
+        params: 메시지 포맷 인자
+
+    Returns:
+        실패 메시지
+    """
+    return FAILURE_MESSAGES.get(code, code).format(*params)
+
+
+def outcome_message(code: str, args: Tuple = ()) -> Tuple[str, object]:
+    """
+    결과 코드를 (메시지, 이벤트 규칙)으로 변환합니다.
+
+    Args:
+        code: Outcome 코드
+        args: 결과 인자 (EQUIP은 카드 인덱스)
+
+    Returns:
+        (메시지, 이벤트 규칙)
+    """
+    template, event = OUTCOME_MESSAGES[code]
+    card = CARDS[args[0]].name if args else None
+    return template.format(card=card), event
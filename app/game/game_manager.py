@@ -4,17 +4,25 @@
 게임의 생성, 초기화, 상태 관리, 승리 조건 체크 등을 담당합니다.
 """
 
+import os
+import secrets
+import time
 import uuid
-import random
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from app.engine import rules
 from app.models.game import Game
 from app.models.player import Player
-from app.models.card import Card
 from app.game.card_manager import CardManager
+from app.game import engine_bridge
+from app.game.event_text import WIN_MESSAGES
+from app.storage.action_log import ActionLog, delete_game_log, rebuild
+from app.storage.game_store import GameStore, InMemoryGameStore
+from app.storage.warm_restart import WarmRestartStore, WarmSnapshot, write_warm_snapshot
 from app.utils.constants import (
     GameState,
     TurnState,
     Role as RoleEnum,
+    BOT_NAME_PREFIXES,
     MIN_PLAYERS,
     MAX_PLAYERS,
 )
@@ -27,17 +35,51 @@ class GameManager:
     게임 인스턴스의 생성, 관리, 상태 업데이트를 담당합니다.
     """
     
-    def __init__(self):
-        """게임 매니저 초기화"""
+    def __init__(
+        self,
+        action_log_dir: Optional[str] = None,
+        snapshot_interval: int = 200,
+        store: Optional[GameStore] = None,
+    ):
+        """
+        게임 매니저 초기화
+        
+        Args:
+            action_log_dir: 게임별 액션 로그 / 스냅샷 디렉터리 (없으면 기록하지 않음)
+            snapshot_interval: 스냅샷 간격 (기록한 액션 수)
+            store: 게임 저장소 (없으면 메모리 저장소)
+        """
+        # 로드된 게임 캐시 (저장소에서 읽은 게임도 여기에 올려 두고 사용)
         self.games: Dict[str, Game] = {}  # 게임 ID -> Game 인스턴스
         self.card_managers: Dict[str, CardManager] = {}  # 게임 ID -> CardManager
+        self.store: GameStore = store if store is not None else InMemoryGameStore()
+        # 게임 ID -> 마지막 활동 시각 (time.monotonic, 수명 관리자가 사용)
+        self.last_activity: Dict[str, float] = {}
+        # 상태별 게임 수 (저장 / 로드 / 제거 때 갱신, 게임 수와 무관하게 count_by_state가 바로 반환)
+        self._state_counts: Dict[str, int] = {state.name: 0 for state in GameState}
+        # 게임 ID -> 마지막으로 센 상태 이름
+        self._counted_states: Dict[str, str] = {}
+        # 행동 마감 관리 (app.game.turn_timer.TurnTimer, 없으면 마감 없음)
+        self.turn_timer: Any = None
+        # AI 플레이어 구동 (app.game.bot_driver.BotDriver, 없으면 봇은 행동하지 않음)
+        self.bot_driver: Any = None
+        self.action_log_dir = action_log_dir
+        self.snapshot_interval = snapshot_interval
+    
+    def _attach_action_log(self, game: Game, fresh: bool = False) -> None:
+        """액션 로그가 설정되어 있으면 게임에 연결합니다 (fresh면 같은 ID의 이전 로그를 지움)."""
+        if self.action_log_dir:
+            game.action_log = ActionLog(self.action_log_dir, game.id, self.snapshot_interval, fresh=fresh)
     
-    def create_game(self, game_id: Optional[str] = None) -> Game:
+    def create_game(self, game_id: Optional[str] = None, seed: Optional[int] = None) -> Game:
         """
         새 게임을 생성합니다.
         
+        게임마다 시드가 고정된 난수 생성기를 두어 셔플 / 판정 / 역할 배정을 재현할 수 있습니다.
+        
         Args:
             game_id: 게임 ID (없으면 자동 생성)
+            seed: 난수 시드 (없으면 임의로 생성해 게임에 기록)
             
         Returns:
             생성된 Game 인스턴스
@@ -45,25 +87,102 @@ class GameManager:
         if game_id is None:
             game_id = f"game_{uuid.uuid4().hex[:8]}"
         
-        if game_id in self.games:
+        if self.get_game(game_id) is not None:
             raise ValueError(f"게임 ID {game_id}가 이미 존재합니다.")
         
+        if seed is None:
+            seed = secrets.randbits(63)
+        
         # 게임 생성
         game = Game(
             id=game_id,
             state=GameState.WAITING,
             turn_state=TurnState.DRAW,
+            seed=seed,
         )
         
-        # 카드 관리자 생성
-        card_manager = CardManager()
+        # 카드 관리자 생성 (게임 난수 생성기 공유)
+        card_manager = CardManager(rng=game.rng)
+        # 제거된 게임과 같은 ID를 다시 쓰면 남은 로그는 다른 게임의 것이므로 새로 시작
+        self._attach_action_log(game, fresh=True)
         
         # 저장
         self.games[game_id] = game
         self.card_managers[game_id] = card_manager
+        self.save_game(game_id)
+        
+        return game
+    
+    def restore_game(self, game_id: str) -> Game:
+        """
+        액션 로그의 최신 스냅샷과 로그 꼬리를 재생해 게임을 복원합니다.
+        
+        Args:
+            game_id: 게임 ID
+            
+        Returns:
+            복원된 Game 인스턴스
+            
+        Raises:
+            ValueError: 액션 로그가 설정되지 않았거나 이미 로드된 게임인 경우
+            FileNotFoundError: 게임의 스냅샷이 없는 경우
+        """
+        if not self.action_log_dir:
+            raise ValueError("액션 로그 디렉터리가 설정되지 않았습니다.")
+        if game_id in self.games:
+            raise ValueError(f"게임 ID {game_id}가 이미 존재합니다.")
+        
+        rebuilt = rebuild(self.action_log_dir, game_id)
+        game, card_manager = engine_bridge.build_game(
+            rebuilt.state,
+            rebuilt.rng,
+            rebuilt.seed,
+            rebuilt.version,
+            rebuilt.history,
+            rebuilt.events,
+        )
+        self._attach_action_log(game)
+        self.games[game_id] = game
+        self.card_managers[game_id] = card_manager
         
+        # 종료 판정은 로그에 남지 않으므로 복원 후 다시 확인
+        self.check_win_condition(game_id)
+        self.save_game(game_id)
         return game
     
+    def save_game(self, game_id: str) -> bool:
+        """
+        로드된 게임의 현재 상태를 저장소에 저장합니다.
+        
+        Args:
+            game_id: 게임 ID
+            
+        Returns:
+            저장 성공 여부 (로드되지 않은 게임이면 False)
+        """
+        game = self.games.get(game_id)
+        if game is None:
+            return False
+        card_manager = self.card_managers[game_id]
+        self.store.save(game, card_manager)
+        self._count_state(game_id, game)
+        self.last_activity[game_id] = time.monotonic()
+        if self.turn_timer is not None:
+            self.turn_timer.sync(game, card_manager)
+        if self.bot_driver is not None:
+            self.bot_driver.sync(game, card_manager)
+        return True
+    
+    def mark_active(self, game_id: str) -> None:
+        """
+        상태 변화 없이 게임의 마지막 활동 시각만 갱신합니다 (재연결 등).
+        
+        Args:
+            game_id: 게임 ID
+        """
+        if game_id in self.games:
+            self.last_activity[game_id] = time.monotonic()
+    
     def add_player_to_game(
         self,
         game_id: str,
@@ -105,6 +224,7 @@ class GameManager:
         )
         
         game.add_player(player)
+        self.save_game(game_id)
         return True
     
     def add_ai_players_to_game(
@@ -162,13 +282,9 @@ class GameManager:
         ai_players = []
         for i in range(add_count):
             ai_id = f"ai_{uuid.uuid4().hex[:8]}"
-            ai_name = f"AI_Player_{current_count + i + 1}"
-            
-            # 난이도에 따른 이름 (선택사항)
-            if difficulty == "easy":
-                ai_name = f"AI_Easy_{current_count + i + 1}"
-            elif difficulty == "hard":
-                ai_name = f"AI_Hard_{current_count + i + 1}"
+            # 난이도에 따른 이름 (봇 드라이버가 이름 접두사로 난이도를 판별)
+            prefix = BOT_NAME_PREFIXES.get(difficulty, BOT_NAME_PREFIXES["medium"])
+            ai_name = f"{prefix}_{current_count + i + 1}"
             
             # AI 플레이어 생성
             position = current_count + i
@@ -189,6 +305,7 @@ class GameManager:
                 f"AI 플레이어 {add_count}명이 추가되었습니다. (난이도: {difficulty})",
                 "notification"
             )
+            self.save_game(game_id)
         
         return {
             "success": True,
@@ -216,117 +333,14 @@ class GameManager:
         if len(game.players) < MIN_PLAYERS:
             return False  # 최소 인원 미달
         
-        # 역할 배정
-        self._assign_roles(game)
-        
-        # 카드 덱 생성 및 셔플
+        # 역할 배정, 덱 셔플, 초기 카드 분배, 첫 번째 플레이어 설정
+        # (역할과 무관하게 첫 번째 플레이어가 시작)
         card_manager = self.card_managers[game_id]
-        deck = card_manager.create_full_deck_and_shuffle()
-        game.deck = deck
-        
-        # 초기 카드 분배
-        self._deal_initial_cards(game, card_manager)
-        
-        # 게임 상태 변경
-        game.state = GameState.IN_PROGRESS
-        game.turn_number = 1
-        
-        # 첫 번째 플레이어 설정 (역할과 무관하게 첫 번째 플레이어가 시작)
-        if game.players:
-            first_player = game.players[0]
-            game.current_player_id = first_player.id
-            game.set_current_player(first_player.id)
-            game.set_turn_state(TurnState.DRAW)
+        engine_bridge.run(game, card_manager, rules.start)
+        self.save_game(game_id)
         
         return True
     
-    def _assign_roles(self, game: Game) -> None:
-        """
-        플레이어들에게 역할을 배정합니다.
-        
-        Args:
-            game: 게임 인스턴스
-        """
-        player_count = len(game.players)
-        roles: List[RoleEnum] = []
-        
-        # 플레이어 수에 따른 역할 구성
-        if player_count == 4:
-            roles = [
-                RoleEnum.SHERIFF,
-                RoleEnum.DEPUTY,
-                RoleEnum.OUTLAW,
-                RoleEnum.RENEGADE,
-            ]
-        elif player_count == 5:
-            roles = [
-                RoleEnum.SHERIFF,
-                RoleEnum.DEPUTY,
-                RoleEnum.OUTLAW,
-                RoleEnum.OUTLAW,
-                RoleEnum.RENEGADE,
-            ]
-        elif player_count == 6:
-            roles = [
-                RoleEnum.SHERIFF,
-                RoleEnum.DEPUTY,
-                RoleEnum.DEPUTY,
-                RoleEnum.OUTLAW,
-                RoleEnum.OUTLAW,
-                RoleEnum.RENEGADE,
-            ]
-        elif player_count == 7:
-            roles = [
-                RoleEnum.SHERIFF,
-                RoleEnum.DEPUTY,
-                RoleEnum.DEPUTY,
-                RoleEnum.OUTLAW,
-                RoleEnum.OUTLAW,
-                RoleEnum.OUTLAW,
-                RoleEnum.RENEGADE,
-            ]
-        else:
-            # 기본 구성 (4명 기준)
-            roles = [
-                RoleEnum.SHERIFF,
-                RoleEnum.DEPUTY,
-                RoleEnum.OUTLAW,
-                RoleEnum.RENEGADE,
-            ]
-            # 나머지는 적도 세력으로 채움
-            while len(roles) < player_count:
-                roles.append(RoleEnum.OUTLAW)
-        # 모든 역할 셔플 (상단주 고정 없음)
-        random.shuffle(roles)
-        final_roles = roles
-        
-        # 플레이어에게 역할 배정
-        for i, player in enumerate(game.players):
-            from app.models.role import Role
-            player.role = Role(final_roles[i])
-            # 역할에 따른 초기 재력 재설정
-            from app.utils.constants import INITIAL_HP
-            initial_hp = INITIAL_HP[final_roles[i]]
-            player.hp = initial_hp
-            player.max_hp = initial_hp
-    
-    def _deal_initial_cards(self, game: Game, card_manager: CardManager) -> None:
-        """
-        게임 시작 시 초기 카드를 분배합니다.
-        
-        Args:
-            game: 게임 인스턴스
-            card_manager: 카드 관리자
-        """
-        for player in game.players:
-            # 플레이어 수에 따른 초기 카드 수
-            initial_cards = 4 if len(game.players) <= 4 else 5
-            
-            # 카드 분배
-            cards = card_manager.draw_cards(initial_cards)
-            for card in cards:
-                player.add_card(card)
-    
     def get_game(self, game_id: str) -> Optional[Game]:
         """
         게임을 조회합니다.
@@ -337,7 +351,28 @@ class GameManager:
         Returns:
             Game 인스턴스 (없으면 None)
         """
-        return self.games.get(game_id)
+        game = self.games.get(game_id)
+        if game is None:
+            game = self._load_from_store(game_id)
+        return game
+    
+    def _load_from_store(self, game_id: str) -> Optional[Game]:
+        """캐시에 없는 게임을 저장소에서 읽어 캐시에 올립니다."""
+        loaded = self.store.load(game_id)
+        if loaded is None:
+            return None
+        game, card_manager = loaded
+        if game.action_log is None:
+            self._attach_action_log(game)
+        self.games[game_id] = game
+        self.card_managers[game_id] = card_manager
+        self._count_state(game_id, game)
+        self.last_activity[game_id] = time.monotonic()
+        if self.turn_timer is not None:
+            self.turn_timer.sync(game, card_manager)
+        if self.bot_driver is not None:
+            self.bot_driver.sync(game, card_manager)
+        return game
     
     def get_card_manager(self, game_id: str) -> Optional[CardManager]:
         """
@@ -349,11 +384,13 @@ class GameManager:
         Returns:
             CardManager 인스턴스 (없으면 None)
         """
+        if game_id not in self.card_managers:
+            self._load_from_store(game_id)
         return self.card_managers.get(game_id)
     
     def remove_game(self, game_id: str) -> bool:
         """
-        게임을 제거합니다.
+        게임을 제거합니다 (액션 로그 / 스냅샷도 삭제).
         
         Args:
             game_id: 게임 ID
@@ -361,12 +398,114 @@ class GameManager:
         Returns:
             제거 성공 여부
         """
-        if game_id in self.games:
-            del self.games[game_id]
-            if game_id in self.card_managers:
-                del self.card_managers[game_id]
-            return True
-        return False
+        game = self.games.pop(game_id, None)
+        if game is None:
+            # 로드하지 않은 게임은 캐시에 올리지 않고 (타이머 / 봇 예약 없이) 저장소에서만 지움
+            if self.store.summary(game_id) is None:
+                return False
+            if self.action_log_dir:
+                delete_game_log(self.action_log_dir, game_id)
+        elif game.action_log is not None:
+            game.action_log.delete()
+        self.card_managers.pop(game_id, None)
+        self.last_activity.pop(game_id, None)
+        counted = self._counted_states.pop(game_id, None)
+        if counted is not None:
+            self._state_counts[counted] -= 1
+        if self.turn_timer is not None:
+            self.turn_timer.cancel(game_id)
+        if self.bot_driver is not None:
+            self.bot_driver.cancel(game_id)
+        self.store.delete(game_id)
+        return True
+    
+    def _count_state(self, game_id: str, game: Game) -> None:
+        """게임의 현재 상태를 상태별 게임 수에 반영합니다 (상태가 바뀐 경우만)."""
+        # use_enum_values라 생성 직후에는 값 문자열, 이후 대입은 GameState일 수 있음
+        name = GameState(game.state).name
+        previous = self._counted_states.get(game_id)
+        if previous == name:
+            return
+        if previous is not None:
+            self._state_counts[previous] -= 1
+        self._state_counts[name] += 1
+        self._counted_states[game_id] = name
+    
+    def count_by_state(self) -> Dict[str, int]:
+        """
+        메모리에 있는 게임 수를 상태별로 반환합니다 (모든 상태 포함, 없으면 0).
+        
+        상태는 게임을 저장 / 로드 / 제거할 때 갱신해 두므로 게임 수와 무관하게 바로 반환합니다.
+        
+        Returns:
+            GameState 이름 -> 게임 수
+        """
+        return dict(self._state_counts)
+    
+    def _iter_serialized_games(self) -> Iterator[Tuple[str, bytes]]:
+        """로드된 게임과 아직 복원하지 않은 웜 리스타트 게임을 직렬화된 형태로 하나씩 돌려줍니다."""
+        for game_id in list(self.games):
+            yield game_id, engine_bridge.serialize_game(self.games[game_id], self.card_managers[game_id])
+        if isinstance(self.store, WarmRestartStore):
+            yield from self.store.snapshot.iter_pending()
+    
+    def save_warm_snapshot(self, path: str, player_games: Dict[str, str]) -> int:
+        """
+        웜 리스타트용으로 게임 전체와 플레이어 -> 게임 매핑을 파일에 기록합니다 (종료 시 호출).
+        
+        연결이 먼저 정리되어 매핑이 비어 있어도 복원되도록, 게임에 참가한 사람 플레이어도 매핑에 넣습니다.
+        
+        Args:
+            path: 스냅샷 파일 경로
+            player_games: 연결 관리자의 플레이어 ID -> 게임 ID
+            
+        Returns:
+            기록한 게임 수
+        """
+        mapping: Dict[str, str] = {}
+        if isinstance(self.store, WarmRestartStore):
+            pending = set(self.store.snapshot.game_ids())
+            mapping.update(
+                (player_id, game_id)
+                for player_id, game_id in self.store.snapshot.player_games.items()
+                if game_id in pending
+            )
+        for game in self.games.values():
+            mapping.update((p.id, game.id) for p in game.players if not p.is_bot)
+        mapping.update(player_games)
+        count = write_warm_snapshot(path, self._iter_serialized_games(), mapping)
+        if isinstance(self.store, WarmRestartStore):
+            # 이전 스냅샷의 남은 게임은 새 스냅샷으로 넘어갔으므로 정리
+            self.store.snapshot.close()
+            os.remove(self.store.snapshot.path)
+        return count
+    
+    def pending_warm_game_ids(self) -> List[str]:
+        """
+        웜 리스타트 스냅샷에 남아 있고 아직 한 번도 조회되지 않은 게임 ID 목록
+        
+        Returns:
+            게임 ID 목록 (스냅샷을 열지 않았으면 빈 목록)
+        """
+        if isinstance(self.store, WarmRestartStore):
+            return self.store.snapshot.game_ids()
+        return []
+    
+    def load_warm_snapshot(self, path: str) -> Dict[str, str]:
+        """
+        웜 리스타트 스냅샷을 엽니다 (기동 시 호출). 게임은 처음 조회될 때 복원됩니다.
+        
+        Args:
+            path: 스냅샷 파일 경로
+            
+        Returns:
+            플레이어 ID -> 게임 ID (스냅샷이 없으면 빈 딕셔너리)
+        """
+        if not os.path.exists(path):
+            return {}
+        snapshot = WarmSnapshot(path)
+        self.store = WarmRestartStore(self.store, snapshot)
+        return dict(snapshot.player_games)
     
     def check_win_condition(self, game_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -387,49 +526,21 @@ class GameManager:
         if not game or game.state != GameState.IN_PROGRESS:
             return None
         
-        alive_players = game.get_alive_players()
-        
-        # 상단주 확인
-        sheriff = next((p for p in alive_players if p.role.is_sheriff), None)
-        
-        if not sheriff:
-            # 상단주 사망 - 적도 세력 승리
-            outlaws = [p for p in alive_players if p.role.is_outlaw]
-            if outlaws:
-                game.state = GameState.FINISHED
-                return {
-                    "winner_id": outlaws[0].id,
-                    "winner_role": "적도 세력",
-                    "reason": "상단주가 사망했습니다.",
-                }
-        else:
-            # 상단주 생존
-            # 적도 세력이 모두 사망했는지 확인
-            outlaws = [p for p in alive_players if p.role.is_outlaw]
-            
-            if not outlaws:
-                # 적도 세력 모두 사망
-                # 야망가가 혼자 남았는지 확인
-                renegades = [p for p in alive_players if p.role.is_renegade]
-                
-                if len(renegades) == 1 and len(alive_players) == 2:
-                    # 야망가가 상단주와 1대1 상황 - 야망가 승리
-                    game.state = GameState.FINISHED
-                    return {
-                        "winner_id": renegades[0].id,
-                        "winner_role": "야망가",
-                        "reason": "야망가가 마지막까지 생존했습니다.",
-                    }
-                else:
-                    # 상단주 팀 승리
-                    game.state = GameState.FINISHED
-                    return {
-                        "winner_id": sheriff.id,
-                        "winner_role": "상단주",
-                        "reason": "상단주 팀이 승리했습니다.",
-                    }
-        
-        return None  # 아직 승리 조건 미충족
+        state = engine_bridge.load_state(game, self.card_managers[game_id])
+        result = rules.winner(state)
+        if result is None:
+            return None  # 아직 승리 조건 미충족
+        
+        code, seat = result
+        winner_role, reason = WIN_MESSAGES[code]
+        game.state = GameState.FINISHED
+        game.touch()
+        self.save_game(game_id)
+        return {
+            "winner_id": state.players[seat].id,
+            "winner_role": winner_role,
+            "reason": reason,
+        }
     
     def get_game_state_dict(self, game_id: str, player_id: Optional[str] = None) -> Optional[dict]:
         """
@@ -452,16 +563,26 @@ class GameManager:
         """
         모든 게임 목록을 반환합니다.
         
+        로드되지 않은 게임은 저장소의 요약만 읽고 캐시에 올리지 않습니다.
+        
         Returns:
             게임 목록
         """
-        return [
-            {
-                "id": game.id,
-                "state": game.state.value,
-                "player_count": len(game.players),
+        games = []
+        for game_id in self.store.list_ids():
+            game = self.games.get(game_id)
+            if game is not None:
+                summary = (GameState(game.state).value, len(game.players))
+            else:
+                summary = self.store.summary(game_id)
+                if summary is None:
+                    continue
+            state, player_count = summary
+            games.append({
+                "id": game_id,
+                "state": state,
+                "player_count": player_count,
                 "max_players": MAX_PLAYERS,
-            }
-            for game in self.games.values()
-        ]
+            })
+        return games
 
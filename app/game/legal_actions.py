@@ -0,0 +1,131 @@
+"""
+합법 액션 조회 (Legal Actions)
+
+엔진의 합법 액션 생성기를 게임 모델에 연결하고, 결과를 상태 버전별로 캐시합니다.
+클라이언트에는 PLAYER_ACTION 메시지의 action 형식 그대로 전달됩니다.
+"""
+
+from typing import Dict, List, Optional
+
+from app.engine.cards import CARD_IDS
+from app.engine.legal import legal_actions
+from app.engine.rules import GIVE_UP, Action
+from app.engine.state import EngineState
+from app.game import engine_bridge
+from app.game.card_manager import CardManager
+from app.models.game import Game
+from app.utils.constants import ActionType
+
+_CACHE_KEY = "legal_actions"
+
+
+def to_client_action(state: EngineState, action: Action) -> Dict:
+    """
+    엔진 액션을 클라이언트 PLAYER_ACTION의 action 형식으로 변환합니다.
+
+    Args:
+        state: 엔진 상태
+        action: 엔진 액션
+
+    Returns:
+        action 딕셔너리 ({"type", "cardId", "targetId", ...})
+    """
+    kind = action.kind
+    if kind == GIVE_UP:
+        return {"type": ActionType.RESPOND_ATTACK.value, "response": "give_up"}
+    if kind == ActionType.RESPOND_ATTACK:
+        return {"type": kind.value, "response": "evade", "cardId": CARD_IDS[action.card]}
+    if kind == ActionType.USE_TREASURE:
+        return {
+            "type": kind.value,
+            "treasure": action.name,
+            "cardIds": [CARD_IDS[c] for c in action.cards],
+        }
+    if kind == ActionType.SELECT_DRAW_ORDER:
+        take, top, bottom = action.cards
+        return {
+            "type": kind.value,
+            "takeCardId": CARD_IDS[take],
+            "topCardId": CARD_IDS[top],
+            "bottomCardId": CARD_IDS[bottom],
+        }
+    result = {"type": kind.value}
+    if action.card is not None:
+        result["cardId"] = CARD_IDS[action.card]
+    if action.target is not None:
+        result["targetId"] = state.players[action.target].id
+    return result
+
+
+def to_handler_data(state: EngineState, action: Action) -> Dict:
+    """
+    엔진 액션을 ActionHandler.handle_action의 data 형식으로 변환합니다 (to_engine_action의 역변환).
+
+    Args:
+        state: 엔진 상태
+        action: 엔진 액션
+
+    Returns:
+        data 딕셔너리 ({"card_id", "target_id", "card_ids", "treasure"} 또는 드로우 순서 카드 ID)
+    """
+    if action.kind == ActionType.SELECT_DRAW_ORDER:
+        take, top, bottom = action.cards
+        return {
+            "take_card_id": CARD_IDS[take],
+            "top_card_id": CARD_IDS[top],
+            "bottom_card_id": CARD_IDS[bottom],
+        }
+    data = {"card_ids": [CARD_IDS[c] for c in action.cards], "treasure": action.name}
+    if action.card is not None:
+        data["card_id"] = CARD_IDS[action.card]
+    if action.target is not None:
+        data["target_id"] = state.players[action.target].id
+    return data
+
+
+def get_legal_engine_actions(
+    game: Game,
+    player_id: str,
+    card_manager: Optional[CardManager] = None,
+) -> List[Action]:
+    """
+    플레이어의 합법 액션을 엔진 액션으로 반환합니다 (봇 / 탐색용).
+
+    Args:
+        game: Game 인스턴스
+        player_id: 플레이어 ID
+        card_manager: 게임의 CardManager (없으면 게임 모델의 덱을 사용)
+
+    Returns:
+        엔진 액션 목록
+    """
+    cache = game.version_cache().setdefault(_CACHE_KEY, {})
+    entry = cache.get(player_id)
+    if entry is None:
+        state = engine_bridge.load_state(game, card_manager)
+        seat = state.seat_of.get(player_id, -1)
+        actions = legal_actions(state, seat)
+        entry = cache[player_id] = (actions, [to_client_action(state, a) for a in actions])
+    return entry[0]
+
+
+def get_legal_actions(
+    game: Game,
+    player_id: str,
+    card_manager: Optional[CardManager] = None,
+) -> List[Dict]:
+    """
+    플레이어가 현재 보낼 수 있는 모든 액션을 클라이언트 형식으로 반환합니다.
+
+    결과는 게임 상태 버전(game.version)이 바뀔 때까지 캐시됩니다.
+
+    Args:
+        game: Game 인스턴스
+        player_id: 플레이어 ID
+        card_manager: 게임의 CardManager (없으면 게임 모델의 덱을 사용)
+
+    Returns:
+        action 딕셔너리 목록 (PLAYER_ACTION의 action 형식)
+    """
+    get_legal_engine_actions(game, player_id, card_manager)
+    return game.version_cache()[_CACHE_KEY][player_id][1]
@@ -0,0 +1,174 @@
+"""
+게임 수명 관리자 (Game Lifecycle Manager)
+
+주기적으로 게임을 훑어 더 이상 필요 없는 게임을 정리합니다.
+
+- FINISHED: 마지막 활동 후 finished_ttl이 지나면 제거 (결과 화면을 볼 유예 시간)
+- WAITING: 연결된 사람 플레이어가 없고 마지막 활동 후 waiting_ttl이 지나면 제거
+- IN_PROGRESS: 연결된 사람 플레이어가 없고 마지막 활동 후 abandoned_ttl이 지나면 제거
+
+마지막 활동 시각은 GameManager.last_activity (게임 저장 / 재연결 시 갱신)를 사용합니다.
+웜 리스타트 뒤 한 번도 조회되지 않은 게임은 기동 시각을 마지막 활동으로 보고 같은 기준으로 버립니다.
+"""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from app.game.game_manager import GameManager
+from app.utils.constants import GameState
+from app.utils.memory import deep_sizeof
+
+if TYPE_CHECKING:
+    from app.websocket.connection_manager import ConnectionManager
+
+# 제거 사유
+REASON_FINISHED = "finished"
+REASON_EMPTY = "empty"
+REASON_ABANDONED = "abandoned"
+
+
+class GameLifecycleManager:
+    """
+    게임 수명 관리자 클래스
+
+    sweep()이 한 번의 정리를 수행하고, run()은 interval초마다 sweep()을 호출합니다.
+    """
+
+    def __init__(
+        self,
+        game_manager: GameManager,
+        connection_manager: "ConnectionManager",
+        finished_ttl: float = 300,
+        waiting_ttl: float = 120,
+        abandoned_ttl: float = 900,
+        interval: float = 30,
+    ):
+        """
+        Args:
+            game_manager: 게임 매니저
+            connection_manager: 연결 관리자 (연결된 사람 플레이어 확인용)
+            finished_ttl: 종료된 게임을 남겨 둘 시간 (초)
+            waiting_ttl: 사람이 없는 대기 게임을 남겨 둘 시간 (초)
+            abandoned_ttl: 사람이 없는 진행 중 게임을 남겨 둘 시간 (초)
+            interval: 정리 주기 (초)
+        """
+        self.game_manager = game_manager
+        self.connection_manager = connection_manager
+        self.finished_ttl = finished_ttl
+        self.waiting_ttl = waiting_ttl
+        self.abandoned_ttl = abandoned_ttl
+        self.interval = interval
+
+        self.evictions: Dict[str, int] = {REASON_FINISHED: 0, REASON_EMPTY: 0, REASON_ABANDONED: 0}
+        self.bytes_reclaimed = 0
+        self.sweeps = 0
+        self.last_sweep: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+        self.started_at = time.monotonic()
+
+    def _has_connected_human(self, game_id: str) -> bool:
+        connections = self.connection_manager
+        return any(connections.is_connected(player_id) for player_id in connections.get_game_players(game_id))
+
+    def _eviction_reason(self, game_id: str, now: float) -> Optional[str]:
+        game = self.game_manager.games.get(game_id)
+        if game is None:
+            return None
+        idle = now - self.game_manager.last_activity.get(game_id, now)
+        if game.state == GameState.FINISHED:
+            return REASON_FINISHED if idle >= self.finished_ttl else None
+        if self._has_connected_human(game_id):
+            return None
+        if game.state == GameState.WAITING:
+            return REASON_EMPTY if idle >= self.waiting_ttl else None
+        return REASON_ABANDONED if idle >= self.abandoned_ttl else None
+
+    def sweep(self, now: Optional[float] = None) -> List[Tuple[str, str, int]]:
+        """
+        제거 대상 게임을 찾아 제거합니다.
+
+        Args:
+            now: 기준 시각 (time.monotonic 기준, 테스트용)
+
+        Returns:
+            제거한 (게임 ID, 사유, 회수한 바이트 추정치) 목록
+        """
+        now = time.monotonic() if now is None else now
+        started = time.perf_counter()
+        evicted = []
+        for game_id in list(self.game_manager.games):
+            reason = self._eviction_reason(game_id, now)
+            if reason is None:
+                continue
+            size = deep_sizeof(
+                self.game_manager.games[game_id],
+                self.game_manager.card_managers.get(game_id),
+            )
+            self.game_manager.remove_game(game_id)
+            self.connection_manager.forget_game(game_id)
+            self.evictions[reason] += 1
+            self.bytes_reclaimed += size
+            evicted.append((game_id, reason, size))
+        if now - self.started_at >= self.abandoned_ttl:
+            # 웜 리스타트 후 아무도 돌아오지 않은 게임은 메모리에 올리지 않고 버림
+            for game_id in self.game_manager.pending_warm_game_ids():
+                if not self._has_connected_human(game_id):
+                    self.game_manager.store.delete(game_id)
+                    self.connection_manager.forget_game(game_id)
+                    self.evictions[REASON_ABANDONED] += 1
+                    evicted.append((game_id, REASON_ABANDONED, 0))
+        # 연결이 끊긴 뒤 남은 빈 플레이어 집합 정리
+        self.connection_manager.prune_empty_games()
+        self.sweeps += 1
+        self.last_sweep = {
+            "evicted": len(evicted),
+            "bytesReclaimed": sum(size for _, _, size in evicted),
+            "durationMs": round((time.perf_counter() - started) * 1000, 3),
+        }
+        return evicted
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        정리 통계를 반환합니다.
+
+        Returns:
+            {
+                "games": int,  # 현재 로드된 게임 수
+                "evictions": {"finished": int, "empty": int, "abandoned": int},
+                "evictedTotal": int,
+                "bytesReclaimed": int,  # 제거한 게임의 메모리 추정치 합계
+                "sweeps": int,
+                "lastSweep": {"evicted": int, "bytesReclaimed": int, "durationMs": float} | None
+            }
+        """
+        return {
+            "games": len(self.game_manager.games),
+            "evictions": dict(self.evictions),
+            "evictedTotal": sum(self.evictions.values()),
+            "bytesReclaimed": self.bytes_reclaimed,
+            "sweeps": self.sweeps,
+            "lastSweep": self.last_sweep,
+        }
+
+    async def run(self) -> None:
+        """interval초마다 sweep()을 호출합니다 (취소될 때까지)."""
+        while True:
+            await asyncio.sleep(self.interval)
+            self.sweep()
+
+    def start(self) -> None:
+        """백그라운드 정리 작업을 시작합니다."""
+        if self._task is None:
+            self.started_at = time.monotonic()
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        """백그라운드 정리 작업을 멈춥니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
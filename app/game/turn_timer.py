@@ -0,0 +1,194 @@
+"""
+턴 타이머 (Turn Timer)
+
+게임마다 지금 행동해야 하는 플레이어의 마감 시각을 관리합니다.
+프로세스 전체의 TimerScheduler 하나를 공유하므로 게임 수와 관계없이 태스크는 하나입니다.
+
+- 턴 (카드 사용 단계): turn_timeout 뒤 턴 종료
+- 공격 대응: respond_timeout 뒤 포기
+- 선택 요청 (드로우 순서 / 자선 경매 / 강탈 카드): selection_timeout 뒤 첫 번째 합법 선택
+- 드로우 단계: 고를 것이 없으므로 바로 턴 시작
+
+턴 중에 공격 대응이나 선택이 끼어들면 턴 시계는 멈췄다가, 턴으로 돌아오면 남은 시간부터 다시 흐릅니다.
+마감이 지나면 on_timeout(game_id, 단계 키)을 호출하고, 기본 액션 적용은 호출한 쪽이 맡습니다.
+기본 액션이 실패하면 (실패 결과 또는 예외) 경고를 남기고 retry_delay 뒤 같은 단계 키로 다시 겁니다.
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+from app.engine.legal import PHASE_DRAW, PHASE_RESPOND, PHASE_TURN, acting_phase
+from app.game import engine_bridge
+from app.game.card_manager import CardManager
+from app.models.game import Game
+from app.utils.scheduler import TimerScheduler
+
+# 단계 키: (단계, 좌석, 턴 번호) - 키가 바뀌어야 마감을 다시 검
+PhaseKey = Tuple[str, int, int]
+
+
+class TurnTimer:
+    """
+    턴 타이머 클래스
+
+    GameManager가 게임을 저장할 때마다 sync()를 호출해 마감을 맞춥니다.
+    타임아웃 값이 0 이하인 단계는 마감을 걸지 않습니다 (드로우 단계는 항상 바로 처리).
+    """
+
+    def __init__(
+        self,
+        on_timeout: Callable[[str, PhaseKey], Awaitable[Any]],
+        turn_timeout: float = 60,
+        respond_timeout: float = 20,
+        selection_timeout: float = 20,
+        retry_delay: float = 5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            on_timeout: 마감이 지난 게임마다 호출할 코루틴 함수 (game_id, 단계 키)
+                - {"success": False, ...}를 반환하거나 예외가 나면 실패로 보고 다시 마감을 걸음
+            turn_timeout: 턴 제한 시간 (초)
+            respond_timeout: 공격 대응 제한 시간 (초)
+            selection_timeout: 선택 요청 제한 시간 (초)
+            retry_delay: 기본 액션이 실패했을 때 다시 시도할 때까지의 시간 (초)
+            clock: 현재 시각 함수 (스케줄러와 공유)
+        """
+        self.on_timeout = on_timeout
+        self.retry_delay = retry_delay
+        self.timeouts = {
+            PHASE_TURN: turn_timeout,
+            PHASE_RESPOND: respond_timeout,
+        }
+        self.selection_timeout = selection_timeout
+        self.scheduler = TimerScheduler(self._expire, clock=clock)
+        # 게임 ID -> 마감이 걸린 단계 키
+        self._keys: Dict[str, PhaseKey] = {}
+        # 게임 ID -> (멈춘 턴의 단계 키, 남은 시간)
+        self._paused: Dict[str, Tuple[PhaseKey, float]] = {}
+        self.expired: Dict[str, int] = {}
+        self.failed = 0
+
+    def _timeout(self, phase: str) -> float:
+        return self.timeouts.get(phase, self.selection_timeout)
+
+    def sync(self, game: Game, card_manager: Optional[CardManager] = None) -> None:
+        """
+        게임의 현재 행동 단계에 맞게 마감을 걸거나 취소합니다.
+
+        같은 단계 키가 이미 걸려 있으면 아무것도 하지 않으므로 (마감 유지) 매 저장마다 불러도 됩니다.
+
+        Args:
+            game: Game 인스턴스
+            card_manager: 게임의 CardManager
+        """
+        game_id = game.id
+        state = engine_bridge.load_state(game, card_manager)
+        acting = acting_phase(state)
+        if acting is None:
+            self.cancel(game_id)
+            game.turn_deadline = None
+            return
+        phase, seat = acting
+        key = (phase, seat, state.turn_number)
+        previous = self._keys.get(game_id)
+        scheduler = self.scheduler
+        now = scheduler.clock()
+        if previous == key:
+            if game.turn_deadline is None and phase != PHASE_DRAW:
+                # 저장소에서 다시 읽은 게임 객체에 마감 표시만 옮김
+                game.turn_deadline = time.time() + scheduler.deadline(game_id) - now
+            return
+
+        if phase == PHASE_DRAW:
+            delay = 0.0
+        elif phase == PHASE_TURN:
+            paused = self._paused.pop(game_id, None)
+            delay = paused[1] if paused is not None and paused[0] == key else self._timeout(phase)
+        else:
+            # 턴 중에 끼어든 대응 / 선택이면 턴 시계를 멈춤
+            if previous is not None and previous[0] == PHASE_TURN:
+                remaining = scheduler.deadline(game_id)
+                if remaining is not None:
+                    self._paused[game_id] = (previous, max(0.0, remaining - now))
+            delay = self._timeout(phase)
+
+        if phase != PHASE_DRAW and self._timeout(phase) <= 0:
+            # 이 단계는 제한 시간을 쓰지 않음
+            scheduler.cancel(game_id)
+            self._keys.pop(game_id, None)
+            game.turn_deadline = None
+            return
+        self._keys[game_id] = key
+        scheduler.arm(game_id, now + delay, key)
+        game.turn_deadline = None if phase == PHASE_DRAW else time.time() + delay
+
+    def cancel(self, game_id: str) -> None:
+        """
+        게임의 마감을 모두 취소합니다 (게임 종료 / 제거 시).
+
+        Args:
+            game_id: 게임 ID
+        """
+        self.scheduler.cancel(game_id)
+        self._keys.pop(game_id, None)
+        self._paused.pop(game_id, None)
+
+    def current_key(self, game_id: str) -> Optional[PhaseKey]:
+        """게임에 걸린 단계 키 (없으면 None)"""
+        return self._keys.get(game_id)
+
+    def _expire(self, game_id: str, key: PhaseKey) -> Optional[Awaitable[Any]]:
+        if self._keys.get(game_id) != key:
+            return None
+        del self._keys[game_id]
+        self.expired[key[0]] = self.expired.get(key[0], 0) + 1
+        return self._run_timeout(game_id, key)
+
+    async def _run_timeout(self, game_id: str, key: PhaseKey) -> Any:
+        try:
+            result = await self.on_timeout(game_id, key)
+        except Exception:
+            logger.exception("행동 마감 처리 중 오류: game={} key={}", game_id, key)
+            result = None
+            failed = True
+        else:
+            failed = isinstance(result, dict) and not result.get("success", True)
+            if failed:
+                logger.warning("행동 마감 기본 액션 실패: game={} key={} result={}", game_id, key, result)
+        if failed:
+            self.failed += 1
+            # 저장이 없으면 sync()가 다시 걸지 않으므로, 그 사이 다른 마감이 걸리지 않았다면 다시 시도
+            if game_id not in self._keys:
+                self._keys[game_id] = key
+                self.scheduler.arm(game_id, self.scheduler.clock() + self.retry_delay, key)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        타이머 통계를 반환합니다.
+
+        Returns:
+            {
+                "armed": int,  # 마감이 걸린 게임 수
+                "paused": int,  # 턴 시계가 멈춘 게임 수
+                "expired": {"draw": int, "turn": int, "respond": int, "selection": int},
+                "failed": int  # 기본 액션이 실패해 다시 건 횟수
+            }
+        """
+        return {
+            "armed": len(self.scheduler),
+            "paused": len(self._paused),
+            "expired": dict(self.expired),
+            "failed": self.failed,
+        }
+
+    def start(self) -> None:
+        """스케줄러 루프를 시작합니다."""
+        self.scheduler.start()
+
+    async def stop(self) -> None:
+        """스케줄러 루프를 멈춥니다."""
+        await self.scheduler.stop()
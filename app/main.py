@@ -2,19 +2,39 @@
 FastAPI 애플리케이션 진입점
 """
 
+import asyncio
 import json
+import threading
 import uuid
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional
-from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
+from loguru import logger
 from app.config import settings
+from app.game.bot_driver import BotDriver
 from app.game.game_manager import GameManager
+from app.game.lifecycle import GameLifecycleManager
+from app.game.turn_timer import TurnTimer
+from app.monitoring import REGISTRY, register_gauges
+from app.monitoring.bandwidth import BandwidthMeter
+from app.monitoring.live_stats import LiveStats
+from app.monitoring.log_pipeline import LogPipeline, RateLimiter
+from app.monitoring.loop_monitor import LoopLagMonitor, SlowOperationLog
+from app.monitoring.memory_report import TracemallocDiff, process_memory, top_games
+from app.monitoring.metrics import DISCONNECT_CLIENT_CLOSED, DISCONNECT_ERROR, DISCONNECT_JOIN_FAILED
+from app.monitoring.profiler import PATH_FILTERS, SamplingProfiler
+from app.monitoring.readiness import ReadinessProbe
+from app.monitoring.slow_capture import SlowActionCapture
+from app.monitoring.tracing import TRACER, JsonlExporter, RingExporter, traces_to_otlp
+from app.storage.action_log import flush_action_logs
+from app.storage.game_store import create_game_store
 from app.websocket.connection_manager import ConnectionManager
 from app.websocket.message_handler import MessageHandler
+from app.security.admin import is_admin_token, require_admin
 from app.security.auth import get_player_id_from_token
 
 # FastAPI 앱 생성
@@ -36,9 +56,96 @@ app.add_middleware(
 )
 
 # 전역 인스턴스
-game_manager = GameManager()
-connection_manager = ConnectionManager()
-message_handler = MessageHandler(game_manager, connection_manager)
+game_manager = GameManager(
+    action_log_dir=settings.ACTION_LOG_DIR,
+    snapshot_interval=settings.ACTION_LOG_SNAPSHOT_INTERVAL,
+    store=create_game_store(
+        settings.GAME_STORE_BACKEND,
+        sqlite_path=settings.GAME_STORE_SQLITE_PATH,
+        redis_url=settings.GAME_STORE_REDIS_URL,
+        flush_interval_ms=settings.GAME_STORE_FLUSH_INTERVAL_MS,
+        batch_size=settings.GAME_STORE_BATCH_SIZE,
+    ),
+)
+bandwidth = BandwidthMeter(
+    window=settings.BANDWIDTH_WINDOW_MINUTES,
+    game_budget=int(settings.BANDWIDTH_GAME_BUDGET_KB_PER_MIN * 1024),
+)
+connection_manager = ConnectionManager(bandwidth)
+slow_operations = SlowOperationLog(
+    threshold=settings.SLOW_HANDLER_MS / 1000,
+    capacity=settings.SLOW_OPERATIONS_KEEP,
+)
+slow_capture = SlowActionCapture(
+    settings.SLOW_ACTION_CAPTURE_DIR,
+    threshold=settings.SLOW_ACTION_CAPTURE_MS / 1000,
+    max_files=settings.SLOW_ACTION_CAPTURE_MAX_FILES,
+) if settings.SLOW_ACTION_CAPTURE_DIR else None
+message_handler = MessageHandler(game_manager, connection_manager, slow_operations, slow_capture)
+turn_timer = TurnTimer(
+    message_handler.handle_timeout,
+    turn_timeout=settings.TURN_TIMEOUT,
+    respond_timeout=settings.RESPOND_TIMEOUT,
+    selection_timeout=settings.SELECTION_TIMEOUT,
+)
+game_manager.turn_timer = turn_timer
+bot_driver = BotDriver(
+    game_manager,
+    message_handler.apply_player_action,
+    think_time=(settings.BOT_THINK_TIME_MIN, settings.BOT_THINK_TIME_MAX),
+    workers=settings.BOT_WORKERS,
+    search_workers=settings.BOT_SEARCH_WORKERS,
+    search_budget=settings.BOT_SEARCH_BUDGET_MS / 1000,
+    batch=settings.BOT_BATCH_POLICY,
+)
+game_manager.bot_driver = bot_driver
+lifecycle_manager = GameLifecycleManager(
+    game_manager,
+    connection_manager,
+    finished_ttl=settings.GAME_FINISHED_TTL,
+    waiting_ttl=settings.GAME_WAITING_TTL,
+    abandoned_ttl=settings.GAME_ABANDONED_TTL,
+    interval=settings.GAME_REAPER_INTERVAL,
+)
+loop_monitor = LoopLagMonitor(interval=settings.LOOP_LAG_INTERVAL)
+live_stats = LiveStats(
+    connection_manager,
+    game_manager,
+    loop_monitor,
+    bot_driver=bot_driver,
+    bandwidth=bandwidth,
+    interval=settings.LIVE_STATS_INTERVAL,
+)
+readiness = ReadinessProbe(
+    connection_manager,
+    game_manager,
+    loop_monitor,
+    max_connections=settings.WS_MAX_CONNECTIONS,
+    min_headroom=settings.READY_MIN_CONNECTION_HEADROOM,
+    max_loop_lag=settings.READY_MAX_LOOP_LAG_MS / 1000,
+    max_pending_sends=settings.READY_MAX_PENDING_SENDS,
+    max_games=settings.READY_MAX_GAMES,
+)
+log_pipeline = LogPipeline(
+    level=settings.LOG_LEVEL,
+    path=settings.LOG_FILE,
+    max_bytes=settings.LOG_FILE_MAX_BYTES,
+    backups=settings.LOG_FILE_BACKUPS,
+    queue_size=settings.LOG_QUEUE_SIZE,
+    limiter=RateLimiter(
+        window=settings.LOG_RATE_WINDOW,
+        burst=settings.LOG_RATE_BURST,
+        sample_every=settings.LOG_SAMPLE_EVERY,
+    ),
+)
+trace_ring = RingExporter(capacity=settings.TRACE_RING_SIZE)
+trace_file = JsonlExporter(settings.TRACE_FILE) if settings.TRACE_FILE else None
+TRACER.configure(settings.TRACE_SAMPLE_RATE, [trace_ring] + ([trace_file] if trace_file else []))
+profiler = SamplingProfiler()
+tracemalloc_diff = TracemallocDiff()
+# 이벤트 루프 스레드 ID (startup에서 기록, 프로파일 기본 대상)
+loop_thread_id: Optional[int] = None
+register_gauges(connection_manager.get_connection_count, game_manager.count_by_state, log_pipeline.record_counts)
 
 # 프로젝트 문서 대시보드 (Astro 빌드 결과물 서빙)
 docs_path = Path(__file__).parent.parent / "docs-app" / "dist"
@@ -54,6 +161,51 @@ async def serve_docs_astro_assets(file_path: str):
     raise HTTPException(status_code=404, detail="Not found")
 
 
+@app.on_event("startup")
+async def on_startup() -> None:
+    """
+    서버 시작 처리
+    
+    로그 파이프라인을 먼저 켜고, 웜 리스타트 스냅샷이 있으면 연결을 받기 전에 복원합니다.
+    그 뒤 백그라운드 작업(추적 기록, 턴 타이머, 봇, 게임 정리, 루프 감시, 실시간 통계)을 시작합니다.
+    """
+    log_pipeline.start()
+    if settings.WARM_RESTART_PATH:
+        player_games = game_manager.load_warm_snapshot(settings.WARM_RESTART_PATH)
+        connection_manager.restore_player_games(player_games)
+    global loop_thread_id
+    loop_thread_id = threading.get_ident()
+    if trace_file is not None:
+        trace_file.start()
+    turn_timer.start()
+    bot_driver.start()
+    lifecycle_manager.start()
+    loop_monitor.start()
+    live_stats.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    """
+    서버 종료 처리
+    
+    백그라운드 작업을 시작의 역순으로 멈추고, 웜 리스타트 스냅샷을 남긴 뒤 저장소와 액션 로그를 반영합니다.
+    남은 추적과 로그는 마지막에 모두 씁니다.
+    """
+    await live_stats.stop()
+    await loop_monitor.stop()
+    await lifecycle_manager.stop()
+    await bot_driver.stop()
+    await turn_timer.stop()
+    if settings.WARM_RESTART_PATH:
+        game_manager.save_warm_snapshot(settings.WARM_RESTART_PATH, connection_manager.player_games)
+    game_manager.store.close()
+    await asyncio.to_thread(flush_action_logs)
+    if trace_file is not None:
+        await asyncio.to_thread(trace_file.stop)
+    await asyncio.to_thread(log_pipeline.stop)
+
+
 app.mount("/docs-view", StaticFiles(directory=str(docs_path), html=True), name="docs-view")
 
 
@@ -68,7 +220,8 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
 
 @app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    """미처리 예외를 500 응답으로 통일 (상세 노출 방지)."""
+    """미처리 예외를 500 응답으로 통일 (상세 노출 방지, 예외는 로그로만)."""
+    logger.opt(exception=exc).error("처리되지 않은 HTTP 예외", path=request.url.path)
     return JSONResponse(
         status_code=500,
         content={"detail": "Internal server error"},
@@ -91,6 +244,139 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """준비 상태 (연결 여유, 루프 지연, 송신 적체, 게임 수 중 하나라도 기준을 넘으면 503, 본문에 현재 값)"""
+    result = readiness.check()
+    return JSONResponse(status_code=200 if result["ready"] else 503, content=result)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 메트릭 (텍스트 노출 형식: 연결 수, 상태별 게임 수, 메시지 / 액션 수, 브로드캐스트 시간, 전송 실패, 연결 해제 사유)"""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/admin/stats/timers", dependencies=[Depends(require_admin)])
+async def timer_stats():
+    """턴 타이머 통계 (마감이 걸린 게임 수, 단계별 자동 처리 수, 자동 처리 실패 수, 관리자 전용)"""
+    return turn_timer.stats()
+
+
+@app.get("/admin/stats/bots", dependencies=[Depends(require_admin)])
+async def bot_stats():
+    """봇 드라이버 통계 (예약된 결정 수, 결정 수, 평균 결정 시간, hard 봇 탐색 통계, 관리자 전용)"""
+    return bot_driver.stats()
+
+
+@app.get("/admin/stats/lifecycle", dependencies=[Depends(require_admin)])
+async def lifecycle_stats():
+    """게임 정리 통계 (사유별 제거 수, 회수한 메모리 추정치, 관리자 전용)"""
+    return lifecycle_manager.stats()
+
+
+@app.get("/admin/slow-operations", dependencies=[Depends(require_admin)])
+async def slow_operations_view(limit: int = Query(default=50, ge=1, le=1000)):
+    """최근 느린 메시지 처리 (게임 ID, 메시지 / 액션 타입, 처리 시간), 이벤트 루프 지연, 느린 액션 캡처 통계 (관리자 전용)"""
+    return {
+        "thresholdMs": slow_operations.threshold * 1000,
+        "slowTotal": slow_operations.total,
+        "loopLag": loop_monitor.stats(),
+        "capture": slow_capture.stats() if slow_capture is not None else None,
+        "recent": slow_operations.recent(limit),
+    }
+
+
+@app.get("/admin/memory", dependencies=[Depends(require_admin)])
+async def memory_view(top: int = Query(default=10, ge=1, le=500)):
+    """프로세스 메모리와 게임별 메모리 추정치 (큰 순서로 top개, 부분별 합계, 관리자 전용)"""
+    report = await top_games(game_manager.games, game_manager.card_managers, top)
+    return {
+        "process": process_memory(),
+        "tracemalloc": tracemalloc_diff.running,
+        **report,
+    }
+
+
+@app.post("/admin/memory/tracemalloc/start", dependencies=[Depends(require_admin)])
+async def tracemalloc_start(frames: int = Query(default=1, ge=1, le=50)):
+    """tracemalloc을 켜고 기준 스냅샷을 찍습니다 (관리자 전용, 켜져 있는 동안 할당 비용이 커짐)."""
+    await asyncio.to_thread(tracemalloc_diff.start, frames)
+    return {"success": True, "message": "tracemalloc 기준 스냅샷을 찍었습니다."}
+
+
+@app.get("/admin/memory/tracemalloc/diff", dependencies=[Depends(require_admin)])
+async def tracemalloc_diff_view(
+    limit: int = Query(default=20, ge=1, le=500),
+    key: str = Query(default="lineno", pattern="^(lineno|filename|traceback)$"),
+    reset: bool = Query(default=False),
+):
+    """기준 스냅샷 이후 늘어난 할당 (파일:줄별, reset=true면 이번 스냅샷이 다음 기준, 관리자 전용)"""
+    if not tracemalloc_diff.running:
+        raise HTTPException(status_code=409, detail="먼저 /admin/memory/tracemalloc/start를 호출하세요.")
+    return await asyncio.to_thread(tracemalloc_diff.diff, limit, key, reset)
+
+
+@app.post("/admin/memory/tracemalloc/stop", dependencies=[Depends(require_admin)])
+async def tracemalloc_stop():
+    """기준 스냅샷을 버리고 tracemalloc을 끕니다 (관리자 전용)."""
+    tracemalloc_diff.stop()
+    return {"success": True, "message": "tracemalloc을 껐습니다."}
+
+
+@app.get("/admin/bandwidth", dependencies=[Depends(require_admin)])
+async def bandwidth_view(
+    top: int = Query(default=10, ge=1, le=500),
+    minutes: int = Query(default=10, ge=0, le=1440),
+):
+    """송신 바이트 집계 (누적 상위 게임 / 연결, 분 단위 버킷 최신순 minutes개, 관리자 전용)"""
+    return bandwidth.snapshot(top, minutes)
+
+
+@app.get("/admin/traces", dependencies=[Depends(require_admin)])
+async def traces_view(limit: int = Query(default=20, ge=1, le=1000)):
+    """최근 샘플링된 추적 (OTLP JSON, 최신순, 관리자 전용)"""
+    return {
+        "sampleRate": TRACER.sample_rate,
+        "started": TRACER.started,
+        "sampled": TRACER.sampled,
+        **traces_to_otlp(trace_ring.recent(limit)),
+    }
+
+
+@app.post("/admin/profile", dependencies=[Depends(require_admin)])
+async def profile_view(
+    seconds: float = Query(default=10, gt=0),
+    interval_ms: Optional[float] = Query(default=None, gt=0),
+    path_filter: Optional[str] = Query(default=None, alias="filter"),
+    threads: str = Query(default="loop", pattern="^(loop|all)$"),
+):
+    """
+    seconds 동안 샘플링 프로파일러를 돌려 collapsed stack 텍스트를 반환합니다 (관리자 전용).
+
+    filter=game|websocket이면 app/game, app/websocket 안의 프레임이 있는 스택만 남기고,
+    threads=all이면 이벤트 루프 외 스레드(봇 워커 등)도 찍습니다. 실행 통계는 X-Profile-* 헤더에 담깁니다.
+    """
+    if path_filter is not None and path_filter not in PATH_FILTERS:
+        raise HTTPException(status_code=400, detail=f"filter는 {', '.join(PATH_FILTERS)} 중 하나여야 합니다.")
+    if profiler.running:
+        raise HTTPException(status_code=409, detail="이미 프로파일이 실행 중입니다.")
+    thread_ids = [loop_thread_id or threading.get_ident()] if threads == "loop" else None
+    interval = (interval_ms or settings.PROFILER_INTERVAL_MS) / 1000
+    try:
+        result = await asyncio.to_thread(
+            profiler.profile,
+            min(seconds, settings.PROFILER_MAX_SECONDS),
+            thread_ids,
+            interval,
+            path_filter,
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    headers = {f"X-Profile-{key[0].upper()}{key[1:]}": str(value) for key, value in result.stats.items()}
+    return PlainTextResponse(result.collapsed(), headers=headers)
+
+
 async def run_ws_message_loop(
     websocket: WebSocket,
     player_id: str,
@@ -101,22 +387,27 @@ async def run_ws_message_loop(
     while True:
         try:
             data = await websocket.receive_text()
-            message = json.loads(data)
-            if message.get("type") == "PING":
-                await connection_manager.send_personal_message(
-                    {
-                        "type": "PONG",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
-                    player_id,
-                )
-                continue
-            result = await message_handler.handle_message(player_id, message)
-            if result.get("success") is not None:
-                await connection_manager.send_personal_message(
-                    {"type": "ACTION_RESPONSE", "data": result},
-                    player_id,
-                )
+            with TRACER.start_trace("ws.message", player_id=player_id) as trace:
+                with TRACER.span("json.decode", bytes=len(data)):
+                    message = json.loads(data)
+                message_type = message.get("type")
+                trace.set_attribute("message.type", message_type)
+                if message_type == "PING":
+                    await connection_manager.send_personal_message(
+                        {
+                            "type": "PONG",
+                            "timestamp": datetime.now(timezone.utc).isoformat(),
+                        },
+                        player_id,
+                    )
+                    continue
+                result = await message_handler.handle_message(player_id, message)
+                if result.get("success") is not None:
+                    with TRACER.span("send", player_id=player_id):
+                        await connection_manager.send_personal_message(
+                            {"type": "ACTION_RESPONSE", "data": result},
+                            player_id,
+                        )
         except json.JSONDecodeError:
             await connection_manager.send_personal_message(
                 {
@@ -130,6 +421,41 @@ async def run_ws_message_loop(
             break
 
 
+@app.websocket("/admin/stats/ws")
+async def admin_stats_websocket(
+    websocket: WebSocket,
+    token: Optional[str] = Query(default=None, description="관리자 토큰 (X-Admin-Token 헤더 대신)"),
+):
+    """
+    관리자 실시간 통계 WebSocket (연결 직후 한 번, 이후 LIVE_STATS_INTERVAL초마다 스냅샷 하나)
+    
+    브라우저 WebSocket은 헤더를 붙일 수 없으므로 token 쿼리로도 인증합니다.
+    관리자 토큰이 아니면 (ADMIN_TOKEN 미설정 포함) 1008로 닫습니다. 클라이언트가 보내는 메시지는 무시합니다.
+    """
+    if not is_admin_token(websocket.headers.get("x-admin-token") or token):
+        await websocket.close(code=1008)
+        return
+    await websocket.accept()
+    queue = live_stats.subscribe()
+    
+    async def push() -> None:
+        await websocket.send_json(live_stats.latest or live_stats.sample())
+        while True:
+            await websocket.send_json(await queue.get())
+    
+    sender = asyncio.create_task(push())
+    try:
+        # 끊김 감지용 수신 루프
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        live_stats.unsubscribe(queue)
+        sender.cancel()
+        await asyncio.gather(sender, return_exceptions=True)
+
+
 @app.websocket("/lobby/{game_id}")
 async def lobby_websocket_endpoint(
     websocket: WebSocket,
@@ -162,6 +488,7 @@ async def lobby_websocket_endpoint(
         await websocket.close(code=1008, reason="최대 연결 수 초과")
         return
     
+    reason = DISCONNECT_ERROR
     try:
         # 연결 성공 메시지 전송 (플레이어 ID 포함)
         await connection_manager.send_personal_message(
@@ -196,16 +523,18 @@ async def lobby_websocket_endpoint(
                 player_id,
             )
             await websocket.close(code=1008, reason=join_result.get("message", "게임 참가 실패"))
+            reason = DISCONNECT_JOIN_FAILED
             return
         
         # 메시지 수신 루프
         await run_ws_message_loop(
             websocket, player_id, connection_manager, message_handler
         )
+        reason = DISCONNECT_CLIENT_CLOSED
     except WebSocketDisconnect:
-        pass
+        reason = DISCONNECT_CLIENT_CLOSED
     finally:
-        connection_manager.disconnect(player_id)
+        connection_manager.disconnect(player_id, reason)
 
 
 @app.websocket("/ws/{player_id}")
@@ -242,6 +571,7 @@ async def websocket_endpoint(
         await websocket.close(code=1008, reason="최대 연결 수 초과")
         return
     
+    reason = DISCONNECT_ERROR
     try:
         # 연결 성공 메시지 전송
         await connection_manager.send_personal_message(
@@ -253,14 +583,20 @@ async def websocket_endpoint(
             player_id,
         )
         
+        # 재시작 전에 참가 중이던 게임이 있으면 현재 상태를 보내 이어서 진행
+        game_id = connection_manager.get_player_game(player_id)
+        if game_id:
+            await message_handler.send_game_state_to_player(player_id, game_id)
+        
         # 메시지 수신 루프
         await run_ws_message_loop(
             websocket, player_id, connection_manager, message_handler
         )
+        reason = DISCONNECT_CLIENT_CLOSED
     except WebSocketDisconnect:
-        pass
+        reason = DISCONNECT_CLIENT_CLOSED
     finally:
-        connection_manager.disconnect(player_id)
+        connection_manager.disconnect(player_id, reason)
 
 
 if __name__ == "__main__":
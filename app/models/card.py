@@ -2,9 +2,43 @@
 카드 (Card) 모델
 """
 
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field
-from app.utils.constants import CardType, Suit, Rank
+from app.utils.constants import CardType, Suit, Rank, CARD_DECK_CONFIG, CARD_DETAILS
+
+
+class CardPayload(dict):
+    """
+    수정할 수 없는 카드 페이로드
+
+    카드마다 하나를 만들어 모든 게임 상태 직렬화가 같은 객체를 공유하므로 변경 메서드를 막습니다.
+    json.dumps 등에는 일반 dict처럼 전달되며, 수정이 필요하면 dict(payload)로 복사해 사용합니다.
+    """
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("카드 페이로드는 공유 객체이므로 수정할 수 없습니다 (dict(payload)로 복사).")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> "CardPayload":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "CardPayload":
+        return self
+
+    def __reduce__(self):
+        return CardPayload, (dict(self),)
+
+
+# 카드 ID -> 클라이언트 전송용 페이로드
+# 카드는 불변이므로 카탈로그 생성 시 한 번만 계산하고 모든 직렬화에서 재사용합니다.
+_CARD_PAYLOADS: Dict[str, CardPayload] = {}
+
+
+def _enum_value(value: Any) -> Any:
+    """Enum이면 값을, 아니면 그대로 반환합니다 (use_enum_values 대응)."""
+    return value.value if hasattr(value, "value") else value
 
 
 class Card(BaseModel):
@@ -24,6 +58,7 @@ class Card(BaseModel):
     
     class Config:
         use_enum_values = True
+        frozen = True
         json_encoders = {
             CardType: lambda v: v.value,
             Suit: lambda v: v.value if v else None,
@@ -78,6 +113,20 @@ class Card(BaseModel):
         card_type_val = self.card_type.value if hasattr(self.card_type, 'value') else str(self.card_type)
         return f"Card(id={self.id}, type={card_type_val}, name={self.name})"
     
+    def to_payload(self) -> CardPayload:
+        """
+        클라이언트 전송용 카드 페이로드 (id, name, suit, rank, description)
+        
+        카탈로그 생성 시 미리 계산된 읽기 전용 페이로드를 그대로 반환합니다.
+        
+        Returns:
+            카드 페이로드
+        """
+        payload = _CARD_PAYLOADS.get(self.id)
+        if payload is None:
+            payload = register_card_payload(self)
+        return payload
+    
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
         # use_enum_values = True로 인해 이미 값으로 변환되었을 수 있음
@@ -95,3 +144,90 @@ class Card(BaseModel):
             "description": self.description,
         }
 
+
+def register_card_payload(card: Card) -> CardPayload:
+    """
+    카드 페이로드를 계산하여 카드 ID 기준으로 등록합니다.
+    
+    Args:
+        card: 등록할 카드
+        
+    Returns:
+        등록된 카드 페이로드
+    """
+    payload = CardPayload(
+        id=card.id,
+        name=card.name,
+        suit=_enum_value(card.suit) if card.suit else None,
+        rank=_enum_value(card.rank) if card.rank else None,
+        description=card.description,
+    )
+    _CARD_PAYLOADS[card.id] = payload
+    return payload
+
+
+# 전체 카드 카탈로그 (프로세스당 한 번 생성, 모든 게임이 같은 불변 Card 인스턴스를 공유)
+_CARD_CATALOG: Optional[Tuple[Card, ...]] = None
+
+
+def _build_card_catalog() -> Tuple[Card, ...]:
+    """
+    덱 구성 설정으로부터 전체 카드 카탈로그를 생성하고 카드별 페이로드를 미리 계산합니다.
+    
+    Returns:
+        카드 카탈로그 (덱 구성 순서)
+    """
+    catalog: List[Card] = []
+    card_counter = 0
+    
+    # 각 카드 타입별로 지정된 수만큼 생성
+    for card_type, count in CARD_DECK_CONFIG.items():
+        card_info = CARD_DETAILS[card_type]
+        
+        for i in range(count):
+            card_id = f"{card_type.value}_{card_counter:03d}"
+            
+            # 무늬와 숫자가 있는 카드인지 확인
+            suit = None
+            rank = None
+            
+            # 정산, 회피, 비상금 카드는 무늬와 숫자가 있음
+            if card_type in [CardType.BANG, CardType.MISSED, CardType.BEER]:
+                # 무늬와 숫자 할당 (순환)
+                suits = [Suit.SPADES, Suit.CLUBS, Suit.HEARTS, Suit.DIAMONDS]
+                ranks = [Rank.ACE, Rank.KING, Rank.QUEEN, Rank.JACK]
+                
+                suit_index = (card_counter // len(ranks)) % len(suits)
+                rank_index = card_counter % len(ranks)
+                
+                suit = suits[suit_index]
+                rank = ranks[rank_index]
+            
+            card = Card(
+                id=card_id,
+                card_type=card_type,
+                name=card_info["name"],
+                suit=suit,
+                rank=rank,
+                range=card_info["range"],
+                description=card_info["description"],
+            )
+            register_card_payload(card)
+            
+            catalog.append(card)
+            card_counter += 1
+    
+    return tuple(catalog)
+
+
+def get_card_catalog() -> Tuple[Card, ...]:
+    """
+    전체 카드 카탈로그를 반환합니다 (최초 호출 시 생성).
+    
+    Returns:
+        카드 카탈로그
+    """
+    global _CARD_CATALOG
+    if _CARD_CATALOG is None:
+        _CARD_CATALOG = _build_card_catalog()
+    return _CARD_CATALOG
@@ -2,8 +2,11 @@
 게임 (Game) 모델
 """
 
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field
+import math
+import random
+import time
+from typing import Any, List, Dict, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
 from app.models.player import Player
 from app.models.card import Card
 from app.utils.constants import GameState, TurnState, Role as RoleEnum
@@ -54,6 +57,17 @@ class Game(BaseModel):
         None,
         description="선택 응답이 필요한 액션의 서버 내부 컨텍스트",
     )
+    version: int = Field(0, description="상태 버전 (규칙 적용 / 플레이어 변경마다 증가)")
+    seed: Optional[int] = Field(None, description="게임 난수 시드 (재현 / 리플레이용, 클라이언트에 노출하지 않음)")
+    
+    # 상태 버전별 파생 데이터 캐시 (버전이 바뀌면 무효)
+    _version_cache: Tuple[int, Dict[str, Any]] = PrivateAttr(default=(-1, {}))
+    # 게임 전용 난수 생성기 (셔플 / 판정 / 역할 배정 모두 이 생성기를 사용)
+    _rng: Optional[random.Random] = PrivateAttr(default=None)
+    # 수락된 규칙 적용을 기록할 액션 로그 (app.storage.ActionLog, 없으면 기록하지 않음)
+    _action_log: Any = PrivateAttr(default=None)
+    # 현재 행동 단계의 마감 시각 (time.time 기준 초, 턴 타이머가 설정 / 없으면 None)
+    _turn_deadline: Optional[float] = PrivateAttr(default=None)
     
     class Config:
         arbitrary_types_allowed = True
@@ -76,6 +90,7 @@ class Game(BaseModel):
             return False  # 이미 존재하는 플레이어
         
         self.players.append(player)
+        self.touch()
         return True
     
     def remove_player(self, player_id: str) -> Optional[Player]:
@@ -90,6 +105,7 @@ class Game(BaseModel):
         """
         for i, player in enumerate(self.players):
             if player.id == player_id:
+                self.touch()
                 return self.players.pop(i)
         return None
     
@@ -221,6 +237,58 @@ class Game(BaseModel):
         """카드를 버림 더미에 추가합니다."""
         self.discard_pile.append(card)
     
+    @property
+    def rng(self) -> random.Random:
+        """
+        게임 전용 난수 생성기를 반환합니다 (seed로 처음 사용할 때 생성).
+        
+        Returns:
+            random.Random 인스턴스
+        """
+        if self._rng is None:
+            self._rng = random.Random(self.seed)
+        return self._rng
+    
+    @rng.setter
+    def rng(self, rng: random.Random) -> None:
+        """복원한 난수 생성기를 설정합니다."""
+        self._rng = rng
+    
+    @property
+    def action_log(self) -> Any:
+        """연결된 액션 로그 (없으면 None)"""
+        return self._action_log
+    
+    @action_log.setter
+    def action_log(self, log: Any) -> None:
+        self._action_log = log
+    
+    @property
+    def turn_deadline(self) -> Optional[float]:
+        """현재 행동 단계의 마감 시각 (time.time 기준 초, 없으면 None)"""
+        return self._turn_deadline
+    
+    @turn_deadline.setter
+    def turn_deadline(self, deadline: Optional[float]) -> None:
+        self._turn_deadline = deadline
+    
+    def touch(self) -> None:
+        """상태 버전을 올립니다 (버전별 캐시 무효화)."""
+        self.version += 1
+    
+    def version_cache(self) -> Dict[str, Any]:
+        """
+        현재 상태 버전에 묶인 캐시 딕셔너리를 반환합니다.
+        
+        Returns:
+            버전이 바뀌면 새로 비워지는 딕셔너리
+        """
+        version, cache = self._version_cache
+        if version != self.version:
+            cache = {}
+            self._version_cache = (self.version, cache)
+        return cache
+    
     def set_current_player(self, player_id: str) -> None:
         """현재 턴 플레이어를 설정합니다."""
         self.current_player_id = player_id
@@ -237,7 +305,6 @@ class Game(BaseModel):
             event: 이벤트 메시지
             event_type: 이벤트 타입 ("action" | "notification" | "error")
         """
-        import time
         self.last_event = event
         
         # 이벤트 로그에 추가
@@ -274,9 +341,12 @@ class Game(BaseModel):
             phase = "lobby"
         
         # turnState 구성
+        # timeLeft: 현재 행동 단계의 남은 시간 (초, 올림) / 마감이 없으면 None
+        deadline = self._turn_deadline
         turn_state = {
             "currentTurn": self.current_player_id or "",
-            "timeLeft": 60,  # TODO: 실제 타이머 구현 시 수정
+            "timeLeft": max(0, math.ceil(deadline - time.time())) if deadline is not None else None,
+            "deadlineAt": int(deadline * 1000) if deadline is not None else None,
         }
         
         # requiredResponse 설정 (모든 유형 공통)
@@ -188,33 +188,14 @@ class Player(BaseModel):
             role_name = str(self.role) if not hide_hand else None
         
         # 핸드 카드 (자신은 전체 정보, 다른 플레이어는 개수만)
+        # 카드 페이로드는 카탈로그 생성 시 미리 계산된 것을 재사용
         if hide_hand:
             hand = []  # 다른 플레이어는 빈 배열
         else:
-            hand = []
-            for card in self.hand:
-                suit_val = card.suit.value if (card.suit and hasattr(card.suit, 'value')) else (card.suit if card.suit else None)
-                rank_val = card.rank.value if (card.rank and hasattr(card.rank, 'value')) else (card.rank if card.rank else None)
-                hand.append({
-                    "id": card.id,
-                    "name": card.name,
-                    "suit": suit_val,
-                    "rank": rank_val,
-                    "description": card.description,
-                })
+            hand = [card.to_payload() for card in self.hand]
         
         # 테이블 카드 (장착 카드들)
-        table_cards = []
-        for slot, card in self.equipment.items():
-            suit_val = card.suit.value if (card.suit and hasattr(card.suit, 'value')) else (card.suit if card.suit else None)
-            rank_val = card.rank.value if (card.rank and hasattr(card.rank, 'value')) else (card.rank if card.rank else None)
-            table_cards.append({
-                "id": card.id,
-                "name": card.name,
-                "suit": suit_val,
-                "rank": rank_val,
-                "description": card.description,
-            })
+        table_cards = [card.to_payload() for card in self.equipment.values()]
         
         # 보물 배열
         treasures = [self.treasure] if self.treasure else []
@@ -0,0 +1,13 @@
+"""
+모니터링 모듈
+
+서버 운영 지표(Prometheus 메트릭 등)를 수집하고 노출합니다.
+"""
+
+from .metrics import REGISTRY, Registry, register_gauges
+
+__all__ = [
+    "REGISTRY",
+    "Registry",
+    "register_gauges",
+]
@@ -0,0 +1,150 @@
+"""
+송신 대역폭 집계 (Bandwidth Meter)
+
+ConnectionManager가 보내는 모든 메시지의 인코딩된 바이트 수를 메시지 타입 / 게임 / 연결별로 셉니다.
+
+- 누적값: 메시지 타입별은 /metrics의 ledger_ws_sent_bytes_total{type}, 게임 / 연결별은 이 객체
+  (게임 / 연결이 정리되면 forget_*로 지움)
+- 분 단위 집계: 분마다 총량과 타입 / 게임 / 연결별 바이트를 버킷 하나로 모으고 최근 window분을 남김
+- 게임 예산: 한 게임이 1분 동안 game_budget 바이트를 넘으면 그 분에 한 번 경고 로그를 남기고
+  ledger_bandwidth_budget_exceeded_total을 올림 (0이면 끔)
+"""
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from loguru import logger
+
+from app.monitoring.metrics import BANDWIDTH_BUDGET_COUNTER, OTHER_SENT_BYTES, SENT_BYTES_COUNTERS
+
+
+class _Minute:
+    """1분 버킷"""
+
+    __slots__ = ("minute", "bytes", "messages", "by_type", "by_game", "by_connection", "over_budget")
+
+    def __init__(self, minute: int):
+        self.minute = minute
+        self.bytes = 0
+        self.messages = 0
+        self.by_type: Dict[str, int] = {}
+        self.by_game: Dict[str, int] = {}
+        self.by_connection: Dict[str, int] = {}
+        # 이번 분에 예산 경고를 낸 게임
+        self.over_budget: set = set()
+
+    def summary(self, top: int) -> Dict[str, Any]:
+        return {
+            "minute": self.minute * 60,
+            "bytes": self.bytes,
+            "messages": self.messages,
+            "byType": dict(self.by_type),
+            "topGames": _top(self.by_game, top),
+            "topConnections": _top(self.by_connection, top),
+            "overBudget": sorted(self.over_budget),
+        }
+
+
+def _top(values: Dict[str, int], limit: int) -> List[Dict[str, Any]]:
+    ranked = sorted(values.items(), key=lambda item: -item[1])[:limit]
+    return [{"id": key, "bytes": size} for key, size in ranked]
+
+
+class BandwidthMeter:
+    """
+    송신 바이트 집계기
+    """
+
+    def __init__(self, window: int = 60, game_budget: int = 0, clock=time.time):
+        """
+        Args:
+            window: 남길 분 단위 버킷 수
+            game_budget: 게임 하나의 분당 예산 (바이트, 0이면 끔)
+            clock: 현재 시각 (초, 테스트용)
+        """
+        self.game_budget = game_budget
+        self.clock = clock
+        self.total_bytes = 0
+        self.total_messages = 0
+        self.by_game: Dict[str, int] = {}
+        self.by_connection: Dict[str, int] = {}
+        self.budget_warnings = 0
+        self.minutes: Deque[_Minute] = deque(maxlen=window)
+        self._current = _Minute(int(clock() // 60))
+
+    def record(self, player_id: str, game_id: Optional[str], message_type: Any, size: int) -> None:
+        """
+        보낸 메시지 하나를 기록합니다 (전송 성공 후).
+
+        Args:
+            player_id: 받은 플레이어 ID (연결)
+            game_id: 플레이어가 속한 게임 ID (없으면 None)
+            message_type: 메시지 타입
+            size: 인코딩된 바이트 수
+        """
+        minute = int(self.clock() // 60)
+        current = self._current
+        if minute != current.minute:
+            self.minutes.append(current)
+            current = self._current = _Minute(minute)
+        if not isinstance(message_type, str):
+            message_type = None
+        (SENT_BYTES_COUNTERS.get(message_type, OTHER_SENT_BYTES) if message_type else OTHER_SENT_BYTES).inc(size)
+        self.total_bytes += size
+        self.total_messages += 1
+        self.by_connection[player_id] = self.by_connection.get(player_id, 0) + size
+        current.bytes += size
+        current.messages += 1
+        type_key = message_type or "other"
+        current.by_type[type_key] = current.by_type.get(type_key, 0) + size
+        current.by_connection[player_id] = current.by_connection.get(player_id, 0) + size
+        if game_id is None:
+            return
+        self.by_game[game_id] = self.by_game.get(game_id, 0) + size
+        used = current.by_game.get(game_id, 0) + size
+        current.by_game[game_id] = used
+        budget = self.game_budget
+        if budget and used > budget and game_id not in current.over_budget:
+            current.over_budget.add(game_id)
+            self.budget_warnings += 1
+            BANDWIDTH_BUDGET_COUNTER.inc()
+            logger.warning(
+                "게임 송신량이 분당 예산을 넘었습니다",
+                game_id=game_id,
+                bytes_this_minute=used,
+                budget=budget,
+            )
+
+    def forget_connection(self, player_id: str) -> None:
+        """끊긴 연결의 누적값을 지웁니다 (분 단위 버킷에는 남음)."""
+        self.by_connection.pop(player_id, None)
+
+    def forget_game(self, game_id: str) -> None:
+        """정리된 게임의 누적값을 지웁니다 (분 단위 버킷에는 남음)."""
+        self.by_game.pop(game_id, None)
+
+    def snapshot(self, top: int = 10, minutes: int = 10) -> Dict[str, Any]:
+        """
+        집계 결과를 반환합니다.
+
+        Args:
+            top: 게임 / 연결 상위 개수
+            minutes: 함께 반환할 지난 분 버킷 수 (최신순)
+
+        Returns:
+            {"totalBytes", "totalMessages", "gameBudgetBytesPerMinute", "budgetWarnings",
+             "topGames", "topConnections", "currentMinute", "minutes"}
+        """
+        finished = list(self.minutes)[-minutes:] if minutes > 0 else []
+        finished.reverse()
+        return {
+            "totalBytes": self.total_bytes,
+            "totalMessages": self.total_messages,
+            "gameBudgetBytesPerMinute": self.game_budget,
+            "budgetWarnings": self.budget_warnings,
+            "topGames": _top(self.by_game, top),
+            "topConnections": _top(self.by_connection, top),
+            "currentMinute": self._current.summary(top),
+            "minutes": [bucket.summary(top) for bucket in finished],
+        }
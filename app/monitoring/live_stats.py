@@ -0,0 +1,183 @@
+"""
+실시간 서버 통계 스트림 (Live Stats)
+
+관리자 대시보드가 여러 엔드포인트를 따로 폴링하지 않도록, interval초(기본 1초)마다 압축된 스냅샷
+하나를 만들어 구독자(/admin/stats/ws)에게 보냅니다.
+
+- 스냅샷은 이미 유지되는 카운터만 읽습니다: 연결 수, GameManager의 상태별 게임 수,
+  ledger_action_seconds 히스토그램, BandwidthMeter 누적 바이트, 루프 지연, 봇 예약 / 계산 중 수.
+  그래서 계산 비용은 게임 / 연결 수와 무관합니다.
+- 초당 값과 분위수는 직전 스냅샷과의 차이(구간 값)로 계산합니다. p50 / p99는 구간에 늘어난
+  히스토그램 버킷 수에서 선형 보간한 추정치입니다 (버킷 경계 사이 정밀도).
+- 스냅샷은 구독자 수와 관계없이 한 번만 만들고, 구독자마다 크기 1짜리 큐에 최신 값만 남깁니다
+  (느린 구독자는 중간 스냅샷을 건너뜀).
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from app.monitoring.metrics import ACTION_SECONDS, Histogram
+
+
+def bucket_quantile(bounds: Sequence[float], counts: Sequence[int], q: float) -> Optional[float]:
+    """
+    버킷별 개수에서 분위수를 추정합니다 (버킷 안에서는 선형 보간, +Inf 버킷은 마지막 경계).
+
+    Args:
+        bounds: 버킷 상한 (오름차순, +Inf 제외)
+        counts: 버킷별 개수 (마지막 칸은 +Inf 버킷)
+        q: 분위 (0~1)
+
+    Returns:
+        추정값 (관측이 없으면 None)
+    """
+    total = sum(counts)
+    if total == 0:
+        return None
+    rank = q * total
+    cumulative = 0
+    lower = 0.0
+    for bound, count in zip(bounds, counts):
+        if count and cumulative + count >= rank:
+            return lower + (bound - lower) * (rank - cumulative) / count
+        cumulative += count
+        lower = bound
+    return bounds[-1] if bounds else None
+
+
+class LiveStats:
+    """
+    고정 주기 서버 통계 집계기 (start()/stop()으로 백그라운드 실행)
+    """
+
+    def __init__(
+        self,
+        connection_manager: Any,
+        game_manager: Any,
+        loop_monitor: Any,
+        bot_driver: Any = None,
+        bandwidth: Any = None,
+        interval: float = 1.0,
+        histogram: Histogram = ACTION_SECONDS,
+        clock=time.monotonic,
+    ):
+        """
+        Args:
+            connection_manager: ConnectionManager (get_connection_count)
+            game_manager: GameManager (count_by_state)
+            loop_monitor: LoopLagMonitor
+            bot_driver: BotDriver (scheduler / in_flight, 없으면 0)
+            bandwidth: BandwidthMeter (total_bytes, 없으면 0)
+            interval: 스냅샷 주기 (초)
+            histogram: 액션 처리 시간 히스토그램
+            clock: 단조 시계 (테스트용)
+        """
+        self.connection_manager = connection_manager
+        self.game_manager = game_manager
+        self.loop_monitor = loop_monitor
+        self.bot_driver = bot_driver
+        self.bandwidth = bandwidth
+        self.interval = interval
+        self.histogram = histogram
+        self.clock = clock
+        self.latest: Optional[Dict[str, Any]] = None
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._last_at = clock()
+        self._last_counts: List[int] = list(histogram.counts)
+        self._last_bytes = self._sent_bytes()
+
+    def _sent_bytes(self) -> int:
+        return self.bandwidth.total_bytes if self.bandwidth is not None else 0
+
+    def sample(self) -> Dict[str, Any]:
+        """
+        직전 sample() 이후 구간의 스냅샷을 만듭니다.
+
+        Returns:
+            {
+                "at": 유닉스 시각 (초),
+                "intervalSec": 실제 구간 길이,
+                "connections": int,
+                "games": {GameState 이름: 게임 수},
+                "actionsPerSec": float,
+                "actionP50Ms": float | None,  # 구간에 액션이 없으면 None
+                "actionP99Ms": float | None,
+                "sentBytesPerSec": float,
+                "loopLagMs": float,  # 최근 샘플 중 최대 지연
+                "botQueue": int  # 결정이 예약된 게임 수 + 워커에서 계산 중인 결정 수
+            }
+        """
+        now = self.clock()
+        elapsed = max(now - self._last_at, 1e-9)
+        counts = list(self.histogram.counts)
+        window = [current - previous for current, previous in zip(counts, self._last_counts)]
+        sent = self._sent_bytes()
+        p50 = bucket_quantile(self.histogram.buckets, window, 0.5)
+        p99 = bucket_quantile(self.histogram.buckets, window, 0.99)
+        bots = self.bot_driver
+        snapshot = {
+            "at": round(time.time(), 3),
+            "intervalSec": round(elapsed, 3),
+            "connections": self.connection_manager.get_connection_count(),
+            "games": self.game_manager.count_by_state(),
+            "actionsPerSec": round(sum(window) / elapsed, 2),
+            "actionP50Ms": round(p50 * 1000, 3) if p50 is not None else None,
+            "actionP99Ms": round(p99 * 1000, 3) if p99 is not None else None,
+            "sentBytesPerSec": round((sent - self._last_bytes) / elapsed, 1),
+            "loopLagMs": round(self.loop_monitor.recent_max_lag * 1000, 3),
+            "botQueue": len(bots.scheduler) + bots.in_flight if bots is not None else 0,
+        }
+        self._last_at = now
+        self._last_counts = counts
+        self._last_bytes = sent
+        self.latest = snapshot
+        return snapshot
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        스냅샷 구독 큐를 만듭니다 (최신 스냅샷 하나만 보관).
+
+        Returns:
+            asyncio.Queue (unsubscribe()로 해제)
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """구독을 해제합니다."""
+        self._subscribers.discard(queue)
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, snapshot: Dict[str, Any]) -> None:
+        """모든 구독자 큐에 스냅샷을 넣습니다 (이전 값이 남아 있으면 버리고 교체)."""
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(snapshot)
+
+    async def run(self) -> None:
+        """interval초마다 스냅샷을 만들어 구독자에게 보냅니다 (취소될 때까지)."""
+        while True:
+            await asyncio.sleep(self.interval)
+            self.publish(self.sample())
+
+    def start(self) -> None:
+        """백그라운드 집계를 시작합니다."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        """백그라운드 집계를 멈춥니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,321 @@
+"""
+구조화 로그 파이프라인 (Log Pipeline)
+
+loguru 로거 앞단은 그대로 쓰고, 출력만 이벤트 루프 밖으로 뺍니다.
+
+- 이벤트 루프(호출 스레드)에서는 레코드를 고정 크기 큐에 넣기만 합니다 (가득 차면 버리고 dropped로 셈).
+  stdout / 파일 쓰기, JSON 직렬화, 파일 로테이션은 모두 전용 writer 스레드에서 합니다.
+- 한 줄에 JSON 하나 (ts, level, logger, function, line, msg, 컨텍스트 / extra 필드, exception).
+- LOG_CONTEXT에 넣은 게임 ID / 플레이어 ID가 그 처리 중에 남긴 모든 로그에 붙습니다
+  (loguru contextualize보다 가벼운 ContextVar 한 번 set / reset).
+- 같은 위치에서 같은 예외가 반복되면 (에러 폭주) window초마다 처음 burst개만 남기고 이후는
+  sample_every개 중 하나만 남깁니다. 빠진 수는 다음에 남는 레코드의 suppressed 필드로 붙습니다.
+  이 필터는 예외 traceback을 문자열로 만들기 전에 돌기 때문에, 버려지는 레코드는 거의 비용이 없습니다.
+"""
+
+import json
+import os
+import queue
+import sys
+import threading
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from loguru import logger
+
+from app.monitoring.metrics import LOG_DROPPED, LOG_SUPPRESSED, LOG_WRITTEN
+
+# 현재 처리 중인 요청의 로그 컨텍스트 (예: {"game_id": ..., "player_id": ...})
+LOG_CONTEXT: ContextVar[Dict[str, Any]] = ContextVar("log_context", default={})
+
+
+# writer 스레드 종료 신호
+_STOP = None
+
+
+def _add_context(record: Dict[str, Any]) -> None:
+    """loguru patcher: LOG_CONTEXT 필드를 extra에 붙입니다 (호출 시 직접 넘긴 값이 우선)."""
+    context = LOG_CONTEXT.get()
+    if context:
+        extra = record["extra"]
+        for key, value in context.items():
+            extra.setdefault(key, value)
+
+
+def _exception_only(record: Dict[str, Any]) -> str:
+    """loguru 포맷: 싱크에는 예외 텍스트만 받고 나머지는 writer 스레드에서 JSON으로 만듦"""
+    return "{exception}"
+
+
+def format_record(record: Dict[str, Any], exception: str = "") -> str:
+    """
+    loguru 레코드를 JSON 한 줄로 만듭니다.
+
+    Args:
+        record: loguru 레코드
+        exception: 포맷된 예외 텍스트 (없으면 빈 문자열)
+
+    Returns:
+        JSON 문자열 (줄바꿈 제외)
+    """
+    entry = {
+        "ts": record["time"].isoformat(timespec="milliseconds"),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "msg": record["message"],
+    }
+    for key, value in record["extra"].items():
+        entry.setdefault(key, value)
+    if exception:
+        entry["exception"] = exception.rstrip("\n")
+    return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RateLimiter:
+    """
+    반복 로그 샘플링 필터 (loguru filter)
+
+    키는 (모듈, 줄 번호, 예외 타입)입니다. 키마다 window초 동안 처음 burst개는 통과시키고,
+    그 뒤로는 sample_every개마다 하나만 통과시킵니다.
+    """
+
+    def __init__(self, window: float = 10.0, burst: int = 5, sample_every: int = 100, max_keys: int = 1024):
+        """
+        Args:
+            window: 집계 구간 (초)
+            burst: 구간마다 그대로 남길 수
+            sample_every: burst 이후 남길 간격 (N개 중 1개)
+            max_keys: 기억할 키 수 상한 (넘으면 비움)
+        """
+        self.window = window
+        self.burst = burst
+        self.sample_every = max(sample_every, 1)
+        self.max_keys = max_keys
+        self.suppressed = 0
+        # 키 -> [구간 시작, 구간 안 개수, 아직 보고하지 않은 생략 수]
+        self._keys: Dict[Tuple, List] = {}
+
+    def __call__(self, record: Dict[str, Any]) -> bool:
+        exception = record["exception"]
+        key = (record["name"], record["line"], exception.type if exception else None)
+        now = record["time"].timestamp()
+        entry = self._keys.get(key)
+        if entry is None or now - entry[0] >= self.window:
+            if entry is None and len(self._keys) >= self.max_keys:
+                self._keys.clear()
+            entry = self._keys[key] = [now, 0, entry[2] if entry else 0]
+        entry[1] += 1
+        seen = entry[1]
+        if seen <= self.burst or (seen - self.burst) % self.sample_every == 0:
+            if entry[2]:
+                record["extra"]["suppressed"] = entry[2]
+                entry[2] = 0
+            return True
+        entry[2] += 1
+        self.suppressed += 1
+        return False
+
+
+class RotatingFile:
+    """
+    크기 기준으로 돌려 쓰는 로그 파일 (writer 스레드 전용)
+
+    max_bytes를 넘기 전에 path -> path.1 -> ... -> path.{backups}로 밀고 새 파일을 엽니다.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 10_000_000, backups: int = 5):
+        """
+        Args:
+            path: 파일 경로
+            max_bytes: 파일 하나의 최대 크기 (0이면 돌리지 않음)
+            backups: 남길 이전 파일 수
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.rotations = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "ab")
+        self._size = self._file.tell()
+
+    def write(self, data: bytes) -> None:
+        if self.max_bytes and self._size and self._size + len(data) > self.max_bytes:
+            self.rotate()
+        self._file.write(data)
+        self._size += len(data)
+
+    def rotate(self) -> None:
+        """현재 파일을 path.1로 밀고 새 파일을 엽니다."""
+        self._file.close()
+        if self.backups > 0:
+            for index in range(self.backups - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+            self._file = open(self.path, "ab")
+        else:
+            self._file = open(self.path, "wb")
+        self._size = 0
+        self.rotations += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class LogPipeline:
+    """
+    loguru 싱크 하나 + writer 스레드
+
+    start()는 loguru의 기존 싱크(기본 stderr)를 이 파이프라인으로 바꾸고,
+    stop()은 큐에 남은 레코드를 모두 쓴 뒤 기본 stderr 싱크로 되돌립니다.
+    """
+
+    def __init__(
+        self,
+        level: str = "INFO",
+        path: Optional[str] = None,
+        max_bytes: int = 10_000_000,
+        backups: int = 5,
+        queue_size: int = 10000,
+        limiter: Optional[RateLimiter] = None,
+        stream: Optional[TextIO] = None,
+    ):
+        """
+        Args:
+            level: 최소 로그 레벨
+            path: 로그 파일 경로 (없으면 stream에만)
+            max_bytes: 로그 파일 하나의 최대 크기
+            backups: 남길 이전 로그 파일 수
+            queue_size: writer 스레드 큐 크기 (가득 차면 버림)
+            limiter: 반복 로그 샘플링 필터 (없으면 기본값)
+            stream: 출력 스트림 (없으면 sys.stdout)
+        """
+        self.level = level
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.limiter = limiter or RateLimiter()
+        self.stream = stream
+        self.written = 0
+        self.dropped = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._file: Optional[RotatingFile] = None
+        self._thread: Optional[threading.Thread] = None
+        self._handler_id: Optional[int] = None
+
+    def _sink(self, message) -> None:
+        """loguru 싱크 (호출 스레드): 큐에 넣기만 함"""
+        try:
+            self._queue.put_nowait((message.record, str(message)))
+        except queue.Full:
+            self.dropped += 1
+
+    def _write_loop(self, stream: TextIO) -> None:
+        """writer 스레드: 큐가 빌 때마다 한 번 flush"""
+        pending = self._queue
+        while True:
+            item = pending.get()
+            if item is _STOP:
+                break
+            self._write(stream, item)
+            if pending.empty():
+                self._flush(stream)
+        while True:
+            try:
+                item = pending.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                self._write(stream, item)
+        self._flush(stream)
+
+    def _write(self, stream: TextIO, item: Tuple[Dict[str, Any], str]) -> None:
+        try:
+            line = format_record(*item) + "\n"
+            stream.write(line)
+            if self._file is not None:
+                self._file.write(line.encode("utf-8"))
+            self.written += 1
+        except Exception:
+            # 로그 한 줄 때문에 writer 스레드가 죽지 않게
+            self.dropped += 1
+
+    def _flush(self, stream: TextIO) -> None:
+        try:
+            stream.flush()
+            if self._file is not None:
+                self._file.flush()
+        except Exception:
+            pass
+
+    def start(self) -> None:
+        """loguru 출력을 이 파이프라인으로 바꾸고 writer 스레드를 시작합니다."""
+        if self._thread is not None:
+            return
+        stream = self.stream or sys.stdout
+        if self.path:
+            self._file = RotatingFile(self.path, self.max_bytes, self.backups)
+        self._thread = threading.Thread(target=self._write_loop, args=(stream,), name="log-writer", daemon=True)
+        self._thread.start()
+        logger.remove()
+        logger.configure(patcher=_add_context)
+        self._handler_id = logger.add(
+            self._sink,
+            level=self.level,
+            format=_exception_only,
+            filter=self.limiter,
+            backtrace=False,
+            diagnose=False,
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """남은 레코드를 모두 쓰고 writer 스레드를 멈춘 뒤 기본 stderr 싱크로 되돌립니다."""
+        if self._thread is None:
+            return
+        logger.remove(self._handler_id)
+        self._handler_id = None
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        logger.add(sys.stderr, level=self.level)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        파이프라인 통계를 반환합니다.
+
+        Returns:
+            {"queued", "written", "dropped", "suppressed", "rotations"}
+        """
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "suppressed": self.limiter.suppressed,
+            "rotations": self._file.rotations if self._file is not None else 0,
+        }
+
+    def record_counts(self) -> Dict[str, int]:
+        """
+        처리 결과별 로그 레코드 누적 수 (/metrics의 ledger_log_records 게이지가 수집할 때 읽음)
+
+        writer / 로그 호출 스레드는 이 객체의 정수만 올리고 메트릭 카운터는 건드리지 않습니다.
+
+        Returns:
+            {LOG_WRITTEN, LOG_SUPPRESSED, LOG_DROPPED: 개수}
+        """
+        return {
+            LOG_WRITTEN: self.written,
+            LOG_SUPPRESSED: self.limiter.suppressed,
+            LOG_DROPPED: self.dropped,
+        }
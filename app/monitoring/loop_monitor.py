@@ -0,0 +1,158 @@
+"""
+이벤트 루프 지연 / 느린 처리 감시 (Loop Monitor)
+
+모든 게임이 asyncio 이벤트 루프 하나를 함께 쓰므로, 느린 액션 처리나 큰 브로드캐스트 하나가
+모든 테이블을 멈추게 합니다. 두 가지를 기록합니다.
+
+- LoopLagMonitor: interval초마다 깨어나도록 예약하고, 실제로 늦게 깨어난 만큼을 루프 지연으로 기록
+  (다른 콜백이 루프를 붙잡고 있던 시간)
+- SlowOperationLog: handle_message 한 번이 threshold를 넘으면 게임 ID / 메시지 타입 / 액션 타입 / 시간을
+  최근 목록(고정 크기)에 남김
+
+두 값 모두 히스토그램(/metrics)으로도 노출됩니다.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from app.monitoring.metrics import LOOP_LAG_SECONDS
+
+
+class LoopLagMonitor:
+    """
+    이벤트 루프 지연 샘플러
+
+    asyncio.sleep(interval) 뒤 실제로 흐른 시간에서 interval을 뺀 값이 지연입니다.
+    """
+
+    def __init__(self, interval: float = 0.25, recent: int = 8):
+        """
+        Args:
+            interval: 샘플 주기 (초)
+            recent: recent_max_lag에 쓸 최근 샘플 수 (기본 8개 = 2초)
+        """
+        self.interval = interval
+        self.samples = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._recent: Deque[float] = deque(maxlen=recent)
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, lag: float) -> None:
+        """
+        지연 샘플 하나를 기록합니다.
+
+        Args:
+            lag: 지연 (초, 음수면 0)
+        """
+        lag = max(lag, 0.0)
+        self.samples += 1
+        self.last_lag = lag
+        self._recent.append(lag)
+        if lag > self.max_lag:
+            self.max_lag = lag
+        LOOP_LAG_SECONDS.observe(lag)
+
+    @property
+    def recent_max_lag(self) -> float:
+        """최근 샘플 중 가장 큰 지연 (초, 샘플 하나의 튐보다 덜 민감한 현재 상태)"""
+        return max(self._recent, default=0.0)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        루프 지연 통계를 반환합니다.
+
+        Returns:
+            {"intervalMs", "samples", "lastMs", "recentMaxMs", "maxMs", "meanMs"}
+        """
+        return {
+            "intervalMs": self.interval * 1000,
+            "samples": self.samples,
+            "lastMs": round(self.last_lag * 1000, 3),
+            "recentMaxMs": round(self.recent_max_lag * 1000, 3),
+            "maxMs": round(self.max_lag * 1000, 3),
+            "meanMs": round(LOOP_LAG_SECONDS.sum / LOOP_LAG_SECONDS.count * 1000, 3) if LOOP_LAG_SECONDS.count else 0.0,
+        }
+
+    async def run(self) -> None:
+        """interval초마다 지연을 잽니다 (취소될 때까지)."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.record(loop.time() - started - self.interval)
+
+    def start(self) -> None:
+        """백그라운드 샘플링을 시작합니다."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        """백그라운드 샘플링을 멈춥니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class SlowOperationLog:
+    """
+    threshold를 넘은 메시지 처리의 최근 기록 (최대 capacity개, 오래된 것부터 버림)
+    """
+
+    def __init__(self, threshold: float = 0.1, capacity: int = 200):
+        """
+        Args:
+            threshold: 느린 처리로 기록할 기준 (초)
+            capacity: 남겨 둘 기록 수
+        """
+        self.threshold = threshold
+        self.total = 0
+        self.records: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+
+    def record(
+        self,
+        duration: float,
+        game_id: Optional[str],
+        message_type: Any,
+        action_type: Any = None,
+        player_id: Optional[str] = None,
+    ) -> None:
+        """
+        느린 처리 하나를 기록합니다 (threshold 비교는 호출자가 함).
+
+        Args:
+            duration: 처리 시간 (초)
+            game_id: 게임 ID
+            message_type: 메시지 타입
+            action_type: PLAYER_ACTION의 액션 타입
+            player_id: 보낸 플레이어 ID
+        """
+        self.total += 1
+        self.records.append({
+            "at": time.time(),
+            "durationMs": round(duration * 1000, 3),
+            "gameId": game_id if isinstance(game_id, str) else None,
+            "messageType": message_type if isinstance(message_type, str) else None,
+            "actionType": action_type if isinstance(action_type, str) else None,
+            "playerId": player_id,
+        })
+
+    def recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        최근 기록을 최신순으로 반환합니다.
+
+        Args:
+            limit: 최대 개수
+
+        Returns:
+            기록 목록
+        """
+        records = list(self.records)[-limit:] if limit > 0 else []
+        records.reverse()
+        return records
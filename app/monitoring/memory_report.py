@@ -0,0 +1,185 @@
+"""
+게임별 메모리 추정 (Memory Report)
+
+RSS가 늘 때 원인이 게임 수인지, 큰 핸드 / 이벤트 로그인지, 남아 있는 pending_action인지
+구분할 수 있도록 게임 하나를 부분별로 나눠 deep_sizeof 방식으로 추정합니다.
+
+- 부분은 hands, players, deck(덱 / 버림 더미 / CardManager), events, pending(pending_action /
+  required_response), caches(상태 버전 캐시: 합법 액션 등), other(나머지) 순서로 세며,
+  앞에서 센 객체는 뒤에서 다시 세지 않습니다. 카드 카탈로그처럼 게임끼리 공유하는 객체는 빠집니다.
+- 게임 전체를 도는 동안 이벤트 루프를 오래 잡지 않도록 YIELD_EVERY개마다 양보합니다.
+- TracemallocDiff: 두 시점 사이에 늘어난 할당을 파일:줄 단위로 비교합니다 (누수 추적용).
+  켜져 있는 동안 모든 할당이 기록되므로 메모리와 CPU 비용이 커서, 필요할 때만 켜고 끕니다.
+"""
+
+import asyncio
+import heapq
+import os
+import resource
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+from app.models.game import Game
+from app.utils.constants import GameState
+from app.utils.memory import sizeof_parts
+
+# 집계 중 이벤트 루프에 양보하는 간격 (게임 수)
+YIELD_EVERY = 50
+
+
+def game_footprint(game: Game, card_manager: Any = None) -> Dict[str, Any]:
+    """
+    게임 하나의 메모리를 부분별로 추정합니다.
+
+    Args:
+        game: Game 인스턴스
+        card_manager: 게임의 CardManager
+
+    Returns:
+        {"gameId", "state", "players", "events", "totalBytes", "parts": {부분 -> 바이트}}
+    """
+    parts = sizeof_parts({
+        "hands": [player.hand for player in game.players],
+        "players": [game.players],
+        "deck": [game.deck, game.discard_pile, card_manager],
+        "events": [game.events, game.last_event],
+        "pending": [game.pending_action, game.required_response],
+        "caches": [game._version_cache],
+        "other": [game],
+    })
+    return {
+        "gameId": game.id,
+        "state": GameState(game.state).name,
+        "players": len(game.players),
+        "events": len(game.events),
+        "totalBytes": sum(parts.values()),
+        "parts": parts,
+    }
+
+
+async def top_games(games: Dict[str, Game], card_managers: Dict[str, Any], limit: int = 10) -> Dict[str, Any]:
+    """
+    모든 게임의 메모리를 추정해 큰 순서로 limit개와 전체 합계를 반환합니다.
+
+    Args:
+        games: 게임 ID -> Game (GameManager.games)
+        card_managers: 게임 ID -> CardManager
+        limit: 반환할 게임 수
+
+    Returns:
+        {"games", "totalBytes", "parts": 부분별 합계, "top": [game_footprint, ...]}
+    """
+    footprints: List[Dict[str, Any]] = []
+    totals: Dict[str, int] = {}
+    for index, game_id in enumerate(list(games)):
+        if index and index % YIELD_EVERY == 0:
+            await asyncio.sleep(0)
+        game = games.get(game_id)
+        if game is None:
+            # 양보하는 사이에 정리된 게임
+            continue
+        footprint = game_footprint(game, card_managers.get(game_id))
+        footprints.append(footprint)
+        for name, size in footprint["parts"].items():
+            totals[name] = totals.get(name, 0) + size
+    return {
+        "games": len(footprints),
+        "totalBytes": sum(totals.values()),
+        "parts": totals,
+        "top": heapq.nlargest(limit, footprints, key=lambda footprint: footprint["totalBytes"]),
+    }
+
+
+def process_memory() -> Dict[str, Optional[int]]:
+    """
+    프로세스 메모리 사용량을 반환합니다.
+
+    Returns:
+        {"rssBytes": 현재 RSS (/proc가 없으면 None), "maxRssBytes": 최대 RSS}
+    """
+    rss = None
+    try:
+        with open("/proc/self/statm") as statm:
+            rss = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    # Linux는 KB 단위
+    return {"rssBytes": rss, "maxRssBytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024}
+
+
+class TracemallocDiff:
+    """
+    tracemalloc 스냅샷 비교 (start 시점 또는 직전 diff 시점 대비)
+    """
+
+    def __init__(self) -> None:
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._owned = False
+
+    @property
+    def running(self) -> bool:
+        return self._baseline is not None
+
+    def start(self, frames: int = 1) -> None:
+        """
+        tracemalloc을 켜고 기준 스냅샷을 찍습니다 (이미 켜져 있으면 기준만 다시 찍음).
+
+        Args:
+            frames: 할당마다 저장할 호출 스택 깊이
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            self._owned = True
+        self._baseline = self._snapshot()
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        """tracemalloc / import 내부 할당을 뺀 스냅샷"""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+    def diff(self, limit: int = 20, key_type: str = "lineno", reset: bool = False) -> Dict[str, Any]:
+        """
+        기준 스냅샷 이후 늘어난 / 줄어든 할당을 큰 순서로 반환합니다.
+
+        Args:
+            limit: 반환할 항목 수
+            key_type: "lineno" | "filename" | "traceback"
+            reset: 이번 스냅샷을 다음 비교의 기준으로 삼을지 여부
+
+        Returns:
+            {"tracedBytes", "peakBytes", "diff": [{"location", "sizeDiffBytes", "sizeBytes", "countDiff", "count"}]}
+
+        Raises:
+            RuntimeError: start()를 먼저 호출하지 않은 경우
+        """
+        if self._baseline is None:
+            raise RuntimeError("tracemalloc 비교가 시작되지 않았습니다.")
+        snapshot = self._snapshot()
+        stats = snapshot.compare_to(self._baseline, key_type)
+        if reset:
+            self._baseline = snapshot
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "tracedBytes": current,
+            "peakBytes": peak,
+            "diff": [
+                {
+                    "location": str(stat.traceback),
+                    "sizeDiffBytes": stat.size_diff,
+                    "sizeBytes": stat.size,
+                    "countDiff": stat.count_diff,
+                    "count": stat.count,
+                }
+                for stat in stats[:limit]
+            ],
+        }
+
+    def stop(self) -> None:
+        """기준 스냅샷을 버리고, 이 객체가 켠 경우 tracemalloc을 끕니다."""
+        self._baseline = None
+        if self._owned:
+            tracemalloc.stop()
+            self._owned = False
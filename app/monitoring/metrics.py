@@ -0,0 +1,366 @@
+"""
+Prometheus 메트릭 (Metrics)
+
+prometheus_client 없이 텍스트 노출 형식(text exposition format 0.0.4)으로 /metrics를 만듭니다.
+
+- 카운터 / 히스토그램은 모듈을 불러올 때 라벨 값별로 미리 만들어 두고(pre-bound),
+  핫 패스에서는 속성 덧셈 한 번만 합니다 (라벨 딕셔너리 생성 / 조회 / 락 없음).
+- 모든 갱신은 이벤트 루프 스레드에서 일어나므로 락이 필요 없습니다.
+- 연결 수 / 상태별 게임 수처럼 이미 다른 곳에 있는 값은 수집할 때만 계산하는 게이지(GaugeFunc)로 둡니다.
+  로그 레코드 수처럼 루프 밖 스레드가 세는 값도 그 객체의 정수로 두고 GaugeFunc로 읽습니다.
+"""
+
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+from app.utils.constants import ActionType
+
+# 라벨 값으로 모르는 메시지 타입이 들어오면 이 값으로 셈 (라벨 수 폭증 방지)
+OTHER = "other"
+
+# handle_message가 처리하는 메시지 타입
+MESSAGE_TYPES = ("PLAYER_ACTION", "JOIN_GAME", "GET_GAME_STATE", "START_GAME", "ADD_AI_PLAYER")
+# 서버가 보내는 메시지 타입 (이 외는 other)
+OUTBOUND_TYPES = ("GAME_STATE_UPDATE", "ACTION_RESPONSE", "GAME_END", "PONG", "ERROR", "CONNECTION_ESTABLISHED")
+
+# 연결 해제 사유
+DISCONNECT_CLIENT_CLOSED = "client_closed"  # 클라이언트가 닫음 (WebSocketDisconnect)
+DISCONNECT_SEND_FAILED = "send_failed"  # 전송 실패로 서버가 정리
+DISCONNECT_JOIN_FAILED = "join_failed"  # 로비 자동 참가 실패로 서버가 닫음
+DISCONNECT_ERROR = "error"  # 수신 루프의 처리되지 않은 예외
+DISCONNECT_REASONS = (DISCONNECT_CLIENT_CLOSED, DISCONNECT_SEND_FAILED, DISCONNECT_JOIN_FAILED, DISCONNECT_ERROR)
+
+# 로그 레코드 처리 결과
+LOG_WRITTEN = "written"  # 출력됨
+LOG_SUPPRESSED = "suppressed"  # 같은 위치 / 예외의 반복이라 샘플링에서 빠짐
+LOG_DROPPED = "dropped"  # 큐가 가득 차서 버림
+LOG_OUTCOMES = (LOG_WRITTEN, LOG_SUPPRESSED, LOG_DROPPED)
+
+# 브로드캐스트 시간 히스토그램 버킷 (초)
+BROADCAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+# 메시지 처리 시간 / 이벤트 루프 지연 히스토그램 버킷 (초)
+ACTION_BUCKETS = (0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """라벨이 정해진 카운터 하나 (inc만 핫 패스에서 호출)"""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+
+class CounterFamily:
+    """
+    라벨 하나로 나뉜 카운터 묶음
+
+    labels()로 라벨 값별 Counter를 미리 받아 두고, 핫 패스에서는 그 Counter만 씁니다.
+    """
+
+    def __init__(self, name: str, help: str, label: Optional[str] = None, values: Iterable[str] = ()):
+        """
+        Args:
+            name: 메트릭 이름 (_total로 끝나는 이름 권장)
+            help: 설명
+            label: 라벨 이름 (없으면 라벨 없는 카운터 하나)
+            values: 미리 만들어 둘 라벨 값 (0도 노출되도록)
+        """
+        self.name = name
+        self.help = help
+        self.label = label
+        self.children: Dict[str, Counter] = {value: Counter() for value in values}
+        if label is None:
+            self.children[""] = Counter()
+
+    def labels(self, value: str = "") -> Counter:
+        """
+        라벨 값의 카운터를 반환합니다 (없으면 만듦, 모듈 로드 / 초기화 시점에 호출).
+
+        Args:
+            value: 라벨 값
+
+        Returns:
+            Counter
+        """
+        child = self.children.get(value)
+        if child is None:
+            child = self.children[value] = Counter()
+        return child
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for value, child in self.children.items():
+            labels = f'{{{self.label}="{_escape(value)}"}}' if self.label else ""
+            lines.append(f"{self.name}{labels} {child.value}")
+        return lines
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (observe는 이분 탐색 한 번 + 덧셈 세 번)"""
+
+    __slots__ = ("name", "help", "buckets", "counts", "sum", "count")
+
+    def __init__(self, name: str, help: str, buckets: Sequence[float]):
+        """
+        Args:
+            name: 메트릭 이름
+            help: 설명
+            buckets: 버킷 상한 (오름차순, +Inf는 자동 추가)
+        """
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        # 마지막 칸은 +Inf 버킷
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            lines.append(f'{self.name}_bucket{{le="{_number(bound)}"}} {cumulative}')
+        lines.append(f"{self.name}_sum {_number(self.sum)}")
+        lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+
+class HistogramFamily:
+    """라벨 하나로 나뉜 히스토그램 묶음 (labels()로 미리 바인딩한 Histogram만 핫 패스에서 사용)"""
+
+    def __init__(self, name: str, help: str, label: str, buckets: Sequence[float], values: Iterable[str] = ()):
+        """
+        Args:
+            name: 메트릭 이름
+            help: 설명
+            label: 라벨 이름
+            buckets: 버킷 상한 (오름차순, +Inf는 자동 추가)
+            values: 미리 만들어 둘 라벨 값
+        """
+        self.name = name
+        self.help = help
+        self.label = label
+        self.buckets = tuple(buckets)
+        self.children: Dict[str, Histogram] = {}
+        for value in values:
+            self.labels(value)
+
+    def labels(self, value: str) -> Histogram:
+        """
+        라벨 값의 히스토그램을 반환합니다 (없으면 만듦).
+
+        Args:
+            value: 라벨 값
+
+        Returns:
+            Histogram
+        """
+        child = self.children.get(value)
+        if child is None:
+            child = self.children[value] = Histogram(self.name, self.help, self.buckets)
+        return child
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        label = self.label
+        for value, child in self.children.items():
+            escaped = _escape(value)
+            cumulative = 0
+            for bound, count in zip(child.buckets + (float("inf"),), child.counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{label}="{escaped}",le="{_number(bound)}"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{{label}="{escaped}"}} {_number(child.sum)}')
+            lines.append(f'{self.name}_count{{{label}="{escaped}"}} {child.count}')
+        return lines
+
+
+class GaugeFunc:
+    """수집할 때만 fn()을 불러 값을 읽는 게이지 (핫 패스 비용 없음)"""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        fn: Callable[[], Union[float, Mapping[str, float]]],
+        label: Optional[str] = None,
+    ):
+        """
+        Args:
+            name: 메트릭 이름
+            help: 설명
+            fn: 값 함수 (label이 있으면 {라벨 값: 값} 반환)
+            label: 라벨 이름
+        """
+        self.name = name
+        self.help = help
+        self.fn = fn
+        self.label = label
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        value = self.fn()
+        if self.label is None:
+            lines.append(f"{self.name} {_number(value)}")
+        else:
+            for key, item in value.items():
+                lines.append(f'{self.name}{{{self.label}="{_escape(key)}"}} {_number(item)}')
+        return lines
+
+
+Metric = Union[CounterFamily, Histogram, HistogramFamily, GaugeFunc]
+
+
+class Registry:
+    """메트릭 목록과 텍스트 노출 형식 렌더링"""
+
+    def __init__(self) -> None:
+        self.metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        메트릭을 등록합니다 (같은 이름이면 교체).
+
+        Args:
+            metric: 메트릭
+
+        Returns:
+            등록한 메트릭
+        """
+        self.metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """
+        등록된 메트릭 전체를 텍스트 노출 형식으로 반환합니다.
+
+        Returns:
+            /metrics 응답 본문
+        """
+        lines: List[str] = []
+        for metric in self.metrics.values():
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+MESSAGES = REGISTRY.register(CounterFamily(
+    "ledger_ws_messages_total",
+    "handle_message가 받은 메시지 수 (타입별)",
+    "type",
+    MESSAGE_TYPES + (OTHER,),
+))
+ACTIONS = REGISTRY.register(CounterFamily(
+    "ledger_actions_total",
+    "적용을 시도한 플레이어 액션 수 (ActionType별, 봇 포함)",
+    "type",
+    [action.value for action in ActionType],
+))
+BROADCAST_SECONDS = REGISTRY.register(Histogram(
+    "ledger_broadcast_seconds",
+    "broadcast_game_state 한 번 (게임 플레이어 전원에게 상태 전송)에 걸린 시간",
+    BROADCAST_BUCKETS,
+))
+ACTION_SECONDS = REGISTRY.register(Histogram(
+    "ledger_action_seconds",
+    "apply_player_action 한 번 (규칙 적용 / 저장 / 브로드캐스트 / 승리 체크, 봇 포함)에 걸린 시간",
+    ACTION_BUCKETS,
+))
+SEND_FAILURES = REGISTRY.register(CounterFamily(
+    "ledger_ws_send_failures_total",
+    "WebSocket 전송 실패 수",
+))
+DISCONNECTS = REGISTRY.register(CounterFamily(
+    "ledger_ws_disconnects_total",
+    "WebSocket 연결 해제 수 (사유별)",
+    "reason",
+    DISCONNECT_REASONS,
+))
+
+HANDLER_SECONDS = REGISTRY.register(HistogramFamily(
+    "ledger_handler_seconds",
+    "handle_message 한 번에 걸린 시간 (메시지 타입별, 브로드캐스트 포함)",
+    "type",
+    LATENCY_BUCKETS,
+    MESSAGE_TYPES + (OTHER,),
+))
+LOOP_LAG_SECONDS = REGISTRY.register(Histogram(
+    "ledger_event_loop_lag_seconds",
+    "이벤트 루프 지연 (예약한 깨어남 시각보다 늦어진 시간)",
+    LATENCY_BUCKETS,
+))
+SENT_BYTES = REGISTRY.register(CounterFamily(
+    "ledger_ws_sent_bytes_total",
+    "ConnectionManager가 보낸 인코딩된 바이트 수 (메시지 타입별)",
+    "type",
+    OUTBOUND_TYPES + (OTHER,),
+))
+BANDWIDTH_BUDGET = REGISTRY.register(CounterFamily(
+    "ledger_bandwidth_budget_exceeded_total",
+    "게임 하나가 분당 송신 예산을 넘은 횟수 (게임 / 분마다 한 번)",
+))
+
+# 핫 패스용으로 미리 바인딩한 카운터
+MESSAGE_COUNTERS: Dict[str, Counter] = {value: MESSAGES.labels(value) for value in MESSAGE_TYPES}
+OTHER_MESSAGES = MESSAGES.labels(OTHER)
+HANDLER_HISTOGRAMS: Dict[str, Histogram] = {value: HANDLER_SECONDS.labels(value) for value in MESSAGE_TYPES}
+OTHER_HANDLER = HANDLER_SECONDS.labels(OTHER)
+ACTION_COUNTERS: Dict[ActionType, Counter] = {action: ACTIONS.labels(action.value) for action in ActionType}
+SEND_FAILURE_COUNTER = SEND_FAILURES.labels()
+DISCONNECT_COUNTERS: Dict[str, Counter] = {reason: DISCONNECTS.labels(reason) for reason in DISCONNECT_REASONS}
+SENT_BYTES_COUNTERS: Dict[str, Counter] = {value: SENT_BYTES.labels(value) for value in OUTBOUND_TYPES}
+OTHER_SENT_BYTES = SENT_BYTES.labels(OTHER)
+BANDWIDTH_BUDGET_COUNTER = BANDWIDTH_BUDGET.labels()
+
+
+def register_gauges(
+    connection_count: Callable[[], int],
+    games_by_state: Callable[[], Mapping[str, int]],
+    log_records: Callable[[], Mapping[str, int]],
+) -> None:
+    """
+    수집 시점에 읽는 게이지를 등록합니다 (앱 초기화 시 한 번).
+
+    Args:
+        connection_count: 현재 연결 수 (ConnectionManager.get_connection_count)
+        games_by_state: GameState 이름 -> 게임 수
+        log_records: 처리 결과(LOG_OUTCOMES) -> 로그 레코드 누적 수 (LogPipeline.record_counts)
+    """
+    REGISTRY.register(GaugeFunc(
+        "ledger_ws_connections",
+        "현재 WebSocket 연결 수",
+        connection_count,
+    ))
+    REGISTRY.register(GaugeFunc(
+        "ledger_games",
+        "메모리에 있는 게임 수 (GameState별)",
+        games_by_state,
+        "state",
+    ))
+    REGISTRY.register(GaugeFunc(
+        "ledger_log_records",
+        "구조화 로그 레코드 누적 수 (처리 결과별)",
+        log_records,
+        "outcome",
+    ))
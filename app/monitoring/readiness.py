@@ -0,0 +1,104 @@
+"""
+준비 상태 판정 (Readiness)
+
+/health는 프로세스가 살아 있는지만 알려 주므로, 리버스 프록시가 포화된 인스턴스에 새 로비를
+보내지 않도록 /ready에서 실제 여유를 기준으로 판정합니다. 하나라도 기준을 넘으면 준비되지 않음(503)입니다.
+
+- 연결 여유: WS_MAX_CONNECTIONS 대비 남은 연결 비율이 min_headroom 미만
+- 이벤트 루프 지연: 최근 샘플 중 최대 지연이 max_loop_lag 초과
+- 송신 적체: 전송을 기다리는 메시지 수(ConnectionManager.pending_sends)가 max_pending_sends 초과
+- 게임 수: 메모리에 있는 게임 수가 max_games 이상
+
+각 기준은 0이면 검사하지 않습니다. 판정은 이미 세어 둔 값만 읽으므로 프록시가 자주 호출해도 됩니다.
+"""
+
+from typing import Any, Dict
+
+from app.game.game_manager import GameManager
+from app.monitoring.loop_monitor import LoopLagMonitor
+from app.websocket.connection_manager import ConnectionManager
+
+
+class ReadinessProbe:
+    """
+    인스턴스 여유 기준 판정기
+    """
+
+    def __init__(
+        self,
+        connection_manager: ConnectionManager,
+        game_manager: GameManager,
+        loop_monitor: LoopLagMonitor,
+        max_connections: int,
+        min_headroom: float = 0.1,
+        max_loop_lag: float = 0.25,
+        max_pending_sends: int = 500,
+        max_games: int = 0,
+    ):
+        """
+        Args:
+            connection_manager: 연결 관리자
+            game_manager: 게임 관리자
+            loop_monitor: 이벤트 루프 지연 감시
+            max_connections: 최대 연결 수 (WS_MAX_CONNECTIONS)
+            min_headroom: 남아 있어야 하는 연결 비율 (0~1)
+            max_loop_lag: 허용 루프 지연 (초)
+            max_pending_sends: 허용 송신 대기 메시지 수
+            max_games: 게임 수 상한
+        """
+        self.connection_manager = connection_manager
+        self.game_manager = game_manager
+        self.loop_monitor = loop_monitor
+        self.max_connections = max_connections
+        self.min_headroom = min_headroom
+        self.max_loop_lag = max_loop_lag
+        self.max_pending_sends = max_pending_sends
+        self.max_games = max_games
+
+    def check(self) -> Dict[str, Any]:
+        """
+        현재 값과 기준을 비교합니다.
+
+        Returns:
+            {
+                "ready": bool,
+                "failing": [기준 이름, ...],  # connections | loopLag | pendingSends | games
+                "connections": {"current", "max", "headroom", "minHeadroom"},
+                "loopLag": {"recentMaxMs", "maxMs"},
+                "pendingSends": {"current", "max"},
+                "games": {"current", "max"}
+            }
+        """
+        failing = []
+
+        connections = self.connection_manager.get_connection_count()
+        capacity = self.max_connections
+        headroom = (capacity - connections) / capacity if capacity > 0 else 1.0
+        if self.min_headroom and headroom < self.min_headroom:
+            failing.append("connections")
+
+        lag = self.loop_monitor.recent_max_lag
+        if self.max_loop_lag and lag > self.max_loop_lag:
+            failing.append("loopLag")
+
+        pending = self.connection_manager.pending_sends
+        if self.max_pending_sends and pending > self.max_pending_sends:
+            failing.append("pendingSends")
+
+        games = len(self.game_manager.games)
+        if self.max_games and games >= self.max_games:
+            failing.append("games")
+
+        return {
+            "ready": not failing,
+            "failing": failing,
+            "connections": {
+                "current": connections,
+                "max": capacity,
+                "headroom": round(headroom, 4),
+                "minHeadroom": self.min_headroom,
+            },
+            "loopLag": {"recentMaxMs": round(lag * 1000, 3), "maxMs": self.max_loop_lag * 1000},
+            "pendingSends": {"current": pending, "max": self.max_pending_sends},
+            "games": {"current": games, "max": self.max_games},
+        }
@@ -0,0 +1,196 @@
+"""
+느린 액션 캡처 (Slow Action Capture)
+
+7인 테이블의 잡화점처럼 액션 하나가 수백 ms 걸리는 경우를 나중에 그대로 재현할 수 있도록,
+처리 시간이 threshold를 넘은 PLAYER_ACTION을 캡처 파일 하나로 남깁니다.
+
+- 액션마다 처리 전에 engine_bridge.game_parts()로 상태를 인코딩 없이 붙잡아 두고
+  (7인 게임 기준 약 80µs, 꺼져 있으면 비용 없음), 기준을 넘었을 때만 인코딩해서 씁니다.
+- 파일: {directory}/{시각}_{게임 ID}_v{버전}.cap
+  = CAPTURE_MAGIC + encode((CAPTURE_FORMAT_VERSION, meta JSON, 게임 바이트))
+  - 게임 바이트: serialize_game()과 같은 형식 (엔진 스냅샷, 난수 상태, 시드, 이벤트 로그)
+  - meta: 게임 / 플레이어 ID, 액션 payload, 처리 시간, 결과, 연결된 플레이어 (브로드캐스트 재현용)
+- 파일 쓰기는 워커 스레드에서 하고, 디렉터리에 max_files개가 넘으면 더 쓰지 않습니다.
+
+재생: python scripts/replay_capture.py {캡처 파일} (샘플링 프로파일러로 collapsed stack 출력)
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from loguru import logger
+
+from app.game import engine_bridge
+from app.game.card_manager import CardManager
+from app.models.game import Game
+from app.storage.codec import decode, encode
+
+CAPTURE_MAGIC = b"LWCP\x01"
+CAPTURE_FORMAT_VERSION = 1
+CAPTURE_SUFFIX = ".cap"
+
+# 파일 이름에 쓸 수 없는 문자
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class Capture(NamedTuple):
+    """load_capture() 결과"""
+
+    meta: Dict[str, Any]
+    game_bytes: bytes
+
+
+def load_capture(path: str) -> Capture:
+    """
+    캡처 파일을 읽습니다.
+
+    Args:
+        path: 캡처 파일 경로
+
+    Returns:
+        Capture (게임은 engine_bridge.deserialize_game(capture.game_bytes)로 복원)
+
+    Raises:
+        ValueError: 캡처 파일이 아니거나 형식 버전이 다른 경우
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(CAPTURE_MAGIC):
+        raise ValueError(f"캡처 파일이 아닙니다: {path}")
+    fmt, meta, game_bytes = decode(data[len(CAPTURE_MAGIC):])
+    if fmt != CAPTURE_FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 캡처 형식 버전: {fmt}")
+    return Capture(json.loads(meta), game_bytes)
+
+
+class SlowActionCapture:
+    """
+    threshold를 넘은 액션의 처리 전 상태와 payload를 파일로 남기는 기록기
+    """
+
+    def __init__(self, directory: str, threshold: float = 0.25, max_files: int = 100):
+        """
+        Args:
+            directory: 캡처 디렉터리
+            threshold: 캡처 기준 처리 시간 (초)
+            max_files: 디렉터리에 둘 최대 캡처 수 (넘으면 쓰지 않음)
+        """
+        self.directory = directory
+        self.threshold = threshold
+        self.max_files = max_files
+        self.written = 0
+        self.skipped = 0
+        self.failed = 0
+        self.last_path: Optional[str] = None
+
+    def before(self, game: Game, card_manager: CardManager) -> Tuple:
+        """
+        액션 처리 전 상태를 붙잡아 둡니다 (인코딩하지 않음).
+
+        Args:
+            game: Game 인스턴스
+            card_manager: 게임의 CardManager
+
+        Returns:
+            engine_bridge.game_parts()의 결과 (record()에 넘김)
+        """
+        return engine_bridge.game_parts(game, card_manager)
+
+    async def record(
+        self,
+        parts: Tuple,
+        game_id: str,
+        player_id: str,
+        action: Any,
+        elapsed: float,
+        result: Optional[Dict],
+        connected: Iterable[str] = (),
+    ) -> Optional[str]:
+        """
+        처리 시간이 threshold 이상이면 캡처 파일을 씁니다 (워커 스레드).
+
+        Args:
+            parts: before()의 결과
+            game_id: 게임 ID
+            player_id: 액션한 플레이어 ID
+            action: PLAYER_ACTION의 action payload
+            elapsed: 처리 시간 (초)
+            result: 처리 결과
+            connected: 게임에 연결된 플레이어 ID (재생 시 브로드캐스트 대상)
+
+        Returns:
+            쓴 파일 경로 (기준 미만이거나 쓰지 않았으면 None)
+        """
+        if elapsed < self.threshold:
+            return None
+        meta = {
+            "gameId": game_id,
+            "playerId": player_id,
+            "action": action,
+            "elapsedMs": round(elapsed * 1000, 3),
+            "capturedAt": time.time(),
+            "version": parts[1],
+            "connected": sorted(connected),
+            "result": {
+                "success": result.get("success"),
+                "message": result.get("message"),
+            } if isinstance(result, dict) else None,
+        }
+        try:
+            path = await asyncio.to_thread(self._write, parts, meta)
+        except Exception:
+            self.failed += 1
+            logger.exception("느린 액션 캡처를 쓰지 못했습니다", game_id=game_id)
+            return None
+        if path is None:
+            self.skipped += 1
+            return None
+        self.written += 1
+        self.last_path = path
+        logger.warning(
+            "느린 액션을 캡처했습니다",
+            game_id=game_id,
+            action_type=action.get("type") if isinstance(action, dict) else None,
+            elapsed_ms=meta["elapsedMs"],
+            path=path,
+        )
+        return path
+
+    def _write(self, parts: Tuple, meta: Dict[str, Any]) -> Optional[str]:
+        os.makedirs(self.directory, exist_ok=True)
+        existing = sum(1 for name in os.listdir(self.directory) if name.endswith(CAPTURE_SUFFIX))
+        if existing >= self.max_files:
+            return None
+        name = f"{int(meta['capturedAt'] * 1000)}_{_UNSAFE.sub('_', str(meta['gameId']))}_v{meta['version']}{CAPTURE_SUFFIX}"
+        path = os.path.join(self.directory, name)
+        data = CAPTURE_MAGIC + encode((
+            CAPTURE_FORMAT_VERSION,
+            json.dumps(meta, ensure_ascii=False, default=str),
+            engine_bridge.encode_game_parts(parts),
+        ))
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        return path
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캡처 통계를 반환합니다.
+
+        Returns:
+            {"directory", "thresholdMs", "maxFiles", "written", "skipped", "failed", "lastPath"}
+        """
+        return {
+            "directory": self.directory,
+            "thresholdMs": self.threshold * 1000,
+            "maxFiles": self.max_files,
+            "written": self.written,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "lastPath": self.last_path,
+        }
@@ -0,0 +1,38 @@
+import hmac
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+from app.config import settings
+
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """
+    관리자 토큰이 설정값(ADMIN_TOKEN)과 같은지 확인합니다.
+
+    ADMIN_TOKEN이 비어 있으면 관리자 기능을 쓰지 않는 것으로 보고 항상 False입니다.
+
+    Args:
+        token: 요청에 담긴 토큰
+
+    Returns:
+        관리자 여부
+    """
+    expected = settings.ADMIN_TOKEN
+    if not expected or not token:
+        return False
+    # 타이밍 공격 방지를 위해 상수 시간 비교
+    return hmac.compare_digest(token.encode("utf-8"), expected.encode("utf-8"))
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    """
+    관리자 엔드포인트 의존성 (X-Admin-Token 헤더 확인).
+
+    Raises:
+        HTTPException: ADMIN_TOKEN이 설정되지 않았으면 404, 토큰이 다르면 401
+    """
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not found")
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=401, detail="관리자 인증이 필요합니다.")
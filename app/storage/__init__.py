@@ -0,0 +1,20 @@
+"""
+저장소 모듈
+
+게임 액션 로그, 스냅샷 등 게임 상태 영속화를 담당합니다.
+"""
+
+from .action_log import ActionLog, ActionLogError, Rebuilt, flush_action_logs, logged_game_ids, rebuild
+from .game_store import GameStore, InMemoryGameStore, create_game_store
+
+__all__ = [
+    "ActionLog",
+    "ActionLogError",
+    "GameStore",
+    "InMemoryGameStore",
+    "Rebuilt",
+    "create_game_store",
+    "flush_action_logs",
+    "logged_game_ids",
+    "rebuild",
+]
@@ -0,0 +1,533 @@
+"""
+액션 로그 (Action Log)
+
+게임별로 수락된 규칙 적용을 추가 전용(append-only) 바이너리 로그에 기록하고,
+주기적으로 압축 스냅샷을 남깁니다. 게임은 최신 스냅샷 + 로그 꼬리를 재생해 복원합니다.
+
+파일 형식:
+- {name}.log: 헤더(LOG_MAGIC) 뒤에 [uint32 길이][레코드] 반복
+  레코드 = encode((op, version, rng_mark, args))
+- {name}.snap: SNAPSHOT_MAGIC + encode((seed, version, log_offset, records, rng_state,
+  engine_snapshot, history)) - history는 스냅샷 시점의 게임 이벤트 로그(Game.events)
+  임시 파일에 쓴 뒤 os.replace로 교체합니다.
+
+파일 쓰기는 프로세스에 하나인 쓰기 스레드(ActionLogWriter)가 맡습니다.
+
+{name}은 게임 ID가 [A-Za-z0-9_-]로만 되어 있으면 그대로, 아니면 "=" + URL-safe base64로
+인코딩한 값입니다 (클라이언트가 정한 ID로 디렉터리 밖에 쓰지 못하게 함).
+"""
+
+import atexit
+import base64
+import os
+import queue
+import random
+import re
+import struct
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from loguru import logger
+
+from app.engine import rules
+from app.engine.events import Event
+from app.engine.rules import Action, Context
+from app.engine.state import EngineState
+from app.storage.codec import LENGTH_PREFIX, decode, encode
+
+LOG_MAGIC = b"LWAL\x01"
+SNAPSHOT_MAGIC = b"LWSN\x01"
+LOG_SUFFIX = ".log"
+SNAPSHOT_SUFFIX = ".snap"
+
+# 파일 이름에 그대로 쓸 수 있는 게임 ID
+_SAFE_ID = re.compile(r"[A-Za-z0-9_-]+")
+# 인코딩한 ID의 접두사 (_SAFE_ID에 없는 문자라 그대로 쓴 ID와 겹치지 않음)
+_ENCODED_PREFIX = "="
+# 파일 이름 길이 제한 (접미사 / .tmp 여유를 뺀 값)
+MAX_NAME_LENGTH = 200
+
+# 복원 시 남길 최근 이벤트 수 (Game.events 보관 개수와 동일)
+REPLAY_EVENT_LIMIT = 50
+
+# 기록 가능한 규칙 함수 (인덱스가 곧 op 코드이므로 뒤에만 추가할 것)
+OPS: Tuple[Callable[..., Any], ...] = (
+    rules.start,
+    rules.perform,
+    rules.start_turn,
+    rules.process_draw_phase,
+    rules.draw_cards_for_player,
+    rules.end_turn,
+    rules.move_to_next_player,
+    rules.set_respond_phase,
+    rules.return_to_play_phase,
+    rules.use_card,
+    rules.bang,
+    rules.beer,
+    rules.panic,
+    rules.equip,
+    rules.gatling,
+    rules.indians,
+    rules.duel,
+    rules.saloon,
+    rules.general_store,
+    rules.general_store_pick,
+    rules.respond_attack,
+    rules.respond_attack_failed,
+    rules.use_treasure,
+    rules.select_steal_card,
+    rules.select_draw_order,
+    rules.handle_end_turn,
+)
+OP_CODES: Dict[Callable[..., Any], int] = {fn: i for i, fn in enumerate(OPS)}
+_PERFORM = OP_CODES[rules.perform]
+
+
+class ActionLogError(Exception):
+    """로그 / 스냅샷이 손상되었거나 재생 결과가 기록과 다를 때 발생"""
+
+
+class Rebuilt(NamedTuple):
+    """rebuild() 결과"""
+
+    state: EngineState
+    rng: random.Random
+    seed: Optional[int]
+    version: int
+    history: List[Dict[str, Any]]
+    events: List[Event]
+    replayed: int
+
+
+def rng_mark(rng: random.Random) -> int:
+    """
+    난수 생성기 위치를 나타내는 32비트 지문을 계산합니다 (상태를 소비하지 않음).
+
+    Args:
+        rng: 게임 난수 생성기
+
+    Returns:
+        재생 검증용 지문
+    """
+    return hash(rng.getstate()[1]) & 0xFFFFFFFF
+
+
+def pack_rng_state(rng: random.Random) -> Tuple:
+    """
+    난수 생성기 상태를 압축된 형태로 만듭니다 (Mersenne Twister 상태를 uint32 배열 바이트로).
+
+    Args:
+        rng: 난수 생성기
+
+    Returns:
+        (버전, 상태 바이트, gauss_next)
+    """
+    version, internal, gauss = rng.getstate()
+    return (version, struct.pack(f"<{len(internal)}I", *internal), gauss)
+
+
+def unpack_rng_state(packed: Tuple) -> random.Random:
+    """
+    pack_rng_state()의 결과로 난수 생성기를 복원합니다.
+
+    Args:
+        packed: (버전, 상태 바이트, gauss_next)
+
+    Returns:
+        복원된 난수 생성기
+    """
+    version, raw, gauss = packed
+    rng = random.Random()
+    rng.setstate((version, struct.unpack(f"<{len(raw) // 4}I", raw), gauss))
+    return rng
+
+
+def file_name(game_id: str) -> str:
+    """
+    게임 ID를 로그 / 스냅샷 파일 이름(접미사 제외)으로 바꿉니다.
+
+    Args:
+        game_id: 게임 ID
+
+    Returns:
+        파일 이름
+
+    Raises:
+        ValueError: 파일 이름으로 쓰기에 너무 긴 ID인 경우
+    """
+    if _SAFE_ID.fullmatch(game_id):
+        name = game_id
+    else:
+        encoded = base64.urlsafe_b64encode(game_id.encode("utf-8")).decode("ascii")
+        name = _ENCODED_PREFIX + encoded.rstrip("=")
+    if len(name) > MAX_NAME_LENGTH:
+        raise ValueError(f"게임 ID가 너무 깁니다: {game_id[:32]}...")
+    return name
+
+
+def game_id_from_name(name: str) -> str:
+    """
+    file_name()의 역변환
+
+    Raises:
+        ValueError: file_name()이 만들 수 없는 이름인 경우
+    """
+    if not name.startswith(_ENCODED_PREFIX):
+        if not _SAFE_ID.fullmatch(name):
+            raise ValueError(f"게임 로그 파일 이름이 아닙니다: {name}")
+        return name
+    encoded = name[len(_ENCODED_PREFIX):]
+    return base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)).decode("utf-8")
+
+
+def game_paths(directory: str, game_id: str) -> Tuple[str, str]:
+    """
+    게임의 로그 / 스냅샷 파일 경로를 반환합니다.
+
+    Args:
+        directory: 로그 디렉터리
+        game_id: 게임 ID
+
+    Returns:
+        (로그 경로, 스냅샷 경로)
+
+    Raises:
+        ValueError: ID가 너무 길거나 경로가 디렉터리 밖을 가리키는 경우
+    """
+    base = os.path.join(directory, file_name(game_id))
+    if os.path.dirname(os.path.realpath(base)) != os.path.realpath(directory):
+        raise ValueError(f"게임 로그 경로가 디렉터리 밖을 가리킵니다: {game_id}")
+    return base + LOG_SUFFIX, base + SNAPSHOT_SUFFIX
+
+
+# 쓰기 스레드 작업 종류
+_APPEND = "append"
+_SNAPSHOT = "snapshot"
+_DELETE = "delete"
+
+
+class ActionLogWriter:
+    """
+    프로세스 전체가 공유하는 액션 로그 쓰기 스레드
+
+    기록 / 스냅샷 / 삭제를 대기열에 넣고 바로 반환하므로 이벤트 루프는 파일 I/O를 하지 않습니다.
+    스레드는 들어온 순서대로 반영하며, 한 번에 꺼낸 기록은 파일별로 모아 열고-쓰고-닫습니다
+    (게임 수와 관계없이 열린 파일은 하나뿐).
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue[Tuple[str, Any, Any]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.records_written = 0
+        self.errors = 0
+
+    def submit(self, kind: str, path: Any, data: Any = None) -> None:
+        """작업 하나를 대기열에 넣습니다 (처음 호출 시 스레드 시작)."""
+        if self._thread is None:
+            self._start()
+        self._queue.put((kind, path, data))
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name="action-log-writer", daemon=True)
+                thread.start()
+                self._thread = thread
+                atexit.register(self.flush)
+
+    def flush(self) -> None:
+        """대기 중인 작업이 모두 반영될 때까지 기다립니다."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, batch: List[Tuple[str, Any, Any]]) -> None:
+        appends: Dict[str, List[bytes]] = {}
+        for kind, path, data in batch:
+            if kind == _APPEND:
+                appends.setdefault(path, []).append(data)
+                continue
+            # 스냅샷 / 삭제 전에 앞선 기록을 먼저 반영해 순서를 지킴
+            self._write_appends(appends)
+            appends = {}
+            try:
+                if kind == _SNAPSHOT:
+                    tmp_path = path + ".tmp"
+                    with open(tmp_path, "wb") as out:
+                        out.write(data)
+                    os.replace(tmp_path, path)
+                else:
+                    for target in path:
+                        try:
+                            os.remove(target)
+                        except FileNotFoundError:
+                            pass
+            except OSError:
+                self.errors += 1
+                logger.exception("액션 로그 {} 실패: {}", kind, path)
+        self._write_appends(appends)
+
+    def _write_appends(self, appends: Dict[str, List[bytes]]) -> None:
+        for path, chunks in appends.items():
+            try:
+                with open(path, "ab") as f:
+                    f.write(b"".join(chunks))
+            except OSError:
+                self.errors += 1
+                logger.exception("액션 로그 기록 실패 ({}건): {}", len(chunks), path)
+                continue
+            self.records_written += len(chunks)
+
+
+# 프로세스 전체의 쓰기 스레드
+writer = ActionLogWriter()
+
+
+def flush_action_logs() -> None:
+    """대기 중인 액션 로그 쓰기를 모두 반영합니다 (종료 시 / 파일을 읽기 전)."""
+    writer.flush()
+
+
+def delete_game_log(directory: str, game_id: str) -> None:
+    """
+    게임의 로그 / 스냅샷 삭제를 쓰기 스레드에 넘깁니다 (로드하지 않은 게임을 제거할 때).
+
+    Args:
+        directory: 로그 디렉터리
+        game_id: 게임 ID
+    """
+    log_path, snapshot_path = game_paths(directory, game_id)
+    writer.submit(_DELETE, (log_path, snapshot_path, snapshot_path + ".tmp"))
+
+
+class ActionLog:
+    """
+    게임 하나의 액션 로그 작성기
+
+    append()는 레코드 하나를 인코딩해 쓰기 스레드(ActionLogWriter)에 넘기고 바로 반환합니다
+    (fsync는 하지 않음). 파일 위치는 여기서 세므로 스냅샷은 쓰기를 기다리지 않고 로그 위치를 기록합니다.
+    snapshot_interval개의 레코드마다 snapshot_due가 참이 됩니다.
+    """
+
+    def __init__(self, directory: str, game_id: str, snapshot_interval: int = 200, fresh: bool = False):
+        """
+        Args:
+            directory: 로그 디렉터리
+            game_id: 게임 ID
+            snapshot_interval: 스냅샷 간격 (레코드 수, 0이면 기준 스냅샷만)
+            fresh: 새 게임이면 참 (같은 ID로 남아 있던 로그 / 스냅샷을 지우고 시작)
+
+        Raises:
+            ValueError: 게임 ID로 로그 경로를 만들 수 없는 경우 (game_paths 참고)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.game_id = game_id
+        self.log_path, self.snapshot_path = game_paths(directory, game_id)
+        self.snapshot_interval = snapshot_interval
+        if fresh:
+            writer.submit(_DELETE, self._paths())
+            self.has_snapshot = False
+            self._size = 0
+        else:
+            # 이어서 쓸 게임이면 대기 중인 쓰기를 반영한 뒤 현재 파일 상태를 읽음
+            writer.flush()
+            self.has_snapshot = os.path.exists(self.snapshot_path)
+            self._size = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+        self.records = 0
+        self.since_snapshot = 0
+
+    def _paths(self) -> Tuple[str, ...]:
+        return (self.log_path, self.snapshot_path, self.snapshot_path + ".tmp")
+
+    def append(self, fn: Callable[..., Any], args: Tuple[Any, ...], mark: int, version: int) -> None:
+        """
+        수락된 규칙 적용 하나를 기록합니다.
+
+        Args:
+            fn: 적용한 규칙 함수 (OPS에 있어야 함)
+            args: 규칙 함수 인자 (Context 제외)
+            mark: 적용 직전의 rng_mark()
+            version: 적용 후 게임 상태 버전
+        """
+        payload = encode((OP_CODES[fn], version, mark, args))
+        data = LENGTH_PREFIX.pack(len(payload)) + payload
+        if self._size == 0:
+            data = LOG_MAGIC + data
+        writer.submit(_APPEND, self.log_path, data)
+        self._size += len(data)
+        self.records += 1
+        self.since_snapshot += 1
+
+    @property
+    def snapshot_due(self) -> bool:
+        """주기 스냅샷을 남길 때가 되었는지 여부"""
+        return 0 < self.snapshot_interval <= self.since_snapshot
+
+    def write_snapshot(
+        self,
+        state_snapshot: Tuple,
+        rng_state: Tuple,
+        seed: Optional[int],
+        version: int,
+        history: List[Dict[str, Any]] = (),
+    ) -> None:
+        """
+        현재 로그 위치를 기준으로 스냅샷을 원자적으로 교체합니다 (쓰기 스레드가 반영).
+
+        Args:
+            state_snapshot: EngineState.snapshot()
+            rng_state: pack_rng_state(rng)
+            seed: 게임 시드
+            version: 게임 상태 버전
+            history: 스냅샷 시점의 게임 이벤트 로그 (Game.events)
+        """
+        payload = SNAPSHOT_MAGIC + encode(
+            (seed, version, self._size, self.records, rng_state, state_snapshot, history)
+        )
+        writer.submit(_SNAPSHOT, self.snapshot_path, payload)
+        self.has_snapshot = True
+        self.since_snapshot = 0
+
+    def close(self) -> None:
+        """대기 중인 쓰기를 반영합니다 (게임마다 열어 둔 파일은 없음)."""
+        writer.flush()
+
+    def delete(self) -> None:
+        """로그 / 스냅샷 삭제를 쓰기 스레드에 넘깁니다 (게임 제거 시)."""
+        writer.submit(_DELETE, self._paths())
+        self.has_snapshot = False
+        self._size = 0
+        self.records = 0
+        self.since_snapshot = 0
+
+
+def read_snapshot(path: str) -> Tuple:
+    """
+    스냅샷 파일을 읽습니다.
+
+    Returns:
+        (seed, version, log_offset, records, rng_state, engine_snapshot, history)
+
+    Raises:
+        ActionLogError: 형식이 잘못된 경우
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if not raw.startswith(SNAPSHOT_MAGIC):
+        raise ActionLogError(f"스냅샷 형식이 아닙니다: {path}")
+    return decode(raw[len(SNAPSHOT_MAGIC):])
+
+
+def iter_records(path: str, offset: int = 0) -> Iterator[Tuple]:
+    """
+    로그 레코드를 순서대로 읽습니다. 마지막의 잘린 레코드(쓰기 중 종료)는 무시합니다.
+
+    Args:
+        path: 로그 파일 경로
+        offset: 읽기 시작 위치 (0이면 헤더 직후)
+
+    Yields:
+        (op, version, rng_mark, args)
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(LOG_MAGIC):
+        raise ActionLogError(f"액션 로그 형식이 아닙니다: {path}")
+    pos = max(offset, len(LOG_MAGIC))
+    size = LENGTH_PREFIX.size
+    end = len(data)
+    while pos + size <= end:
+        length = LENGTH_PREFIX.unpack_from(data, pos)[0]
+        start = pos + size
+        if start + length > end:
+            break
+        yield decode(data[start:start + length])
+        pos = start + length
+
+
+def replay_record(ctx: Context, record: Tuple) -> None:
+    """
+    레코드 하나를 컨텍스트에 다시 적용합니다.
+
+    Raises:
+        ActionLogError: 난수 위치가 기록과 다른 경우 (규칙 / 카탈로그 변경 등)
+    """
+    op, _version, mark, args = record
+    if rng_mark(ctx.rng) != mark:
+        raise ActionLogError(f"난수 위치가 기록과 다릅니다 (op={op})")
+    if op == _PERFORM:
+        args = (Action(*args[0]),)
+    OPS[op](ctx, *args)
+
+
+def rebuild(directory: str, game_id: str) -> Rebuilt:
+    """
+    최신 스냅샷과 로그 꼬리로 게임 상태를 복원합니다.
+
+    Args:
+        directory: 로그 디렉터리
+        game_id: 게임 ID
+
+    Returns:
+        Rebuilt(상태, 난수 생성기, 시드, 버전, 스냅샷 이벤트 로그, 꼬리 이벤트, 재생한 레코드 수)
+
+    Raises:
+        FileNotFoundError: 스냅샷이 없는 경우
+        ValueError: 게임 ID로 로그 경로를 만들 수 없는 경우
+        ActionLogError: 로그가 손상되었거나 재생이 기록과 어긋나는 경우
+    """
+    log_path, snapshot_path = game_paths(directory, game_id)
+    flush_action_logs()
+    seed, version, offset, _records, rng_state, snapshot, history = read_snapshot(snapshot_path)
+    rng = unpack_rng_state(rng_state)
+    ctx = Context(EngineState.from_snapshot(snapshot), rng)
+
+    events: deque = deque(maxlen=REPLAY_EVENT_LIMIT)
+    replayed = 0
+    if os.path.exists(log_path):
+        for record in iter_records(log_path, offset):
+            replay_record(ctx, record)
+            events.extend(ctx.events)
+            ctx.events.clear()
+            version = record[1]
+            replayed += 1
+    return Rebuilt(ctx.state, rng, seed, version, list(history), list(events), replayed)
+
+
+def logged_game_ids(directory: str) -> List[str]:
+    """
+    스냅샷이 있는 (복원 가능한) 게임 ID 목록을 반환합니다.
+
+    Args:
+        directory: 로그 디렉터리
+
+    Returns:
+        게임 ID 목록 (정렬됨)
+    """
+    flush_action_logs()
+    if not os.path.isdir(directory):
+        return []
+    game_ids = []
+    for name in os.listdir(directory):
+        if not name.endswith(SNAPSHOT_SUFFIX):
+            continue
+        try:
+            game_ids.append(game_id_from_name(name[:-len(SNAPSHOT_SUFFIX)]))
+        except ValueError:
+            continue
+    return sorted(game_ids)
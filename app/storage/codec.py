@@ -0,0 +1,163 @@
+"""
+바이너리 코덱 (Binary Codec)
+
+액션 로그 레코드와 스냅샷을 위한 작고 빠른 태그 기반 직렬화 형식입니다.
+None / bool / int / float / str / bytes / tuple(list) / dict만 지원하며,
+Enum은 값으로 저장합니다. 리스트는 튜플로 복원됩니다.
+"""
+
+import struct
+from enum import Enum
+from typing import Any, List, Tuple
+
+_B = struct.Struct("<b")
+_Q = struct.Struct("<q")
+_D = struct.Struct("<d")
+_I = struct.Struct("<I")
+
+# 레코드 길이 접두사 (little-endian uint32)
+LENGTH_PREFIX = _I
+
+
+def _encode_int(value: int, out: List[bytes]) -> None:
+    if -128 <= value <= 127:
+        out.append(b"b" + _B.pack(value))
+    else:
+        out.append(b"q" + _Q.pack(value))
+
+
+def _encode_str(value: str, out: List[bytes]) -> None:
+    raw = value.encode("utf-8")
+    out.append(b"s" + _I.pack(len(raw)))
+    out.append(raw)
+
+
+def _encode_seq(value: Any, out: List[bytes]) -> None:
+    out.append(b"t" + _I.pack(len(value)))
+    for item in value:
+        _ENCODERS.get(type(item), _encode)(item, out)
+
+
+def _encode_dict(value: dict, out: List[bytes]) -> None:
+    out.append(b"d" + _I.pack(len(value)))
+    for key, item in value.items():
+        _ENCODERS.get(type(key), _encode)(key, out)
+        _ENCODERS.get(type(item), _encode)(item, out)
+
+
+def _encode_bytes(value: bytes, out: List[bytes]) -> None:
+    out.append(b"y" + _I.pack(len(value)))
+    out.append(bytes(value))
+
+
+# 정확한 타입별 인코더 (하위 클래스 / Enum 등은 _encode로 처리)
+_ENCODERS = {
+    int: _encode_int,
+    str: _encode_str,
+    tuple: _encode_seq,
+    list: _encode_seq,
+    dict: _encode_dict,
+    bytes: _encode_bytes,
+    type(None): lambda value, out: out.append(b"N"),
+    bool: lambda value, out: out.append(b"T" if value else b"F"),
+    float: lambda value, out: out.append(b"f" + _D.pack(value)),
+}
+
+
+def _encode(value: Any, out: List[bytes]) -> None:
+    if isinstance(value, Enum):
+        _encode(value.value, out)
+    elif isinstance(value, bool):
+        out.append(b"T" if value else b"F")
+    elif isinstance(value, int):
+        _encode_int(value, out)
+    elif isinstance(value, str):
+        _encode_str(value, out)
+    elif isinstance(value, (tuple, list)):
+        _encode_seq(value, out)
+    elif isinstance(value, dict):
+        _encode_dict(value, out)
+    elif isinstance(value, float):
+        out.append(b"f" + _D.pack(value))
+    elif isinstance(value, (bytes, bytearray)):
+        _encode_bytes(value, out)
+    elif value is None:
+        out.append(b"N")
+    else:
+        raise TypeError(f"직렬화할 수 없는 타입: {type(value).__name__}")
+
+
+def encode(value: Any) -> bytes:
+    """
+    값을 바이너리로 직렬화합니다.
+
+    Args:
+        value: 직렬화할 값
+
+    Returns:
+        직렬화된 바이트
+    """
+    out: List[bytes] = []
+    _ENCODERS.get(type(value), _encode)(value, out)
+    return b"".join(out)
+
+
+def _decode(buf: bytes, pos: int) -> Tuple[Any, int]:
+    tag = buf[pos]
+    pos += 1
+    if tag == 0x62:  # b
+        return _B.unpack_from(buf, pos)[0], pos + 1
+    if tag == 0x74:  # t
+        count = _I.unpack_from(buf, pos)[0]
+        pos += 4
+        items = []
+        for _ in range(count):
+            item, pos = _decode(buf, pos)
+            items.append(item)
+        return tuple(items), pos
+    if tag == 0x4E:  # N
+        return None, pos
+    if tag == 0x73:  # s
+        size = _I.unpack_from(buf, pos)[0]
+        pos += 4
+        return buf[pos:pos + size].decode("utf-8"), pos + size
+    if tag == 0x54:  # T
+        return True, pos
+    if tag == 0x46:  # F
+        return False, pos
+    if tag == 0x71:  # q
+        return _Q.unpack_from(buf, pos)[0], pos + 8
+    if tag == 0x64:  # d
+        count = _I.unpack_from(buf, pos)[0]
+        pos += 4
+        result = {}
+        for _ in range(count):
+            key, pos = _decode(buf, pos)
+            result[key], pos = _decode(buf, pos)
+        return result, pos
+    if tag == 0x66:  # f
+        return _D.unpack_from(buf, pos)[0], pos + 8
+    if tag == 0x79:  # y
+        size = _I.unpack_from(buf, pos)[0]
+        pos += 4
+        return bytes(buf[pos:pos + size]), pos + size
+    raise ValueError(f"알 수 없는 태그: {tag!r} (offset {pos - 1})")
+
+
+def decode(buf: bytes) -> Any:
+    """
+    바이너리를 값으로 역직렬화합니다.
+
+    Args:
+        buf: encode()로 만든 바이트
+
+    Returns:
+        복원된 값 (리스트는 튜플로 복원)
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    value, pos = _decode(buf, 0)
+    if pos != len(buf):
+        raise ValueError(f"남은 바이트가 있습니다: {len(buf) - pos}")
+    return value
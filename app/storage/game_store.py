@@ -0,0 +1,290 @@
+"""
+게임 저장소 (Game Store)
+
+GameManager가 게임을 저장 / 조회 / 나열할 때 사용하는 인터페이스와 백엔드 선택을 담당합니다.
+
+- memory: 프로세스 메모리에 게임 객체를 그대로 보관 (기본값, 직렬화 없음)
+- sqlite: SQLite(WAL) 파일에 배치 write-behind로 저장 (app.storage.sqlite_store)
+- redis: Redis 프로토콜(RESP) 서버에 배치 write-behind로 저장 (app.storage.redis_store)
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type
+
+from app.models.game import Game
+from app.utils.constants import GameState
+
+if TYPE_CHECKING:
+    from app.game.card_manager import CardManager
+
+GAME_STORE_BACKENDS = ("memory", "sqlite", "redis")
+
+
+class GameStore(ABC):
+    """
+    게임 저장소 인터페이스
+
+    save()는 호출 시점의 게임 상태를 저장하고, load()는 저장된 게임을 (Game, CardManager)로 돌려줍니다.
+    직렬화하는 백엔드의 load()는 매번 새 객체를 만들므로, 호출자는 로드한 게임을 캐시해 사용합니다.
+    """
+
+    @abstractmethod
+    def save(self, game: Game, card_manager: "CardManager") -> None:
+        """게임을 저장합니다."""
+
+    @abstractmethod
+    def load(self, game_id: str) -> Optional[Tuple[Game, "CardManager"]]:
+        """게임을 조회합니다 (없으면 None)."""
+
+    @abstractmethod
+    def delete(self, game_id: str) -> None:
+        """게임을 삭제합니다."""
+
+    @abstractmethod
+    def list_ids(self) -> List[str]:
+        """저장된 게임 ID 목록을 반환합니다."""
+
+    def summary(self, game_id: str) -> Optional[Tuple[str, int]]:
+        """
+        게임 목록용 요약을 조회합니다 (직렬화하는 백엔드도 게임 객체를 만들지 않음).
+
+        Args:
+            game_id: 게임 ID
+
+        Returns:
+            (게임 상태 값, 플레이어 수) (없으면 None)
+        """
+        loaded = self.load(game_id)
+        if loaded is None:
+            return None
+        game = loaded[0]
+        return GameState(game.state).value, len(game.players)
+
+    def flush(self) -> None:
+        """쓰기 대기 중인 저장을 모두 반영합니다 (write-behind 백엔드용)."""
+
+    def close(self) -> None:
+        """저장소를 닫습니다 (대기 중인 저장은 먼저 반영)."""
+        self.flush()
+
+
+class InMemoryGameStore(GameStore):
+    """프로세스 메모리 저장소 (게임 객체를 직렬화 없이 그대로 보관)"""
+
+    def __init__(self):
+        self._games: Dict[str, Tuple[Game, "CardManager"]] = {}
+
+    def save(self, game: Game, card_manager: "CardManager") -> None:
+        self._games[game.id] = (game, card_manager)
+
+    def load(self, game_id: str) -> Optional[Tuple[Game, "CardManager"]]:
+        return self._games.get(game_id)
+
+    def delete(self, game_id: str) -> None:
+        self._games.pop(game_id, None)
+
+    def list_ids(self) -> List[str]:
+        return list(self._games)
+
+
+class SerializedGameStore(GameStore):
+    """
+    바이트 단위로 저장하는 백엔드의 공통 구현
+
+    하위 클래스는 _put / _get / _delete / _keys만 구현합니다.
+    """
+
+    def save(self, game: Game, card_manager: "CardManager") -> None:
+        # app.game이 이 모듈을 가져오므로 순환 import를 피해 호출 시점에 가져옴
+        from app.game import engine_bridge
+        self._put(game.id, engine_bridge.serialize_game(game, card_manager))
+
+    def load(self, game_id: str) -> Optional[Tuple[Game, "CardManager"]]:
+        from app.game import engine_bridge
+        data = self._get(game_id)
+        if data is None:
+            return None
+        return engine_bridge.deserialize_game(data)
+
+    def delete(self, game_id: str) -> None:
+        self._delete(game_id)
+
+    def list_ids(self) -> List[str]:
+        return self._keys()
+
+    def summary(self, game_id: str) -> Optional[Tuple[str, int]]:
+        from app.game import engine_bridge
+        data = self._get(game_id)
+        if data is None:
+            return None
+        return engine_bridge.game_summary(data)
+
+    @abstractmethod
+    def _put(self, game_id: str, data: bytes) -> None:
+        ...
+
+    @abstractmethod
+    def _get(self, game_id: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def _delete(self, game_id: str) -> None:
+        ...
+
+    @abstractmethod
+    def _keys(self) -> List[str]:
+        ...
+
+
+# 대기열에서 삭제를 나타내는 값
+_DELETED = None
+
+
+class WriteBehindGameStore(SerializedGameStore):
+    """
+    저장 / 삭제를 대기열에 넣고 바로 반환하는 백엔드의 공통 구현
+
+    백그라운드 스레드가 flush_interval_ms마다 (또는 batch_size개가 쌓이면) 대기열을
+    _write_batch()로 한 번에 반영하므로, 이벤트 루프에서 호출하는 save()는 I/O를 하지 않습니다.
+    같은 게임의 연속 저장은 마지막 것만 기록되고, 반영에 실패한 배치는 대기열에 되돌려
+    다음 주기에 다시 시도합니다.
+
+    하위 클래스는 연결을 준비한 뒤 super().__init__()을 호출하고
+    _write_batch / _read / _stored_keys를 구현합니다.
+    """
+
+    # 백그라운드 스레드가 삼키고 다음 주기에 재시도할 예외
+    retry_errors: Tuple[Type[BaseException], ...] = ()
+
+    def __init__(self, flush_interval_ms: int, batch_size: int, thread_name: str):
+        """
+        Args:
+            flush_interval_ms: 대기열 반영 주기
+            batch_size: 이 개수만큼 쌓이면 즉시 반영
+            thread_name: 백그라운드 스레드 이름
+        """
+        self.flush_interval = flush_interval_ms / 1000
+        self.batch_size = batch_size
+        self._pending: Dict[str, Optional[bytes]] = {}
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self.flushes = 0
+        self.rows_written = 0
+        self._thread = threading.Thread(target=self._run, name=thread_name, daemon=True)
+        self._thread.start()
+
+    def _put(self, game_id: str, data: bytes) -> None:
+        with self._pending_lock:
+            self._pending[game_id] = data
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wakeup.set()
+
+    def _get(self, game_id: str) -> Optional[bytes]:
+        with self._pending_lock:
+            if game_id in self._pending:
+                return self._pending[game_id]
+        return self._read(game_id)
+
+    def _delete(self, game_id: str) -> None:
+        with self._pending_lock:
+            self._pending[game_id] = _DELETED
+
+    def _keys(self) -> List[str]:
+        stored = set(self._stored_keys())
+        with self._pending_lock:
+            for game_id, data in self._pending.items():
+                if data is _DELETED:
+                    stored.discard(game_id)
+                else:
+                    stored.add(game_id)
+        return sorted(stored)
+
+    def flush(self) -> None:
+        """대기열을 현재 스레드에서 즉시 반영합니다."""
+        with self._write_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return
+            upserts = {gid: data for gid, data in batch.items() if data is not _DELETED}
+            deletes = [gid for gid, data in batch.items() if data is _DELETED]
+            try:
+                self._write_batch(upserts, deletes)
+            except Exception:
+                # 반영하지 못한 저장은 더 새로운 저장이 없을 때만 되돌려 놓음
+                with self._pending_lock:
+                    for gid, data in batch.items():
+                        self._pending.setdefault(gid, data)
+                raise
+            self.flushes += 1
+            self.rows_written += len(batch)
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except self.retry_errors:
+                # 다음 주기에 다시 시도
+                time.sleep(self.flush_interval)
+
+    def close(self) -> None:
+        """백그라운드 스레드를 멈추고 남은 대기열을 반영합니다."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join()
+        self.flush()
+
+    @abstractmethod
+    def _write_batch(self, upserts: Dict[str, bytes], deletes: List[str]) -> None:
+        """대기열 한 배치를 백엔드에 반영합니다 (실패하면 예외)."""
+
+    @abstractmethod
+    def _read(self, game_id: str) -> Optional[bytes]:
+        """반영된 게임을 읽습니다."""
+
+    @abstractmethod
+    def _stored_keys(self) -> List[str]:
+        """반영된 게임 ID 목록을 반환합니다."""
+
+
+def create_game_store(
+    backend: str = "memory",
+    sqlite_path: str = "./data/games.db",
+    redis_url: str = "redis://localhost:6379/0",
+    flush_interval_ms: int = 50,
+    batch_size: int = 100,
+) -> GameStore:
+    """
+    설정에 맞는 게임 저장소를 만듭니다.
+
+    Args:
+        backend: "memory" | "sqlite" | "redis"
+        sqlite_path: SQLite 파일 경로 (sqlite)
+        redis_url: redis://host:port/db (redis)
+        flush_interval_ms: write-behind 반영 주기 (sqlite / redis)
+        batch_size: 이 개수만큼 쌓이면 주기와 무관하게 반영 (sqlite / redis)
+
+    Returns:
+        GameStore 인스턴스
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드
+    """
+    if backend == "memory":
+        return InMemoryGameStore()
+    if backend == "sqlite":
+        from app.storage.sqlite_store import SQLiteGameStore
+        return SQLiteGameStore(sqlite_path, flush_interval_ms=flush_interval_ms, batch_size=batch_size)
+    if backend == "redis":
+        from app.storage.redis_store import RedisGameStore
+        return RedisGameStore(redis_url, flush_interval_ms=flush_interval_ms, batch_size=batch_size)
+    raise ValueError(f"지원하지 않는 게임 저장소: {backend} (가능한 값: {', '.join(GAME_STORE_BACKENDS)})")
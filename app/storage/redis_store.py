@@ -0,0 +1,185 @@
+"""
+Redis 게임 저장소
+
+Redis 프로토콜(RESP2)을 직접 구현한 작은 동기 클라이언트로 게임을 저장합니다.
+외부 redis 패키지 없이 Redis / KeyDB / 호환 서버(테스트용 대역 포함)에 붙을 수 있습니다.
+save()는 대기열에 넣고 바로 반환하며, 백그라운드 스레드가 배치마다 한 번의 파이프라인으로
+반영합니다 (서버 장애 중에는 대기열에 남겨 두고 재시도).
+
+키 구조:
+- {prefix}game:{game_id} -> 직렬화된 게임 (STRING)
+- {prefix}games -> 게임 ID 집합 (SET)
+"""
+
+import socket
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+from app.storage.game_store import WriteBehindGameStore
+
+
+class RedisError(Exception):
+    """서버가 에러 응답(-ERR ...)을 보냈을 때 발생"""
+
+
+def _command(args: Sequence[Any]) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.encode("utf-8")
+        elif isinstance(arg, int):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n" % len(arg))
+        parts.append(arg)
+        parts.append(b"\r\n")
+    return b"".join(parts)
+
+
+class RespClient:
+    """
+    최소한의 RESP2 클라이언트 (스레드 안전, 파이프라인 지원)
+
+    Args:
+        url: redis://[:password@]host:port/db
+        timeout: 소켓 타임아웃 (초)
+    """
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.db = int((parsed.path or "/0").lstrip("/") or 0)
+        self.password = parsed.password
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._file = None
+
+    def _connect(self) -> None:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock = sock
+        self._file = sock.makefile("rb")
+        if self.password:
+            self._roundtrip([("AUTH", self.password)])
+        if self.db:
+            self._roundtrip([("SELECT", self.db)])
+
+    def _read_reply(self) -> Any:
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("Redis 연결이 끊어졌습니다.")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            return RedisError(rest.decode())
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            size = int(rest)
+            if size < 0:
+                return None
+            data = self._file.read(size + 2)
+            return data[:-2]
+        if kind == b"*":
+            count = int(rest)
+            if count < 0:
+                return None
+            return [self._read_reply() for _ in range(count)]
+        raise RedisError(f"알 수 없는 응답: {line!r}")
+
+    def _roundtrip(self, commands: Sequence[Sequence[Any]]) -> List[Any]:
+        self._sock.sendall(b"".join(_command(c) for c in commands))
+        replies = [self._read_reply() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+        return replies
+
+    def pipeline(self, commands: Sequence[Sequence[Any]]) -> List[Any]:
+        """
+        여러 명령을 한 번의 왕복으로 보냅니다. 연결이 끊겼으면 한 번 재연결합니다.
+
+        Args:
+            commands: (명령, 인자...) 목록
+
+        Returns:
+            명령별 응답 목록
+        """
+        with self._lock:
+            if self._sock is None:
+                self._connect()
+            try:
+                return self._roundtrip(commands)
+            except (ConnectionError, OSError):
+                self.close_connection()
+                self._connect()
+                return self._roundtrip(commands)
+
+    def execute(self, *args: Any) -> Any:
+        """명령 하나를 실행합니다."""
+        return self.pipeline([args])[0]
+
+    def close_connection(self) -> None:
+        """연결을 닫습니다 (다음 명령에서 다시 연결)."""
+        if self._sock is not None:
+            try:
+                self._file.close()
+                self._sock.close()
+            finally:
+                self._sock = None
+                self._file = None
+
+
+class RedisGameStore(WriteBehindGameStore):
+    """Redis(RESP) + 배치 write-behind 게임 저장소 - 배치의 SET/SADD, DEL/SREM을 한 번의 왕복으로 보냅니다."""
+
+    retry_errors = (RedisError, ConnectionError, OSError)
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "lw:",
+        flush_interval_ms: int = 50,
+        batch_size: int = 100,
+    ):
+        """
+        Args:
+            url: redis://[:password@]host:port/db
+            prefix: 키 접두사
+            flush_interval_ms: 대기열 반영 주기
+            batch_size: 이 개수만큼 쌓이면 즉시 반영
+        """
+        self.client = RespClient(url)
+        self.prefix = prefix
+        self._index = prefix + "games"
+        super().__init__(flush_interval_ms, batch_size, thread_name="redis-game-store")
+
+    def _key(self, game_id: str) -> str:
+        return f"{self.prefix}game:{game_id}"
+
+    def _read(self, game_id: str) -> Optional[bytes]:
+        return self.client.execute("GET", self._key(game_id))
+
+    def _stored_keys(self) -> List[str]:
+        return [member.decode("utf-8") for member in self.client.execute("SMEMBERS", self._index)]
+
+    def _write_batch(self, upserts: Dict[str, bytes], deletes: List[str]) -> None:
+        commands: List[Sequence[Any]] = []
+        for game_id, data in upserts.items():
+            commands.append(("SET", self._key(game_id), data))
+        if upserts:
+            commands.append(("SADD", self._index, *upserts))
+        if deletes:
+            commands.append(("DEL", *(self._key(game_id) for game_id in deletes)))
+            commands.append(("SREM", self._index, *deletes))
+        self.client.pipeline(commands)
+
+    def close(self) -> None:
+        """백그라운드 스레드를 멈추고 남은 대기열을 반영한 뒤 연결을 닫습니다."""
+        if self._closed:
+            return
+        super().close()
+        self.client.close_connection()
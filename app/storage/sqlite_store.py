@@ -0,0 +1,88 @@
+"""
+SQLite 게임 저장소
+
+WAL 모드 SQLite 파일에 게임을 저장합니다. save()는 직렬화한 바이트를 대기열에 넣고 바로 반환하며,
+백그라운드 스레드가 flush_interval_ms마다 (또는 batch_size개가 쌓이면) 한 트랜잭션으로 반영합니다.
+같은 게임의 연속 저장은 마지막 것만 기록됩니다.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from app.storage.game_store import WriteBehindGameStore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+class SQLiteGameStore(WriteBehindGameStore):
+    """SQLite(WAL) + 배치 write-behind 게임 저장소"""
+
+    retry_errors = (sqlite3.Error,)
+
+    def __init__(self, path: str, flush_interval_ms: int = 50, batch_size: int = 100):
+        """
+        Args:
+            path: SQLite 파일 경로 (":memory:"는 지원하지 않음)
+            flush_interval_ms: 대기열 반영 주기
+            batch_size: 이 개수만큼 쌓이면 즉시 반영
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+
+        self._writer = self._connect()
+        self._writer.execute(_SCHEMA)
+        self._writer.commit()
+        self._reader = self._connect()
+        self._read_lock = threading.Lock()
+        super().__init__(flush_interval_ms, batch_size, thread_name="sqlite-game-store")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _read(self, game_id: str) -> Optional[bytes]:
+        with self._read_lock:
+            row = self._reader.execute("SELECT data FROM games WHERE id = ?", (game_id,)).fetchone()
+        return row[0] if row else None
+
+    def _stored_keys(self) -> List[str]:
+        with self._read_lock:
+            return [row[0] for row in self._reader.execute("SELECT id FROM games")]
+
+    def _write_batch(self, upserts: Dict[str, bytes], deletes: List[str]) -> None:
+        now = time.time()
+        conn = self._writer
+        conn.execute("BEGIN")
+        try:
+            if upserts:
+                conn.executemany(
+                    "INSERT INTO games (id, data, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                    [(gid, data, now) for gid, data in upserts.items()],
+                )
+            if deletes:
+                conn.executemany("DELETE FROM games WHERE id = ?", [(gid,) for gid in deletes])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        """백그라운드 스레드를 멈추고 남은 대기열을 반영한 뒤 연결을 닫습니다."""
+        if self._closed:
+            return
+        super().close()
+        self._reader.close()
+        self._writer.close()
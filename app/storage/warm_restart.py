@@ -0,0 +1,237 @@
+"""
+웜 리스타트 (Warm Restart)
+
+종료 시 살아 있는 게임 전체와 플레이어 -> 게임 매핑을 파일 하나에 스트리밍으로 기록하고,
+기동 시 그 파일의 색인만 읽어 둔 뒤 게임은 처음 조회될 때 하나씩 복원합니다.
+
+파일 형식:
+- WARM_MAGIC 뒤에 레코드 반복: [종류 1바이트][uint32 키 길이][키][uint32 데이터 길이][데이터]
+  - b"G": 키 = 게임 ID, 데이터 = engine_bridge.serialize_game() 결과
+  - b"M": 키 없음, 데이터 = encode(((player_id, game_id), ...)) - 파일 끝에 한 번
+- 임시 파일에 쓴 뒤 os.replace로 교체합니다.
+"""
+
+import os
+import threading
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.models.game import Game
+from app.storage.codec import LENGTH_PREFIX, decode, encode
+from app.storage.game_store import GameStore
+
+if TYPE_CHECKING:
+    from app.game.card_manager import CardManager
+
+WARM_MAGIC = b"LWWR\x01"
+# 복원을 시작한 스냅샷 파일은 이 접미사로 옮겨 두어, 다음 기동 때 다시 복원되지 않게 함
+RESTORED_SUFFIX = ".restored"
+
+_GAME = b"G"
+_MAPPING = b"M"
+_PREFIX_SIZE = LENGTH_PREFIX.size
+
+
+def _write_record(f: BinaryIO, kind: bytes, key: bytes, data: bytes) -> None:
+    f.write(kind)
+    f.write(LENGTH_PREFIX.pack(len(key)))
+    f.write(key)
+    f.write(LENGTH_PREFIX.pack(len(data)))
+    f.write(data)
+
+
+def write_warm_snapshot(
+    path: str,
+    games: Iterable[Tuple[str, bytes]],
+    player_games: Dict[str, str],
+) -> int:
+    """
+    게임과 플레이어 매핑을 스냅샷 파일로 기록합니다.
+
+    게임은 하나씩 받아 바로 쓰므로 전체를 메모리에 모아 두지 않습니다.
+
+    Args:
+        path: 스냅샷 파일 경로
+        games: (게임 ID, 직렬화된 게임) 반복자
+        player_games: 플레이어 ID -> 게임 ID
+
+    Returns:
+        기록한 게임 수
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    count = 0
+    with open(tmp_path, "wb", buffering=1 << 16) as f:
+        f.write(WARM_MAGIC)
+        for game_id, data in games:
+            _write_record(f, _GAME, game_id.encode("utf-8"), data)
+            count += 1
+        _write_record(f, _MAPPING, b"", encode(tuple(player_games.items())))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return count
+
+
+class WarmSnapshot:
+    """
+    스냅샷 파일의 색인만 읽어 두고, 게임 데이터는 요청 시 파일에서 읽습니다.
+
+    기동 시 비용은 레코드 헤더를 건너뛰며 읽는 것뿐이라 게임 수천 개도 금방 열립니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 스냅샷 파일 경로 (열기 전에 RESTORED_SUFFIX를 붙인 이름으로 옮김)
+
+        Raises:
+            ValueError: 스냅샷 파일 형식이 아닌 경우
+        """
+        self.path = path + RESTORED_SUFFIX
+        os.replace(path, self.path)
+        self._file: Optional[BinaryIO] = open(self.path, "rb")
+        self._lock = threading.Lock()
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self.player_games: Dict[str, str] = {}
+        self._scan()
+
+    def _scan(self) -> None:
+        f = self._file
+        if f.read(len(WARM_MAGIC)) != WARM_MAGIC:
+            raise ValueError(f"웜 리스타트 스냅샷이 아닙니다: {self.path}")
+        while True:
+            kind = f.read(1)
+            if not kind:
+                return
+            key = f.read(LENGTH_PREFIX.unpack(f.read(_PREFIX_SIZE))[0])
+            size = LENGTH_PREFIX.unpack(f.read(_PREFIX_SIZE))[0]
+            if kind == _GAME:
+                self._index[key.decode("utf-8")] = (f.tell(), size)
+                f.seek(size, os.SEEK_CUR)
+            elif kind == _MAPPING:
+                self.player_games = dict(decode(f.read(size)))
+            else:
+                raise ValueError(f"알 수 없는 레코드 종류: {kind!r}")
+
+    def game_ids(self) -> List[str]:
+        """아직 복원하지 않은 게임 ID 목록"""
+        return list(self._index)
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self._index
+
+    def peek(self, game_id: str) -> Optional[bytes]:
+        """
+        게임 데이터를 색인에 남겨 둔 채 읽습니다 (목록 요약용).
+
+        Args:
+            game_id: 게임 ID
+
+        Returns:
+            직렬화된 게임 (없으면 None)
+        """
+        with self._lock:
+            entry = self._index.get(game_id)
+            if entry is None or self._file is None:
+                return None
+            offset, size = entry
+            self._file.seek(offset)
+            return self._file.read(size)
+
+    def take(self, game_id: str) -> Optional[bytes]:
+        """
+        게임 데이터를 읽고 색인에서 뺍니다 (한 게임은 한 번만 복원).
+
+        Args:
+            game_id: 게임 ID
+
+        Returns:
+            직렬화된 게임 (없으면 None)
+        """
+        with self._lock:
+            entry = self._index.pop(game_id, None)
+            if entry is None or self._file is None:
+                return None
+            offset, size = entry
+            self._file.seek(offset)
+            data = self._file.read(size)
+            if not self._index:
+                self.close()
+            return data
+
+    def iter_pending(self) -> Iterator[Tuple[str, bytes]]:
+        """
+        아직 복원하지 않은 게임을 직렬화된 그대로 하나씩 꺼냅니다 (다음 스냅샷으로 넘길 때 사용).
+
+        Yields:
+            (게임 ID, 직렬화된 게임)
+        """
+        for game_id in self.game_ids():
+            data = self.take(game_id)
+            if data is not None:
+                yield game_id, data
+
+    def discard(self, game_id: str) -> None:
+        """복원하지 않고 색인에서 뺍니다."""
+        with self._lock:
+            self._index.pop(game_id, None)
+
+    def close(self) -> None:
+        """파일을 닫습니다."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class WarmRestartStore(GameStore):
+    """
+    웜 리스타트 스냅샷을 기존 저장소 위에 겹쳐 보여 주는 저장소
+
+    스냅샷에 남은 게임은 처음 load()될 때 복원해 아래 저장소에 저장하고, 이후로는 아래 저장소만 사용합니다.
+    """
+
+    def __init__(self, inner: GameStore, snapshot: WarmSnapshot):
+        """
+        Args:
+            inner: 실제 게임 저장소
+            snapshot: 열어 둔 웜 리스타트 스냅샷
+        """
+        self.inner = inner
+        self.snapshot = snapshot
+
+    def save(self, game: Game, card_manager: "CardManager") -> None:
+        self.snapshot.discard(game.id)
+        self.inner.save(game, card_manager)
+
+    def load(self, game_id: str) -> Optional[Tuple[Game, "CardManager"]]:
+        data = self.snapshot.take(game_id) if game_id in self.snapshot else None
+        if data is None:
+            return self.inner.load(game_id)
+        from app.game import engine_bridge
+        game, card_manager = engine_bridge.deserialize_game(data)
+        self.inner.save(game, card_manager)
+        return game, card_manager
+
+    def delete(self, game_id: str) -> None:
+        self.snapshot.discard(game_id)
+        self.inner.delete(game_id)
+
+    def list_ids(self) -> List[str]:
+        ids = self.inner.list_ids()
+        known = set(ids)
+        return ids + [game_id for game_id in self.snapshot.game_ids() if game_id not in known]
+
+    def summary(self, game_id: str) -> Optional[Tuple[str, int]]:
+        data = self.snapshot.peek(game_id)
+        if data is None:
+            return self.inner.summary(game_id)
+        from app.game import engine_bridge
+        return engine_bridge.game_summary(data)
+
+    def flush(self) -> None:
+        self.inner.flush()
+
+    def close(self) -> None:
+        self.snapshot.close()
+        self.inner.close()
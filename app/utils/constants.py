@@ -124,6 +124,13 @@ INITIAL_HP = {
 
 DEFAULT_RANGE = 1  # 기본 영향력 (사거리)
 
+# AI 난이도 -> 플레이어 이름 접두사 (난이도는 이름으로 저장 / 복원됨)
+BOT_NAME_PREFIXES = {
+    "easy": "AI_Easy",
+    "medium": "AI_Player",
+    "hard": "AI_Hard",
+}
+
 # ==================== 게임 설정 (config에서 로드) ====================
 MIN_PLAYERS: int = settings.MIN_PLAYERS
 MAX_PLAYERS: int = settings.MAX_PLAYERS
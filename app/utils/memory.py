@@ -0,0 +1,101 @@
+"""
+메모리 사용량 추정
+
+객체 그래프를 따라가며 sys.getsizeof를 합산합니다. 카드 카탈로그처럼 여러 게임이 공유하는
+객체와 Enum / 타입 / 함수 같은 전역 객체는 세지 않으므로, "이 게임을 지우면 돌아오는 메모리"의 근사치입니다.
+"""
+
+import sys
+import types
+from enum import Enum
+from typing import Any, Dict, Iterable, Optional, Set
+
+# 따라가지 않는 전역 객체 타입
+_SKIP_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    Enum,
+)
+# 내부에 다른 객체를 담지 않는 타입
+_ATOMIC_TYPES = (int, float, bool, str, bytes, bytearray, type(None), complex)
+
+_shared_ids: Optional[Set[int]] = None
+
+
+def _shared() -> Set[int]:
+    """게임끼리 공유하는 객체 (카드 카탈로그) ID"""
+    global _shared_ids
+    if _shared_ids is None:
+        from app.engine.cards import CARDS
+        _shared_ids = {id(CARDS)} | {id(card) for card in CARDS}
+    return _shared_ids
+
+
+def _children(obj: Any) -> Iterable[Any]:
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            yield key
+            yield value
+        return
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        yield from obj
+        return
+    attrs = getattr(obj, "__dict__", None)
+    if attrs is not None:
+        yield attrs
+    for name in ("__pydantic_private__", "__pydantic_extra__", "__pydantic_fields_set__"):
+        value = getattr(obj, name, None)
+        if value is not None and name not in (attrs or ()):
+            yield value
+    for name in getattr(type(obj), "__slots__", ()):
+        value = getattr(obj, name, None)
+        if value is not None:
+            yield value
+
+
+def deep_sizeof(*objs: Any) -> int:
+    """
+    객체들이 (공유 객체를 제외하고) 차지하는 메모리를 바이트 단위로 추정합니다.
+
+    Args:
+        objs: 크기를 잴 객체들 (서로 공유하는 부분은 한 번만 셈)
+
+    Returns:
+        추정 바이트 수
+    """
+    return _walk(objs, set(_shared()))
+
+
+def sizeof_parts(parts: Dict[str, Iterable[Any]]) -> Dict[str, int]:
+    """
+    이름 붙인 부분별로 메모리를 추정합니다 (앞의 부분에서 센 객체는 뒤에서 다시 세지 않음).
+
+    예를 들어 {"hands": [p.hand for p in players], "players": [players]}이면 핸드는 hands에만
+    들어가고 players는 핸드를 뺀 나머지가 됩니다.
+
+    Args:
+        parts: 이름 -> 그 부분에 속한 객체들 (순서대로 셈, 감싼 컨테이너 자체는 세지 않음)
+
+    Returns:
+        이름 -> 추정 바이트 수
+    """
+    seen = set(_shared())
+    return {name: _walk(objs, seen) for name, objs in parts.items()}
+
+
+def _walk(objs: Iterable[Any], seen: Set[int]) -> int:
+    """seen에 없는 객체를 따라가며 크기를 더합니다 (seen을 갱신)."""
+    stack = list(objs)
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SKIP_TYPES):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if not isinstance(obj, _ATOMIC_TYPES):
+            stack.extend(_children(obj))
+    return total
@@ -0,0 +1,170 @@
+"""
+타이머 스케줄러
+
+프로세스 전체에서 하나만 두는 마감 시각 스케줄러입니다. 게임마다 태스크를 만들지 않고
+최소 힙 하나와 asyncio 태스크 하나로 모든 마감을 처리합니다.
+
+- arm(): O(log n) - 같은 키로 다시 걸면 이전 마감은 취소됨
+- cancel(): O(1) - 힙에서 바로 빼지 않고 표시만 함 (지연 삭제)
+- 취소된 항목이 살아 있는 항목보다 많아지면 힙을 다시 만들어 크기를 제한
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# 힙 항목: [마감 시각, 순번, 키, 값, 유효 여부]
+_DEADLINE, _SEQ, _KEY, _VALUE, _ACTIVE = range(5)
+
+
+class TimerScheduler:
+    """
+    키별 마감 시각을 관리하고, 마감이 지나면 on_expire(key, value)를 호출합니다.
+
+    시각은 clock() 기준 (기본 time.monotonic)입니다.
+    """
+
+    def __init__(
+        self,
+        on_expire: Callable[[Hashable, Any], Any],
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            on_expire: 마감된 키마다 호출할 함수 (코루틴 함수면 태스크로 실행)
+            clock: 현재 시각 함수
+        """
+        self.on_expire = on_expire
+        self.clock = clock
+        self._heap: List[list] = []
+        self._entries: Dict[Hashable, list] = {}
+        self._counter = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.fired = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def arm(self, key: Hashable, deadline: float, value: Any = None) -> None:
+        """
+        키의 마감 시각을 설정합니다 (기존 마감은 대체).
+
+        Args:
+            key: 마감 키
+            deadline: 마감 시각 (clock() 기준)
+            value: 만료 시 on_expire에 넘길 값
+        """
+        old = self._entries.get(key)
+        if old is not None:
+            old[_ACTIVE] = False
+        entry = [deadline, next(self._counter), key, value, True]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry and self._wakeup is not None:
+            # 가장 이른 마감이 바뀌었으므로 대기 중인 루프를 깨움
+            self._wakeup.set()
+        self._compact()
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        키의 마감을 취소합니다.
+
+        Args:
+            key: 마감 키
+
+        Returns:
+            취소한 마감이 있었는지 여부
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry[_ACTIVE] = False
+        return True
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        """키의 마감 시각 (없으면 None)"""
+        entry = self._entries.get(key)
+        return entry[_DEADLINE] if entry is not None else None
+
+    def _compact(self) -> None:
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [entry for entry in self._heap if entry[_ACTIVE]]
+            heapq.heapify(self._heap)
+
+    def next_deadline(self) -> Optional[float]:
+        """가장 이른 유효 마감 시각 (없으면 None)"""
+        heap = self._heap
+        while heap and not heap[0][_ACTIVE]:
+            heapq.heappop(heap)
+        return heap[0][_DEADLINE] if heap else None
+
+    def pop_due(self, now: Optional[float] = None) -> List[Tuple[Hashable, Any]]:
+        """
+        마감이 지난 항목을 모두 꺼냅니다 (on_expire는 호출하지 않음).
+
+        Args:
+            now: 기준 시각 (없으면 clock())
+
+        Returns:
+            (키, 값) 목록 - 마감 순서
+        """
+        now = self.clock() if now is None else now
+        heap = self._heap
+        due = []
+        while heap and (not heap[0][_ACTIVE] or heap[0][_DEADLINE] <= now):
+            entry = heapq.heappop(heap)
+            if entry[_ACTIVE]:
+                entry[_ACTIVE] = False
+                del self._entries[entry[_KEY]]
+                due.append((entry[_KEY], entry[_VALUE]))
+        return due
+
+    def fire_due(self, now: Optional[float] = None) -> int:
+        """
+        마감이 지난 항목마다 on_expire를 호출합니다.
+
+        Returns:
+            호출한 수
+        """
+        due = self.pop_due(now)
+        for key, value in due:
+            result = self.on_expire(key, value)
+            if asyncio.iscoroutine(result):
+                asyncio.get_running_loop().create_task(result)
+        self.fired += len(due)
+        return len(due)
+
+    async def run(self) -> None:
+        """가장 이른 마감까지 잠들었다가 만료 항목을 처리하는 루프 (취소될 때까지)."""
+        self._wakeup = asyncio.Event()
+        while True:
+            deadline = self.next_deadline()
+            timeout = None if deadline is None else max(0.0, deadline - self.clock())
+            if timeout == 0.0:
+                await asyncio.sleep(0)
+            else:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            self._wakeup.clear()
+            self.fire_due()
+
+    def start(self) -> None:
+        """스케줄러 루프를 시작합니다."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        """스케줄러 루프를 멈춥니다 (걸려 있는 마감은 유지)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wakeup = None
@@ -4,8 +4,16 @@
 WebSocket 연결을 관리하고 메시지를 브로드캐스트합니다.
 """
 
-from typing import Dict, Set
+import json
+from typing import Dict, Optional, Set
 from fastapi import WebSocket, WebSocketDisconnect
+from app.monitoring.bandwidth import BandwidthMeter
+from app.monitoring.metrics import (
+    DISCONNECT_CLIENT_CLOSED,
+    DISCONNECT_COUNTERS,
+    DISCONNECT_SEND_FAILED,
+    SEND_FAILURE_COUNTER,
+)
 from app.utils.constants import WS_MAX_CONNECTIONS
 
 
@@ -16,14 +24,22 @@ class ConnectionManager:
     WebSocket 연결을 관리하고 메시지를 브로드캐스트합니다.
     """
     
-    def __init__(self):
-        """연결 관리자 초기화"""
+    def __init__(self, bandwidth: Optional[BandwidthMeter] = None):
+        """
+        연결 관리자 초기화
+        
+        Args:
+            bandwidth: 송신 바이트 집계기 (없으면 집계하지 않음)
+        """
+        self.bandwidth = bandwidth
         # 플레이어 ID -> WebSocket 연결
         self.active_connections: Dict[str, WebSocket] = {}
         # 게임 ID -> 플레이어 ID 집합
         self.game_players: Dict[str, Set[str]] = {}
         # 플레이어 ID -> 게임 ID
         self.player_games: Dict[str, str] = {}
+        # 전송을 기다리는 중인 메시지 수 (느린 클라이언트로 소켓 버퍼가 차면 늘어남)
+        self.pending_sends = 0
     
     async def connect(self, websocket: WebSocket, player_id: str) -> bool:
         """
@@ -43,21 +59,27 @@ class ConnectionManager:
         self.active_connections[player_id] = websocket
         return True
     
-    def disconnect(self, player_id: str) -> None:
+    def disconnect(self, player_id: str, reason: str = DISCONNECT_CLIENT_CLOSED) -> None:
         """
         WebSocket 연결을 해제합니다.
         
         Args:
             player_id: 플레이어 ID
+            reason: 해제 사유 (메트릭 라벨, app.monitoring.metrics.DISCONNECT_REASONS)
         """
         if player_id in self.active_connections:
             del self.active_connections[player_id]
+            DISCONNECT_COUNTERS[reason].inc()
+            if self.bandwidth is not None:
+                self.bandwidth.forget_connection(player_id)
         
         # 게임에서 플레이어 제거
         if player_id in self.player_games:
             game_id = self.player_games[player_id]
             if game_id in self.game_players:
                 self.game_players[game_id].discard(player_id)
+                if not self.game_players[game_id]:
+                    del self.game_players[game_id]
             del self.player_games[player_id]
     
     def register_player_to_game(self, player_id: str, game_id: str) -> None:
@@ -68,12 +90,56 @@ class ConnectionManager:
             player_id: 플레이어 ID
             game_id: 게임 ID
         """
+        # 다른 게임에 등록되어 있었다면 그 게임에서 빼기
+        previous = self.player_games.get(player_id)
+        if previous is not None and previous != game_id and previous in self.game_players:
+            self.game_players[previous].discard(player_id)
+            if not self.game_players[previous]:
+                del self.game_players[previous]
+        
         if game_id not in self.game_players:
             self.game_players[game_id] = set()
         
         self.game_players[game_id].add(player_id)
         self.player_games[player_id] = game_id
     
+    def forget_game(self, game_id: str) -> None:
+        """
+        제거된 게임의 플레이어 매핑을 정리합니다 (연결은 유지).
+        
+        Args:
+            game_id: 게임 ID
+        """
+        for player_id in self.game_players.pop(game_id, set()):
+            if self.player_games.get(player_id) == game_id:
+                del self.player_games[player_id]
+        if self.bandwidth is not None:
+            self.bandwidth.forget_game(game_id)
+    
+    def prune_empty_games(self) -> int:
+        """
+        플레이어가 없는 게임 항목을 지웁니다.
+        
+        Returns:
+            지운 항목 수
+        """
+        empty = [game_id for game_id, players in self.game_players.items() if not players]
+        for game_id in empty:
+            del self.game_players[game_id]
+        return len(empty)
+    
+    def restore_player_games(self, player_games: Dict[str, str]) -> None:
+        """
+        웜 리스타트 스냅샷의 플레이어 -> 게임 매핑을 복원합니다.
+        
+        다시 연결한 플레이어는 참가 절차 없이 이전 게임을 이어서 진행합니다.
+        
+        Args:
+            player_games: 플레이어 ID -> 게임 ID
+        """
+        for player_id, game_id in player_games.items():
+            self.register_player_to_game(player_id, game_id)
+    
     def get_game_players(self, game_id: str) -> Set[str]:
         """
         게임에 연결된 플레이어 ID 목록을 반환합니다.
@@ -102,6 +168,9 @@ class ConnectionManager:
         """
         특정 플레이어에게 메시지를 전송합니다.
         
+        send_json과 같은 형식으로 직접 인코딩해 보내고, bandwidth가 있으면 보낸 바이트 수를
+        메시지 타입 / 게임 / 연결별로 기록합니다.
+        
         Args:
             message: 전송할 메시지
             player_id: 플레이어 ID
@@ -113,13 +182,21 @@ class ConnectionManager:
             return False
         
         websocket = self.active_connections[player_id]
+        # starlette send_json과 같은 인코딩 (ensure_ascii 기본값이라 글자 수 == 바이트 수)
+        text = json.dumps(message, separators=(",", ":"))
+        self.pending_sends += 1
         try:
-            await websocket.send_json(message)
-            return True
+            await websocket.send_text(text)
         except Exception:
             # 연결이 끊어진 경우
-            self.disconnect(player_id)
+            SEND_FAILURE_COUNTER.inc()
+            self.disconnect(player_id, DISCONNECT_SEND_FAILED)
             return False
+        finally:
+            self.pending_sends -= 1
+        if self.bandwidth is not None:
+            self.bandwidth.record(player_id, self.player_games.get(player_id), message.get("type"), len(text))
+        return True
     
     async def broadcast_to_game(self, message: dict, game_id: str) -> int:
         """
@@ -5,11 +5,30 @@ WebSocket 메시지를 처리하고 게임 상태를 업데이트합니다.
 """
 
 import json
-from typing import Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
+from loguru import logger
+from app.engine import IllegalAction, acting_phase, default_action, rules
+from app.engine.legal import PHASE_DRAW
 from app.models.game import Game
+from app.game import engine_bridge
 from app.game.game_manager import GameManager
 from app.game.turn_manager import TurnManager
 from app.game.action_handler import ActionHandler
+from app.game.legal_actions import get_legal_actions
+from app.monitoring.log_pipeline import LOG_CONTEXT
+from app.monitoring.loop_monitor import SlowOperationLog
+from app.monitoring.slow_capture import SlowActionCapture
+from app.monitoring.tracing import NOOP_SPAN, TRACER
+from app.monitoring.metrics import (
+    ACTION_COUNTERS,
+    ACTION_SECONDS,
+    BROADCAST_SECONDS,
+    HANDLER_HISTOGRAMS,
+    MESSAGE_COUNTERS,
+    OTHER_HANDLER,
+    OTHER_MESSAGES,
+)
 from app.websocket.connection_manager import ConnectionManager
 from app.utils.constants import ActionType, GameState, MIN_PLAYERS, MAX_PLAYERS
 
@@ -25,6 +44,8 @@ class MessageHandler:
         self,
         game_manager: GameManager,
         connection_manager: ConnectionManager,
+        slow_operations: Optional[SlowOperationLog] = None,
+        slow_capture: Optional[SlowActionCapture] = None,
     ):
         """
         메시지 핸들러 초기화
@@ -32,9 +53,13 @@ class MessageHandler:
         Args:
             game_manager: GameManager 인스턴스
             connection_manager: ConnectionManager 인스턴스
+            slow_operations: 느린 메시지 처리 기록 (없으면 기록하지 않음)
+            slow_capture: 느린 액션 캡처 (없으면 캡처하지 않음)
         """
         self.game_manager = game_manager
         self.connection_manager = connection_manager
+        self.slow_operations = slow_operations
+        self.slow_capture = slow_capture
 
     def _error(self, message: str, code: str = "BAD_REQUEST") -> Dict:
         """
@@ -57,6 +82,53 @@ class MessageHandler:
         """
         플레이어로부터 받은 메시지를 처리합니다.
         
+        메시지 타입별 처리 시간을 히스토그램에 남기고, slow_operations의 기준을 넘으면
+        게임 ID / 메시지 타입 / 액션 타입과 함께 느린 처리로 기록합니다.
+        처리 중에 남긴 로그에는 플레이어 ID와 게임 ID가 붙습니다 (LOG_CONTEXT).
+        
+        Args:
+            player_id: 플레이어 ID
+            message: 받은 메시지
+            
+        Returns:
+            처리 결과
+        """
+        message_type = message.get("type") if isinstance(message, dict) else None
+        known = isinstance(message_type, str)
+        (MESSAGE_COUNTERS.get(message_type, OTHER_MESSAGES) if known else OTHER_MESSAGES).inc()
+        context = LOG_CONTEXT.set({
+            "player_id": player_id,
+            "game_id": self.connection_manager.get_player_game(player_id),
+        })
+        started = time.perf_counter()
+        try:
+            return await self._dispatch(player_id, message)
+        finally:
+            LOG_CONTEXT.reset(context)
+            elapsed = time.perf_counter() - started
+            (HANDLER_HISTOGRAMS.get(message_type, OTHER_HANDLER) if known else OTHER_HANDLER).observe(elapsed)
+            slow = self.slow_operations
+            if slow is not None and elapsed >= slow.threshold:
+                self._record_slow(slow, elapsed, player_id, message)
+    
+    def _record_slow(self, slow: SlowOperationLog, elapsed: float, player_id: str, message: Any) -> None:
+        """느린 처리의 게임 ID / 메시지 타입 / 액션 타입을 찾아 기록합니다 (기준을 넘었을 때만 호출)."""
+        if not isinstance(message, dict):
+            slow.record(elapsed, None, None, player_id=player_id)
+            return
+        action = message.get("action")
+        slow.record(
+            elapsed,
+            self.connection_manager.get_player_game(player_id) or message.get("game_id"),
+            message.get("type"),
+            action.get("type") if isinstance(action, dict) else None,
+            player_id,
+        )
+    
+    async def _dispatch(self, player_id: str, message: dict) -> Dict:
+        """
+        메시지 타입별 처리 함수를 호출합니다.
+        
         Args:
             player_id: 플레이어 ID
             message: 받은 메시지
@@ -82,11 +154,12 @@ class MessageHandler:
                     message=f"지원하지 않는 메시지 타입: {message_type}",
                     code="UNSUPPORTED_MESSAGE_TYPE",
                 )
-        except Exception as e:
-            # 예외 발생 시 에러 메시지 반환
-            import traceback
-            print(f"[ERROR] handle_message 예외 발생: {type(e).__name__}: {e}")
-            traceback.print_exc()
+        except Exception:
+            # 예외 발생 시 에러 메시지 반환 (traceback은 로그 파이프라인이 루프 밖에서 씀)
+            logger.exception(
+                "handle_message 예외 발생",
+                message_type=message.get("type") if isinstance(message, dict) else None,
+            )
             return self._error(
                 message="메시지 처리 중 서버 내부 오류가 발생했습니다.",
                 code="INTERNAL_ERROR",
@@ -118,24 +191,58 @@ class MessageHandler:
                 code="PLAYER_NOT_IN_GAME",
             )
         
+        with TRACER.span("handle_player_action", game_id=game_id):
+            return await self.apply_player_action(game_id, player_id, message.get("action", {}))
+    
+    async def apply_player_action(self, game_id: str, player_id: str, action: dict) -> Dict:
+        """
+        플레이어 액션을 게임에 적용하고 결과를 브로드캐스트합니다.
+        
+        클라이언트 메시지와 서버 쪽 봇 드라이버가 같은 경로를 사용하며, 처리 시간은
+        ledger_action_seconds 히스토그램에 남깁니다.
+        slow_capture가 있으면 처리 전 상태를 붙잡아 두고, 처리(규칙 적용 / 저장 / 브로드캐스트 /
+        승리 체크)가 기준을 넘으면 캡처 파일로 남깁니다.
+        
+        Args:
+            game_id: 게임 ID
+            player_id: 플레이어 ID
+            action: PLAYER_ACTION 메시지의 action 딕셔너리
+            
+        Returns:
+            처리 결과
+        """
         game = self.game_manager.get_game(game_id)
         if not game:
             return self._error(
                 message="게임을 찾을 수 없습니다.",
                 code="GAME_NOT_FOUND",
             )
-        
-        # 게임 로직 컴포넌트 생성
-        from app.game.card_manager import CardManager
-        from app.game.turn_manager import TurnManager
-        from app.game.action_handler import ActionHandler
-        
         card_manager = self.game_manager.get_card_manager(game_id)
+        capture = self.slow_capture
+        parts = capture.before(game, card_manager) if capture is not None else None
+        started = time.perf_counter()
+        result = await self._apply_action(game, card_manager, game_id, player_id, action)
+        elapsed = time.perf_counter() - started
+        ACTION_SECONDS.observe(elapsed)
+        if capture is not None and elapsed >= capture.threshold:
+            await capture.record(
+                parts,
+                game_id,
+                player_id,
+                action,
+                elapsed,
+                result,
+                self.connection_manager.get_game_players(game_id),
+            )
+        return result
+    
+    async def _apply_action(self, game: Game, card_manager: Any, game_id: str, player_id: str, action: dict) -> Dict:
+        """apply_player_action의 본체 (액션 변환 / 규칙 적용 / 저장 / 브로드캐스트 / 승리 체크)"""
+        # 게임 로직 컴포넌트 생성
         turn_manager = TurnManager(game, card_manager)
         action_handler = ActionHandler(game, turn_manager, card_manager)
         
         # 새로운 메시지 형식 파싱
-        action = message.get("action", {})
         if not action:
             return self._error(
                 message="액션 정보가 필요합니다.",
@@ -150,6 +257,7 @@ class MessageHandler:
                 message=f"잘못된 액션 타입: {action_type_str}",
                 code="INVALID_ACTION_TYPE",
             )
+        ACTION_COUNTERS[action_type].inc()
         
         # 액션 타입별 데이터 변환 (기존 ActionHandler 형식으로)
         if action_type == ActionType.USE_CARD:
@@ -206,11 +314,64 @@ class MessageHandler:
                 code="UNSUPPORTED_ACTION_TYPE",
             )
         
-        # 게임 상태 업데이트 전송
+        # 게임 상태 저장 및 업데이트 전송
         if result.get("success"):
+            with TRACER.span("save_game"):
+                self.game_manager.save_game(game_id)
             await self.broadcast_game_state(game_id)
         
         # 승리 조건 체크
+        with TRACER.span("check_win_condition"):
+            win_info = self.game_manager.check_win_condition(game_id)
+        if win_info:
+            await self.broadcast_game_state(game_id)
+            await self.broadcast_win_info(game_id, win_info)
+        
+        return result
+    
+    async def handle_timeout(self, game_id: str, phase_key: Tuple[str, int, int]) -> Optional[Dict]:
+        """
+        행동 마감이 지난 게임에 기본 액션을 적용합니다 (턴 타이머가 호출).
+        
+        드로우 단계는 턴 시작, 턴은 턴 종료, 공격 대응은 포기, 선택 요청은 첫 번째 합법 선택을 적용합니다.
+        그 사이에 단계가 바뀌었으면 (플레이어가 먼저 행동) 아무것도 하지 않습니다.
+        
+        Args:
+            game_id: 게임 ID
+            phase_key: 마감을 걸 때의 (단계, 좌석, 턴 번호)
+            
+        Returns:
+            처리 결과 (적용하지 않았으면 None)
+        """
+        game = self.game_manager.get_game(game_id)
+        if not game:
+            return None
+        card_manager = self.game_manager.get_card_manager(game_id)
+        state = engine_bridge.load_state(game, card_manager)
+        acting = acting_phase(state)
+        if acting is None or (*acting, state.turn_number) != tuple(phase_key):
+            return None
+        action = default_action(state)
+        if action is None:
+            return None
+        
+        try:
+            outcome = engine_bridge.run(game, card_manager, rules.perform, action)
+        except IllegalAction as exc:
+            return engine_bridge.failure(exc)
+        result = engine_bridge.outcome_result(outcome, game)
+        if not result["success"]:
+            return result
+        
+        phase, seat = acting
+        if phase != PHASE_DRAW:
+            game.add_event(
+                f"{state.players[seat].name}의 제한 시간이 지나 자동으로 진행되었습니다.",
+                "notification",
+            )
+        self.game_manager.save_game(game_id)
+        await self.broadcast_game_state(game_id)
+        
         win_info = self.game_manager.check_win_condition(game_id)
         if win_info:
             await self.broadcast_game_state(game_id)
@@ -247,6 +408,17 @@ class MessageHandler:
         if not game:
             game = self.game_manager.create_game(game_id)
         
+        # 이미 참가한 플레이어면 (재연결 / 웜 리스타트 후) 다시 등록만 하고 현재 상태를 보냄
+        if game.get_player(player_id):
+            self.connection_manager.register_player_to_game(player_id, game_id)
+            self.game_manager.mark_active(game_id)
+            await self.send_game_state_to_player(player_id, game_id)
+            return {
+                "success": True,
+                "message": "게임에 다시 연결되었습니다.",
+                "game_id": game_id,
+            }
+        
         # 플레이어 추가
         success = self.game_manager.add_player_to_game(
             game_id, player_id, player_name
@@ -363,12 +535,14 @@ class MessageHandler:
                     code="START_GAME_FAILED",
                 )
         
-        # 게임 시작 이벤트 로그 추가
+        # 게임 시작 이벤트 로그 추가 (저장소 / 웜 리스타트 스냅샷에도 남도록 다시 저장)
         game = self.game_manager.get_game(game_id)  # 업데이트된 게임 상태 가져오기
         game.add_event(
             f"게임이 시작되었습니다! 총 {len(game.players)}명의 플레이어가 참여합니다.",
             "notification"
         )
+        game.touch()
+        self.game_manager.save_game(game_id)
         
         # 모든 플레이어에게 게임 상태 전송
         await self.broadcast_game_state(game_id)
@@ -476,9 +650,34 @@ class MessageHandler:
         Returns:
             전송 성공 여부
         """
+        message = self._game_state_message(player_id, game_id)
+        if message is None:
+            return False
+        return await self.connection_manager.send_personal_message(message, player_id)
+    
+    async def _send_game_state_traced(self, player_id: str, game_id: str) -> bool:
+        """send_game_state_to_player와 같지만 직렬화와 전송을 각각 스팬으로 남깁니다 (추적 중인 브로드캐스트용)."""
+        with TRACER.span("serialize", player_id=player_id):
+            message = self._game_state_message(player_id, game_id)
+        if message is None:
+            return False
+        with TRACER.span("send", player_id=player_id):
+            return await self.connection_manager.send_personal_message(message, player_id)
+    
+    def _game_state_message(self, player_id: str, game_id: str) -> Optional[Dict]:
+        """
+        플레이어에게 보낼 GAME_STATE_UPDATE 메시지를 만듭니다.
+        
+        Args:
+            player_id: 플레이어 ID
+            game_id: 게임 ID
+            
+        Returns:
+            메시지 (게임이 없으면 None)
+        """
         game_state = self.game_manager.get_game_state_dict(game_id, player_id)
         if not game_state:
-            return False
+            return None
         
         # 프론트엔드 요청 형식으로 메시지 구성
         message = {
@@ -486,7 +685,33 @@ class MessageHandler:
             **game_state,  # gameId, players, currentTurn, turnState, events, phase
         }
         
-        return await self.connection_manager.send_personal_message(message, player_id)
+        # 행동할 차례인 플레이어에게는 가능한 액션 목록도 함께 전송
+        game = self.game_manager.get_game(game_id)
+        if game and self._is_acting_player(game, player_id):
+            message["legalActions"] = get_legal_actions(
+                game,
+                player_id,
+                self.game_manager.get_card_manager(game_id),
+            )
+        return message
+    
+    def _is_acting_player(self, game: Game, player_id: str) -> bool:
+        """
+        플레이어가 현재 액션을 보내야 하는지 확인합니다 (턴 / 방어 / 선택 차례).
+        
+        Args:
+            game: Game 인스턴스
+            player_id: 플레이어 ID
+            
+        Returns:
+            행동할 차례 여부
+        """
+        if game.state != GameState.IN_PROGRESS:
+            return False
+        if player_id in (game.current_player_id, game.defending_player_id):
+            return True
+        response = game.required_response
+        return bool(response) and response.get("currentPickerId") == player_id
     
     async def broadcast_game_state(self, game_id: str) -> int:
         """
@@ -505,9 +730,14 @@ class MessageHandler:
         player_ids = self.connection_manager.get_game_players(game_id)
         success_count = 0
         
-        for player_id in list(player_ids):
-            if await self.send_game_state_to_player(player_id, game_id):
-                success_count += 1
+        started = time.perf_counter()
+        with TRACER.span("broadcast_game_state", players=len(player_ids)) as span:
+            # 플레이어별 스팬은 추적 중일 때만 (꺼져 있으면 플레이어당 추가 비용 없음)
+            send = self.send_game_state_to_player if span is NOOP_SPAN else self._send_game_state_traced
+            for player_id in list(player_ids):
+                if await send(player_id, game_id):
+                    success_count += 1
+        BROADCAST_SECONDS.observe(time.perf_counter() - started)
         
         return success_count
     
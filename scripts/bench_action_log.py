@@ -0,0 +1,119 @@
+"""
+액션 로그 복원 벤치마크.
+
+1k / 10k 액션 길이의 게임 로그를 만든 뒤
+- 최신 스냅샷 + 로그 꼬리로 복원하는 시간
+- 기준 스냅샷부터 전체 로그를 재생하는 시간
+- 로그 크기 (액션당 바이트)
+를 측정합니다.
+
+사용법: python scripts/bench_action_log.py [액션 수 ...]
+(기본값 1150 / 10150: 로그 꼬리가 남도록 스냅샷 간격 200과 어긋나게 잡음)
+"""
+
+import os
+import sys
+import tempfile
+import time
+import random
+from typing import Dict, List, Tuple
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from app.game.action_handler import ActionHandler
+from app.game.game_manager import GameManager
+from app.game.turn_manager import TurnManager
+from app.storage.action_log import LOG_SUFFIX, rebuild
+from app.utils.constants import ActionType, CardType, GameState, TurnState
+
+# 피해를 주지 않는 카드만 사용해 게임이 끝나지 않게 함
+PEACEFUL_TYPES = {
+    CardType.BEER, CardType.PANIC, CardType.SALOON, CardType.GENERAL_STORE,
+    CardType.VOLCANIC, CardType.WINCHESTER, CardType.SCOPE, CardType.BARREL, CardType.MUSTANG,
+}
+SEED = 20240101
+REPEAT = 5
+
+
+def record_game(directory: str, actions: int, snapshot_interval: int) -> int:
+    """평화적인 봇끼리 게임을 진행하며 actions개의 규칙 적용을 기록합니다."""
+    gm = GameManager(action_log_dir=directory, snapshot_interval=snapshot_interval)
+    game = gm.create_game("bench", seed=SEED)
+    for i in range(5):
+        gm.add_player_to_game(game.id, f"bot_{i}", f"Bot_{i}")
+    gm.start_game(game.id)
+    card_manager = gm.get_card_manager(game.id)
+    turn_manager = TurnManager(game, card_manager)
+    action_handler = ActionHandler(game, turn_manager, card_manager)
+    log = game.action_log
+    bot_rng = random.Random(SEED)
+
+    while log.records < actions and game.state == GameState.IN_PROGRESS:
+        if game.turn_state == TurnState.DRAW:
+            turn_manager.start_turn(game.current_player_id)
+            continue
+        pending = game.pending_action or {}
+        if pending.get("type") == "GENERAL_STORE":
+            picker = pending["pick_order"][pending["current_index"]]
+            card = bot_rng.choice(pending["remaining_cards"])
+            action_handler.handle_action(ActionType.GENERAL_STORE_PICK, picker, {"card_id": card.id})
+            continue
+        player = game.get_player(game.current_player_id)
+        playable = [c for c in player.hand if c.card_type in PEACEFUL_TYPES]
+        if playable and bot_rng.random() < 0.5:
+            card = bot_rng.choice(playable)
+            others = [p for p in game.players if p.id != player.id and p.hand]
+            target = bot_rng.choice(others).id if others else None
+            action_handler.handle_action(
+                ActionType.USE_CARD, player.id, {"card_id": card.id, "target_id": target}
+            )
+            continue
+        action_handler.handle_action(ActionType.END_TURN, player.id, {})
+    records = log.records
+    log.close()
+    return records
+
+
+def time_rebuild(directory: str) -> Tuple[float, int]:
+    """rebuild()의 최소 소요 시간 (ms)과 재생한 레코드 수"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        rebuilt = rebuild(directory, "bench")
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, rebuilt.replayed
+
+
+def bench(actions: int) -> Dict[str, float]:
+    """한 길이에 대해 스냅샷 복원 / 전체 재생 시간을 측정합니다."""
+    with tempfile.TemporaryDirectory() as snap_dir, tempfile.TemporaryDirectory() as full_dir:
+        records = record_game(snap_dir, actions, snapshot_interval=200)
+        record_game(full_dir, actions, snapshot_interval=0)
+        log_bytes = os.path.getsize(os.path.join(full_dir, "bench" + LOG_SUFFIX))
+        snapshot_ms, tail = time_rebuild(snap_dir)
+        full_ms, _ = time_rebuild(full_dir)
+        return {
+            "actions": records,
+            "bytes_per_action": log_bytes / max(records, 1),
+            "tail": tail,
+            "snapshot_tail_ms": snapshot_ms,
+            "full_replay_ms": full_ms,
+        }
+
+
+def main(sizes: List[int]) -> None:
+    print(f"{'actions':>8} {'bytes/action':>13} {'tail':>5} {'snapshot+tail ms':>17} {'full replay ms':>15}")
+    for size in sizes:
+        row = bench(size)
+        print(
+            f"{row['actions']:>8} {row['bytes_per_action']:>13.1f} {row['tail']:>5} "
+            f"{row['snapshot_tail_ms']:>17.2f} {row['full_replay_ms']:>15.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1150, 10150])
@@ -0,0 +1,99 @@
+"""
+봇 정책 벤치마크.
+
+진행 단계가 서로 다른 게임 여러 개에서 행동할 좌석의 결정 요청을 모은 뒤,
+봇 드라이버처럼 이벤트 루프에서 워커 스레드로 결정을 보낼 때의 초당 결정 수를 비교합니다
+(봇마다 run_in_executor로 choose_action 한 번 vs 배치 전체를 choose_actions로 한 번).
+
+전체 결정 요청과, 후보가 많은 카드 사용 단계 요청만 따로 측정합니다.
+
+사용법: python scripts/bench_bot_policy.py [결정 수] [반복 수]
+(기본값 500 / 5)
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from app.ai.policy import DecisionRequest, choose_action, choose_actions
+from app.engine.legal import PHASE_DRAW, PHASE_TURN, acting_phase, legal_actions
+from app.game import engine_bridge
+from app.game.game_manager import GameManager
+from tests.parity_scenarios import play_scenario
+
+
+def prepare_requests(count: int) -> List[DecisionRequest]:
+    """행동할 좌석이 있는 결정 요청 count개를 만듭니다 (medium 난이도)."""
+    gm = GameManager()
+    requests: List[DecisionRequest] = []
+    seed = 0
+    while len(requests) < count:
+        play_scenario(seed, 4 + seed % 4, max_steps=10 + seed % 80, gm=gm)
+        game_id = f"parity_{seed}"
+        game = gm.get_game(game_id)
+        state = engine_bridge.load_state(game, gm.get_card_manager(game_id))
+        acting = acting_phase(state)
+        if acting is not None and acting[0] != PHASE_DRAW and legal_actions(state, acting[1]):
+            requests.append((state, acting[1], "medium", seed))
+        gm.remove_game(game_id)
+        seed += 1
+    return requests
+
+
+def best_of(repeat: int, fn: Callable[[], object]) -> float:
+    """fn을 repeat번 실행한 가장 짧은 시간 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_dispatch(requests: List[DecisionRequest], repeat: int, pool: ThreadPoolExecutor) -> None:
+    """봇마다 보내는 경우와 배치로 보내는 경우의 초당 결정 수를 출력합니다."""
+    candidates = sum(len(legal_actions(state, seat)) for state, seat, _, _ in requests)
+    print(f"decisions={len(requests)} candidates/decision={candidates / len(requests):.1f}")
+
+    async def loop_dispatch() -> None:
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, choose_action, state, seat, difficulty, random.Random(seed))
+                for state, seat, difficulty, seed in requests
+            )
+        )
+
+    async def batch_dispatch() -> None:
+        await asyncio.get_running_loop().run_in_executor(pool, choose_actions, requests)
+
+    loop_rate = len(requests) / best_of(repeat, lambda: asyncio.run(loop_dispatch()))
+    batch_rate = len(requests) / best_of(repeat, lambda: asyncio.run(batch_dispatch()))
+    print(f"{'per-bot loop/s':>15} {'batched/s':>10} {'speedup':>8}")
+    print(f"{loop_rate:>15.0f} {batch_rate:>10.0f} {batch_rate / loop_rate:>7.2f}x")
+
+
+def main(count: int, repeat: int) -> None:
+    requests = prepare_requests(count)
+    turn_requests = [request for request in requests if acting_phase(request[0]) == (PHASE_TURN, request[1])]
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="bot") as pool:
+        print("[all phases]")
+        run_dispatch(requests, repeat, pool)
+        print("[card phase only]")
+        run_dispatch(turn_requests, repeat, pool)
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    defaults = [500, 5]
+    main(*(args + defaults[len(args):]))
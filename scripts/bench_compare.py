@@ -0,0 +1,171 @@
+"""
+핫 패스 벤치마크(tests/benchmarks) 기준선 기록 / 회귀 비교.
+
+- record: 벤치마크를 돌려 결과를 기준선 JSON(tests/benchmarks/baseline.json)으로 저장합니다.
+- compare: 벤치마크를 다시 돌리거나(--current 없을 때) 저장된 결과를 읽어 기준선과 비교하고,
+  기준선보다 threshold 이상 느려진 벤치마크가 있으면 종료 코드 1을 반환합니다.
+
+비교 통계는 기본값이 최솟값(min)입니다. 공유 / 단일 코어 머신에서는 중앙값과 평균이 실행마다 2배 가까이
+흔들리지만, 최솟값은 잡음이 적은 라운드를 반영하므로 실행 간 차이가 10% 안팎으로 유지됩니다.
+기준선은 측정한 머신에서만 의미가 있으므로, 머신이 바뀌면 같은 머신에서 record부터 다시 합니다.
+
+사용법:
+    python scripts/bench_compare.py record
+    python scripts/bench_compare.py compare --threshold 0.2
+    python scripts/bench_compare.py compare --current run.json --stat median
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+BENCHMARK_DIR = os.path.join("tests", "benchmarks")
+DEFAULT_BASELINE = os.path.join(PROJECT_ROOT, BENCHMARK_DIR, "baseline.json")
+STATS = ("min", "median", "mean")
+
+
+def run_benchmarks(json_path: str, pytest_args: List[str]) -> None:
+    """tests/benchmarks를 시간 측정 모드로 돌리고 pytest-benchmark JSON을 json_path에 씁니다."""
+    command = [
+        sys.executable, "-m", "pytest", BENCHMARK_DIR,
+        "--benchmark-only", f"--benchmark-json={json_path}", "-q", *pytest_args,
+    ]
+    subprocess.run(command, cwd=PROJECT_ROOT, check=True)
+
+
+def trim(source: str, target: str) -> None:
+    """
+    pytest-benchmark JSON에서 비교에 필요한 부분만 남겨 저장합니다 (라운드별 원시 측정값 제외).
+
+    Args:
+        source: --benchmark-json 파일
+        target: 저장할 기준선 경로
+    """
+    with open(source, encoding="utf-8") as f:
+        data = json.load(f)
+    baseline = {
+        "machine_info": data["machine_info"],
+        "commit_info": data["commit_info"],
+        "datetime": data["datetime"],
+        "benchmarks": [
+            {
+                "name": bench["name"],
+                "params": bench["params"],
+                "stats": {key: value for key, value in bench["stats"].items() if key != "data"},
+            }
+            for bench in data["benchmarks"]
+        ],
+    }
+    with open(target, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def load_stats(path: str, stat: str) -> Dict[str, float]:
+    """
+    pytest-benchmark JSON에서 벤치마크별 통계를 읽습니다.
+
+    Args:
+        path: --benchmark-json 파일
+        stat: min / median / mean
+
+    Returns:
+        벤치마크 이름(파라미터 포함) -> 초
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {bench["name"]: bench["stats"][stat] for bench in data["benchmarks"]}
+
+
+def compare(
+    baseline: Dict[str, float],
+    current: Dict[str, float],
+    threshold: float,
+) -> Tuple[List[Tuple[str, Optional[float], Optional[float], Optional[float]]], List[str]]:
+    """
+    기준선과 현재 결과를 비교합니다.
+
+    Args:
+        baseline: 기준선 통계
+        current: 현재 통계
+        threshold: 허용 비율 (0.2면 기준선보다 20% 넘게 느려질 때 회귀)
+
+    Returns:
+        ([(이름, 기준선, 현재, 비율)], 회귀한 벤치마크 이름 목록)
+    """
+    rows = []
+    regressions = []
+    for name in sorted(set(baseline) | set(current)):
+        base, now = baseline.get(name), current.get(name)
+        ratio = now / base if base and now is not None else None
+        rows.append((name, base, now, ratio))
+        if ratio is not None and ratio > 1 + threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def _us(value: Optional[float]) -> str:
+    return f"{value * 1e6:,.1f}" if value is not None else "-"
+
+
+def print_table(rows, regressions: List[str], stat: str) -> None:
+    """비교 결과를 표로 출력합니다 (시간 단위 µs)."""
+    width = max([len(name) for name, *_ in rows] + [9])
+    print(f"{'benchmark':<{width}} {'baseline ' + stat:>18} {'current ' + stat:>18} {'ratio':>7}")
+    for name, base, now, ratio in rows:
+        flag = "  REGRESSION" if name in regressions else ("  (new)" if base is None else "")
+        shown = f"{ratio:.2f}x" if ratio is not None else "-"
+        print(f"{name:<{width}} {_us(base):>18} {_us(now):>18} {shown:>7}{flag}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="핫 패스 벤치마크 기준선 기록 / 회귀 비교")
+    parser.add_argument("command", choices=("record", "compare"))
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준선 JSON 경로")
+    parser.add_argument("--current", help="비교할 pytest-benchmark JSON (없으면 벤치마크를 새로 돌림)")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀로 판단할 느려짐 비율 (기본 0.2 = 20%%)")
+    parser.add_argument("--stat", choices=STATS, default="min", help="비교할 통계 (기본 min)")
+    args, pytest_args = parser.parse_known_args(argv)
+
+    if args.command == "record":
+        fd, raw_path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            run_benchmarks(raw_path, pytest_args)
+            trim(raw_path, args.baseline)
+        finally:
+            os.remove(raw_path)
+        print(f"baseline saved: {args.baseline}")
+        return 0
+
+    current_path = args.current
+    if current_path is None:
+        fd, current_path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+    try:
+        if args.current is None:
+            run_benchmarks(current_path, pytest_args)
+        rows, regressions = compare(
+            load_stats(args.baseline, args.stat),
+            load_stats(current_path, args.stat),
+            args.threshold,
+        )
+    finally:
+        if args.current is None:
+            os.remove(current_path)
+    print_table(rows, regressions, args.stat)
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than baseline by more than {args.threshold:.0%}")
+        return 1
+    print(f"no regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+게임 저장소 벤치마크.
+
+동시에 진행 중인 게임 여러 개를 만든 뒤, 워커 스레드들이 게임을 번갈아 저장하면서
+백엔드별 초당 저장 수와 저장 지연(p50 / p99)을 측정합니다.
+redis 백엔드는 테스트용 RESP 대역 서버(tests/redis_standin.py)를 상대로 측정합니다.
+
+사용법: python scripts/bench_game_store.py [게임 수] [워커 수] [게임당 저장 수]
+(기본값 200 / 1 / 20: 게임 루프 하나가 저장하는 서버 구조와 같게 워커 1개)
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Tuple
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from app.game.card_manager import CardManager
+from app.game.game_manager import GameManager
+from app.models.game import Game
+from app.storage.game_store import GAME_STORE_BACKENDS, GameStore, create_game_store
+from tests.parity_scenarios import play_scenario
+from tests.redis_standin import RedisStandIn
+
+
+def prepare_games(count: int) -> List[Tuple[Game, CardManager]]:
+    """서로 다른 진행 단계의 게임 count개를 만듭니다."""
+    gm = GameManager()
+    for seed in range(count):
+        play_scenario(seed, 4 + seed % 4, max_steps=20 + seed % 60, gm=gm)
+    return [(gm.get_game(game_id), gm.get_card_manager(game_id)) for game_id in gm.store.list_ids()]
+
+
+def run_backend(store: GameStore, games: List[Tuple[Game, CardManager]], workers: int, rounds: int) -> Dict:
+    """워커마다 맡은 게임을 rounds번씩 번갈아 저장하며 저장 지연을 기록합니다."""
+    latencies: List[List[float]] = [[] for _ in range(workers)]
+    barrier = threading.Barrier(workers + 1)
+
+    def worker(index: int) -> None:
+        mine = games[index::workers]
+        out = latencies[index]
+        barrier.wait()
+        for _ in range(rounds):
+            for game, card_manager in mine:
+                # 액션 한 번이 적용된 것처럼 버전을 올린 뒤 저장
+                game.version += 1
+                start = time.perf_counter()
+                store.save(game, card_manager)
+                out.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    flush_start = time.perf_counter()
+    store.flush()
+    flush_ms = (time.perf_counter() - flush_start) * 1000
+
+    samples = sorted(t for out in latencies for t in out)
+    return {
+        "saves": len(samples),
+        "saves_per_sec": len(samples) / elapsed,
+        "p50_ms": samples[len(samples) // 2] * 1000,
+        "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000,
+        "final_flush_ms": flush_ms,
+    }
+
+
+def main(game_count: int, workers: int, rounds: int) -> None:
+    games = prepare_games(game_count)
+    print(f"games={len(games)} workers={workers} saves/game={rounds}")
+    print(f"{'backend':>8} {'saves':>7} {'saves/sec':>10} {'p50 ms':>8} {'p99 ms':>8} {'final flush ms':>15}")
+    standin = RedisStandIn()
+    port = standin.start()
+    with tempfile.TemporaryDirectory() as directory:
+        for backend in GAME_STORE_BACKENDS:
+            store = create_game_store(
+                backend,
+                sqlite_path=os.path.join(directory, "games.db"),
+                redis_url=f"redis://127.0.0.1:{port}/0",
+            )
+            row = run_backend(store, games, workers, rounds)
+            store.close()
+            print(
+                f"{backend:>8} {row['saves']:>7} {row['saves_per_sec']:>10.0f} "
+                f"{row['p50_ms']:>8.3f} {row['p99_ms']:>8.3f} {row['final_flush_ms']:>15.2f}"
+            )
+    standin.stop()
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    defaults = [200, 1, 20]
+    main(*(args + defaults[len(args):]))
@@ -0,0 +1,163 @@
+"""
+느린 액션 캡처 재생.
+
+SLOW_ACTION_CAPTURE_DIR에 남은 캡처 파일 하나를 읽어, 캡처 시점의 게임(엔진 스냅샷 + 난수 상태)을
+복원하고 같은 action payload를 서버와 같은 경로(MessageHandler.apply_player_action)로 다시 적용합니다.
+난수 상태까지 복원하므로 결과는 캡처 당시와 같습니다. 브로드캐스트는 캡처 당시 연결된 플레이어에게
+아무것도 하지 않는 소켓으로 보내 직렬화 비용까지 재현합니다.
+
+- 먼저 한 번 재생해 캡처된 결과와 비교하고 처리 시간을 출력합니다.
+- 이어서 --seconds 동안 매번 새로 복원해 반복 재생하면서 샘플링 프로파일러로 메인 스레드를 찍어
+  collapsed stack 텍스트(flamegraph.pl, speedscope 입력)를 출력합니다. 복원 비용은
+  build_handler 아래 스택으로 따로 보입니다.
+
+사용법:
+    python scripts/replay_capture.py captures/1700000000000_game1_v42.cap
+    python scripts/replay_capture.py CAPTURE --seconds 10 --filter game -o slow.collapsed
+    python scripts/replay_capture.py CAPTURE --once
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from app.game import engine_bridge
+from app.game.game_manager import GameManager
+from app.monitoring.profiler import PATH_FILTERS, ProfileResult, SamplingProfiler
+from app.monitoring.slow_capture import Capture, load_capture
+from app.websocket.connection_manager import ConnectionManager
+from app.websocket.message_handler import MessageHandler
+
+# 프로파일하며 재생하는 동안의 GIL 전환 주기 (초)
+REPLAY_SWITCH_INTERVAL = 0.0001
+
+
+class _NullSocket:
+    """보낸 프레임을 버리는 WebSocket 대용"""
+
+    async def send_text(self, text: str) -> None:
+        return None
+
+
+def build_handler(capture: Capture) -> Tuple[MessageHandler, str]:
+    """캡처의 처리 전 게임을 새 GameManager에 올리고 연결된 플레이어를 등록합니다."""
+    game, card_manager = engine_bridge.deserialize_game(capture.game_bytes)
+    game_manager = GameManager()
+    game_manager.games[game.id] = game
+    game_manager.card_managers[game.id] = card_manager
+    connection_manager = ConnectionManager()
+    for player_id in capture.meta.get("connected", ()):
+        connection_manager.active_connections[player_id] = _NullSocket()
+        connection_manager.register_player_to_game(player_id, game.id)
+    return MessageHandler(game_manager, connection_manager), game.id
+
+
+def replay_once(loop: asyncio.AbstractEventLoop, capture: Capture) -> Tuple[Dict, float]:
+    """
+    캡처를 한 번 재생합니다.
+
+    Returns:
+        (처리 결과, 처리 시간 초 - 복원 제외)
+    """
+    handler, game_id = build_handler(capture)
+    started = time.perf_counter()
+    result = loop.run_until_complete(
+        handler.apply_player_action(game_id, capture.meta["playerId"], capture.meta["action"])
+    )
+    return result, time.perf_counter() - started
+
+
+def profile_replays(
+    loop: asyncio.AbstractEventLoop,
+    capture: Capture,
+    seconds: float,
+    interval: float,
+    path_filter: Optional[str],
+) -> Tuple[ProfileResult, List[float]]:
+    """seconds 동안 반복 재생하면서 메인 스레드를 샘플링합니다."""
+    profiler = SamplingProfiler()
+    target = threading.get_ident()
+    holder: Dict[str, ProfileResult] = {}
+    sampler = threading.Thread(
+        target=lambda: holder.setdefault("result", profiler.profile(seconds, [target], interval, path_filter)),
+        name="replay-profiler",
+        daemon=True,
+    )
+    timings: List[float] = []
+    # 샘플러는 GIL을 얻어야 찍을 수 있는데, 기본 전환 주기(5ms)로는 ms 단위 재생이 GIL을 놓는 곳
+    # (이벤트 루프의 select)에만 샘플이 몰리므로 재생 동안 전환 주기를 줄임 (이 프로세스 전용이라 비용 무관)
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(REPLAY_SWITCH_INTERVAL)
+    try:
+        sampler.start()
+        while True:
+            timings.append(replay_once(loop, capture)[1])
+            if not sampler.is_alive():
+                break
+        sampler.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    return holder["result"], timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="느린 액션 캡처를 재생하고 프로파일합니다.")
+    parser.add_argument("capture", help="캡처 파일 (.cap)")
+    parser.add_argument("--seconds", type=float, default=5.0, help="프로파일하며 반복 재생할 시간 (초)")
+    parser.add_argument("--interval-ms", type=float, default=2.0, help="샘플 간격 (ms, 최소 2)")
+    parser.add_argument("--filter", choices=sorted(PATH_FILTERS), default=None, help="이 경로 안의 스택만 남김")
+    parser.add_argument("-o", "--output", default=None, help="collapsed stack 출력 파일 (없으면 stdout)")
+    parser.add_argument("--once", action="store_true", help="한 번만 재생하고 결과만 출력 (프로파일 안 함)")
+    args = parser.parse_args()
+
+    capture = load_capture(args.capture)
+    meta = capture.meta
+    loop = asyncio.new_event_loop()
+    try:
+        result, elapsed = replay_once(loop, capture)
+        captured = meta.get("result") or {}
+        same = (result.get("success"), result.get("message")) == (captured.get("success"), captured.get("message"))
+        print(
+            f"game={meta['gameId']} version={meta['version']} player={meta['playerId']} action={meta['action']}",
+            file=sys.stderr,
+        )
+        print(
+            f"captured {meta['elapsedMs']:.1f}ms -> replay {elapsed * 1000:.1f}ms, "
+            f"result {'matches' if same else 'DIFFERS'}: {result.get('success')} {result.get('message')!r}",
+            file=sys.stderr,
+        )
+        if args.once:
+            return 0 if same else 1
+
+        profile, timings = profile_replays(loop, capture, args.seconds, args.interval_ms / 1000, args.filter)
+    finally:
+        loop.close()
+
+    stats = profile.stats
+    print(
+        f"{len(timings)} replays: min {min(timings) * 1000:.1f}ms, median {statistics.median(timings) * 1000:.1f}ms; "
+        f"{stats['samples']} samples, overhead {stats['overhead']:.1%}",
+        file=sys.stderr,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(profile.collapsed())
+        print(f"collapsed stacks written: {args.output}", file=sys.stderr)
+    else:
+        sys.stdout.write(profile.collapsed())
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,33 @@
 """
 간단한 규칙 기반 AI를 사용해 여러 판의 게임을 자동 시뮬레이션하는 스크립트.
 
+게임 N판을 워커 프로세스들에 나눠 돌리고, 게임마다 끝나는 즉시 결과를 받아 역할별 / 보물별 승리 통계를 합칩니다.
+i번째 게임은 항상 seed + i로 시작하므로 워커 수와 관계없이 같은 시드면 같은 통계가 나옵니다.
+마지막에 전체 / 워커별 초당 게임 수와 워커별 최대 RSS를 출력합니다.
+
+--engine headless는 pydantic 모델과 이벤트 문구 없이 엔진 상태만으로 같은 게임을 돌립니다
+(app.engine.headless, 같은 시드면 model과 같은 결과).
+
+사용법:
+    python scripts/simulate_games.py -n 1000 -p 5 -j 4 --seed 0 --out results.jsonl
+    python scripts/simulate_games.py -n 10000 -p 5 --engine headless
+
 주의: 이 스크립트는 내부 테스트/밸런스 체크용이며, 실제 서비스 경로와는 분리된 유틸리티입니다.
 """
 
+import argparse
+import json
+import multiprocessing
 import os
-import sys
 import random
-from typing import Dict
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
 # 프로젝트 루트를 PYTHONPATH에 추가
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -15,138 +35,360 @@ PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
 if PROJECT_ROOT not in sys.path:
     sys.path.append(PROJECT_ROOT)
 
+from app.engine import rules
+from app.engine.headless import ScriptedBot, apply_first, new_game
+from app.game import engine_bridge
+from app.game.event_text import WIN_MESSAGES
 from app.game.game_manager import GameManager
 from app.game.turn_manager import TurnManager
 from app.game.action_handler import ActionHandler
-from app.utils.constants import ActionType, GameState, TurnState
+from app.game.legal_actions import to_handler_data
+from app.utils.constants import TREASURE_NAMES, GameState, Role
+
+# 승리 역할 -> 함께 이긴 역할
+WINNING_TEAMS = {
+    Role.SHERIFF.value: {Role.SHERIFF.value, Role.DEPUTY.value},
+    Role.OUTLAW.value: {Role.OUTLAW.value},
+    Role.RENEGADE.value: {Role.RENEGADE.value},
+}
+
+# 워커 프로세스마다 하나 (끝난 게임은 바로 제거하므로 게임 수와 관계없이 메모리 일정)
+_worker_manager: Optional[GameManager] = None
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS (MB, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _result(winner_role: Optional[str], winner_id: Optional[str], turns: int, seed: int, treasures: List) -> Dict:
+    """승리 결과 요약 (treasures = [(보물, 보유자 역할 값), ...])"""
+    winners = WINNING_TEAMS.get(winner_role, set())
+    return {
+        "success": True,
+        "winner_role": winner_role,
+        "winner_id": winner_id,
+        "turns": turns,
+        "seed": seed,
+        "treasures": [[treasure, role in winners] for treasure, role in treasures if treasure],
+    }
 
 
-def run_single_game(game_manager: GameManager, player_count: int = 4) -> Dict:
-    """단일 게임을 AI끼리 돌리고 결과 요약을 반환합니다."""
-    game = game_manager.create_game()
+def _unfinished(reason: str, turns: int, seed: int) -> Dict:
+    return {"success": False, "reason": reason, "turns": turns, "seed": seed, "treasures": []}
+
+
+def run_single_game(
+    game_manager: GameManager,
+    player_count: int = 4,
+    seed: Optional[int] = None,
+    max_turns: int = 500,
+) -> Dict:
+    """
+    단일 게임을 AI끼리 돌리고 결과 요약을 반환합니다 (같은 seed면 같은 결과).
+
+    GameManager / ActionHandler(모델 경로)로 진행합니다.
+    플레이어마다 서로 다른 보물을 하나씩 주고, 끝난 게임은 game_manager에서 제거합니다.
+
+    Args:
+        game_manager: 게임 매니저
+        player_count: 플레이어 수
+        seed: 게임 시드 (없으면 무작위)
+        max_turns: 이 턴 수를 넘기면 무승부로 끝냄
+
+    Returns:
+        {"success", "winner_role" | "reason", "turns", "seed", "treasures": [[보물, 승리 여부], ...]}
+    """
+    game = game_manager.create_game(seed=seed)
     game_id = game.id
+    try:
+        return _play(game_manager, game_id, player_count, max_turns)
+    finally:
+        game_manager.remove_game(game_id)
+
+
+def _play(game_manager: GameManager, game_id: str, player_count: int, max_turns: int) -> Dict:
+    game = game_manager.get_game(game_id)
+    # 봇 선택 / 보물 배정용 난수는 게임 규칙 난수와 분리하되 같은 시드에서 파생
+    bot = ScriptedBot(game.seed + 1)
+    treasure_rng = random.Random(game.seed + 2)
 
     # 플레이어 생성 (전부 봇)
     for i in range(player_count):
         player_id = f"bot_{i+1}"
-        player_name = f"Bot_{i+1}"
-        game_manager.add_player_to_game(game_id, player_id, player_name)
+        game_manager.add_player_to_game(game_id, player_id, player_id)
+    for player, treasure in zip(game.players, treasure_rng.sample(sorted(TREASURE_NAMES), player_count)):
+        player.treasure = treasure
 
-    # 게임 시작
-    started = game_manager.start_game(game_id)
-    if not started:
-        return {"success": False, "reason": "FAILED_TO_START"}
+    # 게임 시작 (첫 플레이어의 드로우 단계)
+    if not game_manager.start_game(game_id):
+        return _unfinished("FAILED_TO_START", 0, game.seed)
 
     card_manager = game_manager.get_card_manager(game_id)
-    turn_manager = TurnManager(game, card_manager)
-    action_handler = ActionHandler(game, turn_manager, card_manager)
-
-    max_turns = 500
-
-    # 첫 번째 턴 시작 (드로우 및 턴 상태 설정)
-    if game.current_player_id:
-        turn_manager.start_turn(game.current_player_id)
+    action_handler = ActionHandler(game, TurnManager(game, card_manager), card_manager)
 
     while game.state == GameState.IN_PROGRESS and game.turn_number <= max_turns:
-        # 먼저 대응 단계가 있는지 처리
-        if game.turn_state == TurnState.RESPOND and game.defending_player_id:
-            defender = game.get_player(game.defending_player_id)
-            if defender and defender.is_alive:
-                # 가능한 경우 회피 카드를 사용, 없으면 포기
-                card_to_use = None
-                for c in defender.hand:
-                    if c.is_missed() or c.is_bang():
-                        card_to_use = c
-                        break
-                if card_to_use:
-                    action_handler.handle_action(
-                        ActionType.RESPOND_ATTACK,
-                        defender.id,
-                        {"card_id": card_to_use.id},
-                    )
-                else:
-                    action_handler.handle_respond_attack_failed(defender.id)
-            continue
-
-        current = turn_manager.get_current_player()
-        if not current or not current.is_alive:
-            # 안전장치: 다음 플레이어로 이동
-            if not turn_manager.move_to_next_player():
-                break
-            continue
-
-        # 간단한 AI: 공격 가능하면 아무나 공격, 아니면 비상금/장착, 그 외 턴 종료
-        acted = False
-        for card in list(current.hand):
-            if card.is_bang():
-                # 임의의 유효 타깃 찾기
-                targets = [
-                    p for p in game.get_alive_players()
-                    if p.id != current.id
-                ]
-                if not targets:
-                    continue
-                target = random.choice(targets)
-                result = action_handler.handle_action(
-                    ActionType.USE_CARD,
-                    current.id,
-                    {"card_id": card.id, "target_id": target.id},
-                )
-                acted = True
+        state = engine_bridge.load_state(game, card_manager)
+        for action in bot.candidates(state):
+            actor_id = state.players[action.player].id
+            if action_handler.handle_action(action.kind, actor_id, to_handler_data(state, action))["success"]:
                 break
-            elif card.is_beer():
-                result = action_handler.handle_action(
-                    ActionType.USE_CARD,
-                    current.id,
-                    {"card_id": card.id},
-                )
-                acted = True
-                break
-
-        # 특별한 액션이 없으면 턴 종료
-        action_handler.handle_action(ActionType.END_TURN, current.id, {})
+        else:
+            return _unfinished("STUCK", game.turn_number, game.seed)
 
         # 승리 조건 체크
         win_info = game_manager.check_win_condition(game_id)
         if win_info:
-            return {
-                "success": True,
-                "winner_role": win_info.get("winner_role"),
-                "winner_id": win_info.get("winner_id"),
-                "turns": game.turn_number,
-            }
+            return _result(
+                win_info.get("winner_role"),
+                win_info.get("winner_id"),
+                game.turn_number,
+                game.seed,
+                [(p.treasure, p.role.name) for p in game.players],
+            )
+
+    return _unfinished("MAX_TURNS_REACHED", game.turn_number, game.seed)
+
+
+def run_headless_game(player_count: int = 4, seed: int = 0, max_turns: int = 500) -> Dict:
+    """
+    run_single_game과 같은 게임을 헤드리스 엔진으로 돌립니다 (같은 seed면 같은 결과).
+
+    Args:
+        player_count: 플레이어 수
+        seed: 게임 시드
+        max_turns: 이 턴 수를 넘기면 무승부로 끝냄
+
+    Returns:
+        run_single_game과 같은 형식의 결과 요약
+    """
+    bot = ScriptedBot(seed + 1)
+    treasures = random.Random(seed + 2).sample(sorted(TREASURE_NAMES), player_count)
+    ctx = new_game(seed, [f"bot_{i+1}" for i in range(player_count)], treasures)
+    state = ctx.state
+    while state.turn_number <= max_turns:
+        if apply_first(ctx, bot.candidates(state)) is None:
+            return _unfinished("STUCK", state.turn_number, seed)
+        won = rules.winner(state)
+        if won is not None:
+            code, seat = won
+            return _result(
+                WIN_MESSAGES[code][0],
+                state.players[seat].id,
+                state.turn_number,
+                seed,
+                [(p.treasure, p.role.value) for p in state.players],
+            )
+    return _unfinished("MAX_TURNS_REACHED", state.turn_number, seed)
 
-    return {
-        "success": False,
-        "reason": "MAX_TURNS_REACHED",
-        "turns": game.turn_number,
-    }
 
+def _init_worker() -> None:
+    global _worker_manager
+    _worker_manager = GameManager()
 
-def simulate(n: int = 100, player_count: int = 4) -> None:
-    """여러 판 시뮬레이션을 돌리고 역할별 승리 횟수를 출력합니다."""
-    gm = GameManager()
-    stats: Dict[str, int] = {}
-    failures: Dict[str, int] = {}
 
-    for _ in range(n):
-        result = run_single_game(gm, player_count=player_count)
+def _play_task(task: Tuple[int, int, int, str]) -> Dict:
+    """워커 프로세스에서 게임 한 판을 돌립니다 (task = (시드, 플레이어 수, 최대 턴, 엔진))."""
+    seed, player_count, max_turns, engine = task
+    started = time.perf_counter()
+    if engine == "headless":
+        result = run_headless_game(player_count, seed, max_turns)
+    else:
+        result = run_single_game(_worker_manager, player_count=player_count, seed=seed, max_turns=max_turns)
+    result["elapsed"] = time.perf_counter() - started
+    result["worker"] = os.getpid()
+    result["peak_rss_mb"] = _peak_rss_mb()
+    return result
+
+
+class SimulationStats:
+    """게임별 결과를 받아 역할 / 보물 / 워커 통계를 합칩니다."""
+
+    def __init__(self) -> None:
+        self.games = 0
+        self.turns = 0
+        self.role_wins: Dict[str, int] = {}
+        self.failures: Dict[str, int] = {}
+        # 보물 -> [보유한 게임 수, 이긴 게임 수]
+        self.treasures: Dict[str, List[int]] = {}
+        # 워커 PID -> {"games", "busy", "peak_rss_mb"}
+        self.workers: Dict[int, Dict[str, Any]] = {}
+
+    def add(self, result: Dict) -> None:
+        """게임 결과 하나를 합칩니다."""
+        self.games += 1
+        self.turns += result.get("turns", 0)
         role = result.get("winner_role")
         if role:
-            stats[role] = stats.get(role, 0) + 1
+            self.role_wins[role] = self.role_wins.get(role, 0) + 1
         else:
             reason = result.get("reason", "UNKNOWN")
-            failures[reason] = failures.get(reason, 0) + 1
+            self.failures[reason] = self.failures.get(reason, 0) + 1
+        for treasure, won in result.get("treasures", []):
+            counts = self.treasures.setdefault(treasure, [0, 0])
+            counts[0] += 1
+            counts[1] += int(won)
+        if "worker" in result:
+            worker = self.workers.setdefault(result["worker"], {"games": 0, "busy": 0.0, "peak_rss_mb": None})
+            worker["games"] += 1
+            worker["busy"] += result.get("elapsed", 0.0)
+            if result.get("peak_rss_mb") is not None:
+                worker["peak_rss_mb"] = max(worker["peak_rss_mb"] or 0.0, result["peak_rss_mb"])
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        """
+        합친 통계를 반환합니다.
+
+        Args:
+            elapsed: 전체 실행 시간 (초)
+
+        Returns:
+            {"games", "gamesPerSec", "avgTurns", "roleWins", "failures", "treasures", "workers"}
+        """
+        return {
+            "games": self.games,
+            "gamesPerSec": round(self.games / elapsed, 2) if elapsed > 0 else 0.0,
+            "avgTurns": round(self.turns / max(1, self.games), 2),
+            "roleWins": dict(sorted(self.role_wins.items(), key=lambda item: -item[1])),
+            "failures": self.failures,
+            "treasures": {
+                name: {"games": held, "wins": wins, "winRate": round(wins / held, 3)}
+                for name, (held, wins) in sorted(self.treasures.items(), key=lambda item: -item[1][1] / item[1][0])
+            },
+            "workers": [
+                {
+                    "pid": pid,
+                    "games": worker["games"],
+                    "gamesPerSec": round(worker["games"] / worker["busy"], 2) if worker["busy"] else 0.0,
+                    "peakRssMb": worker["peak_rss_mb"],
+                }
+                for pid, worker in sorted(self.workers.items())
+            ],
+        }
 
-    print(f"Simulated {n} games (players={player_count})")
-    for role, count in stats.items():
-        print(f"- {role}: {count} wins")
-    if failures:
+
+def run_games(
+    n: int,
+    player_count: int = 4,
+    seed: int = 0,
+    workers: int = 1,
+    max_turns: int = 500,
+    engine: str = "model",
+) -> Iterator[Dict]:
+    """
+    게임 n판을 워커 프로세스들에 나눠 돌리고, 끝나는 순서대로 결과를 내보냅니다.
+
+    Args:
+        n: 게임 수
+        player_count: 게임당 플레이어 수
+        seed: 시작 시드 (i번째 게임은 seed + i)
+        workers: 워커 프로세스 수 (1 이하이면 현재 프로세스에서 실행)
+        max_turns: 게임당 최대 턴
+        engine: "model" (GameManager / ActionHandler) 또는 "headless" (app.engine.headless)
+
+    Yields:
+        게임 결과 딕셔너리 (elapsed / worker / peak_rss_mb 포함)
+    """
+    tasks = [(seed + i, player_count, max_turns, engine) for i in range(n)]
+    if workers <= 1:
+        _init_worker()
+        for task in tasks:
+            yield _play_task(task)
+        return
+    # 작은 묶음으로 나눠 워커 간 부하를 고르게 (게임마다 길이가 다름)
+    chunksize = max(1, n // (workers * 16))
+    with multiprocessing.get_context("spawn").Pool(workers, initializer=_init_worker) as pool:
+        yield from pool.imap_unordered(_play_task, tasks, chunksize=chunksize)
+
+
+def simulate(
+    n: int = 100,
+    player_count: int = 4,
+    seed: int = 0,
+    workers: int = 1,
+    max_turns: int = 500,
+    out: Optional[str] = None,
+    engine: str = "model",
+) -> Dict[str, Any]:
+    """
+    여러 판 시뮬레이션을 돌리고 합친 통계를 반환합니다.
+
+    Args:
+        n: 게임 수
+        player_count: 게임당 플레이어 수
+        seed: 시작 시드
+        workers: 워커 프로세스 수
+        max_turns: 게임당 최대 턴
+        out: 게임별 결과를 한 줄씩 기록할 JSONL 경로 (없으면 기록하지 않음)
+        engine: "model" 또는 "headless" (같은 시드면 같은 통계)
+
+    Returns:
+        SimulationStats.summary() 결과
+    """
+    stats = SimulationStats()
+    started = time.perf_counter()
+    sink = open(out, "w", encoding="utf-8") if out else None
+    try:
+        for result in run_games(n, player_count, seed, workers, max_turns, engine):
+            stats.add(result)
+            if sink is not None:
+                sink.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if sink is not None:
+            sink.close()
+    return stats.summary(time.perf_counter() - started)
+
+
+def print_summary(summary: Dict[str, Any], player_count: int) -> None:
+    """통계를 사람이 읽기 좋게 출력합니다."""
+    print(
+        f"Simulated {summary['games']} games (players={player_count}) "
+        f"in {summary['games'] / summary['gamesPerSec'] if summary['gamesPerSec'] else 0:.1f}s "
+        f"- {summary['gamesPerSec']} games/sec, avg {summary['avgTurns']} turns"
+    )
+    for role, count in summary["roleWins"].items():
+        print(f"- {role}: {count} wins ({count / summary['games']:.1%})")
+    if summary["failures"]:
         print("Failures:")
-        for reason, count in failures.items():
+        for reason, count in summary["failures"].items():
             print(f"- {reason}: {count} games")
+    if summary["treasures"]:
+        print("Treasures (win rate of the holder's team):")
+        for name, row in summary["treasures"].items():
+            print(f"- {name}: {row['wins']}/{row['games']} ({row['winRate']:.1%})")
+    print("Workers:")
+    for worker in summary["workers"]:
+        rss = f"{worker['peakRssMb']} MB" if worker["peakRssMb"] is not None else "n/a"
+        print(f"- pid {worker['pid']}: {worker['games']} games, {worker['gamesPerSec']} games/sec, peak RSS {rss}")
 
 
-if __name__ == "__main__":
-    simulate(50, player_count=4)
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="AI끼리 여러 판을 병렬로 시뮬레이션합니다.")
+    parser.add_argument("-n", "--games", type=int, default=100, help="게임 수 (기본 100)")
+    parser.add_argument("-p", "--players", type=int, default=4, help="게임당 플레이어 수 (기본 4)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수 (기본 CPU 수)")
+    parser.add_argument("--seed", type=int, default=0, help="시작 시드 (i번째 게임은 seed + i, 기본 0)")
+    parser.add_argument("--max-turns", type=int, default=500, help="게임당 최대 턴 (기본 500)")
+    parser.add_argument("--out", help="게임별 결과 JSONL 경로")
+    parser.add_argument(
+        "--engine",
+        choices=("model", "headless"),
+        default="model",
+        help="model: GameManager / ActionHandler 경로, headless: 모델 / 이벤트 문구 없는 빠른 경로 (기본 model)",
+    )
+    parser.add_argument("--json", action="store_true", help="통계를 JSON으로 출력")
+    args = parser.parse_args(argv)
 
+    summary = simulate(args.games, args.players, args.seed, args.workers, args.max_turns, args.out, args.engine)
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print_summary(summary, args.players)
+
+
+if __name__ == "__main__":
+    main()
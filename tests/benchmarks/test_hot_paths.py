@@ -0,0 +1,147 @@
+"""
+pytest-benchmark suite for the server's hot paths.
+
+A plain `pytest` run executes every benchmark once as a smoke test (see tests/conftest.py).
+Timing runs and the regression check go through scripts/bench_compare.py.
+"""
+
+import asyncio
+import random
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from app.engine import rules
+from app.engine.headless import ScriptedBot, apply_first, new_game
+from app.game import engine_bridge
+from app.game.action_handler import ActionHandler
+from app.game.card_manager import CardManager
+from app.game.game_manager import GameManager
+from app.game.turn_manager import TurnManager
+from app.models.game import Game
+from app.utils.constants import CardType
+from app.websocket.connection_manager import ConnectionManager
+from app.websocket.message_handler import MessageHandler
+from tests.parity_scenarios import bot_treasures, play_bot_game
+
+
+def _started_game(player_count: int, seed: int = 0) -> Tuple[GameManager, Game, CardManager]:
+    """A seeded game with the first player's turn started (cards drawn)."""
+    gm = GameManager()
+    game = gm.create_game(f"bench_{player_count}", seed=seed)
+    for i in range(player_count):
+        gm.add_player_to_game(game.id, f"p{i}", f"P{i}")
+    gm.start_game(game.id)
+    card_manager = gm.get_card_manager(game.id)
+    TurnManager(game, card_manager).start_turn(game.current_player_id)
+    return gm, game, card_manager
+
+
+class _Socket:
+    """Stands in for a WebSocket: drops the already-encoded frame."""
+
+    def __init__(self) -> None:
+        self.frames = 0
+
+    async def send_text(self, text: str) -> None:
+        self.frames += 1
+
+
+def test_create_full_deck_and_shuffle(benchmark) -> None:
+    card_manager = CardManager(rng=random.Random(0))
+    deck = benchmark(card_manager.create_full_deck_and_shuffle)
+    assert len(deck) == len(card_manager.deck) > 0
+
+
+@pytest.mark.parametrize("player_count", [4, 7])
+def test_game_to_dict(benchmark, player_count: int) -> None:
+    _, game, _ = _started_game(player_count)
+    data = benchmark(game.to_dict, game.players[0].id)
+    assert len(data["players"]) == player_count
+
+
+@pytest.mark.parametrize("player_count", [4, 7])
+def test_broadcast_game_state(benchmark, player_count: int) -> None:
+    gm, game, _ = _started_game(player_count)
+    connections = ConnectionManager()
+    sockets: List[_Socket] = []
+    for player in game.players:
+        sockets.append(_Socket())
+        connections.active_connections[player.id] = sockets[-1]
+        connections.register_player_to_game(player.id, game.id)
+    handler = MessageHandler(gm, connections)
+    loop = asyncio.new_event_loop()
+    try:
+        sent = benchmark(lambda: loop.run_until_complete(handler.broadcast_game_state(game.id)))
+    finally:
+        loop.close()
+    assert sent == player_count
+    assert all(socket.frames for socket in sockets)
+
+
+def test_calculate_distance(benchmark) -> None:
+    _, game, _ = _started_game(7)
+    pairs = [(a, b) for a in game.players for b in game.players if a is not b]
+
+    def all_pairs() -> int:
+        return sum(game.calculate_distance(a, b) for a, b in pairs)
+
+    assert benchmark(all_pairs) > 0
+
+
+def _bang_fixture() -> Tuple[bytes, str, str, str, str]:
+    """
+    Serialized game where the current player holds a 정산 and the next seat holds a 회피.
+
+    Returns (serialized game, attacker id, bang card id, target id, missed card id).
+    """
+    _, game, card_manager = _started_game(4)
+    attacker = game.get_player(game.current_player_id)
+    target = game.players[(attacker.position + 1) % len(game.players)]
+    bang = next(c for c in card_manager.deck if c.card_type == CardType.BANG)
+    missed = next(c for c in card_manager.deck if c.card_type == CardType.MISSED)
+    card_manager.deck.remove(bang)
+    card_manager.deck.remove(missed)
+    attacker.hand.append(bang)
+    target.hand.append(missed)
+    return engine_bridge.serialize_game(game, card_manager), attacker.id, bang.id, target.id, missed.id
+
+
+def test_bang_then_respond_attack(benchmark) -> None:
+    data, attacker_id, bang_id, target_id, missed_id = _bang_fixture()
+
+    def setup():
+        game, card_manager = engine_bridge.deserialize_game(data)
+        handler = ActionHandler(game, TurnManager(game, card_manager), card_manager)
+        bang = next(c for c in game.get_player(attacker_id).hand if c.id == bang_id)
+        return (handler, bang), {}
+
+    def attack_and_evade(handler: ActionHandler, bang) -> Tuple[Dict, Dict]:
+        attacked = handler.handle_bang_card(attacker_id, bang, target_id)
+        return attacked, handler.handle_respond_attack(target_id, {"card_id": missed_id})
+
+    attacked, responded = benchmark.pedantic(attack_and_evade, setup=setup, rounds=200)
+    assert attacked["success"] and responded["success"]
+
+
+def test_full_game_model(benchmark) -> None:
+    ids = [f"p{i}" for i in range(5)]
+    trace, state = benchmark.pedantic(play_bot_game, args=(3, ids), rounds=5)
+    assert trace and rules.winner(state) is not None
+
+
+def test_full_game_headless(benchmark) -> None:
+    ids = [f"p{i}" for i in range(5)]
+
+    def play() -> Tuple[int, Optional[Tuple[str, int]]]:
+        ctx = new_game(3, ids, bot_treasures(3, len(ids)), game_id="bot_3")
+        bot = ScriptedBot(4)
+        steps = 0
+        while steps < 400 and rules.winner(ctx.state) is None:
+            if apply_first(ctx, bot.candidates(ctx.state)) is None:
+                break
+            steps += 1
+        return steps, rules.winner(ctx.state)
+
+    steps, won = benchmark.pedantic(play, rounds=20)
+    assert steps > 0 and won is not None
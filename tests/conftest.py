@@ -7,6 +7,19 @@ from fastapi.testclient import TestClient
 
 from app.main import app
 
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    # tests/benchmarks needs pytest-benchmark (requirements.txt dev tools)
+    collect_ignore = ["benchmarks"]
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Time benchmarks only on request (--benchmark-only / --benchmark-enable); otherwise run each once."""
+    option = config.option
+    if hasattr(option, "benchmark_disable") and not (option.benchmark_only or option.benchmark_enable):
+        option.benchmark_disable = True
+
 
 @pytest.fixture
 def client() -> TestClient:
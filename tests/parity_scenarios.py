@@ -0,0 +1,283 @@
+"""
+Seeded scripted games used by the engine parity tests.
+
+The driver plays games only through the public ActionHandler / TurnManager /
+GameManager API and records a digest of the full game state after every step.
+Golden digests in tests/data/engine_parity_golden.json were recorded from the
+handlers before the rules moved into app.engine.
+"""
+
+import hashlib
+import json
+import os
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.engine import rules
+from app.engine.headless import ScriptedBot
+from app.engine.rules import Action
+from app.engine.state import EngineState
+from app.game import engine_bridge
+from app.game.action_handler import ActionHandler
+from app.game.card_manager import CardManager
+from app.game.game_manager import GameManager
+from app.game.legal_actions import to_handler_data
+from app.game.turn_manager import TurnManager
+from app.models.game import Game
+from app.utils.constants import TREASURE_NAMES, ActionType, GameState, TurnState
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "data", "engine_parity_golden.json")
+
+# (seed, player_count) scenarios covered by the golden file
+SCENARIOS: List[Tuple[int, int]] = [(seed, 4 + seed % 4) for seed in range(24)]
+MAX_STEPS = 300
+
+
+def _value(v: Any) -> Any:
+    return v.value if hasattr(v, "value") else v
+
+
+def _card_ids(cards: List[Any]) -> List[str]:
+    return [c.id for c in cards]
+
+
+def dump_game(game: Game, card_manager: CardManager) -> Dict[str, Any]:
+    """Canonical, timestamp-free dump of everything the rules can touch."""
+    pending = None
+    if game.pending_action:
+        pending = {
+            k: (_card_ids(v) if isinstance(v, list) and v and hasattr(v[0], "id") else v)
+            for k, v in game.pending_action.items()
+        }
+    return {
+        "state": _value(game.state),
+        "current": game.current_player_id,
+        "turn_state": _value(game.turn_state),
+        "turn_number": game.turn_number,
+        "players": [
+            {
+                "id": p.id,
+                "role": p.role.name,
+                "hp": p.hp,
+                "max_hp": p.max_hp,
+                "hand": _card_ids(p.hand),
+                "equipment": [[slot, c.id] for slot, c in p.equipment.items()],
+                "treasure": p.treasure,
+                "alive": p.is_alive,
+                "position": p.position,
+            }
+            for p in game.players
+        ],
+        "deck": _card_ids(card_manager.deck),
+        "discard": _card_ids(card_manager.discard_pile),
+        "attack_counters": game.turn_attack_counters,
+        "treasure_counters": game.treasure_counters,
+        "defending": game.defending_player_id,
+        "required_missed": game.pending_required_missed,
+        "used_missed": game.pending_used_missed,
+        "required_response": game.required_response,
+        "pending_action": pending,
+        "last_event": game.last_event,
+        "events": [[e["message"], e["type"]] for e in game.events],
+    }
+
+
+def digest(obj: Any) -> str:
+    raw = json.dumps(obj, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def setup_game(
+    seed: int,
+    player_count: int,
+    gm: Optional[GameManager] = None,
+) -> Tuple[GameManager, Game, CardManager]:
+    """Create and start a seeded game with deterministically assigned treasures."""
+    gm = gm or GameManager()
+    game_id = f"parity_{seed}"
+    game = gm.create_game(game_id, seed=seed)
+    for i in range(player_count):
+        gm.add_player_to_game(game_id, f"p{i}", f"P{i}")
+
+    treasure_rng = random.Random(seed * 31 + 7)
+    names = sorted(TREASURE_NAMES)
+    for player in game.players:
+        if treasure_rng.random() < 0.8:
+            player.treasure = treasure_rng.choice(names)
+    gm.start_game(game_id)
+    return gm, game, gm.get_card_manager(game_id)
+
+
+def _choose_step(
+    game: Game,
+    rng: random.Random,
+) -> Tuple[str, Optional[str], Dict[str, Any]]:
+    """Pick the next scripted action: (kind, player_id, data)."""
+    alive = [p for p in game.players if p.is_alive]
+    ctx = game.pending_action or {}
+    ptype = ctx.get("type")
+
+    if ptype == "SELECT_DRAW_ORDER":
+        ids = _card_ids(ctx.get("cards") or [])
+        rng.shuffle(ids)
+        if len(ids) == 3 and rng.random() < 0.9:
+            data = {"take_card_id": ids[0], "top_card_id": ids[1], "bottom_card_id": ids[2]}
+        else:
+            data = {"take_card_id": ids[0] if ids else None, "top_card_id": None, "bottom_card_id": None}
+        return ActionType.SELECT_DRAW_ORDER.value, ctx.get("player_id"), data
+
+    if ptype == "SELECT_STEAL_CARD":
+        ids = _card_ids(ctx.get("cards") or [])
+        card_id = rng.choice(ids) if ids and rng.random() < 0.9 else "missing"
+        return ActionType.SELECT_STEAL_CARD.value, ctx.get("attacker_id"), {"card_id": card_id}
+
+    if ptype == "GENERAL_STORE":
+        order = ctx.get("pick_order") or []
+        idx = ctx.get("current_index", 0)
+        remaining = _card_ids(ctx.get("remaining_cards") or [])
+        picker = order[idx] if idx < len(order) else None
+        if rng.random() < 0.1 and alive:
+            picker = rng.choice(alive).id
+        card_id = rng.choice(remaining) if remaining else None
+        return ActionType.GENERAL_STORE_PICK.value, picker, {"card_id": card_id}
+
+    if game.turn_state == TurnState.RESPOND and game.defending_player_id:
+        defender = game.get_player(game.defending_player_id)
+        roll = rng.random()
+        if roll < 0.05:
+            return ActionType.END_TURN.value, game.current_player_id, {}
+        if defender and defender.hand and roll < 0.55:
+            return ActionType.RESPOND_ATTACK.value, defender.id, {"card_id": rng.choice(defender.hand).id}
+        return "GIVE_UP", game.defending_player_id, {}
+
+    if game.turn_state == TurnState.DRAW:
+        return "START_TURN", game.current_player_id, {}
+
+    current = game.get_player(game.current_player_id) if game.current_player_id else None
+    if current is None:
+        return "MOVE_NEXT", None, {}
+
+    roll = rng.random()
+    if roll < 0.03 and alive:
+        # 차례가 아닌 플레이어의 잘못된 시도
+        other = rng.choice(alive)
+        card_id = other.hand[0].id if other.hand else None
+        return ActionType.USE_CARD.value, other.id, {"card_id": card_id, "target_id": current.id}
+    if roll < 0.25 or not current.hand:
+        return ActionType.END_TURN.value, current.id, {}
+    if roll < 0.30 and len(current.hand) >= 2:
+        picks = rng.sample(current.hand, 2)
+        return ActionType.USE_TREASURE.value, current.id, {
+            "treasure": "생명 장부",
+            "card_ids": [c.id for c in picks],
+        }
+    card = rng.choice(current.hand)
+    targets = [p for p in game.players if p.id != current.id]
+    if rng.random() < 0.1:
+        targets = list(game.players)
+    elif rng.random() < 0.4:
+        # 사거리 1 카드(강제 압류 등)가 실제로 발동되도록 이웃 대상을 우선
+        size = len(game.players)
+        targets = [
+            p for p in targets
+            if (p.position - current.position) % size in (1, size - 1)
+        ] or targets
+    target = rng.choice(targets) if targets else None
+    return ActionType.USE_CARD.value, current.id, {
+        "card_id": card.id,
+        "target_id": target.id if target and rng.random() < 0.95 else None,
+    }
+
+
+def play_scenario(
+    seed: int,
+    player_count: int,
+    max_steps: int = MAX_STEPS,
+    gm: Optional[GameManager] = None,
+) -> List[str]:
+    """Play one scripted game and return the per-step state digests."""
+    gm, game, card_manager = setup_game(seed, player_count, gm)
+    turn_manager = TurnManager(game, card_manager)
+    action_handler = ActionHandler(game, turn_manager, card_manager)
+    rng = random.Random(seed * 7919 + 1)
+
+    digests = [digest(dump_game(game, card_manager))]
+    for _ in range(max_steps):
+        if game.state != GameState.IN_PROGRESS:
+            break
+        kind, player_id, data = _choose_step(game, rng)
+        if kind == "START_TURN":
+            result: Any = turn_manager.start_turn(player_id)
+        elif kind == "MOVE_NEXT":
+            result = turn_manager.move_to_next_player()
+        elif kind == "GIVE_UP":
+            result = action_handler.handle_respond_attack_failed(player_id)
+        else:
+            result = action_handler.handle_action(ActionType(kind), player_id, data)
+        win_info = gm.check_win_condition(game.id)
+        digests.append(digest({
+            "step": [kind, player_id, data],
+            "result": result,
+            "win": win_info,
+            "game": dump_game(game, card_manager),
+        }))
+    return digests
+
+
+def bot_treasures(seed: int, count: int) -> List[str]:
+    """Distinct treasures for the scripted-bot games, one per seat."""
+    return random.Random(seed * 31 + 7).sample(sorted(TREASURE_NAMES), count)
+
+
+def play_bot_game(
+    seed: int,
+    player_ids: List[str],
+    max_steps: int = 400,
+    gm: Optional[GameManager] = None,
+) -> Tuple[List[Optional[Action]], EngineState]:
+    """
+    Play a ScriptedBot game through GameManager + ActionHandler (models, rendered events).
+
+    Returns the applied-action trace (None when no candidate applied) and the final engine state.
+    """
+    gm = gm or GameManager()
+    game = gm.create_game(f"bot_{seed}", seed=seed)
+    for player_id in player_ids:
+        gm.add_player_to_game(game.id, player_id, player_id)
+    for player, treasure in zip(game.players, bot_treasures(seed, len(player_ids))):
+        player.treasure = treasure
+    gm.start_game(game.id)
+    card_manager = gm.get_card_manager(game.id)
+    handler = ActionHandler(game, TurnManager(game, card_manager), card_manager)
+    bot = ScriptedBot(seed + 1)
+
+    trace: List[Optional[Action]] = []
+    for _ in range(max_steps):
+        state = engine_bridge.load_state(game, card_manager)
+        if rules.winner(state) is not None:
+            break
+        applied = None
+        for action in bot.candidates(state):
+            player_id = state.players[action.player].id
+            if handler.handle_action(action.kind, player_id, to_handler_data(state, action))["success"]:
+                applied = action
+                break
+        trace.append(applied)
+        if applied is None:
+            break
+    return trace, engine_bridge.load_state(game, card_manager)
+
+
+def generate_golden(path: str = GOLDEN_PATH) -> None:
+    """Record golden digests for every scenario."""
+    golden = {
+        f"{seed}:{count}": play_scenario(seed, count)
+        for seed, count in SCENARIOS
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(golden, f, indent=0)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    generate_golden()
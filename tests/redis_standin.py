@@ -0,0 +1,111 @@
+"""
+In-process Redis stand-in for tests and benchmarks.
+
+Speaks enough RESP2 (PING, SELECT, AUTH, SET, GET, DEL, EXISTS, SADD, SREM,
+SMEMBERS, FLUSHDB) for RedisGameStore, so the Redis backend can be exercised
+without a real server.
+"""
+
+import socketserver
+import threading
+from typing import Dict, List, Optional, Set, Union
+
+Value = Union[bytes, Set[bytes]]
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    disable_nagle_algorithm = True
+
+    def _read_command(self) -> Optional[List[bytes]]:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.strip().split()
+        args = []
+        for _ in range(int(line[1:-2])):
+            size = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(size + 2)[:-2])
+        return args
+
+    def handle(self) -> None:
+        server: RedisStandIn = self.server.owner
+        db = 0
+        while True:
+            args = self._read_command()
+            if args is None:
+                return
+            name = args[0].upper()
+            if name == b"SELECT":
+                db = int(args[1])
+                reply = b"+OK\r\n"
+            else:
+                reply = server.execute(db, name, args[1:])
+            self.wfile.write(reply)
+
+
+def _bulk(value: Optional[bytes]) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+class RedisStandIn:
+    """Threaded TCP server holding all data in memory."""
+
+    def __init__(self):
+        self.databases: Dict[int, Dict[bytes, Value]] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[socketserver.ThreadingTCPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def execute(self, db: int, name: bytes, args: List[bytes]) -> bytes:
+        with self._lock:
+            data = self.databases.setdefault(db, {})
+            if name == b"PING":
+                return b"+PONG\r\n"
+            if name in (b"AUTH", b"FLUSHDB"):
+                if name == b"FLUSHDB":
+                    data.clear()
+                return b"+OK\r\n"
+            if name == b"SET":
+                data[args[0]] = args[1]
+                return b"+OK\r\n"
+            if name == b"GET":
+                return _bulk(data.get(args[0]))
+            if name in (b"DEL", b"EXISTS"):
+                found = [key for key in args if key in data]
+                if name == b"DEL":
+                    for key in found:
+                        del data[key]
+                return b":%d\r\n" % len(found)
+            if name == b"SADD":
+                members = data.setdefault(args[0], set())
+                added = len(set(args[1:]) - members)
+                members.update(args[1:])
+                return b":%d\r\n" % added
+            if name == b"SREM":
+                members = data.get(args[0], set())
+                removed = len(members & set(args[1:]))
+                members.difference_update(args[1:])
+                return b":%d\r\n" % removed
+            if name == b"SMEMBERS":
+                members = sorted(data.get(args[0], set()))
+                return b"*%d\r\n" % len(members) + b"".join(_bulk(m) for m in members)
+            return b"-ERR unknown command '%s'\r\n" % name
+
+    def start(self) -> int:
+        """Start serving on a free localhost port and return the port."""
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.owner = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self._server.server_address[1]
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,121 @@
+"""
+Action log: binary codec, snapshot + tail rebuild and torn-write tolerance.
+"""
+
+import os
+
+import pytest
+
+from app.game.game_manager import GameManager
+from app.storage import codec
+from app.storage.action_log import (
+    LOG_SUFFIX,
+    file_name,
+    flush_action_logs,
+    iter_records,
+    logged_game_ids,
+    rebuild,
+)
+from tests.parity_scenarios import SCENARIOS, dump_game, play_scenario
+
+
+def test_codec_round_trip() -> None:
+    """Every supported type survives encode/decode (lists come back as tuples)."""
+    value = (None, True, False, 0, -1, 127, -129, 2**62, "정산", b"\x00\x01", 1.5,
+             [1, (2, 3)], {"a": {"b": None}, 3: "x"})
+    decoded = codec.decode(codec.encode(value))
+    assert decoded[:11] == value[:11]
+    assert decoded[11] == (1, (2, 3))
+    assert decoded[12] == {"a": {"b": None}, 3: "x"}
+
+
+def _comparable(game, card_manager):
+    dump = dump_game(game, card_manager)
+    dump["events"] = dump["events"][-10:]
+    return dump
+
+
+@pytest.mark.parametrize("interval", [0, 7, 200])
+def test_rebuild_matches_live_game(tmp_path, interval: int) -> None:
+    """A game restored from snapshot + log tail equals the live game."""
+    directory = str(tmp_path)
+    for seed, count in SCENARIOS[:6]:
+        live = GameManager(action_log_dir=directory, snapshot_interval=interval)
+        play_scenario(seed, count, gm=live)
+        game_id = f"parity_{seed}"
+
+        restored = GameManager(action_log_dir=directory, snapshot_interval=interval)
+        game = restored.restore_game(game_id)
+        original = live.get_game(game_id)
+        assert game.version == original.version
+        assert game.state == original.state
+        assert _comparable(game, restored.get_card_manager(game_id)) == _comparable(
+            original, live.get_card_manager(game_id)
+        )
+        # 복원한 게임도 같은 난수 흐름을 이어감
+        assert game.rng.random() == original.rng.random()
+        live.get_game(game_id).action_log.close()
+        restored.get_game(game_id).action_log.close()
+    assert len(logged_game_ids(directory)) == 6
+
+
+def test_torn_tail_record_is_ignored(tmp_path) -> None:
+    """A partially written last record (crash mid-append) is skipped on replay."""
+    directory = str(tmp_path)
+    live = GameManager(action_log_dir=directory, snapshot_interval=0)
+    play_scenario(3, 7, max_steps=40, gm=live)
+    live.get_game("parity_3").action_log.close()
+    path = os.path.join(directory, "parity_3" + LOG_SUFFIX)
+    records = len(list(iter_records(path)))
+    with open(path, "ab") as f:
+        f.write(b"\xff\x00\x00\x00partial")
+    assert len(list(iter_records(path))) == records
+    GameManager(action_log_dir=directory).restore_game("parity_3")
+
+
+def test_unsafe_game_id_stays_inside_directory(tmp_path) -> None:
+    """Client-chosen ids with path separators are encoded, not joined into the path."""
+    directory = tmp_path / "logs"
+    gm = GameManager(action_log_dir=str(directory))
+    game = gm.create_game("../escaped", seed=5)
+    for i in range(4):
+        gm.add_player_to_game(game.id, f"esc_p{i}", f"P{i}")
+    gm.start_game(game.id)
+
+    assert logged_game_ids(str(directory)) == ["../escaped"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["logs"]
+    assert all("/" not in name and not name.startswith(".") for name in os.listdir(directory))
+    assert rebuild(str(directory), "../escaped").version == game.version
+    assert file_name("방_1") != file_name("_1") and file_name("room-1") == "room-1"
+
+
+def test_reused_game_id_starts_a_fresh_log(tmp_path) -> None:
+    """Removing a game deletes its log; a new game under the same id rebuilds cleanly."""
+    directory = str(tmp_path)
+    gm = GameManager(action_log_dir=directory)
+    for seed in (1, 2):
+        game = gm.create_game("room1", seed=seed)
+        for i in range(4):
+            gm.add_player_to_game(game.id, f"room_p{i}", f"P{i}")
+        gm.start_game(game.id)
+        assert rebuild(directory, "room1").seed == seed
+        gm.remove_game("room1")
+        assert logged_game_ids(directory) == []
+        assert os.listdir(directory) == []
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc/self/fd")
+def test_live_games_hold_no_log_file_descriptors(tmp_path) -> None:
+    """Records go through the shared writer thread; no per-game handle stays open."""
+    directory = str(tmp_path)
+    gm = GameManager(action_log_dir=directory)
+    for n in range(20):
+        game = gm.create_game(f"fd_{n}", seed=n)
+        for i in range(4):
+            gm.add_player_to_game(game.id, f"fd{n}_p{i}", f"P{i}")
+        gm.start_game(game.id)
+    flush_action_logs()
+
+    open_paths = [os.path.realpath(os.path.join("/proc/self/fd", fd)) for fd in os.listdir("/proc/self/fd")]
+    assert not [path for path in open_paths if path.startswith(os.path.realpath(directory))]
+    assert len(logged_game_ids(directory)) == 20
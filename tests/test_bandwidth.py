@@ -0,0 +1,96 @@
+"""
+Outbound bandwidth accounting: per-type / per-game / per-connection bytes and the per-game budget.
+"""
+
+import json
+
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.monitoring.bandwidth import BandwidthMeter
+from app.monitoring.metrics import BANDWIDTH_BUDGET_COUNTER, SENT_BYTES_COUNTERS
+from app.websocket.connection_manager import ConnectionManager
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 6000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Socket:
+    def __init__(self) -> None:
+        self.frames = []
+
+    async def send_text(self, text: str) -> None:
+        self.frames.append(text)
+
+
+def test_minute_buckets_roll_over() -> None:
+    """Bytes land in the current minute; finished minutes are returned newest first."""
+    clock = _Clock()
+    meter = BandwidthMeter(window=3, clock=clock)
+    meter.record("p1", "g1", "GAME_STATE_UPDATE", 100)
+    meter.record("p2", "g1", "PONG", 10)
+    clock.now += 60
+    meter.record("p1", "g1", "GAME_STATE_UPDATE", 50)
+
+    snapshot = meter.snapshot(top=5, minutes=5)
+    assert snapshot["totalBytes"] == 160
+    assert snapshot["topConnections"][0] == {"id": "p1", "bytes": 150}
+    assert snapshot["currentMinute"]["bytes"] == 50
+    (previous,) = snapshot["minutes"]
+    assert previous["byType"] == {"GAME_STATE_UPDATE": 100, "PONG": 10}
+    assert previous["topGames"] == [{"id": "g1", "bytes": 110}]
+
+
+def test_budget_warning_once_per_game_per_minute() -> None:
+    """Going over the budget counts once per game per minute, not once per message."""
+    clock = _Clock()
+    meter = BandwidthMeter(game_budget=100, clock=clock)
+    before = BANDWIDTH_BUDGET_COUNTER.value
+    for _ in range(5):
+        meter.record("p1", "g1", "GAME_STATE_UPDATE", 60)
+    meter.record("p2", "g2", "GAME_STATE_UPDATE", 60)
+    assert meter.budget_warnings == 1
+    assert meter.snapshot()["currentMinute"]["overBudget"] == ["g1"]
+
+    clock.now += 60
+    meter.record("p1", "g1", "GAME_STATE_UPDATE", 200)
+    assert meter.budget_warnings == 2
+    assert BANDWIDTH_BUDGET_COUNTER.value - before == 2
+
+
+async def test_connection_manager_records_encoded_size() -> None:
+    """send_personal_message records exactly the bytes that went on the wire."""
+    meter = BandwidthMeter()
+    manager = ConnectionManager(meter)
+    socket = _Socket()
+    manager.active_connections["p1"] = socket
+    manager.register_player_to_game("p1", "g1")
+    counter = SENT_BYTES_COUNTERS["ACTION_RESPONSE"]
+    before = counter.value
+
+    message = {"type": "ACTION_RESPONSE", "data": {"message": "카드를 냈습니다"}}
+    assert await manager.send_personal_message(message, "p1")
+    (frame,) = socket.frames
+    assert json.loads(frame) == message
+    assert meter.by_game == {"g1": len(frame)}
+    assert counter.value - before == len(frame)
+
+    manager.forget_game("g1")
+    manager.disconnect("p1")
+    assert meter.by_game == {} and meter.by_connection == {}
+
+
+def test_bandwidth_endpoint_requires_token(client: TestClient, monkeypatch) -> None:
+    """/admin/bandwidth is admin-only."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", None)
+    assert client.get("/admin/bandwidth").status_code == 404
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    response = client.get("/admin/bandwidth?top=3&minutes=2", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    assert {"totalBytes", "topGames", "topConnections", "currentMinute", "minutes"} <= set(response.json())
@@ -0,0 +1,146 @@
+"""
+Bot driver: server-side AI players act through the normal action path.
+"""
+
+import asyncio
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from app.ai import choose_action, choose_actions, difficulty_of, ismcts
+from app.engine import acting_phase, legal_actions, rules
+from app.game import engine_bridge
+from app.game.bot_driver import BotDriver
+from app.game.game_manager import GameManager
+from app.game.turn_timer import TurnTimer
+from app.utils.constants import GameState
+from app.websocket.connection_manager import ConnectionManager
+from app.websocket.message_handler import MessageHandler
+from tests.parity_scenarios import play_scenario
+
+
+def test_policy_picks_legal_actions() -> None:
+    """Every difficulty returns one of the seat's legal actions; names map back to difficulties."""
+    gm = GameManager()
+    gm.create_game("policy", seed=5)
+    result = gm.add_ai_players_to_game("policy", 4, difficulty="hard")
+    assert result["added_count"] == 4
+    gm.start_game("policy")
+    game = gm.get_game("policy")
+    assert difficulty_of(game.players[0].name) == "hard"
+    assert difficulty_of("Alice") == "medium"
+
+    state = engine_bridge.load_state(game, gm.get_card_manager("policy"))
+    rules.start_turn(rules.Context(state, game.rng), state.current)
+    legal = legal_actions(state, state.current)
+    for difficulty in ("easy", "medium", "hard"):
+        assert choose_action(state, state.current, difficulty) in legal
+
+
+def test_batched_policy_matches_per_bot_choices() -> None:
+    """choose_actions picks, for every request, the same action as a per-bot choose_action with the same seed."""
+    gm = GameManager()
+    requests = []
+    for seed in range(40):
+        play_scenario(seed, 4 + seed % 4, max_steps=5 + seed * 2, gm=gm)
+        game = gm.get_game(f"parity_{seed}")
+        state = engine_bridge.load_state(game, gm.get_card_manager(game.id))
+        acting = acting_phase(state)
+        if acting is not None and legal_actions(state, acting[1]):
+            requests.append((state, acting[1], ("easy", "medium", "hard")[seed % 3], seed))
+    assert len(requests) > 20
+
+    chosen = choose_actions(requests)
+    assert len(chosen) == len(requests)
+    for (state, seat, difficulty, seed), action in zip(requests, chosen):
+        assert action in legal_actions(state, seat)
+        assert action == choose_action(state, seat, difficulty, random.Random(seed))
+
+
+@pytest.mark.parametrize("batched", [False, True])
+async def test_bots_play_a_game_without_clients(batched: bool) -> None:
+    """Bot-only games advance on their own: the timer resolves the draw and the driver plays every seat."""
+    gm = GameManager()
+    handler = MessageHandler(gm, ConnectionManager())
+    timer = TurnTimer(handler.handle_timeout, turn_timeout=30, respond_timeout=30, selection_timeout=30)
+    driver = BotDriver(gm, handler.apply_player_action, think_time=(0, 0), workers=2, batch=batched)
+    gm.turn_timer = timer
+    gm.bot_driver = driver
+    timer.start()
+    driver.start()
+    try:
+        for seed in range(3):
+            game_id = f"bots_{seed}"
+            gm.create_game(game_id, seed=seed)
+            gm.add_ai_players_to_game(game_id, 5, difficulty=("easy", "medium", "hard")[seed])
+            gm.start_game(game_id)
+
+        for _ in range(400):
+            await asyncio.sleep(0.01)
+            games = [gm.get_game(f"bots_{seed}") for seed in range(3)]
+            if all(g.state == GameState.FINISHED or g.turn_number >= 10 for g in games):
+                break
+    finally:
+        await driver.stop()
+        await timer.stop()
+
+    for game in games:
+        assert game.state == GameState.FINISHED or game.turn_number >= 10
+    stats = driver.stats()
+    assert stats["decisions"] > 0
+    assert stats["failures"] == 0
+    assert (stats["batch"]["batches"] > 0) == batched
+    # the turn timer only had to resolve draw phases
+    assert set(timer.stats()["expired"]) == {"draw"}
+
+
+async def test_driver_restarts_after_stop() -> None:
+    """stop() leaves usable pools behind, so a second start/stop cycle in one process still decides."""
+    gm = GameManager()
+    handler = MessageHandler(gm, ConnectionManager())
+    timer = TurnTimer(handler.handle_timeout, turn_timeout=30, respond_timeout=30, selection_timeout=30)
+    driver = BotDriver(gm, handler.apply_player_action, think_time=(0, 0), workers=1, search_workers=1)
+    gm.turn_timer = timer
+    gm.bot_driver = driver
+    driver.start()
+    await driver.stop()
+
+    timer.start()
+    driver.start()
+    try:
+        assert driver.search_executor.submit(int).result(timeout=30) == 0
+        gm.create_game("restart", seed=4)
+        gm.add_ai_players_to_game("restart", 4, difficulty="medium")
+        gm.start_game("restart")
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            if driver.decisions:
+                break
+    finally:
+        await driver.stop()
+        await timer.stop()
+    assert driver.decisions > 0
+    assert driver.failures == 0
+
+
+def test_hard_search_respects_budget_in_a_process_pool() -> None:
+    """ISMCTS returns a legal action within its time budget and reports search statistics, across processes."""
+    gm = GameManager()
+    gm.create_game("search", seed=11)
+    gm.add_ai_players_to_game("search", 5, difficulty="hard")
+    gm.start_game("search")
+    game = gm.get_game("search")
+    state = engine_bridge.load_state(game, gm.get_card_manager("search"))
+    rules.start_turn(rules.Context(state, game.rng), state.current)
+    legal = legal_actions(state, state.current)
+
+    action, stats = ismcts.decide(state, state.current, 0.1, seed=1)
+    assert action in legal
+    assert stats["iterations"] > 0 and stats["maxDepth"] >= 1
+    assert stats["elapsedMs"] < 100 + 50
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        action, stats = pool.submit(ismcts.decide, state, state.current, 0.05, 2).result()
+    assert action in legal and stats["playoutsPerSec"] > 0
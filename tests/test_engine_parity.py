@@ -0,0 +1,56 @@
+"""
+Rules engine: parity with the pre-engine handlers and pure state semantics.
+"""
+
+import json
+import random
+
+import pytest
+
+from app.engine import Action, EngineState, PlayerState, apply
+from app.engine.rules import START_TURN, Context, start
+from app.utils.constants import GameState
+from tests.parity_scenarios import GOLDEN_PATH, SCENARIOS, play_scenario
+
+
+with open(GOLDEN_PATH, encoding="utf-8") as _f:
+    GOLDEN = json.load(_f)
+
+
+@pytest.mark.parametrize("seed,player_count", SCENARIOS)
+def test_scenario_matches_golden(seed: int, player_count: int) -> None:
+    """Scripted game produces the same state after every step as the old handlers."""
+    expected = GOLDEN[f"{seed}:{player_count}"]
+    actual = play_scenario(seed, player_count)
+    for step, (want, got) in enumerate(zip(expected, actual)):
+        assert got == want, f"state diverged at step {step}"
+    assert len(actual) == len(expected)
+
+
+def _started_state(seed: int, player_count: int = 5) -> EngineState:
+    players = [
+        PlayerState(f"p{i}", f"P{i}", "sheriff", 4, 4, 1, [], {}, None, True, i, False)
+        for i in range(player_count)
+    ]
+    ctx = Context(EngineState("g", players), random.Random(seed))
+    start(ctx)
+    return ctx.state
+
+
+def test_snapshot_round_trip() -> None:
+    """Snapshots survive JSON and rebuild an equal state."""
+    state = _started_state(1)
+    snapshot = state.snapshot()
+    restored = EngineState.from_snapshot(json.loads(json.dumps(snapshot)))
+    assert restored.snapshot() == snapshot
+
+
+def test_apply_leaves_input_untouched() -> None:
+    """apply works on a copy and reports events for the new state."""
+    state = _started_state(2)
+    assert state.status == GameState.IN_PROGRESS
+    before = state.snapshot()
+    transition = apply(state, Action(START_TURN, state.current), random.Random(0))
+    assert state.snapshot() == before
+    assert transition.state.snapshot() != before
+    assert transition.events
@@ -0,0 +1,40 @@
+"""
+Per-game seeded RNG: same seed, same game; no use of the global random module.
+"""
+
+import random
+
+from app.game.game_manager import GameManager
+from tests.parity_scenarios import SCENARIOS, play_scenario
+
+
+def _deal(seed: int):
+    gm = GameManager()
+    game = gm.create_game(seed=seed)
+    for i in range(5):
+        gm.add_player_to_game(game.id, f"p{i}", f"P{i}")
+    gm.start_game(game.id)
+    return [(p.role.name, [c.id for c in p.hand]) for p in game.players], [
+        c.id for c in gm.get_card_manager(game.id).deck
+    ]
+
+
+def test_seed_is_recorded_and_reproduces_deal() -> None:
+    """create_game records the seed and the same seed deals the same game."""
+    gm = GameManager()
+    assert gm.create_game().seed is not None
+    assert _deal(42) == _deal(42)
+    assert _deal(42) != _deal(43)
+
+
+def test_games_do_not_touch_global_random() -> None:
+    """Playing a seeded game neither consumes nor depends on the global random state."""
+    seed, count = SCENARIOS[5]
+    random.seed(123)
+    expected = random.random()
+    random.seed(123)
+    first = play_scenario(seed, count, max_steps=80)
+    assert random.random() == expected
+
+    random.seed(999)
+    assert play_scenario(seed, count, max_steps=80) == first
@@ -0,0 +1,162 @@
+"""
+Game stores: memory, SQLite (WAL, write-behind) and Redis (against a local stand-in).
+"""
+
+import pytest
+
+from app.game.game_manager import GameManager
+from app.storage.game_store import create_game_store
+from app.storage.redis_store import RedisGameStore
+from app.storage.sqlite_store import SQLiteGameStore
+from app.utils.constants import GameState
+from app.websocket.connection_manager import ConnectionManager
+from app.websocket.message_handler import MessageHandler
+from tests.parity_scenarios import SCENARIOS, dump_game, play_scenario
+from tests.redis_standin import RedisStandIn
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def make_store(request, tmp_path):
+    standin = None
+    stores = []
+    if request.param == "redis":
+        standin = RedisStandIn()
+        port = standin.start()
+
+    def factory():
+        store = create_game_store(
+            request.param,
+            sqlite_path=str(tmp_path / "games.db"),
+            redis_url=f"redis://127.0.0.1:{port}/1" if standin else "",
+        )
+        stores.append(store)
+        return store
+
+    # 메모리 저장소는 프로세스 안에서만 공유되므로 같은 인스턴스를 돌려줌
+    shared = create_game_store("memory")
+
+    def shared_factory():
+        return shared
+
+    yield shared_factory if request.param == "memory" else factory
+    for store in stores:
+        store.close()
+    if standin:
+        standin.stop()
+
+
+def test_store_round_trip(make_store) -> None:
+    """Games saved mid-play load back equal into a fresh GameManager."""
+    live = GameManager(store=make_store())
+    for seed, count in SCENARIOS[:4]:
+        play_scenario(seed, count, max_steps=60, gm=live)
+        live.save_game(f"parity_{seed}")
+    waiting = live.create_game("lobby", seed=7)
+    live.add_player_to_game(waiting.id, "p1", "Alice")
+    live.store.flush()
+
+    other = GameManager(store=make_store())
+    listed = {g["id"]: g for g in other.list_games()}
+    assert sorted(listed) == sorted(["lobby"] + [f"parity_{seed}" for seed, _ in SCENARIOS[:4]])
+    assert listed["lobby"]["player_count"] == 1
+    assert listed["lobby"]["state"] == GameState.WAITING.value
+    # 목록은 저장소 요약만 읽고 게임을 캐시에 올리지 않음
+    assert other.games == {}
+    for game_id in other.store.list_ids():
+        game = other.get_game(game_id)
+        original = live.get_game(game_id)
+        assert game.version == original.version
+        assert dump_game(game, other.get_card_manager(game_id)) == dump_game(
+            original, live.get_card_manager(game_id)
+        )
+        if game is not original:
+            assert game.rng.random() == original.rng.random()
+
+    assert other.remove_game("lobby")
+    other.store.flush()
+    assert "lobby" not in make_store().list_ids()
+
+
+def test_sqlite_write_behind(tmp_path) -> None:
+    """Pending writes are readable before the flush and survive close/reopen."""
+    path = str(tmp_path / "games.db")
+    store = SQLiteGameStore(path, flush_interval_ms=60_000, batch_size=1000)
+    gm = GameManager(store=store)
+    play_scenario(*SCENARIOS[0], max_steps=30, gm=gm)
+    game_id = f"parity_{SCENARIOS[0][0]}"
+    gm.save_game(game_id)
+    assert store.flushes == 0
+    assert store.load(game_id)[0].version == gm.get_game(game_id).version
+    gm.remove_game(game_id)
+    gm.create_game("kept", seed=1)
+    store.close()
+
+    reopened = SQLiteGameStore(path)
+    assert reopened.list_ids() == ["kept"]
+    reopened.close()
+
+
+def test_redis_outage_keeps_saves_queued() -> None:
+    """Saves never touch the socket; writes queued while Redis is down land once it is back."""
+    standin = RedisStandIn()
+    store = RedisGameStore(f"redis://127.0.0.1:{standin.start()}/1", flush_interval_ms=60_000)
+    gm = GameManager(store=store)
+    game = gm.create_game("outage", seed=3)
+    standin.stop()
+    store.client.close_connection()
+
+    assert gm.add_player_to_game(game.id, "p1", "Alice")
+    with pytest.raises(OSError):
+        store.flush()
+    assert store.load("outage")[0].version == game.version
+
+    standin = RedisStandIn()
+    store.client.port = standin.start()
+    store.close()
+    reopened = RedisGameStore(f"redis://127.0.0.1:{store.client.port}/1")
+    assert reopened.list_ids() == ["outage"]
+    assert reopened.load("outage")[0].version == game.version
+    reopened.close()
+    standin.stop()
+
+
+def test_remove_unloaded_game_skips_hydration(make_store) -> None:
+    """Removing a game this manager never loaded deletes it without loading it or arming timers."""
+    live = GameManager(store=make_store())
+    live.create_game("stale", seed=9)
+    live.store.flush()
+
+    class RecordingTimer:
+        def __init__(self) -> None:
+            self.synced = []
+
+        def sync(self, game, card_manager=None) -> None:
+            self.synced.append(game.id)
+
+        def cancel(self, game_id) -> None:
+            pass
+
+    other = GameManager(store=make_store())
+    other.turn_timer = RecordingTimer()
+    assert other.remove_game("stale")
+    assert other.games == {} and other.turn_timer.synced == []
+    assert not other.remove_game("stale")
+    other.store.flush()
+    assert "stale" not in make_store().list_ids()
+
+
+async def test_start_notification_reaches_the_store(tmp_path) -> None:
+    """START_GAME saves after adding its notification, so a game reloaded from the store keeps it."""
+    store = SQLiteGameStore(str(tmp_path / "games.db"), flush_interval_ms=60_000)
+    gm = GameManager(store=store)
+    handler = MessageHandler(gm, ConnectionManager())
+    gm.create_game("started", seed=5)
+    for i in range(4):
+        gm.add_player_to_game("started", f"s_p{i}", f"P{i}")
+    result = await handler.handle_start_game("s_p0", {"game_id": "started"})
+    assert result["success"]
+
+    game, _ = store.load("started")
+    assert game.version == gm.get_game("started").version
+    assert game.events[-1]["message"].startswith("게임이 시작되었습니다!")
+    store.close()
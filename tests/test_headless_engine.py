@@ -0,0 +1,43 @@
+"""
+Differential test: the headless engine and ActionHandler play the same seeded games identically.
+"""
+
+from typing import List, Optional, Tuple
+
+from app.engine import rules
+from app.engine.headless import ScriptedBot, apply_first, new_game
+from app.engine.rules import Action
+from tests.parity_scenarios import bot_treasures, play_bot_game
+
+MAX_STEPS = 400
+
+
+def play_headless(seed: int, ids: List[str]) -> Tuple[List[Optional[Action]], Tuple, Optional[Tuple[str, int]]]:
+    """Play the same game on a single EngineState with no models or event text."""
+    ctx = new_game(seed, ids, bot_treasures(seed, len(ids)), game_id=f"bot_{seed}")
+    bot = ScriptedBot(seed + 1)
+    trace: List[Optional[Action]] = []
+    for _ in range(MAX_STEPS):
+        if rules.winner(ctx.state) is not None:
+            break
+        applied = apply_first(ctx, bot.candidates(ctx.state))
+        trace.append(applied)
+        if applied is None:
+            break
+    assert ctx.events == []
+    return trace, ctx.state.snapshot(), rules.winner(ctx.state)
+
+
+def test_headless_matches_action_handler() -> None:
+    """Same seeds, same bot: every applied action, the winner and the final state agree across both engines."""
+    finished = 0
+    for seed in range(24):
+        ids = [f"p{i}" for i in range(4 + seed % 4)]
+        model_trace, model_state = play_bot_game(seed, ids, MAX_STEPS)
+        model_final, model_winner = model_state.snapshot(), rules.winner(model_state)
+        headless_trace, headless_final, headless_winner = play_headless(seed, ids)
+        assert headless_trace == model_trace, f"seed {seed}"
+        assert headless_winner == model_winner, f"seed {seed}"
+        assert headless_final == model_final, f"seed {seed}"
+        finished += model_winner is not None
+    assert finished >= 16
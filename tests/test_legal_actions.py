@@ -0,0 +1,123 @@
+"""
+Legal-action generator: agreement with the handlers, caching and push.
+"""
+
+import copy
+import random
+from typing import Any, Dict, List
+
+from app.game.action_handler import ActionHandler
+from app.game.game_manager import GameManager
+from app.game.legal_actions import get_legal_actions
+from app.game.turn_manager import TurnManager
+from app.utils.constants import ActionType, GameState, TurnState
+from app.websocket.message_handler import MessageHandler
+from tests.parity_scenarios import setup_game
+
+
+def _submit(game, card_manager, player_id: str, action: Dict[str, Any]) -> Dict:
+    """Send a client-format action through the handlers (same mapping as MessageHandler)."""
+    handler = ActionHandler(game, TurnManager(game, card_manager), card_manager)
+    kind = ActionType(action["type"])
+    if kind == ActionType.RESPOND_ATTACK and action["response"] == "give_up":
+        return handler.handle_respond_attack_failed(player_id)
+    data = {
+        "card_id": action.get("cardId"),
+        "target_id": action.get("targetId"),
+        "treasure": action.get("treasure"),
+        "card_ids": action.get("cardIds") or [],
+        "take_card_id": action.get("takeCardId"),
+        "top_card_id": action.get("topCardId"),
+        "bottom_card_id": action.get("bottomCardId"),
+    }
+    return handler.handle_action(kind, player_id, data)
+
+
+def _acting_players(game) -> List[str]:
+    response = game.required_response or {}
+    ids = [game.defending_player_id, response.get("currentPickerId"), game.current_player_id]
+    return [pid for pid in dict.fromkeys(ids) if pid]
+
+
+def test_listed_actions_are_accepted_and_unlisted_cards_rejected() -> None:
+    """Every listed action succeeds; hand cards that are not listed fail for every target."""
+    for seed in range(4):
+        gm, game, card_manager = setup_game(seed, 4 + seed % 4)
+        turn_manager = TurnManager(game, card_manager)
+        rng = random.Random(seed)
+        for _ in range(60):
+            if game.state != GameState.IN_PROGRESS:
+                break
+            if game.turn_state == TurnState.DRAW:
+                turn_manager.start_turn(game.current_player_id)
+                continue
+            options = []
+            for player_id in _acting_players(game):
+                options = get_legal_actions(game, player_id, card_manager)
+                if options:
+                    break
+            assert options, "an acting player must always have a legal action"
+
+            for action in options:
+                g, cm = copy.deepcopy(game), copy.deepcopy(card_manager)
+                assert _submit(g, cm, player_id, action)["success"], action
+
+            listed = {a.get("cardId") for a in options if a["type"] == ActionType.USE_CARD}
+            # while a selection is pending only the selection replies are listed
+            free_play = game.turn_state == TurnState.PLAY_CARD and not game.required_response
+            if free_play and game.current_player_id == player_id:
+                for card in game.get_player(player_id).hand:
+                    if card.id in listed:
+                        continue
+                    for target in [None] + [p.id for p in game.players]:
+                        g, cm = copy.deepcopy(game), copy.deepcopy(card_manager)
+                        action = {"type": "USE_CARD", "cardId": card.id, "targetId": target}
+                        assert not _submit(g, cm, player_id, action)["success"], action
+
+            _submit(game, card_manager, player_id, rng.choice(options))
+            gm.check_win_condition(game.id)
+
+
+def test_cached_until_version_changes() -> None:
+    """Repeated lookups reuse the cached list until the game state changes."""
+    _, game, card_manager = setup_game(3, 5)
+    TurnManager(game, card_manager).start_turn(game.current_player_id)
+    player_id = game.current_player_id
+    first = get_legal_actions(game, player_id, card_manager)
+    assert get_legal_actions(game, player_id, card_manager) is first
+    _submit(game, card_manager, player_id, {"type": "END_TURN"})
+    assert get_legal_actions(game, player_id, card_manager) is not first
+    assert get_legal_actions(game, player_id, card_manager) == []
+
+
+class _Connections:
+    def __init__(self, player_ids: List[str]):
+        self.player_ids = player_ids
+        self.sent: Dict[str, Dict] = {}
+
+    def get_game_players(self, game_id: str) -> List[str]:
+        return self.player_ids
+
+    async def send_personal_message(self, message: Dict, player_id: str) -> bool:
+        self.sent[player_id] = message
+        return True
+
+
+async def test_state_update_carries_legal_actions_for_acting_player() -> None:
+    """GAME_STATE_UPDATE includes legalActions only for the player who must act."""
+    gm = GameManager()
+    game = gm.create_game("legal_push")
+    for i in range(4):
+        gm.add_player_to_game(game.id, f"p{i}", f"P{i}")
+    gm.start_game(game.id)
+    card_manager = gm.get_card_manager(game.id)
+    TurnManager(game, card_manager).start_turn(game.current_player_id)
+
+    connections = _Connections([p.id for p in game.players])
+    await MessageHandler(gm, connections).broadcast_game_state(game.id)
+
+    for player_id, message in connections.sent.items():
+        if player_id == game.current_player_id:
+            assert {"type": "END_TURN"} in message["legalActions"]
+        else:
+            assert "legalActions" not in message
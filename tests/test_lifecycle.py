@@ -0,0 +1,44 @@
+"""
+Game lifecycle manager: TTL eviction of finished, empty and abandoned games.
+"""
+
+from app.game.game_manager import GameManager
+from app.game.lifecycle import GameLifecycleManager
+from app.utils.constants import GameState
+from app.websocket.connection_manager import ConnectionManager
+from tests.parity_scenarios import play_scenario
+
+
+def test_sweep_evicts_by_state_and_ttl() -> None:
+    """Only idle games without connected humans (or finished ones) are evicted and counted."""
+    gm = GameManager()
+    cm = ConnectionManager()
+    reaper = GameLifecycleManager(gm, cm, finished_ttl=10, waiting_ttl=20, abandoned_ttl=30)
+
+    for seed in (1, 2, 3):
+        play_scenario(seed, 4, max_steps=10, gm=gm)
+    gm.get_game("parity_1").state = GameState.FINISHED
+    gm.create_game("lobby_empty")
+    gm.create_game("lobby_live")
+    gm.add_player_to_game("lobby_live", "alice", "Alice")
+    cm.register_player_to_game("alice", "lobby_live")
+    cm.active_connections["alice"] = object()
+    cm.register_player_to_game("p0", "parity_2")
+    cm.active_connections["p0"] = object()
+    cm.register_player_to_game("ghost", "parity_3")
+    cm.disconnect("ghost")
+    assert "parity_3" not in cm.game_players
+
+    now = max(gm.last_activity.values())
+    assert reaper.sweep(now + 5) == []
+
+    evicted = {game_id: reason for game_id, reason, _ in reaper.sweep(now + 25)}
+    assert evicted == {"parity_1": "finished", "lobby_empty": "empty"}
+
+    evicted = {game_id: reason for game_id, reason, _ in reaper.sweep(now + 35)}
+    assert evicted == {"parity_3": "abandoned"}
+    assert sorted(gm.games) == ["lobby_live", "parity_2"]
+
+    stats = reaper.stats()
+    assert stats["evictions"] == {"finished": 1, "empty": 1, "abandoned": 1}
+    assert stats["bytesReclaimed"] > 3 * 10_000
@@ -0,0 +1,83 @@
+"""
+Live stats stream: per-interval snapshot from pre-aggregated counters and the admin WebSocket.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.config import settings
+from app.game.game_manager import GameManager
+from app.monitoring.bandwidth import BandwidthMeter
+from app.monitoring.live_stats import LiveStats, bucket_quantile
+from app.monitoring.loop_monitor import LoopLagMonitor
+from app.monitoring.metrics import Histogram
+from app.websocket.connection_manager import ConnectionManager
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_quantile_interpolates() -> None:
+    """Quantiles interpolate inside the bucket that holds the rank."""
+    bounds = (0.001, 0.01, 0.1)
+    assert bucket_quantile(bounds, [0, 0, 0, 0], 0.5) is None
+    assert bucket_quantile(bounds, [0, 10, 0, 0], 0.5) == pytest.approx(0.0055)
+    assert bucket_quantile(bounds, [98, 0, 1, 1], 0.99) == pytest.approx(0.1)
+    assert bucket_quantile(bounds, [0, 0, 0, 5], 0.5) == 0.1
+
+
+def test_sample_reports_rates_for_the_interval() -> None:
+    """Rates and percentiles cover only what happened since the previous sample."""
+    clock = _Clock()
+    histogram = Histogram("test_action_seconds", "test", (0.001, 0.01, 0.1))
+    bandwidth = BandwidthMeter()
+    games = GameManager()
+    games.create_game("live_game", seed=1)
+    histogram.observe(0.05)  # before the stream started: not reported
+    stats = LiveStats(ConnectionManager(), games, LoopLagMonitor(), bandwidth=bandwidth,
+                      histogram=histogram, clock=clock)
+
+    for _ in range(20):
+        histogram.observe(0.005)
+    bandwidth.record("p1", "live_game", "GAME_STATE_UPDATE", 4000)
+    clock.now += 2.0
+    snapshot = stats.sample()
+    assert snapshot["actionsPerSec"] == 10.0
+    assert 1.0 < snapshot["actionP50Ms"] < 10.0
+    assert snapshot["sentBytesPerSec"] == 2000.0
+    assert snapshot["games"]["WAITING"] == 1
+    assert snapshot["botQueue"] == 0
+
+    clock.now += 1.0
+    idle = stats.sample()
+    assert idle["actionsPerSec"] == 0.0 and idle["actionP99Ms"] is None
+
+
+async def test_slow_subscriber_keeps_only_latest() -> None:
+    """Each subscriber holds at most one pending snapshot, the newest."""
+    stats = LiveStats(ConnectionManager(), GameManager(), LoopLagMonitor())
+    queue = stats.subscribe()
+    stats.publish({"n": 1})
+    stats.publish({"n": 2})
+    assert queue.qsize() == 1 and queue.get_nowait() == {"n": 2}
+    stats.unsubscribe(queue)
+    assert stats.subscribers == 0
+
+
+def test_stats_websocket_requires_token(client: TestClient, monkeypatch) -> None:
+    """Without the admin token the socket is closed; with ?token= the first snapshot arrives at once."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("/admin/stats/ws?token=wrong") as websocket:
+            websocket.receive_json()
+
+    with client.websocket_connect("/admin/stats/ws?token=secret") as websocket:
+        snapshot = websocket.receive_json()
+    assert {"connections", "games", "actionsPerSec", "actionP50Ms", "actionP99Ms",
+            "sentBytesPerSec", "loopLagMs", "botQueue"} <= set(snapshot)
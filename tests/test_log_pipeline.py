@@ -0,0 +1,103 @@
+"""
+Structured JSON logging: queue-backed sink, context, repeated-error sampling and rotation.
+"""
+
+import io
+import json
+import threading
+
+from loguru import logger
+
+from app.game.game_manager import GameManager
+from app.monitoring.log_pipeline import LOG_CONTEXT, LogPipeline, RateLimiter, RotatingFile
+from app.websocket.connection_manager import ConnectionManager
+from app.websocket.message_handler import MessageHandler
+
+
+def _lines(stream: io.StringIO) -> list:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+async def test_handler_exception_is_logged_as_json_with_context() -> None:
+    """An exception inside a handler becomes one JSON line carrying player, game and traceback."""
+    gm = GameManager()
+    connections = ConnectionManager()
+    game = gm.create_game("log_game", seed=1)
+    gm.add_player_to_game(game.id, "p0", "P0")
+    connections.register_player_to_game("p0", game.id)
+    handler = MessageHandler(gm, connections)
+
+    async def broken(player_id, message):
+        raise KeyError("missing")
+
+    handler.handle_get_game_state = broken
+    stream = io.StringIO()
+    pipeline = LogPipeline(stream=stream)
+    pipeline.start()
+    try:
+        result = await handler.handle_message("p0", {"type": "GET_GAME_STATE"})
+    finally:
+        pipeline.stop()
+
+    assert result["error_code"] == "INTERNAL_ERROR"
+    (entry,) = _lines(stream)
+    assert entry["level"] == "ERROR"
+    assert entry["player_id"] == "p0" and entry["game_id"] == "log_game"
+    assert entry["message_type"] == "GET_GAME_STATE"
+    assert "KeyError" in entry["exception"]
+    assert LOG_CONTEXT.get() == {}
+
+
+def test_repeated_errors_are_sampled() -> None:
+    """Past the burst only every Nth repeat is written; the next written line reports what was skipped."""
+    stream = io.StringIO()
+    pipeline = LogPipeline(stream=stream, limiter=RateLimiter(window=60, burst=3, sample_every=100))
+    pipeline.start()
+    try:
+        for _ in range(1000):
+            try:
+                raise ValueError("storm")
+            except ValueError:
+                logger.exception("repeated")
+    finally:
+        pipeline.stop()
+
+    entries = _lines(stream)
+    assert len(entries) == 3 + 997 // 100
+    assert entries[3]["suppressed"] == 99
+    assert pipeline.stats()["suppressed"] == 1000 - len(entries)
+    assert pipeline.record_counts() == {"written": len(entries), "suppressed": 1000 - len(entries), "dropped": 0}
+
+
+def test_full_queue_drops_instead_of_blocking() -> None:
+    """While the writer is stuck, records beyond the queue size are dropped and counted."""
+    release = threading.Event()
+
+    class StuckStream(io.StringIO):
+        def write(self, text):
+            release.wait(5)
+            return super().write(text)
+
+    pipeline = LogPipeline(stream=StuckStream(), queue_size=2, limiter=RateLimiter(burst=100))
+    pipeline.start()
+    try:
+        for i in range(20):
+            logger.info("line {}", i)
+        assert pipeline.dropped >= 10
+    finally:
+        release.set()
+        pipeline.stop()
+    assert pipeline.written + pipeline.dropped == 20
+
+
+def test_rotating_file_keeps_backups(tmp_path) -> None:
+    """Files roll over to .1, .2 before exceeding max_bytes and only `backups` old files are kept."""
+    path = str(tmp_path / "server.jsonl")
+    log_file = RotatingFile(path, max_bytes=100, backups=2)
+    for _ in range(10):
+        log_file.write(b"x" * 39 + b"\n")
+    log_file.close()
+
+    assert log_file.rotations == 4
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["server.jsonl", "server.jsonl.1", "server.jsonl.2"]
+    assert (tmp_path / "server.jsonl").stat().st_size <= 100
@@ -0,0 +1,63 @@
+"""
+Event-loop lag sampling, slow-handler attribution and the admin view.
+"""
+
+import asyncio
+import time
+
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.game.game_manager import GameManager
+from app.monitoring.loop_monitor import LoopLagMonitor, SlowOperationLog
+from app.websocket.connection_manager import ConnectionManager
+from app.websocket.message_handler import MessageHandler
+
+
+async def test_lag_monitor_sees_a_blocking_callback() -> None:
+    """A callback that holds the loop for 50 ms shows up as loop lag."""
+    monitor = LoopLagMonitor(interval=0.01)
+    monitor.start()
+    await asyncio.sleep(0.02)
+    time.sleep(0.05)
+    await asyncio.sleep(0.03)
+    await monitor.stop()
+    assert monitor.samples >= 2
+    assert monitor.max_lag >= 0.03
+
+
+async def test_slow_handler_is_recorded_with_game_and_action() -> None:
+    """Messages over the threshold are logged with game id, message type and action type."""
+    gm = GameManager()
+    connections = ConnectionManager()
+    game = gm.create_game("slow_game", seed=1)
+    for i in range(4):
+        gm.add_player_to_game(game.id, f"p{i}", f"P{i}")
+        connections.register_player_to_game(f"p{i}", game.id)
+    gm.start_game(game.id)
+    slow = SlowOperationLog(threshold=0.0, capacity=2)
+    handler = MessageHandler(gm, connections, slow)
+
+    await handler.handle_message("p0", {"type": "GET_GAME_STATE"})
+    await handler.handle_message("p0", {"type": "PLAYER_ACTION", "action": {"type": "END_TURN"}})
+    await handler.handle_message("p1", ["not", "a", "dict"])
+
+    assert slow.total == 3
+    latest, previous = slow.recent()
+    assert latest["messageType"] is None and latest["playerId"] == "p1"
+    assert previous["gameId"] == "slow_game"
+    assert previous["messageType"] == "PLAYER_ACTION"
+    assert previous["actionType"] == "END_TURN"
+    assert previous["durationMs"] >= 0
+
+
+def test_admin_view_requires_token(client: TestClient, monkeypatch) -> None:
+    """/admin/slow-operations is hidden without ADMIN_TOKEN and checks the X-Admin-Token header."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", None)
+    assert client.get("/admin/slow-operations").status_code == 404
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    assert client.get("/admin/slow-operations", headers={"X-Admin-Token": "wrong"}).status_code == 401
+    response = client.get("/admin/slow-operations", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    assert {"thresholdMs", "slowTotal", "loopLag", "recent"} <= set(response.json())
@@ -0,0 +1,83 @@
+"""
+Per-game memory accounting and the tracemalloc diff used for leak hunting.
+"""
+
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.game.game_manager import GameManager
+from app.monitoring.memory_report import TracemallocDiff, game_footprint, top_games
+from app.utils.memory import deep_sizeof
+
+
+def _started_game(gm: GameManager, game_id: str, players: int):
+    game = gm.create_game(game_id, seed=1)
+    for i in range(players):
+        gm.add_player_to_game(game.id, f"{game_id}_p{i}", f"P{i}")
+    gm.start_game(game.id)
+    return game
+
+
+def test_parts_add_up_to_deep_sizeof() -> None:
+    """The per-part breakdown covers the same objects as deep_sizeof, each counted once."""
+    gm = GameManager()
+    game = _started_game(gm, "mem_game", 5)
+    card_manager = gm.get_card_manager(game.id)
+    footprint = game_footprint(game, card_manager)
+
+    assert footprint["totalBytes"] == deep_sizeof(game, card_manager)
+    assert footprint["parts"]["hands"] > 0
+    game.events.extend({"message": "x" * 200, "type": "info"} for _ in range(40))
+    assert game_footprint(game, card_manager)["parts"]["events"] > footprint["parts"]["events"]
+
+
+async def test_top_games_orders_by_footprint() -> None:
+    """Top-N is sorted by total size and the totals cover every game."""
+    gm = GameManager()
+    _started_game(gm, "small", 4)
+    big = _started_game(gm, "big", 7)
+    big.pending_action = {"cards": list(range(500))}
+
+    report = await top_games(gm.games, gm.card_managers, limit=1)
+    assert report["games"] == 2
+    (heaviest,) = report["top"]
+    assert heaviest["gameId"] == "big"
+    assert heaviest["parts"]["pending"] > 4000
+    assert report["totalBytes"] == sum(report["parts"].values())
+
+
+def test_tracemalloc_diff_reports_new_allocations() -> None:
+    """Allocations made after start() show up in the diff attributed to this file."""
+    diff = TracemallocDiff()
+    diff.start()
+    try:
+        retained = [bytearray(1024) for _ in range(200)]
+        result = diff.diff(limit=5)
+    finally:
+        diff.stop()
+    assert retained
+    top = result["diff"][0]
+    assert __file__ in top["location"]
+    assert top["sizeDiffBytes"] >= 200 * 1024
+
+
+def test_memory_endpoint_requires_token(client: TestClient, monkeypatch) -> None:
+    """/admin/memory is admin-only; the diff endpoint refuses until tracemalloc is started."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", None)
+    assert client.get("/admin/memory").status_code == 404
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    headers = {"X-Admin-Token": "secret"}
+    response = client.get("/admin/memory?top=3", headers=headers)
+    assert response.status_code == 200
+    assert {"process", "games", "totalBytes", "parts", "top"} <= set(response.json())
+    assert client.get("/admin/memory/tracemalloc/diff", headers=headers).status_code == 409
+
+
+def test_stats_endpoints_are_admin_only(client: TestClient, monkeypatch) -> None:
+    """Timer, bot and lifecycle stats live under /admin and need the admin token."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    for name in ("timers", "bots", "lifecycle"):
+        assert client.get(f"/stats/{name}").status_code == 404
+        assert client.get(f"/admin/stats/{name}").status_code == 401
+        assert client.get(f"/admin/stats/{name}", headers={"X-Admin-Token": "secret"}).status_code == 200
@@ -0,0 +1,76 @@
+"""
+Prometheus /metrics endpoint and the pre-bound counters behind it.
+"""
+
+from typing import Dict
+
+from fastapi.testclient import TestClient
+
+from app.game.game_manager import GameManager
+from app.monitoring.metrics import CounterFamily, Histogram, Registry
+
+
+def _samples(text: str) -> Dict[str, float]:
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+def test_exposition_format() -> None:
+    """Counters expose every pre-bound label; histogram buckets are cumulative with +Inf."""
+    registry = Registry()
+    family = registry.register(CounterFamily("demo_total", "demo", "kind", ("a", "b")))
+    histogram = registry.register(Histogram("demo_seconds", "demo", (0.1, 1.0)))
+    family.labels("a").inc(3)
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value)
+
+    text = registry.render()
+    assert "# TYPE demo_total counter" in text
+    samples = _samples(text)
+    assert samples['demo_total{kind="a"}'] == 3
+    assert samples['demo_total{kind="b"}'] == 0
+    assert samples['demo_seconds_bucket{le="0.1"}'] == 1
+    assert samples['demo_seconds_bucket{le="1.0"}'] == 2
+    assert samples['demo_seconds_bucket{le="+Inf"}'] == 3
+    assert samples["demo_seconds_count"] == 3
+
+
+def test_metrics_endpoint_counts_messages_and_disconnects(client: TestClient) -> None:
+    """A WebSocket session shows up in message, connection and disconnect-reason series."""
+    before = _samples(client.get("/metrics").text)
+    with client.websocket_connect("/ws/metrics_probe") as websocket:
+        websocket.receive_json()  # CONNECTION_ESTABLISHED
+        assert _samples(client.get("/metrics").text)["ledger_ws_connections"] >= 1
+        websocket.send_json({"type": "GET_GAME_STATE"})
+        websocket.receive_json()
+        websocket.send_json({"type": "NOT_A_MESSAGE"})
+        websocket.receive_json()
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    after = _samples(response.text)
+    assert after['ledger_ws_messages_total{type="GET_GAME_STATE"}'] == before['ledger_ws_messages_total{type="GET_GAME_STATE"}'] + 1
+    assert after['ledger_ws_messages_total{type="other"}'] == before['ledger_ws_messages_total{type="other"}'] + 1
+    assert after['ledger_ws_disconnects_total{reason="client_closed"}'] == before['ledger_ws_disconnects_total{reason="client_closed"}'] + 1
+    assert 'ledger_games{state="IN_PROGRESS"}' in after
+    assert 'ledger_log_records{outcome="dropped"}' in after
+    assert "ledger_broadcast_seconds_count" in after
+
+
+def test_game_gauge_counts_waiting_and_started_games() -> None:
+    """count_by_state handles both the stored enum value (new game) and an assigned GameState."""
+    gm = GameManager()
+    gm.create_game("gauge_waiting", seed=1)
+    started = gm.create_game("gauge_started", seed=2)
+    for i in range(4):
+        gm.add_player_to_game(started.id, f"gauge_p{i}", f"P{i}")
+    gm.start_game(started.id)
+
+    counts = gm.count_by_state()
+    assert counts["WAITING"] == 1
+    assert counts["IN_PROGRESS"] == 1
@@ -0,0 +1,82 @@
+"""
+In-process sampling profiler and the /admin/profile endpoint.
+"""
+
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.game.game_manager import GameManager
+from app.monitoring.profiler import ProfileResult, SamplingProfiler
+
+
+def _busy_game_work(stop: threading.Event) -> None:
+    gm = GameManager()
+    for i in range(200):
+        gm.create_game(f"profiled_{i}", seed=i)
+    while not stop.is_set():
+        gm.count_by_state()
+
+
+def test_collapsed_output_is_sorted_by_count() -> None:
+    """Each line is 'frame;frame count', most frequent first."""
+    result = ProfileResult({"a;b": 2, "a;c": 5}, {})
+    assert result.collapsed() == "a;c 5\na;b 2\n"
+    assert ProfileResult({}, {}).collapsed() == ""
+
+
+def test_game_filter_keeps_only_app_game_frames() -> None:
+    """With filter=game every stack starts at an app/game frame and unrelated samples are dropped."""
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_game_work, args=(stop,))
+    worker.start()
+    try:
+        result = SamplingProfiler().profile(0.3, [worker.ident], interval=0.002, path_filter="game")
+    finally:
+        stop.set()
+        worker.join()
+
+    assert result.stats["samples"] > 0
+    assert result.stacks
+    for stack in result.stacks:
+        assert stack.startswith("app/game/")
+    assert result.stats["intervalMs"] == 2
+    assert 0 <= result.stats["overhead"] < 1
+
+
+def test_only_one_profile_runs_at_a_time() -> None:
+    """A second profile while one is running is refused instead of doubling the overhead."""
+    profiler = SamplingProfiler()
+    started = threading.Thread(target=profiler.profile, args=(0.3,))
+    started.start()
+    time.sleep(0.05)
+    try:
+        assert profiler.running
+        try:
+            profiler.profile(0.01)
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("concurrent profile was accepted")
+    finally:
+        started.join()
+    assert not profiler.running
+
+
+def test_profile_endpoint_requires_token(client: TestClient, monkeypatch) -> None:
+    """/admin/profile is admin-only, validates the filter and reports stats in headers."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", None)
+    assert client.post("/admin/profile?seconds=0.05").status_code == 404
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    headers = {"X-Admin-Token": "secret"}
+    assert client.post("/admin/profile?seconds=0.05", headers={"X-Admin-Token": "wrong"}).status_code == 401
+    assert client.post("/admin/profile?seconds=0.05&filter=nope", headers=headers).status_code == 400
+
+    response = client.post("/admin/profile?seconds=0.1&threads=all", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert int(response.headers["X-Profile-Samples"]) > 0
+    assert "X-Profile-Overhead" in response.headers
@@ -0,0 +1,78 @@
+"""
+/ready: readiness thresholds for connection headroom, loop lag, send backlog and game count.
+"""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.game.game_manager import GameManager
+from app.monitoring.loop_monitor import LoopLagMonitor
+from app.monitoring.readiness import ReadinessProbe
+from app.websocket.connection_manager import ConnectionManager
+
+
+class _SlowSocket:
+    """A client whose socket buffer is full: send_text waits until released."""
+
+    def __init__(self, release: asyncio.Event) -> None:
+        self.release = release
+
+    async def send_text(self, text: str) -> None:
+        await self.release.wait()
+
+
+def _probe(**thresholds) -> ReadinessProbe:
+    return ReadinessProbe(ConnectionManager(), GameManager(), LoopLagMonitor(recent=2), max_connections=10, **thresholds)
+
+
+def test_ready_endpoint_reports_figures(client: TestClient) -> None:
+    """An idle instance is ready and returns every figure the proxy routes on."""
+    response = client.get("/ready")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ready"] is True and body["failing"] == []
+    assert {"connections", "loopLag", "pendingSends", "games"} <= set(body)
+
+
+def test_connection_headroom_and_game_count() -> None:
+    """Too few free connection slots or too many games make the instance not ready."""
+    probe = _probe(min_headroom=0.2, max_games=1)
+    for i in range(8):
+        probe.connection_manager.active_connections[f"p{i}"] = object()
+    assert probe.check()["ready"] is True
+
+    probe.connection_manager.active_connections["p8"] = object()
+    probe.game_manager.create_game("ready_game", seed=1)
+    result = probe.check()
+    assert result["failing"] == ["connections", "games"]
+    assert result["connections"]["headroom"] == 0.1
+
+
+def test_loop_lag_uses_recent_samples() -> None:
+    """One lag spike fails readiness until it scrolls out of the recent window."""
+    probe = _probe(max_loop_lag=0.1)
+    probe.loop_monitor.record(0.3)
+    assert probe.check()["failing"] == ["loopLag"]
+    probe.loop_monitor.record(0.01)
+    probe.loop_monitor.record(0.01)
+    assert probe.check()["ready"] is True
+
+
+async def test_pending_sends_backlog() -> None:
+    """Sends stuck behind a slow client count as backlog until they complete."""
+    probe = _probe(max_pending_sends=2)
+    manager = probe.connection_manager
+    release = asyncio.Event()
+    for i in range(3):
+        manager.active_connections[f"slow{i}"] = _SlowSocket(release)
+    sends = [asyncio.create_task(manager.send_personal_message({"type": "PONG"}, f"slow{i}")) for i in range(3)]
+    await asyncio.sleep(0)
+    result = probe.check()
+    assert result["pendingSends"]["current"] == 3
+    assert result["failing"] == ["pendingSends"]
+
+    release.set()
+    assert all(await asyncio.gather(*sends))
+    assert manager.pending_sends == 0
+    assert probe.check()["ready"] is True
@@ -0,0 +1,99 @@
+"""
+Slow-action capture: pre-action snapshot + payload + RNG state, and deterministic replay.
+"""
+
+import os
+import subprocess
+import sys
+
+from app.game import engine_bridge
+from app.game.game_manager import GameManager
+from app.game.legal_actions import get_legal_actions
+from app.game.turn_manager import TurnManager
+from app.monitoring.slow_capture import SlowActionCapture, load_capture
+from app.storage.codec import decode
+from app.websocket.connection_manager import ConnectionManager
+from app.websocket.message_handler import MessageHandler
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _table(capture: SlowActionCapture, players: int = 7):
+    gm = GameManager()
+    connections = ConnectionManager()
+    game = gm.create_game("capture_game", seed=7)
+    for i in range(players):
+        gm.add_player_to_game(game.id, f"p{i}", f"P{i}")
+        connections.register_player_to_game(f"p{i}", game.id)
+    gm.start_game(game.id)
+    player_id = game.current_player_id
+    card_manager = gm.get_card_manager(game.id)
+    TurnManager(game, card_manager).start_turn(player_id)
+    handler = MessageHandler(gm, connections, slow_capture=capture)
+    return handler, game, card_manager, player_id
+
+
+async def test_slow_action_is_captured_and_replays_identically(tmp_path) -> None:
+    """A captured action re-applied to the restored pre-action game ends in the same state."""
+    capture = SlowActionCapture(str(tmp_path), threshold=0.0)
+    handler, game, card_manager, player_id = _table(capture)
+    action = get_legal_actions(game, player_id, card_manager)[0]
+    result = await handler.apply_player_action(game.id, player_id, action)
+    assert result["success"]
+    after = engine_bridge.serialize_game(game, card_manager)
+
+    (name,) = os.listdir(tmp_path)
+    loaded = load_capture(os.path.join(tmp_path, name))
+    assert loaded.meta["action"] == action
+    assert loaded.meta["playerId"] == player_id
+    assert loaded.meta["connected"] == [f"p{i}" for i in range(7)]
+
+    restored, restored_cards = engine_bridge.deserialize_game(loaded.game_bytes)
+    gm = GameManager()
+    gm.games[restored.id] = restored
+    gm.card_managers[restored.id] = restored_cards
+    replayed = await MessageHandler(gm, ConnectionManager()).apply_player_action(restored.id, player_id, action)
+    assert replayed == result
+    # same engine state, RNG position and event text (event timestamps are wall-clock)
+    replay_fmt, *replay_state, replay_events = decode(engine_bridge.serialize_game(restored, restored_cards))
+    fmt, *state, events = decode(after)
+    assert replay_state == state
+    assert [e["message"] for e in replay_events] == [e["message"] for e in events]
+
+
+async def test_fast_actions_are_not_written(tmp_path) -> None:
+    """Below the threshold nothing is encoded or written."""
+    capture = SlowActionCapture(str(tmp_path), threshold=60.0)
+    handler, game, card_manager, player_id = _table(capture, players=4)
+    action = get_legal_actions(game, player_id, card_manager)[0]
+    assert (await handler.apply_player_action(game.id, player_id, action))["success"]
+    assert os.listdir(tmp_path) == []
+    assert capture.written == 0
+
+
+async def test_capture_directory_is_capped(tmp_path) -> None:
+    """Once max_files captures exist, further slow actions are counted as skipped."""
+    capture = SlowActionCapture(str(tmp_path), threshold=0.0, max_files=1)
+    handler, game, card_manager, player_id = _table(capture, players=4)
+    parts = capture.before(game, card_manager)
+    assert await capture.record(parts, game.id, player_id, {"type": "END_TURN"}, 1.0, None) is not None
+    assert await capture.record(parts, game.id, player_id, {"type": "END_TURN"}, 1.0, None) is None
+    assert (capture.written, capture.skipped) == (1, 1)
+
+
+async def test_replay_cli_profiles_capture(tmp_path) -> None:
+    """scripts/replay_capture.py confirms the result matches and writes collapsed stacks."""
+    capture = SlowActionCapture(str(tmp_path / "captures"), threshold=0.0)
+    handler, game, card_manager, player_id = _table(capture)
+    action = get_legal_actions(game, player_id, card_manager)[0]
+    await handler.apply_player_action(game.id, player_id, action)
+
+    output = tmp_path / "replay.collapsed"
+    completed = subprocess.run(
+        [sys.executable, os.path.join("scripts", "replay_capture.py"), capture.last_path,
+         "--seconds", "0.3", "-o", str(output)],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60,
+    )
+    assert completed.returncode == 0, completed.stderr
+    assert "result matches" in completed.stderr
+    assert "apply_player_action" in output.read_text(encoding="utf-8")
@@ -0,0 +1,109 @@
+"""
+Request tracing: head sampling, span tree for a PLAYER_ACTION and the OTLP-shaped exports.
+"""
+
+import json
+
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.game.game_manager import GameManager
+from app.game.legal_actions import get_legal_actions
+from app.game.turn_manager import TurnManager
+from app.monitoring.tracing import NOOP_SPAN, TRACER, JsonlExporter, RingExporter, Tracer, traces_to_otlp
+from app.websocket.connection_manager import ConnectionManager
+from app.websocket.message_handler import MessageHandler
+
+
+def _traced(monkeypatch, rate: float = 1.0) -> RingExporter:
+    ring = RingExporter(capacity=10)
+    monkeypatch.setattr(TRACER, "sample_rate", rate)
+    monkeypatch.setattr(TRACER, "exporters", [ring])
+    return ring
+
+
+def test_disabled_tracer_returns_noop(monkeypatch) -> None:
+    """With sampling off nothing is allocated or exported, and child spans outside a trace are no-ops."""
+    ring = _traced(monkeypatch, rate=0.0)
+    with TRACER.start_trace("ws.message") as root:
+        assert root is NOOP_SPAN
+        assert TRACER.span("json.decode") is NOOP_SPAN
+    assert TRACER.span("orphan") is NOOP_SPAN
+    assert not ring.traces
+
+
+async def test_player_action_span_tree(monkeypatch) -> None:
+    """One sampled PLAYER_ACTION yields dispatch, rules, save, broadcast, serialize, send and win-check spans."""
+    ring = _traced(monkeypatch)
+    gm = GameManager()
+    connections = ConnectionManager()
+    game = gm.create_game("trace_game", seed=1)
+    for i in range(4):
+        gm.add_player_to_game(game.id, f"p{i}", f"P{i}")
+        connections.register_player_to_game(f"p{i}", game.id)
+    gm.start_game(game.id)
+    handler = MessageHandler(gm, connections)
+    player_id = game.current_player_id
+    card_manager = gm.get_card_manager(game.id)
+    TurnManager(game, card_manager).start_turn(player_id)
+    action = get_legal_actions(game, player_id, card_manager)[0]
+
+    with TRACER.start_trace("ws.message", player_id=player_id):
+        result = await handler.handle_message(player_id, {"type": "PLAYER_ACTION", "action": action})
+    assert result["success"]
+
+    (spans,) = ring.recent()
+    by_name = {}
+    for span in spans:
+        by_name.setdefault(span.name, []).append(span)
+    root = by_name["ws.message"][0]
+    assert root.parent_id is None and spans[-1] is root
+    assert by_name["handle_player_action"][0].parent_id == root.span_id
+    dispatch_id = by_name["handle_player_action"][0].span_id
+    for name in ("rules", "save_game", "broadcast_game_state", "check_win_condition"):
+        assert by_name[name][0].parent_id == dispatch_id
+    broadcast_id = by_name["broadcast_game_state"][0].span_id
+    assert len(by_name["serialize"]) == 4
+    assert all(span.parent_id == broadcast_id for span in by_name["serialize"] + by_name["send"])
+    assert {span.trace_id for span in spans} == {root.trace_id}
+
+
+def test_otlp_export_and_jsonl_file(tmp_path) -> None:
+    """Exports follow the OTLP JSON layout; the JSONL exporter writes one request per trace."""
+    ring = RingExporter()
+    path = tmp_path / "traces.jsonl"
+    jsonl = JsonlExporter(str(path))
+    jsonl.start()
+    tracer = Tracer(sample_rate=1.0, exporters=[ring, jsonl])
+    with tracer.start_trace("root", count=3):
+        with tracer.span("child", ok=True):
+            pass
+        try:
+            with tracer.span("failing"):
+                raise ValueError("bad")
+        except ValueError:
+            pass
+    jsonl.stop()
+
+    request = traces_to_otlp(ring.recent())
+    spans = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [span["name"] for span in spans] == ["child", "failing", "root"]
+    child, failing, root = spans
+    assert child["parentSpanId"] == root["spanId"] and "parentSpanId" not in root
+    assert len(root["traceId"]) == 32 and len(root["spanId"]) == 16
+    assert root["attributes"] == [{"key": "count", "value": {"intValue": "3"}}]
+    assert failing["status"]["code"] == "STATUS_CODE_ERROR"
+    assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+    (line,) = path.read_text().splitlines()
+    assert json.loads(line) == request
+
+
+def test_traces_endpoint_requires_token(client: TestClient, monkeypatch) -> None:
+    """/admin/traces is admin-only and returns OTLP resourceSpans."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", None)
+    assert client.get("/admin/traces").status_code == 404
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    response = client.get("/admin/traces", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    assert {"sampleRate", "resourceSpans"} <= set(response.json())
@@ -0,0 +1,159 @@
+"""
+Turn timer: process-wide deadline scheduler and default actions on expiry.
+"""
+
+import asyncio
+import random
+
+from app.engine import apply, legal_actions, rules
+from app.engine.rules import IllegalAction
+from app.game import engine_bridge
+from app.game.game_manager import GameManager
+from app.game.turn_timer import TurnTimer
+from app.utils.constants import ActionType
+from app.utils.scheduler import TimerScheduler
+from app.websocket.connection_manager import ConnectionManager
+from app.websocket.message_handler import MessageHandler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_scheduler_orders_cancels_and_rearms() -> None:
+    """Due keys pop in deadline order; cancelled and re-armed keys fire once at their latest deadline."""
+    clock = FakeClock()
+    scheduler = TimerScheduler(lambda key, value: None, clock=clock)
+    rng = random.Random(3)
+    deadlines = {f"g{i}": clock.now + rng.uniform(0, 100) for i in range(10_000)}
+    for key, deadline in deadlines.items():
+        scheduler.arm(key, deadline, key)
+    for i in range(0, 10_000, 2):
+        scheduler.cancel(f"g{i}")
+        del deadlines[f"g{i}"]
+    scheduler.arm("g1", clock.now + 500, "late")
+    deadlines["g1"] = clock.now + 500
+
+    assert len(scheduler) == 5_000
+    assert len(scheduler._heap) <= 2 * len(scheduler) + 64
+    assert scheduler.next_deadline() == min(deadlines.values())
+
+    due = scheduler.pop_due(clock.now + 100)
+    assert [key for key, _ in due] == sorted(
+        (key for key, deadline in deadlines.items() if deadline <= clock.now + 100),
+        key=deadlines.get,
+    )
+    assert scheduler.pop_due(clock.now + 1000) == [("g1", "late")]
+    assert len(scheduler) == 0 and scheduler.next_deadline() is None
+
+
+async def _fire(timer: TurnTimer) -> None:
+    timer.scheduler.fire_due()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _attack(gm: GameManager, game_id: str) -> None:
+    """Have the current player play a card that puts a target into the respond phase."""
+    game = gm.get_game(game_id)
+    card_manager = gm.get_card_manager(game_id)
+    state = engine_bridge.load_state(game, card_manager)
+    for action in legal_actions(state, state.current):
+        if action.kind != ActionType.USE_CARD or action.target is None:
+            continue
+        try:
+            trial = apply(state, action, random.Random(0))
+        except IllegalAction:
+            continue
+        if trial.state.response is not None and trial.state.response[0] == "RESPOND_ATTACK":
+            engine_bridge.run(game, card_manager, rules.perform, action)
+            gm.save_game(game_id)
+            return
+    raise AssertionError("no attack available")
+
+
+async def test_expired_phases_apply_default_actions() -> None:
+    """Draw resolves at once, respond gives up after its timeout, the paused turn clock resumes, and the turn ends."""
+    clock = FakeClock()
+    gm = GameManager()
+    handler = MessageHandler(gm, ConnectionManager())
+    timer = TurnTimer(handler.handle_timeout, turn_timeout=60, respond_timeout=20, clock=clock)
+    gm.turn_timer = timer
+
+    for seed in range(20):
+        game_id = f"timer_{seed}"
+        gm.create_game(game_id, seed=seed)
+        for i in range(4):
+            gm.add_player_to_game(game_id, f"p{i}", f"P{i}")
+        gm.start_game(game_id)
+        assert timer.current_key(game_id)[0] == "draw"
+        await _fire(timer)
+        game = gm.get_game(game_id)
+        assert timer.current_key(game_id)[0] == "turn"
+        assert game.to_dict()["turnState"]["timeLeft"] == 60
+        clock.now += 15
+        try:
+            _attack(gm, game_id)
+            break
+        except AssertionError:
+            gm.remove_game(game_id)
+    else:
+        raise AssertionError("no seed produced an attack")
+
+    current = game.current_player_id
+    seat = [p.id for p in game.players].index(current)
+    turn_number = game.turn_number
+    expired = dict(timer.expired)
+    assert timer.current_key(game_id)[0] == "respond"
+    assert game.to_dict()["turnState"]["timeLeft"] == 20
+
+    clock.now += 20
+    await _fire(timer)
+    assert game.required_response is None
+    assert timer.current_key(game_id) == ("turn", seat, turn_number)
+    assert timer.scheduler.deadline(game_id) == clock.now + 45
+
+    clock.now += 45
+    await _fire(timer)
+    assert game.current_player_id != current
+    assert game.turn_number == turn_number + 1
+    assert timer.current_key(game_id)[0] == "turn"
+    expired["respond"] = expired.get("respond", 0) + 1
+    expired["turn"] = expired.get("turn", 0) + 1
+    assert timer.stats()["expired"] == expired
+
+
+async def test_failed_default_action_is_retried() -> None:
+    """A default action that fails (no save, so no sync) re-arms the same phase after retry_delay."""
+    clock = FakeClock()
+    gm = GameManager()
+    handler = MessageHandler(gm, ConnectionManager())
+    calls = []
+
+    async def flaky_timeout(game_id, key):
+        calls.append(key)
+        if len(calls) == 1:
+            return {"success": False, "message": "일시적 실패"}
+        return await handler.handle_timeout(game_id, key)
+
+    timer = TurnTimer(flaky_timeout, retry_delay=5, clock=clock)
+    gm.turn_timer = timer
+    gm.create_game("retry", seed=1)
+    for i in range(4):
+        gm.add_player_to_game("retry", f"p{i}", f"P{i}")
+    gm.start_game("retry")
+    draw_key = timer.current_key("retry")
+
+    await _fire(timer)
+    assert timer.current_key("retry") == draw_key
+    assert timer.scheduler.deadline("retry") == clock.now + 5
+    assert timer.stats()["failed"] == 1
+
+    clock.now += 5
+    await _fire(timer)
+    assert calls == [draw_key, draw_key]
+    assert timer.current_key("retry")[0] == "turn"
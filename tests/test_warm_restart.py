@@ -0,0 +1,47 @@
+"""
+Warm restart: shutdown snapshot of every game plus the player mapping, lazy restore on boot.
+"""
+
+import os
+
+from app.game.game_manager import GameManager
+from app.storage.warm_restart import RESTORED_SUFFIX
+from tests.parity_scenarios import SCENARIOS, dump_game, play_scenario
+
+
+def test_warm_restart_round_trip(tmp_path) -> None:
+    """Games and the mapping survive two restarts; games are only decoded on first access."""
+    path = str(tmp_path / "warm.bin")
+    live = GameManager()
+    game_ids = []
+    for seed, count in SCENARIOS[:5]:
+        play_scenario(seed, count, max_steps=45, gm=live)
+        game_ids.append(f"parity_{seed}")
+    assert live.save_warm_snapshot(path, {"spectator": game_ids[0]}) == 5
+
+    booted = GameManager()
+    mapping = booted.load_warm_snapshot(path)
+    assert mapping["spectator"] == game_ids[0]
+    assert mapping["p0"] in game_ids
+    assert not os.path.exists(path)
+    assert booted.games == {}
+    assert sorted(booted.store.list_ids()) == sorted(game_ids)
+    assert sorted(g["id"] for g in booted.list_games()) == sorted(game_ids)
+    assert booted.games == {}
+    assert sorted(booted.pending_warm_game_ids()) == sorted(game_ids)
+
+    first = booted.get_game(game_ids[0])
+    assert dump_game(first, booted.get_card_manager(game_ids[0])) == dump_game(
+        live.get_game(game_ids[0]), live.get_card_manager(game_ids[0])
+    )
+    assert list(booted.games) == [game_ids[0]]
+
+    # 복원하지 않은 게임도 다음 스냅샷으로 그대로 넘어감
+    assert booted.save_warm_snapshot(path, {}) == 5
+    assert not os.path.exists(path + RESTORED_SUFFIX)
+    again = GameManager()
+    again.load_warm_snapshot(path)
+    for game_id in game_ids:
+        assert dump_game(again.get_game(game_id), again.get_card_manager(game_id)) == dump_game(
+            live.get_game(game_id), live.get_card_manager(game_id)
+        )